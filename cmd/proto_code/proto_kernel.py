@@ -24,28 +24,42 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import contextvars
+import copy
 import datetime
 import enum
+import hashlib
 import importlib
 import json
 import logging
+import logging.handlers
 import os
 import pathlib
+import queue
+import re
 import shlex
 import shutil
 import subprocess
 import sys
+import sysconfig
+import tempfile
+import time
 import typing
-
+import urllib.parse
+import urllib.request
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 # The release process ensures that content in this file matches the version below while tagging the release commit
 # (otherwise, if the file comes from a different commit, the version is irrelevant):
 __version__ = "0.13.0.dev0"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 logger: logging.Logger = logging.getLogger()
 
 log_stride = contextvars.ContextVar("state_stride")
 
+# The name of the `EnvState` being evaluated (see `StateStrideFilter`):
+log_state_name = contextvars.ContextVar("state_name")
+
 ValueType = typing.TypeVar("ValueType")
 DataValueType = typing.TypeVar("DataValueType")
 
@@ -57,7 +71,7 @@ _proto_kernel_abs_path: str | None = None
 
 def run_process(env_ctx: EnvContext) -> None:
     import atexit
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # See UC_10_80_27_57.extend_DAG.md
     try:
         ensure_min_python_version()
@@ -65,7 +79,7 @@ def run_process(env_ctx: EnvContext) -> None:
         state_everything_executed: bool = env_ctx.eval_state(TargetState.target_everything_executed.value.name)
         assert state_everything_executed
         atexit.register(lambda: env_ctx.print_exit_line(0))
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     except subprocess.CalledProcessError as subproc_error:
         # Convert the list of arguments into a single shell-escaped string:
         if isinstance(subproc_error.cmd, list):
@@ -187,7 +201,10 @@ class KeyWord(enum.Enum):
     key_global = "global"
     key_env = "env"
     key_local = "local"
+    key_user = "user"
+    key_host = "host"
     key_derived = "derived"
+    key_merged = "merged"
 
     key_help = "help"
 
@@ -223,6 +240,15 @@ class KeyWord(enum.Enum):
     key_default = "default"
     key_conf = "conf"
     key_effective = "effective"
+    key_async = "async"
+    key_watch = "watch"
+    key_format = "format"
+    key_direct = "direct"
+    key_exec = "exec"
+    key_launch = "launch"
+    key_record = "record"
+    key_lock = "lock"
+    key_fd = "fd"
 
     key_configured = "configured"
     key_parsed = "parsed"
@@ -234,13 +260,13 @@ class KeyWord(enum.Enum):
     key_updated = "updated"
     key_generated = "generated"
     key_prepared = "prepared"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 class TopDir(enum.Enum):
     """
     Top-level directories (or dirs under `TopDir.dir_var`).
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     dir_var = f"{KeyWord.key_var.value}"
     dir_tmp = f"{KeyWord.key_tmp.value}"
     dir_log = f"{KeyWord.key_log.value}"
@@ -255,22 +281,28 @@ class ConfLeap(enum.Enum):
 
     # surrogate: no associated config file:
     leap_input = f"{KeyWord.key_input.value}"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     leap_primer = f"{KeyWord.key_primer.value}"
 
     # TODO: Rename, use `global` instead:
     #       FT_23_37_64_44.global_vs_local.md
     #       FT_89_41_35_82.conf_leap.md
     leap_client = f"{KeyWord.key_client.value}"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # TODO: Remove, use `local` instead:
     #       FT_23_37_64_44.global_vs_local.md
     #       FT_89_41_35_82.conf_leap.md
     leap_env = f"{KeyWord.key_env.value}"
 
+    # Optional layers outside the repo (for host-specific tuning without committing it):
+    #       FT_23_37_64_44.global_vs_local.md
+    #       FT_89_41_35_82.conf_leap.md
+    leap_host = f"{KeyWord.key_host.value}"
+    leap_user = f"{KeyWord.key_user.value}"
+
     # surrogate: no associated config file:
     leap_derived = f"{KeyWord.key_derived.value}"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # TODO: Consolidate `leap_global` and `leap_local` are not really `ConfLeap`-s.
     #       Instead, see `leap_client` and `leap_env`.
     leap_global = f"{KeyWord.key_global.value}"
@@ -283,7 +315,7 @@ class PrimerRuntime(enum.Enum):
     """
 
     runtime_proto = "proto"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     runtime_meta = "meta"
 
 
@@ -293,7 +325,7 @@ class EntryFunc(enum.Enum):
 
     FT_25_62_13_55.entry_func.md
     """
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # FT_85_17_35_21.boot_env.md
     func_boot_env = "boot_env"
 
@@ -306,7 +338,7 @@ class EntryFunc(enum.Enum):
 
     # Direct CLI execution via (e.g.) `./proto_kernel.py` executing `__main__` section:
     func_run_main = "run_main"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 class ExecMode(enum.Enum):
     """
@@ -315,7 +347,7 @@ class ExecMode(enum.Enum):
 
     FT_31_04_70_72.exec_mode.md
     """
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     mode_cli = "cli"
 
     mode_api = "api"
@@ -327,7 +359,7 @@ class SubCommand(enum.Enum):
 
     See FT_11_27_29_83.sub_command.md
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     command_boot = "boot"
 
     # TODO: This is not used yet. It should call "some_module:some_main".
@@ -336,7 +368,7 @@ class SubCommand(enum.Enum):
     # FT_42_03_79_73.reboot_env.md
     # UC_61_12_90_59.upgrade_venv.md
     command_reboot = "reboot"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # FT_00_22_19_59.derived_config.md
     # FT_19_44_42_19.effective_config.md
     command_eval = "eval"
@@ -349,7 +381,7 @@ class SubCommand(enum.Enum):
 
 # TODO: TODO_31_76_38_60.sub_command_for_shell.md: remove "command" (when replaced by `shell_mode` or `run_mode`):
 class CommandAction(enum.Enum):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     action_command = "command"
 
 
@@ -358,7 +390,7 @@ class FilesystemObject(enum.Enum):
     fs_object_file = "file"
 
     fs_object_dir = "dir"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     fs_object_symlink = "symlink"
 
 
@@ -372,7 +404,7 @@ class PathType(enum.Enum):
 
     # Absolute path:
     path_abs = "abs_path"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 class EnvVar(enum.Enum):
     """
@@ -382,7 +414,7 @@ class EnvVar(enum.Enum):
     # FT_87_17_49_36.kernel_copy.md
     # TODO: TODO_24_49_18_17.fix_proto_code_terms.md: rename to `*_KERNEL_COPY` or `*_PROTO_KERNEL`?
     var_PROTOPRIMER_PROTO_CODE = "PROTOPRIMER_PROTO_CODE"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # FT_58_74_37_70.boot_vs_start.md
     # Selects the main function to run, for example, "sup_module.sub_module:some_main".
     var_PROTOPRIMER_MAIN_FUNC = "PROTOPRIMER_MAIN_FUNC"
@@ -394,9 +426,30 @@ class EnvVar(enum.Enum):
     var_PROTOPRIMER_CONF_BASENAME = "PROTOPRIMER_CONF_BASENAME"
 
     var_PROTOPRIMER_START_ID = "PROTOPRIMER_START_ID"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     var_PROTOPRIMER_VENV_DRIVER = "PROTOPRIMER_VENV_DRIVER"
 
+    # FT_73_95_31_84.venv_driver.md: shared host-level dir with `uv` (overrides `ConfField.field_uv_tools_dir_abs_path`):
+    var_PROTOPRIMER_UV_TOOLS_DIR = "PROTOPRIMER_UV_TOOLS_DIR"
+
+    # FT_23_37_64_44.global_vs_local.md: path to the conf file for `ConfLeap.leap_host`:
+    var_PROTOPRIMER_HOST_CONF = "PROTOPRIMER_HOST_CONF"
+
+    # FT_38_73_38_52.log_verbosity.md: write the file log from a background thread (see `QueuedLogHandler`):
+    var_PROTOPRIMER_ASYNC_FILE_LOG = "PROTOPRIMER_ASYNC_FILE_LOG"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    # FT_38_73_38_52.log_verbosity.md: one of the `LogFormat` values for the file log:
+    var_PROTOPRIMER_FILE_LOG_FORMAT = "PROTOPRIMER_FILE_LOG_FORMAT"
+
+    # UC_36_72_11_12.pipe_to_execute_with_activated_venv.md: execute `--command` without interactive shell (see `ShellDriverBase.exec_command`):
+    var_PROTOPRIMER_DIRECT_EXEC = "PROTOPRIMER_DIRECT_EXEC"
+
+    # FT_75_87_82_46.entry_script.md: set by the fast launcher entry script on a miss (see `write_launch_record`):
+    var_PROTOPRIMER_LAUNCH_RECORD = "PROTOPRIMER_LAUNCH_RECORD"
+
+    # FT_73_95_31_84.venv_driver.md: the file descriptor of the `venv` lock passed to the next `python` (see `hold_venv_lock`):
+    var_PROTOPRIMER_VENV_LOCK_FD = "PROTOPRIMER_VENV_LOCK_FD"
+
     # TODO: Consider splitting `is_test_run()` and `PROTOPRIMER_MOCKED_RESTART` into different `feature_story`-ies.
     var_PROTOPRIMER_MOCKED_RESTART = "PROTOPRIMER_MOCKED_RESTART"
     """
@@ -407,7 +460,7 @@ class EnvVar(enum.Enum):
 class ConfDst(enum.Enum):
     """
     See FT_23_37_64_44.global_vs_local.md
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     TODO: Is this supposed to be called conf src (instead of `conf dst`)?
     """
 
@@ -416,7 +469,7 @@ class ConfDst(enum.Enum):
     dst_global = "gconf"
 
     dst_local = "lconf"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 class ValueName(enum.Enum):
 
@@ -426,6 +479,10 @@ class ValueName(enum.Enum):
 
     value_final_state = "final_state"
 
+    value_watch_conf = "watch_conf"
+
+    value_conf_format = "conf_format"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     value_py_exec = "py_exec"
 
     value_primer_runtime = "primer_runtime"
@@ -437,15 +494,17 @@ class ValueName(enum.Enum):
     value_install_specs = "install_specs"
 
     value_install_group = "install_group"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     value_install_extras = "install_extras"
 
     value_extra_command_args = "extra_command_args"
 
+    value_install_mode = "install_mode"
+
     value_venv_driver = "venv_driver"
 
     value_python = "python"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     value_version = "version"
 
     value_file_basename = "file_basename"
@@ -461,13 +520,13 @@ class PathName(enum.Enum):
     # TODO: use another suffix (not `dir`) as `dir` is specified by `FilesystemObject.fs_object_dir`
     # TODO: make use of it in naming states (instead of using only `path_proto_code`):
     path_proto_dir = "proto_dir"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # TODO: Add a `feature_topic` for `ref root` (explaining how everything is relative to it):
     path_ref_root = "ref_root"
 
     # See FT_89_41_35_82.conf_leap.md / primer
     path_primer_conf = f"{ConfLeap.leap_primer.value}_conf"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # TODO: Instead of `path_conf_client`, use `path_global_conf`:
     # See FT_89_41_35_82.conf_leap.md / client
     path_conf_client = f"conf_{ConfLeap.leap_client.value}"
@@ -478,6 +537,12 @@ class PathName(enum.Enum):
     path_conf_env = f"conf_{ConfLeap.leap_env.value}"
     path_local_conf = f"{ConfLeap.leap_local.value}_conf"
 
+    # See FT_89_41_35_82.conf_leap.md / host
+    path_host_conf = f"{ConfLeap.leap_host.value}_conf"
+
+    # See FT_89_41_35_82.conf_leap.md / user
+    path_user_conf = f"{ConfLeap.leap_user.value}_conf"
+
     # TODO: Rename to "lconf_link" (otherwise, `local_conf_symlink_rel_path` does not reflect anything about `lconf` or `leap_env`):
     path_link_name = "link_name"
 
@@ -502,9 +567,13 @@ class PathName(enum.Enum):
 
     path_build_root = "build_root"
 
+    path_uv_tools = "uv_tools"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    path_required_uv = "required_uv"
+
 
 class ParsedArg(enum.Enum):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     name_selected_env_dir = f"{PathName.path_selected_env.value}_{FilesystemObject.fs_object_dir.value}"
 
     name_command = f"{KeyWord.key_run.value}_{CommandAction.action_command.value}"
@@ -513,10 +582,64 @@ class ParsedArg(enum.Enum):
 
     name_final_state = str(ValueName.value_final_state.value)
 
+    name_watch_conf = str(ValueName.value_watch_conf.value)
+
+    name_conf_format = str(ValueName.value_conf_format.value)
+
 
 class LogLevel(enum.Enum):
     name_quiet = "quiet"
     name_verbose = "verbose"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+class LogFormat(enum.Enum):
+    """
+    See `EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT`.
+    """
+
+    # See `DefaultFileLogFormatter`:
+    log_format_text = "text"
+
+    # See `JsonFileLogFormatter`:
+    log_format_json = "json"
+
+
+class EffectiveConfigFormat(enum.Enum):
+    """
+    Output formats for the effective config (see `SubCommand.command_eval`).
+
+    See: FT_19_44_42_19.effective_config.md
+    """
+
+    # Human-readable output per `ConfLeap` (printed as each `ConfLeap` is loaded):
+    format_text = "text"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    # Single JSON document (see `build_effective_conf_document`):
+    format_json = "json"
+
+    # One JSON document per line - one line per field (see `describe_field_provenance`):
+    format_ndjson = "ndjson"
+
+
+class FieldProvenance(enum.Enum):
+    """
+    Explains where the effective value of a top-level `ConfLeap.*` field comes from.
+    """
+
+    # The field is set in the `ConfLeap.*` data and its value is effective:
+    provenance_set = enum.auto()
+
+    # The field is set in the `ConfLeap.*` data, but it is overridden by another `ConfLeap.*` (see `MergedConfData`):
+    provenance_overridden = enum.auto()
+
+    # The field is missing in the `ConfLeap.*` data, but the value set by another `ConfLeap.*` applies:
+    provenance_inherited = enum.auto()
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    # The field is not set by any `ConfLeap.*` - the default applies:
+    provenance_defaulted = enum.auto()
+
+    # The field is set in the `ConfLeap.*` data, but it is not used by the `protoprimer` (see `get_used_conf_field_names`):
+    provenance_unused = enum.auto()
 
 
 class SyntaxArg:
@@ -525,14 +648,14 @@ class SyntaxArg:
     arg_help = f"--{KeyWord.key_help.value}"
 
     arg_final_state = f"--{ParsedArg.name_final_state.value}"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     arg_c = f"-{CommandAction.action_command.value[0]}"
     arg_command = f"--{CommandAction.action_command.value}"
 
     arg_q = f"-{LogLevel.name_quiet.value[0]}"
     arg_quiet = f"--{LogLevel.name_quiet.value}"
     dest_quiet = f"{ValueName.value_stderr_log_level.value}_{LogLevel.name_quiet.value}"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     arg_v = f"-{LogLevel.name_verbose.value[0]}"
     arg_verbose = f"--{LogLevel.name_verbose.value}"
     dest_verbose = f"{ValueName.value_stderr_log_level.value}_{LogLevel.name_verbose.value}"
@@ -540,6 +663,10 @@ class SyntaxArg:
     arg_e = f"-{KeyWord.key_env.value[0]}"
     arg_env = f"--{KeyWord.key_env.value}"
 
+    arg_watch = f"--{KeyWord.key_watch.value}"
+
+    arg_format = f"--{KeyWord.key_format.value}"
+
 
 class SelectorFunc(enum.Enum):
     """
@@ -610,15 +737,27 @@ class ConfField(enum.Enum):
     # state_venv_driver_inited:
     field_venv_driver = f"{ValueName.value_venv_driver.value}"
 
+    # FT_73_95_31_84.venv_driver.md: shared host-level dir with `uv` (instead of the one under `local_cache`):
+    # state_venv_driver_prepared:
+    field_uv_tools_dir_abs_path = f"{PathName.path_uv_tools.value}_{FilesystemObject.fs_object_dir.value}_{PathType.path_abs.value}"
+
+    # FT_73_95_31_84.venv_driver.md: pinned `uv` version (instead of the latest one):
+    # state_venv_driver_prepared:
+    field_required_uv_version = f"{PathName.path_required_uv.value}_{ValueName.value_version.value}"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # state_version_constraints_file_basename_inited:
     field_version_constraints_file_basename = f"{ValueName.value_version_constraints.value}_{ValueName.value_file_basename.value}"
 
     # parent of `field_build_root_dir_rel_path` & `field_install_extras`:
     # state_project_descriptors_inited:
     field_project_descriptors = f"{ValueName.value_project_descriptors.value}"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     field_install_specs = f"{ValueName.value_install_specs.value}"
 
+    # FT_46_37_27_11.editable_install.md: how `install_specs` are resolved and installed (see `InstallMode`):
+    # state_protoprimer_package_installed:
+    field_install_mode = f"{ValueName.value_install_mode.value}"
+
     ####################################################################################################################
 
     # child of `field_project_descriptors`:
@@ -626,7 +765,7 @@ class ConfField(enum.Enum):
 
     # child of `field_project_descriptors`:
     field_install_extras = f"{ValueName.value_install_extras.value}"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # child of `field_project_descriptors`:
     field_install_group = f"{ValueName.value_install_group.value}"
 
@@ -637,7 +776,7 @@ class ConfField(enum.Enum):
 
 
 ########################################################################################################################
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 class VenvDriverBase:
 
@@ -649,7 +788,7 @@ class VenvDriverBase:
         local_venv_dir_abs_path: str,
     ) -> bool:
         return self.get_type() == get_venv_type(local_venv_dir_abs_path)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def create_venv(
         self,
         local_venv_dir_abs_path: str,
@@ -662,7 +801,7 @@ class VenvDriverBase:
         local_venv_dir_abs_path: str,
     ) -> None:
         raise NotImplementedError()
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def install_packages(
         self,
         selected_python_file_abs_path: str,
@@ -670,14 +809,14 @@ class VenvDriverBase:
     ):
         """
         Install packages (which are not necessarily listed in any of the `pyproject.toml` files).
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         This is against UC_78_58_06_54.no_stray_packages.md (in relation to the main `venv`),
         but it is required for separate non-main `venv`-s created for tools (like `uv`).
         """
         sub_proc_args: list[str] = self.get_install_dependencies_cmd(selected_python_file_abs_path)
         sub_proc_args.extend(given_packages)
 
-        logger.info(f"installing packages: {' '.join(sub_proc_args)}")
+        logger.info("installing packages: %s", " ".join(sub_proc_args))
 
         subprocess.check_call(sub_proc_args)
 
@@ -699,26 +838,6 @@ class VenvDriverBase:
         *   FT_46_37_27_11.editable_install.md
         """
 
-        editable_project_install_args = []
-        for project_descriptor in project_descriptors:
-            project_build_root_dir_rel_path = project_descriptor[ConfField.field_build_root_dir_rel_path.value]
-            project_build_root_dir_abs_path = os.path.join(
-                ref_root_dir_abs_path,
-                project_build_root_dir_rel_path,
-            )
-
-            install_extras: list[str]
-            if ConfField.field_install_extras.value in project_descriptor:
-                install_extras = project_descriptor[ConfField.field_install_extras.value]
-            else:
-                install_extras = []
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-            editable_project_install_args.append("--editable")
-            if len(install_extras) > 0:
-                editable_project_install_args.append(f"{project_build_root_dir_abs_path}[{','.join(install_extras)}]")
-            else:
-                editable_project_install_args.append(f"{project_build_root_dir_abs_path}")
-
         sub_proc_args = self.get_install_dependencies_cmd(venv_python_file_abs_path)
         sub_proc_args.extend(
             [
@@ -728,99 +847,309 @@ class VenvDriverBase:
         )
         sub_proc_args.extend(extra_command_args)
 
-        sub_proc_args.extend(editable_project_install_args)
-
-        logger.info(f"installing projects: {' '.join(sub_proc_args)}")
-
-        env_vars = os.environ.copy()
+        sub_proc_args.extend(
+            self._get_editable_project_install_args(
+                ref_root_dir_abs_path,
+                project_descriptors,
+            )
+        )
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-        # Adding `venv/bin` is required for `uv` to access `keyring`.
-        # See: FT_17_41_51_83.private_artifact_repo.md
-        env_vars[ConfConstInput.ext_env_var_PATH] = f"{os.path.dirname(venv_python_file_abs_path)}:{env_vars[ConfConstInput.ext_env_var_PATH]}"
+        logger.info("installing projects: %s", " ".join(sub_proc_args))
 
         subprocess.check_call(
             sub_proc_args,
-            env=env_vars,
+            env=self._get_install_env_vars(venv_python_file_abs_path),
         )
 
-    def get_install_dependencies_cmd(
+    def resolve_dependencies(
         self,
+        ref_root_dir_abs_path: str,
         venv_python_file_abs_path: str,
-    ) -> list[str]:
-        raise NotImplementedError()
+        constraints_file_abs_path: str,
+        project_descriptors: list[dict],
+        extra_command_args: list[str],
+        resolved_file_abs_path: str,
+        is_hashed: bool = False,
+    ) -> None:
+        """
+        Resolve all projects from the `project_descriptors` by a single resolver run (without installing them).
 
-    def pin_versions(
+        The `resolved_file_abs_path` is written in the requirements file format with exact pins
+        (and `--editable` entries for the projects) to be used by `install_resolved_dependencies`.
+        If `is_hashed`, each pin also lists `--hash` options (see `InstallMode.install_locked`).
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        See also: FT_46_37_27_11.editable_install.md
+        """
+        logger.info(f"resolving projects into [{resolved_file_abs_path}]")
+        requirement_args: list[str] = self._get_editable_project_install_args(
+            ref_root_dir_abs_path,
+            project_descriptors,
+        )
+        self._resolve_dependencies_impl(
+            requirement_args,
+            venv_python_file_abs_path,
+            constraints_file_abs_path,
+            extra_command_args,
+            resolved_file_abs_path,
+            is_hashed,
+        )
+
+    def _resolve_dependencies_impl(
         self,
+        requirement_args: list[str],
         venv_python_file_abs_path: str,
         constraints_file_abs_path: str,
+        extra_command_args: list[str],
+        resolved_file_abs_path: str,
+        is_hashed: bool,
     ) -> None:
-        logger.info(f"generating version constraints file [{constraints_file_abs_path}]")
-        with open(constraints_file_abs_path, "w") as f:
-            subprocess.check_call(
-                self._get_pin_versions_cmd(venv_python_file_abs_path),
-                stdout=f,
-            )
+        raise NotImplementedError()
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-    def _get_pin_versions_cmd(
+    def install_resolved_dependencies(
         self,
         venv_python_file_abs_path: str,
-    ) -> list[str]:
-        raise NotImplementedError()
-
-
-class VenvDriverPip(VenvDriverBase):
-
-    def __init__(
-        self,
-        required_python_version: str,
-        selected_python_file_abs_path: str,
-        state_local_venv_dir_abs_path_inited: str,
-    ):
-        self.required_python_version: str = required_python_version
-        self.selected_python_file_abs_path: str = selected_python_file_abs_path
-        self.state_local_venv_dir_abs_path_inited: str = state_local_venv_dir_abs_path_inited
+        resolved_file_abs_path: str,
+        extra_command_args: list[str],
+    ) -> None:
+        """
+        Install exactly the set from `resolve_dependencies` (the resolver is not run again).
+        """
+        sub_proc_args = self.get_install_dependencies_cmd(venv_python_file_abs_path)
+        sub_proc_args.extend(
+            [
+                "--no-deps",
+                "--requirement",
+                resolved_file_abs_path,
+            ]
+        )
+        sub_proc_args.extend(extra_command_args)
 
-    def get_type(self) -> VenvDriverType:
-        return VenvDriverType.venv_pip
+        logger.info("installing resolved projects: %s", " ".join(sub_proc_args))
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-    def _create_venv_impl(
+        subprocess.check_call(
+            sub_proc_args,
+            env=self._get_install_env_vars(venv_python_file_abs_path),
+        )
+
+    def install_locked_dependencies(
         self,
-        # TODO: Do we need this arg if we have `state_local_venv_dir_abs_path_inited`?
-        local_venv_dir_abs_path: str,
+        ref_root_dir_abs_path: str,
+        venv_python_file_abs_path: str,
+        lock_file_abs_path: str,
+        project_descriptors: list[dict],
+        extra_command_args: list[str],
     ) -> None:
-        subprocess.check_call(
+        """
+        Install the lock file (see `write_install_lock_file`) and the projects without any resolver run.
+
+        The projects are installed separately because
+        `--editable` entries are not allowed with `--require-hashes`.
+        """
+        sub_proc_args = self.get_install_dependencies_cmd(venv_python_file_abs_path)
+        sub_proc_args.extend(
             [
-                self.selected_python_file_abs_path,
-                "-m",
-                ConfConstEnv.default_dir_rel_path_venv,
-                local_venv_dir_abs_path,
+                "--no-deps",
+                "--require-hashes",
+                "--requirement",
+                lock_file_abs_path,
             ]
         )
-        # Use the python executable within the created `venv`:
-        venv_python_executable = os.path.join(
-            local_venv_dir_abs_path,
-            ConfConstGeneral.file_rel_path_venv_python,
+        sub_proc_args.extend(extra_command_args)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        logger.info("installing locked packages: %s", " ".join(sub_proc_args))
+
+        subprocess.check_call(
+            sub_proc_args,
+            env=self._get_install_env_vars(venv_python_file_abs_path),
+        )
+
+        sub_proc_args = self.get_install_dependencies_cmd(venv_python_file_abs_path)
+        sub_proc_args.append("--no-deps")
+        sub_proc_args.extend(extra_command_args)
+        sub_proc_args.extend(
+            self._get_editable_project_install_args(
+                ref_root_dir_abs_path,
+                project_descriptors,
+            )
         )
+
+        logger.info("installing locked projects: %s", " ".join(sub_proc_args))
+
         subprocess.check_call(
-            [
-                venv_python_executable,
-                "-m",
-                "pip",
-                "install",
-                "--upgrade",
-                "pip",
-            ]
+            sub_proc_args,
+            env=self._get_install_env_vars(venv_python_file_abs_path),
         )
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-    def get_install_dependencies_cmd(
+    def sync_resolved_dependencies(
         self,
-        # TODO: Do we need this arg if we have `state_local_venv_dir_abs_path_inited`?
         venv_python_file_abs_path: str,
-    ) -> list[str]:
-        return [
-            venv_python_file_abs_path,
-            "-m",
-            "pip",
+        resolved_file_abs_path: str,
+        extra_command_args: list[str],
+    ) -> None:
+        """
+        Make `venv` contain exactly the set from `resolve_dependencies`:
+        install missing packages and uninstall any other (stray) ones
+        except the `venv` bootstrap packages (see `ConfConstGeneral.venv_bootstrap_package_names`).
+
+        See also: UC_78_58_06_54.no_stray_packages.md
+        """
+        # NOTE: No `pip sync` or `uv pip sync` - the latter also uninstalls the `venv` bootstrap packages.
+        self.install_resolved_dependencies(
+            venv_python_file_abs_path,
+            resolved_file_abs_path,
+            extra_command_args,
+        )
+
+        installed_packages: list[dict] = json.loads(
+            subprocess.check_output(
+                self._get_list_packages_cmd(venv_python_file_abs_path),
+                universal_newlines=True,
+            )
+        )
+        stray_package_names: list[str] = get_stray_package_names(
+            installed_packages,
+            resolved_file_abs_path,
+        )
+        if len(stray_package_names) == 0:
+            return
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        sub_proc_args = self._get_uninstall_packages_cmd(venv_python_file_abs_path)
+        sub_proc_args.extend(stray_package_names)
+
+        logger.info("uninstalling stray packages: %s", " ".join(sub_proc_args))
+
+        subprocess.check_call(sub_proc_args)
+
+    def _get_list_packages_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+        """
+        The command to list installed packages in the `pip list --format=json` format.
+        """
+        raise NotImplementedError()
+
+    def _get_uninstall_packages_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+        raise NotImplementedError()
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    @staticmethod
+    def _get_editable_project_install_args(
+        ref_root_dir_abs_path: str,
+        project_descriptors: list[dict],
+    ) -> list[str]:
+        editable_project_install_args = []
+        for project_descriptor in project_descriptors:
+            project_build_root_dir_rel_path = project_descriptor[ConfField.field_build_root_dir_rel_path.value]
+            project_build_root_dir_abs_path = os.path.join(
+                ref_root_dir_abs_path,
+                project_build_root_dir_rel_path,
+            )
+
+            install_extras: list[str]
+            if ConfField.field_install_extras.value in project_descriptor:
+                install_extras = project_descriptor[ConfField.field_install_extras.value]
+            else:
+                install_extras = []
+
+            editable_project_install_args.append("--editable")
+            if len(install_extras) > 0:
+                editable_project_install_args.append(f"{project_build_root_dir_abs_path}[{','.join(install_extras)}]")
+            else:
+                editable_project_install_args.append(f"{project_build_root_dir_abs_path}")
+        return editable_project_install_args
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    @staticmethod
+    def _get_install_env_vars(
+        venv_python_file_abs_path: str,
+    ) -> dict[str, str]:
+        env_vars = os.environ.copy()
+
+        # Adding `venv/bin` is required for `uv` to access `keyring`.
+        # See: FT_17_41_51_83.private_artifact_repo.md
+        env_vars[ConfConstInput.ext_env_var_PATH] = f"{os.path.dirname(venv_python_file_abs_path)}:{env_vars[ConfConstInput.ext_env_var_PATH]}"
+        return env_vars
+
+    def get_install_dependencies_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+        raise NotImplementedError()
+
+    def pin_versions(
+        self,
+        venv_python_file_abs_path: str,
+        constraints_file_abs_path: str,
+    ) -> None:
+        logger.info(f"generating version constraints file [{constraints_file_abs_path}]")
+        with open(constraints_file_abs_path, "w") as f:
+            subprocess.check_call(
+                self._get_pin_versions_cmd(venv_python_file_abs_path),
+                stdout=f,
+            )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _get_pin_versions_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+        raise NotImplementedError()
+
+
+class VenvDriverPip(VenvDriverBase):
+
+    def __init__(
+        self,
+        required_python_version: str,
+        selected_python_file_abs_path: str,
+        state_local_venv_dir_abs_path_inited: str,
+    ):
+        self.required_python_version: str = required_python_version
+        self.selected_python_file_abs_path: str = selected_python_file_abs_path
+        self.state_local_venv_dir_abs_path_inited: str = state_local_venv_dir_abs_path_inited
+
+    def get_type(self) -> VenvDriverType:
+        return VenvDriverType.venv_pip
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _create_venv_impl(
+        self,
+        # TODO: Do we need this arg if we have `state_local_venv_dir_abs_path_inited`?
+        local_venv_dir_abs_path: str,
+    ) -> None:
+        subprocess.check_call(
+            [
+                self.selected_python_file_abs_path,
+                "-m",
+                ConfConstEnv.default_dir_rel_path_venv,
+                local_venv_dir_abs_path,
+            ]
+        )
+        # Use the python executable within the created `venv`:
+        venv_python_executable = os.path.join(
+            local_venv_dir_abs_path,
+            ConfConstGeneral.file_rel_path_venv_python,
+        )
+        subprocess.check_call(
+            [
+                venv_python_executable,
+                "-m",
+                "pip",
+                "install",
+                "--upgrade",
+                "pip",
+            ]
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_install_dependencies_cmd(
+        self,
+        # TODO: Do we need this arg if we have `state_local_venv_dir_abs_path_inited`?
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+        return [
+            venv_python_file_abs_path,
+            "-m",
+            "pip",
             "install",
         ]
 
@@ -837,6 +1166,90 @@ class VenvDriverPip(VenvDriverBase):
             "--exclude-editable",
         ]
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _resolve_dependencies_impl(
+        self,
+        requirement_args: list[str],
+        venv_python_file_abs_path: str,
+        constraints_file_abs_path: str,
+        extra_command_args: list[str],
+        resolved_file_abs_path: str,
+        is_hashed: bool,
+    ) -> None:
+        # There is no `pip compile` - use the installation report of a dry run instead:
+        report_file_abs_path = f"{resolved_file_abs_path}.json"
+        sub_proc_args = self.get_install_dependencies_cmd(venv_python_file_abs_path)
+        sub_proc_args.extend(
+            [
+                "--dry-run",
+                # Report the entire resolved set (not only packages missing in the `venv`):
+                "--ignore-installed",
+                "--quiet",
+                "--report",
+                report_file_abs_path,
+                "--constraint",
+                constraints_file_abs_path,
+            ]
+        )
+        sub_proc_args.extend(extra_command_args)
+        sub_proc_args.extend(requirement_args)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        subprocess.check_call(
+            sub_proc_args,
+            env=self._get_install_env_vars(venv_python_file_abs_path),
+        )
+
+        resolved_lines: list[str] = []
+        for install_item in read_json_file(report_file_abs_path)["install"]:
+            download_info: dict = install_item["download_info"]
+            package_metadata: dict = install_item["metadata"]
+            if download_info.get("dir_info", {}).get("editable", False):
+                resolved_lines.append(f"--editable {urllib.request.url2pathname(urllib.parse.urlparse(download_info['url']).path)}")
+            else:
+                resolved_line: str
+                if install_item.get("is_direct", False):
+                    resolved_line = f"{package_metadata['name']} @ {download_info['url']}"
+                else:
+                    resolved_line = f"{package_metadata['name']}=={package_metadata['version']}"
+                if is_hashed:
+                    # NOTE: Unlike `uv`, `pip` reports the hash of the selected archive only (for this platform):
+                    archive_info: dict = download_info.get("archive_info", {})
+                    archive_hashes: dict = archive_info.get("hashes", {})
+                    if len(archive_hashes) == 0 and "hash" in archive_info:
+                        hash_name, hash_value = archive_info["hash"].split("=", 1)
+                        archive_hashes = {hash_name: hash_value}
+                    for hash_name, hash_value in sorted(archive_hashes.items()):
+                        resolved_line += f" --hash={hash_name}:{hash_value}"
+                resolved_lines.append(resolved_line)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        write_text_file(
+            resolved_file_abs_path,
+            "".join(f"{resolved_line}\n" for resolved_line in resolved_lines),
+        )
+
+    def _get_list_packages_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+        return [
+            venv_python_file_abs_path,
+            "-m",
+            "pip",
+            "list",
+            "--format=json",
+        ]
+
+    def _get_uninstall_packages_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+        return [
+            venv_python_file_abs_path,
+            "-m",
+            "pip",
+            "uninstall",
+            "--yes",
+        ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 class VenvDriverUv(VenvDriverBase):
 
@@ -846,17 +1259,35 @@ class VenvDriverUv(VenvDriverBase):
         selected_python_file_abs_path: str,
         state_local_venv_dir_abs_path_inited: str,
         state_local_cache_dir_abs_path_inited: str,
+        uv_tools_dir_abs_path: str | None = None,
+        required_uv_version: str | None = None,
     ):
         self.required_python_version: str = required_python_version
         self.selected_python_file_abs_path: str = selected_python_file_abs_path
         self.state_local_venv_dir_abs_path_inited: str = state_local_venv_dir_abs_path_inited
-        self.uv_venv_abs_path: str = os.path.join(
-            # TODO: make it relative to "cache/venv" specifically (instead of directly to "cache"):
-            state_local_cache_dir_abs_path_inited,
-            ConfConstEnv.default_dir_rel_path_venv,
-            # TODO: take from config (or default constant):
-            "uv.venv",
-        )
+        self.uv_tools_dir_abs_path: str | None = uv_tools_dir_abs_path
+        self.required_uv_version: str | None = required_uv_version
+
+        if self.uv_tools_dir_abs_path is None:
+            self.uv_venv_abs_path: str = os.path.join(
+                # TODO: make it relative to "cache/venv" specifically (instead of directly to "cache"):
+                state_local_cache_dir_abs_path_inited,
+                ConfConstEnv.default_dir_rel_path_venv,
+                # TODO: take from config (or default constant):
+                ConfConstGeneral.file_basename_uv_venv,
+            )
+        elif self.required_uv_version is None:
+            # FT_73_95_31_84.venv_driver.md: shared host-level `uv` (the symlink to the `venv` keyed by `uv` version):
+            self.uv_venv_abs_path: str = os.path.join(
+                self.uv_tools_dir_abs_path,
+                ConfConstGeneral.file_basename_uv_venv,
+            )
+        else:
+            # FT_73_95_31_84.venv_driver.md: shared host-level `uv` (the `venv` keyed by the pinned `uv` version):
+            self.uv_venv_abs_path: str = os.path.join(
+                self.uv_tools_dir_abs_path,
+                get_versioned_uv_venv_basename(self.required_uv_version),
+            )
         self.uv_exec_abs_path: str = os.path.join(
             self.uv_venv_abs_path,
             ConfConstGeneral.file_rel_path_venv_uv,
@@ -870,28 +1301,16 @@ class VenvDriverUv(VenvDriverBase):
         return VenvDriverType.venv_uv
 
     def _ensure_uv_is_available(self):
+        if os.path.exists(self.uv_exec_abs_path) and self.uv_tools_dir_abs_path is None and self.required_uv_version is not None and get_uv_version(self.uv_exec_abs_path) != self.required_uv_version:
+            # The `uv` under `local_cache` is not keyed by version - replace it with the pinned one:
+            logger.info(f"replacing `uv` [{self.uv_venv_abs_path}] with `{ConfField.field_required_uv_version.value}` [{self.required_uv_version}]")
+            shutil.rmtree(self.uv_venv_abs_path)
+
         if not os.path.exists(self.uv_exec_abs_path):
-            # To use `VenvDriverType.venv_uv`, use `VenvDriverType.venv_pip` to install `uv` first:
-            pip_driver = VenvDriverPip(
-                required_python_version=self.required_python_version,
-                # TODO: assert python version suitable for `uv` (because this `venv` will be used to install `uv`).
-                # NOTE: Create this `venv` (to install `uv`) with whatever `python` runs now:
-                selected_python_file_abs_path=self.selected_python_file_abs_path,
-                # Instead of `self.state_local_venv_dir_abs_path_inited`,
-                # this intermediate driver uses ` self.uv_venv_abs_path`:
-                state_local_venv_dir_abs_path_inited=self.uv_venv_abs_path,
-            )
-            pip_driver.create_venv(self.uv_venv_abs_path)
-            uv_exec_venv_python_abs_path = os.path.join(
-                self.uv_venv_abs_path,
-                ConfConstGeneral.file_rel_path_venv_python,
-            )
-            pip_driver.install_packages(
-                uv_exec_venv_python_abs_path,
-                [
-                    ConfConstGeneral.name_uv_package,
-                ],
-            )
+            if self.uv_tools_dir_abs_path is None:
+                self._install_uv(self.uv_venv_abs_path)
+            else:
+                self._install_shared_uv()
         else:
             # Verify `self.uv_exec_abs_path` is functional:
             subprocess.check_call(
@@ -904,6 +1323,84 @@ class VenvDriverUv(VenvDriverBase):
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         assert os.path.isfile(self.uv_exec_abs_path)
 
+    def _install_uv(
+        self,
+        uv_venv_abs_path: str,
+    ) -> None:
+        # To use `VenvDriverType.venv_uv`, use `VenvDriverType.venv_pip` to install `uv` first:
+        pip_driver = VenvDriverPip(
+            required_python_version=self.required_python_version,
+            # TODO: assert python version suitable for `uv` (because this `venv` will be used to install `uv`).
+            # NOTE: Create this `venv` (to install `uv`) with whatever `python` runs now:
+            selected_python_file_abs_path=self.selected_python_file_abs_path,
+            # Instead of `self.state_local_venv_dir_abs_path_inited`,
+            # this intermediate driver uses `uv_venv_abs_path`:
+            state_local_venv_dir_abs_path_inited=uv_venv_abs_path,
+        )
+        pip_driver.create_venv(uv_venv_abs_path)
+        uv_exec_venv_python_abs_path = os.path.join(
+            uv_venv_abs_path,
+            ConfConstGeneral.file_rel_path_venv_python,
+        )
+        pip_driver.install_packages(
+            uv_exec_venv_python_abs_path,
+            [
+                ConfConstGeneral.name_uv_package if self.required_uv_version is None else f"{ConfConstGeneral.name_uv_package}=={self.required_uv_version}",
+            ],
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _install_shared_uv(self) -> None:
+        """
+        Install `uv` once per host into `self.uv_tools_dir_abs_path` (instead of once per client repo).
+
+        The `venv` with `uv` is keyed by the installed `uv` version (e.g. `uv-0.8.0.venv`):
+        *   with `ConfField.field_required_uv_version`, the `self.uv_venv_abs_path` is the `venv` with that version,
+        *   without it, the `self.uv_venv_abs_path` symlink points to the latest version installed at the time
+            (it is not refreshed until it is removed).
+        Concurrent first-time installs (from different client repos) are serialized by a file lock.
+        """
+        with acquire_file_lock(f"{self.uv_venv_abs_path}.{ConfConstGeneral.file_ext_lock}"):
+            # Another process may have installed it while this one was waiting for the lock:
+            if os.path.exists(self.uv_exec_abs_path):
+                return
+
+            tmp_uv_venv_abs_path = f"{self.uv_venv_abs_path}.{os.getpid()}.tmp"
+            shutil.rmtree(tmp_uv_venv_abs_path, ignore_errors=True)
+            self._install_uv(tmp_uv_venv_abs_path)
+
+            # The key is the version actually installed (not the requested one):
+            uv_version: str = get_uv_version(
+                os.path.join(
+                    tmp_uv_venv_abs_path,
+                    ConfConstGeneral.file_rel_path_venv_uv,
+                )
+            )
+            if self.required_uv_version is not None and uv_version != self.required_uv_version:
+                shutil.rmtree(tmp_uv_venv_abs_path)
+                raise AssertionError(f"`{ConfField.field_required_uv_version.value}` [{self.required_uv_version}] does not match the installed `uv` version [{uv_version}]")
+            versioned_uv_venv_basename = get_versioned_uv_venv_basename(uv_version)
+            versioned_uv_venv_abs_path = os.path.join(
+                self.uv_tools_dir_abs_path,
+                versioned_uv_venv_basename,
+            )
+            if os.path.exists(versioned_uv_venv_abs_path):
+                # The same version is already installed (the symlink was removed):
+                shutil.rmtree(tmp_uv_venv_abs_path)
+            else:
+                # NOTE: Only `bin/uv` (self-contained binary) is used from this `venv` - it is safe to move it:
+                os.rename(tmp_uv_venv_abs_path, versioned_uv_venv_abs_path)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+            logger.info(f"using shared `uv` [{versioned_uv_venv_abs_path}]")
+            if self.required_uv_version is not None:
+                # The pinned `venv` is used directly (no symlink):
+                return
+            tmp_symlink_abs_path = f"{self.uv_venv_abs_path}.{os.getpid()}.link"
+            if os.path.lexists(tmp_symlink_abs_path):
+                os.remove(tmp_symlink_abs_path)
+            os.symlink(versioned_uv_venv_basename, tmp_symlink_abs_path)
+            # Atomic replacement of the symlink (if any) for the concurrent readers (without the lock):
+            os.replace(tmp_symlink_abs_path, self.uv_venv_abs_path)
+
     def _create_venv_impl(
         self,
         # TODO: Do we need this arg if we have `state_local_venv_dir_abs_path_inited`?
@@ -920,7 +1417,7 @@ class VenvDriverUv(VenvDriverBase):
                 self.required_python_version,
             ]
         )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         subprocess.check_call(
             [
                 self.uv_exec_abs_path,
@@ -932,7 +1429,7 @@ class VenvDriverUv(VenvDriverBase):
                 local_venv_dir_abs_path,
             ]
         )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def get_install_dependencies_cmd(
         self,
         # TODO: Do we need this arg if we have `state_local_venv_dir_abs_path_inited`?
@@ -952,13 +1449,13 @@ class VenvDriverUv(VenvDriverBase):
             #       a `python` exec path internal to `uv` which fails if used directly.
             self.venv_python_file_abs_path,
         ]
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _get_pin_versions_cmd(
         self,
         # TODO: Do we need this arg if we have `state_local_venv_dir_abs_path_inited`?
         venv_python_file_abs_path: str,
     ) -> list[str]:
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         self._ensure_uv_is_available()
 
         return [
@@ -973,6 +1470,89 @@ class VenvDriverUv(VenvDriverBase):
             #       a `python` exec path internal to `uv` which fails if used directly.
             self.venv_python_file_abs_path,
         ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _resolve_dependencies_impl(
+        self,
+        requirement_args: list[str],
+        venv_python_file_abs_path: str,
+        constraints_file_abs_path: str,
+        extra_command_args: list[str],
+        resolved_file_abs_path: str,
+        is_hashed: bool,
+    ) -> None:
+
+        self._ensure_uv_is_available()
+
+        # `uv pip compile` accepts requirements only via input files - one requirement (e.g. `--editable path[extras]`) per line:
+        requirements_in_lines: list[str] = []
+        for requirement_arg in requirement_args:
+            if len(requirements_in_lines) > 0 and requirements_in_lines[-1] == "--editable":
+                requirements_in_lines[-1] = f"--editable {requirement_arg}"
+            else:
+                requirements_in_lines.append(requirement_arg)
+        requirements_in_abs_path = f"{resolved_file_abs_path}.in"
+        write_text_file(
+            requirements_in_abs_path,
+            "".join(f"{requirements_in_line}\n" for requirements_in_line in requirements_in_lines),
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        sub_proc_args = [
+            self.uv_exec_abs_path,
+            "pip",
+            "compile",
+            "--python",
+            self.venv_python_file_abs_path,
+            "--quiet",
+            "--constraint",
+            constraints_file_abs_path,
+        ]
+        if is_hashed:
+            # Hashes of all archives of the pinned versions (for any platform):
+            sub_proc_args.append("--generate-hashes")
+        sub_proc_args.extend(extra_command_args)
+        sub_proc_args.extend(
+            [
+                "--output-file",
+                resolved_file_abs_path,
+                requirements_in_abs_path,
+            ]
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        subprocess.check_call(
+            sub_proc_args,
+            env=self._get_install_env_vars(venv_python_file_abs_path),
+        )
+
+    def _get_list_packages_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+
+        self._ensure_uv_is_available()
+
+        return [
+            self.uv_exec_abs_path,
+            "pip",
+            "list",
+            "--format=json",
+            "--python",
+            self.venv_python_file_abs_path,
+        ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _get_uninstall_packages_cmd(
+        self,
+        venv_python_file_abs_path: str,
+    ) -> list[str]:
+
+        self._ensure_uv_is_available()
+
+        return [
+            self.uv_exec_abs_path,
+            "pip",
+            "uninstall",
+            "--python",
+            self.venv_python_file_abs_path,
+        ]
 
 
 class VenvDriverType(enum.Enum):
@@ -985,6 +1565,28 @@ class VenvDriverType(enum.Enum):
     venv_uv = VenvDriverUv
 
 
+class InstallMode(enum.Enum):
+    """
+    See FT_46_37_27_11.editable_install.md
+    """
+
+    # Each `install_group` (in the `install_specs` order) is installed by a separate resolver run:
+    install_per_group = enum.auto()
+
+    # All `install_group`-s are resolved by a single resolver run (honoring `extra_command_args` of each),
+    # then exactly the resolved set is installed without another resolver run:
+    install_combined = enum.auto()
+
+    # Same as `install_combined`, but `venv` is synced to exactly the resolved set
+    # (stray packages are uninstalled instead of waiting for a `reboot`):
+    install_synced = enum.auto()
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    # Same as `install_combined`, but the resolved set (with hashes) is persisted into a lock file
+    # (next to the version constraints file) which is installed without any resolver run
+    # until any of the `pyproject.toml` files (or other install inputs) changes:
+    install_locked = enum.auto()
+
+
 ########################################################################################################################
 
 
@@ -994,13 +1596,145 @@ class ShellType(enum.Enum):
 
     shell_zsh = "zsh"
 
+    shell_fish = "fish"
 
+    # POSIX `sh` (e.g. `dash`):
+    shell_sh = "sh"
+
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 def remove_protoprimer_env_vars(env_vars: typing.MutableMapping[str, str]) -> None:
     """
     FT_66_02_54_56.context_isolation.md
     """
     for env_var in EnvVar:
         env_vars.pop(env_var.value, None)
+
+
+class ActivatedEnvDelta:
+    """
+    Env var changes made by sourcing the `venv` `activate` script (see `ShellDriverBase.get_activated_env_delta`).
+    """
+
+    # Shell-maintained env vars (not changed by the `activate` script)
+    # and `PS1` (the prompt is set by the init file for interactive shells only):
+    ignored_env_vars: list[str] = [
+        "_",
+        "SHLVL",
+        "PWD",
+        "OLDPWD",
+        "PS1",
+    ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def __init__(
+        self,
+        env_vars_set: dict[str, str],
+        env_vars_prepended: dict[str, str],
+        env_vars_unset: list[str],
+    ):
+        self.env_vars_set: dict[str, str] = env_vars_set
+        # Prefixes to `os.pathsep`-separated lists (e.g. `PATH`):
+        self.env_vars_prepended: dict[str, str] = env_vars_prepended
+        self.env_vars_unset: list[str] = env_vars_unset
+
+    @staticmethod
+    def from_env_vars_diff(
+        orig_env_vars: dict[str, str],
+        activated_env_vars: dict[str, str],
+    ) -> ActivatedEnvDelta:
+        env_vars_set: dict[str, str] = {}
+        env_vars_prepended: dict[str, str] = {}
+        for env_var_name, activated_value in activated_env_vars.items():
+            orig_value: str | None = orig_env_vars.get(env_var_name, None)
+            if env_var_name in ActivatedEnvDelta.ignored_env_vars or orig_value == activated_value:
+                continue
+            if orig_value and activated_value.endswith(f"{os.pathsep}{orig_value}"):
+                env_vars_prepended[env_var_name] = activated_value[: -len(f"{os.pathsep}{orig_value}")]
+            else:
+                env_vars_set[env_var_name] = activated_value
+        env_vars_unset: list[str] = [env_var_name for env_var_name in orig_env_vars if env_var_name not in activated_env_vars and env_var_name not in ActivatedEnvDelta.ignored_env_vars]
+        # The `activate` script unsets `PYTHONHOME` only if it is set:
+        if ConfConstInput.ext_env_var_PYTHONHOME not in env_vars_unset:
+            env_vars_unset.append(ConfConstInput.ext_env_var_PYTHONHOME)
+        return ActivatedEnvDelta(
+            env_vars_set=env_vars_set,
+            env_vars_prepended=env_vars_prepended,
+            env_vars_unset=env_vars_unset,
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    @staticmethod
+    def from_venv_abs_path(venv_abs_path: str) -> ActivatedEnvDelta:
+        """
+        The minimal delta (without running the `activate` script) - what it always does.
+        """
+        return ActivatedEnvDelta(
+            env_vars_set={
+                ConfConstInput.ext_env_var_VIRTUAL_ENV: venv_abs_path,
+            },
+            env_vars_prepended={
+                ConfConstInput.ext_env_var_PATH: os.path.join(
+                    venv_abs_path,
+                    ConfConstGeneral.file_rel_path_venv_bin,
+                ),
+            },
+            env_vars_unset=[
+                ConfConstInput.ext_env_var_PYTHONHOME,
+            ],
+        )
+
+    @staticmethod
+    def from_data(delta_data: dict) -> ActivatedEnvDelta:
+        return ActivatedEnvDelta(
+            env_vars_set=delta_data["env_vars_set"],
+            env_vars_prepended=delta_data["env_vars_prepended"],
+            env_vars_unset=delta_data["env_vars_unset"],
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def to_data(self) -> dict:
+        return {
+            "env_vars_set": self.env_vars_set,
+            "env_vars_prepended": self.env_vars_prepended,
+            "env_vars_unset": self.env_vars_unset,
+        }
+
+    def apply_env_vars(
+        self,
+        env_vars: dict[str, str],
+    ) -> dict[str, str]:
+        activated_env_vars: dict[str, str] = env_vars.copy()
+        for env_var_name in self.env_vars_unset:
+            activated_env_vars.pop(env_var_name, None)
+        for env_var_name, prepended_value in self.env_vars_prepended.items():
+            orig_value: str | None = activated_env_vars.get(env_var_name, None)
+            if orig_value:
+                activated_env_vars[env_var_name] = f"{prepended_value}{os.pathsep}{orig_value}"
+            else:
+                activated_env_vars[env_var_name] = prepended_value
+        activated_env_vars.update(self.env_vars_set)
+        return activated_env_vars
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_shell_lines(self) -> list[str]:
+        shell_lines: list[str] = []
+        for env_var_name in self.env_vars_unset:
+            shell_lines.append(f"unset {env_var_name}")
+        for env_var_name, prepended_value in self.env_vars_prepended.items():
+            shell_lines.append(f'export {env_var_name}={shlex.quote(prepended_value)}"${{{env_var_name}:+{os.pathsep}${env_var_name}}}"')
+        for env_var_name, env_var_value in self.env_vars_set.items():
+            shell_lines.append(f"export {env_var_name}={shlex.quote(env_var_value)}")
+        return shell_lines
+
+    def get_fish_lines(self) -> list[str]:
+        fish_lines: list[str] = []
+        for env_var_name in self.env_vars_unset:
+            fish_lines.append(f"set --erase {env_var_name}")
+        for env_var_name, prepended_value in self.env_vars_prepended.items():
+            if env_var_name.endswith("PATH"):
+                # `fish` keeps `*PATH` env vars as lists (joined by `os.pathsep` on export):
+                fish_lines.append(f"set --global --export {env_var_name} {quote_fish_arg(prepended_value)} ${env_var_name}")
+            else:
+                fish_lines.append(f"set --query {env_var_name}; and set --global --export {env_var_name} {quote_fish_arg(prepended_value + os.pathsep)}${env_var_name}; or set --global --export {env_var_name} {quote_fish_arg(prepended_value)}")
+        for env_var_name, env_var_value in self.env_vars_set.items():
+            fish_lines.append(f"set --global --export {env_var_name} {quote_fish_arg(env_var_value)}")
+        return fish_lines
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 class ShellDriverBase:
@@ -1045,24 +1779,52 @@ class ShellDriverBase:
     def write_init_file(
         self,
         venv_abs_path: str,
-    ):
-        pathlib.Path(os.path.dirname(self.get_init_file_abs_path())).mkdir(
+    ) -> bool:
+        """
+        Returns `True` if the init file was (re-)written.
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        The content depends only on `venv_abs_path`, `activate_venv`, and the cached `ActivatedEnvDelta`:
+        the existing file is reused if its content is the same (no write and no `mkdir` on every shell start).
+        """
+        init_file_abs_path: str = self.get_init_file_abs_path()
+        init_file_data: str = self.get_init_file_data(venv_abs_path)
+        if os.path.isfile(init_file_abs_path) and read_text_file(init_file_abs_path) == init_file_data:
+            return False
+
+        pathlib.Path(os.path.dirname(init_file_abs_path)).mkdir(
             parents=True,
             exist_ok=True,
         )
-        write_text_file(
-            self.get_init_file_abs_path(),
-            f"""
-# Load user settings if available:
-test -f ~/{self.get_init_file_basename()} && source ~/{self.get_init_file_basename()} || true
-# Activate `venv`:
-if [ "{str(self.activate_venv).lower()}" = "true" ]
-then
-    source {self.get_venv_activate_script_abs_path(venv_abs_path)}
-fi
-""",
+        # Parallel shells may start concurrently - each sees either the old or the new complete file:
+        write_text_file_atomically(
+            init_file_abs_path,
+            init_file_data,
         )
+        return True
+
+    def get_init_file_data(
+        self,
+        venv_abs_path: str,
+    ) -> str:
+        # POSIX `.` (not `source`) to support all `sh`-compatible shells:
+        init_file_data: str = f"""
+# Load user settings if available:
+test -f ~/{self.get_init_file_basename()} && . ~/{self.get_init_file_basename()} || true
+"""
+        if self.activate_venv:
+            init_file_data += "# Activate `venv` (see `ActivatedEnvDelta`):\n"
+            init_file_data += "\n".join(self.get_activate_lines(venv_abs_path)) + "\n"
+        return init_file_data
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_activate_lines(
+        self,
+        venv_abs_path: str,
+    ) -> list[str]:
+        activate_lines: list[str] = self.get_activated_env_delta(venv_abs_path).get_shell_lines()
+        # Same prompt as the `activate` script (`deactivate` is not defined - exit the shell instead):
+        activate_lines.append(f'[ -z "${{VIRTUAL_ENV_DISABLE_PROMPT:-}}" ] && PS1={shlex.quote(f"({os.path.basename(venv_abs_path)}) ")}"${{PS1:-}}" || true')
+        return activate_lines
+
     def configure_interactive_shell(
         self,
         has_command: bool,
@@ -1078,12 +1840,12 @@ fi
         command_line: str | None,
         venv_abs_path: str,
     ) -> int:
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         if command_line is None and not start_interactive_shell:
             return 0
 
         self.write_init_file(venv_abs_path)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         self.configure_interactive_shell(command_line is not None)
 
         self.shell_args.extend(
@@ -1101,23 +1863,165 @@ fi
                     command_line,
                 ]
             )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        flush_log_handlers()
 
         os.execve(
             self.shell_abs_path,
             self.shell_args,
             self.shell_env_vars,
         )
+
+        # When `os.execve` is mocked:
+        # noinspection PyUnreachableCode
+        return 0
+
+    def get_activated_env_vars(
+        self,
+        venv_abs_path: str,
+    ) -> dict[str, str]:
+        """
+        Computes env vars the same way as sourcing the `venv` `activate` script does (see `write_init_file`).
+        """
+        if not self.activate_venv:
+            return self.shell_env_vars.copy()
+        return self.get_activated_env_delta(venv_abs_path).apply_env_vars(self.shell_env_vars)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_activated_env_file_abs_path(self) -> str:
+        return os.path.join(
+            self.cache_dir_abs_path,
+            self.get_type().value,
+            ConfConstGeneral.activated_env_file_basename,
+        )
+
+    def get_activated_env_delta(
+        self,
+        venv_abs_path: str,
+    ) -> ActivatedEnvDelta:
+        """
+        Captures the `ActivatedEnvDelta` once per `venv` (invalidated by the `pyvenv.cfg` mtime).
+        """
+        venv_config_file_abs_path: str = os.path.join(
+            venv_abs_path,
+            ConfConstGeneral.venv_config_file_basename,
+        )
+        if not os.path.isfile(venv_config_file_abs_path):
+            # No `venv` (yet) to run its `activate` script:
+            return ActivatedEnvDelta.from_venv_abs_path(venv_abs_path)
+        venv_config_mtime_ns: int = os.stat(venv_config_file_abs_path).st_mtime_ns
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        activated_env_file_abs_path: str = self.get_activated_env_file_abs_path()
+        if os.path.isfile(activated_env_file_abs_path):
+            activated_env_data: dict = read_json_file(activated_env_file_abs_path)
+            if activated_env_data.get("venv_abs_path", None) == venv_abs_path and activated_env_data.get("venv_config_mtime_ns", None) == venv_config_mtime_ns:
+                return ActivatedEnvDelta.from_data(activated_env_data)
+
+        activated_env_delta: ActivatedEnvDelta = self.capture_activated_env_delta(venv_abs_path)
+        pathlib.Path(os.path.dirname(activated_env_file_abs_path)).mkdir(
+            parents=True,
+            exist_ok=True,
+        )
+        write_text_file_atomically(
+            activated_env_file_abs_path,
+            json.dumps(
+                {
+                    "venv_abs_path": venv_abs_path,
+                    "venv_config_mtime_ns": venv_config_mtime_ns,
+                    **activated_env_delta.to_data(),
+                },
+                indent=4,
+            ),
+        )
+        return activated_env_delta
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def capture_activated_env_delta(
+        self,
+        venv_abs_path: str,
+    ) -> ActivatedEnvDelta:
+        """
+        Runs the `activate` script by this shell (once) to diff the env vars before and after.
+        """
+        dump_env_vars_command: str = get_shell_command_line(
+            [
+                sys.executable,
+                "-I",
+                "-c",
+                "import json, os; print(json.dumps(dict(os.environ)))",
+            ]
+        )
+        logger.info("capturing activated env vars of `venv` [%s]", venv_abs_path)
+        sub_proc = subprocess.run(
+            [
+                self.shell_abs_path,
+                "-c",
+                self.get_capture_command_line(
+                    dump_env_vars_command,
+                    self.get_venv_activate_script_abs_path(venv_abs_path),
+                ),
+            ],
+            env=self.shell_env_vars,
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+        # The last two lines (ignore any output by the shell itself):
+        orig_env_vars_line, activated_env_vars_line = sub_proc.stdout.decode("utf-8").splitlines()[-2:]
+        return ActivatedEnvDelta.from_env_vars_diff(
+            json.loads(orig_env_vars_line),
+            json.loads(activated_env_vars_line),
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_capture_command_line(
+        self,
+        dump_env_vars_command: str,
+        activate_script_abs_path: str,
+    ) -> str:
+        return f"{dump_env_vars_command} && . {shlex.quote(activate_script_abs_path)} && {dump_env_vars_command}"
+
+    def exec_command(
+        self,
+        command_line: str,
+        venv_abs_path: str,
+    ) -> int:
+        """
+        Direct-exec mode (see `EnvVar.var_PROTOPRIMER_DIRECT_EXEC`):
+        unlike `run_shell`, it does not write the init file and does not start an interactive shell
+        (no `*rc`-files are sourced - only the `venv` activation is applied by `get_activated_env_vars`).
+        """
+
+        flush_log_handlers()
+
+        os.execve(
+            self.shell_abs_path,
+            [
+                self.shell_abs_path,
+                "-c",
+                command_line,
+            ],
+            self.get_activated_env_vars(venv_abs_path),
+        )
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         # When `os.execve` is mocked:
         # noinspection PyUnreachableCode
         return 0
 
 
+def is_direct_exec_enabled() -> bool:
+    """
+    See `EnvVar.var_PROTOPRIMER_DIRECT_EXEC`.
+    """
+    return str_to_bool(
+        os.getenv(
+            EnvVar.var_PROTOPRIMER_DIRECT_EXEC.value,
+            ConfConstInput.default_PROTOPRIMER_DIRECT_EXEC,
+        )
+    )
+
+
 class ShellDriverBash(ShellDriverBase):
 
     def get_type(self) -> ShellType:
         return ShellType.shell_bash
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def get_init_file_basename(self):
         return ".bashrc"
 
@@ -1127,65 +2031,161 @@ class ShellDriverBash(ShellDriverBase):
     ) -> None:
         self.shell_args.extend(
             [
-                # `bash` uses explicit override for `.bashrc`:
-                "--init-file",
-                self.get_init_file_abs_path(),
+                # `bash` uses explicit override for `.bashrc`:
+                "--init-file",
+                self.get_init_file_abs_path(),
+            ]
+        )
+
+
+class ShellDriverZsh(ShellDriverBase):
+
+    def get_type(self) -> ShellType:
+        return ShellType.shell_zsh
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_init_file_basename(self):
+        return ".zshrc"
+
+    def configure_interactive_shell(
+        self,
+        has_command: bool,
+    ) -> None:
+        if not sys.stdin.closed and not sys.stdin.isatty() and not has_command:
+            # Unlike `bash`, `zsh` reads `tty` instead of `stdin` (for UI control) unless `-s` is specified:
+            self.shell_args.extend(
+                [
+                    "-s",
+                ]
+            )
+        # `zsh` takes "dot dir" path to find overridden `.zshrc`:
+        # TODO: Define in KnownEnvVar enum:
+        self.shell_env_vars["ZDOTDIR"] = os.path.dirname(self.get_init_file_abs_path())
+
+
+class ShellDriverFish(ShellDriverBase):
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_type(self) -> ShellType:
+        return ShellType.shell_fish
+
+    def get_init_file_basename(self):
+        return "config.fish"
+
+    @staticmethod
+    def get_venv_activate_script_abs_path(venv_abs_path: str) -> str:
+        return os.path.join(
+            venv_abs_path,
+            ConfConstGeneral.file_rel_path_venv_activate_fish,
+        )
+
+    def get_init_file_data(
+        self,
+        venv_abs_path: str,
+    ) -> str:
+        init_file_data: str = """
+# User settings are loaded by `fish` itself (before `--init-command`).
+"""
+        if self.activate_venv:
+            init_file_data += "# Activate `venv` (see `ActivatedEnvDelta`):\n"
+            init_file_data += "\n".join(self.get_activate_lines(venv_abs_path)) + "\n"
+        return init_file_data
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_activate_lines(
+        self,
+        venv_abs_path: str,
+    ) -> list[str]:
+        activate_lines: list[str] = self.get_activated_env_delta(venv_abs_path).get_fish_lines()
+        # Same prompt as the `activate.fish` script (`deactivate` is not defined - exit the shell instead):
+        activate_lines.extend(
+            [
+                "if not set --query VIRTUAL_ENV_DISABLE_PROMPT; and functions --query fish_prompt; and not functions --query _protoprimer_orig_fish_prompt",
+                "    functions --copy fish_prompt _protoprimer_orig_fish_prompt",
+                f"    function fish_prompt; printf '%s' {quote_fish_arg(f'({os.path.basename(venv_abs_path)}) ')}; _protoprimer_orig_fish_prompt; end",
+                "end",
+            ]
+        )
+        return activate_lines
+
+    def get_capture_command_line(
+        self,
+        dump_env_vars_command: str,
+        activate_script_abs_path: str,
+    ) -> str:
+        # `activate.fish` may fail on prompt setup when non-interactive - dump env vars regardless:
+        return f"{dump_env_vars_command}; source {quote_fish_arg(activate_script_abs_path)}; {dump_env_vars_command}"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def configure_interactive_shell(
+        self,
+        has_command: bool,
+    ) -> None:
+        self.shell_args.extend(
+            [
+                # `fish` runs init commands after its own config (and before `-c`):
+                "--init-command",
+                f"source {quote_fish_arg(self.get_init_file_abs_path())}",
             ]
         )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
-class ShellDriverZsh(ShellDriverBase):
+
+class ShellDriverSh(ShellDriverBase):
 
     def get_type(self) -> ShellType:
-        return ShellType.shell_zsh
+        return ShellType.shell_sh
 
     def get_init_file_basename(self):
-        return ".zshrc"
-
+        return ".shrc"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def configure_interactive_shell(
         self,
         has_command: bool,
     ) -> None:
-        if not sys.stdin.closed and not sys.stdin.isatty() and not has_command:
-            # Unlike `bash`, `zsh` reads `tty` instead of `stdin` (for UI control) unless `-s` is specified:
-            self.shell_args.extend(
-                [
-                    "-s",
-                ]
-            )
-        # `zsh` takes "dot dir" path to find overridden `.zshrc`:
+        # Interactive POSIX `sh` sources the file specified by `ENV`:
         # TODO: Define in KnownEnvVar enum:
-        self.shell_env_vars["ZDOTDIR"] = os.path.dirname(self.get_init_file_abs_path())
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        self.shell_env_vars["ENV"] = self.get_init_file_abs_path()
+
+
+def quote_fish_arg(arg_value: str) -> str:
+    """
+    Unlike `shlex.quote`, uses `fish` single-quote escaping (only backslash and single quote are escaped).
+    """
+    return "'" + arg_value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
 
 def _get_shell_driver(
     cache_dir_abs_path: str,
     activate_venv: bool = True,
 ) -> ShellDriverBase:
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # TODO: Define in KnownEnvVar enum:
     var_shell = "SHELL"
     shell_abs_path: str | None = os.environ.get(var_shell, None)
     shell_driver_type: type[ShellDriverBase]
 
     if shell_abs_path is None:
-        # TODO: Implement `ShellDriverSh` using `/bin/sh` instead:
         logger.warning(f"env var `{var_shell}` is not set - assuming `bash` as default")
 
         # TODO: How will work on Windows without `shutil`? And without POSIX shell?
         # noinspection PyDeprecation
         shell_abs_path = shutil.which("bash")
-        # TODO: If `bash` is not in the `PATH`, fall back to `/bin/sh` instead:
-        assert shell_abs_path is not None
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-        shell_driver_type = ShellDriverBash
+        if shell_abs_path is None:
+            # POSIX shell path:
+            shell_abs_path = "/bin/sh"
+            shell_driver_type = ShellDriverSh
+        else:
+            shell_driver_type = ShellDriverBash
     elif os.path.basename(shell_abs_path) == ShellType.shell_bash.value:
         shell_driver_type = ShellDriverBash
     elif os.path.basename(shell_abs_path) == ShellType.shell_zsh.value:
         shell_driver_type = ShellDriverZsh
+    elif os.path.basename(shell_abs_path) == ShellType.shell_fish.value:
+        shell_driver_type = ShellDriverFish
+    elif os.path.basename(shell_abs_path) in [
+        ShellType.shell_sh.value,
+        "dash",
+    ]:
+        shell_driver_type = ShellDriverSh
     else:
         raise ValueError(f"env var `{var_shell}` has unknown value [{shell_abs_path}]")
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     shell_env_vars = os.environ.copy()
     remove_protoprimer_env_vars(shell_env_vars)
     return shell_driver_type(
@@ -1198,7 +2198,7 @@ def _get_shell_driver(
 
 ########################################################################################################################
 
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 class ConfConstGeneral:
 
     # The project name = package name:
@@ -1208,7 +2208,7 @@ class ConfConstGeneral:
 
     # Concept name of the FT_90_65_67_62.proto_code.md:
     name_proto_code = "proto_code"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # The main module of the `protoprimer` package (this file):
     name_primer_kernel_module = "primer_kernel"
 
@@ -1220,17 +2220,56 @@ class ConfConstGeneral:
     # TODO: TODO_24_49_18_17.fix_proto_code_terms.md: rename to `*_KERNEL_COPY` or `*_PROTO_KERNEL`?
     # File name of the FT_90_65_67_62.proto_code.md:
     default_proto_code_basename = f"{default_proto_code_module}.py"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     python_version_file_basename = ".python-version"
 
     venv_config_file_basename = "pyvenv.cfg"
 
-    pytest_module = "pytest"
+    # See `ShellDriverBase.get_activated_env_delta`:
+    activated_env_file_basename = "activated_env.json"
 
+    pytest_module = "pytest"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     name_pip_package = "pip"
 
+    # Installed into every `venv` on creation (never uninstalled as stray packages by `InstallMode.install_synced`):
+    venv_bootstrap_package_names = [
+        name_pip_package,
+        "setuptools",
+        "wheel",
+    ]
+
     name_uv_package = "uv"
 
+    # FT_23_37_64_44.global_vs_local.md: the only fields read via `AbstractOverriddenFieldCachingStateNode`:
+    overridden_field_names = [
+        ConfField.field_required_python_version.value,
+        ConfField.field_python_selector_file_rel_path.value,
+        ConfField.field_local_venv_dir_rel_path.value,
+        ConfField.field_local_log_dir_rel_path.value,
+        ConfField.field_local_tmp_dir_rel_path.value,
+        ConfField.field_local_cache_dir_rel_path.value,
+        ConfField.field_venv_driver.value,
+        ConfField.field_uv_tools_dir_abs_path.value,
+        ConfField.field_required_uv_version.value,
+        ConfField.field_version_constraints_file_basename.value,
+        ConfField.field_project_descriptors.value,
+        ConfField.field_install_specs.value,
+        ConfField.field_install_mode.value,
+    ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    # FT_23_37_64_44.global_vs_local.md: the only fields `ConfLeap.leap_host` and `ConfLeap.leap_user` may set
+    # (these conf files apply to every client repo on the host - repo-specific fields belong to the repo):
+    host_tuning_field_names = [
+        ConfField.field_local_log_dir_rel_path.value,
+        ConfField.field_local_tmp_dir_rel_path.value,
+        ConfField.field_local_cache_dir_rel_path.value,
+        ConfField.field_venv_driver.value,
+        ConfField.field_uv_tools_dir_abs_path.value,
+        ConfField.field_required_uv_version.value,
+        ConfField.field_install_mode.value,
+    ]
+
     curr_dir_rel_path = "."
 
     module_func_separator = ":"
@@ -1239,9 +2278,9 @@ class ConfConstGeneral:
     # This is a value declared for completeness,
     # but unused (evaluated dynamically via the bootstrap process):
     input_based = None
-
-    file_rel_path_venv_bin = os.path.join("bin")
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    file_rel_path_venv_bin = os.path.join("bin")
+
     file_rel_path_venv_python = os.path.join(
         file_rel_path_venv_bin,
         "python",
@@ -1252,15 +2291,64 @@ class ConfConstGeneral:
         "activate",
     )
 
+    file_rel_path_venv_activate_fish = os.path.join(
+        file_rel_path_venv_bin,
+        "activate.fish",
+    )
+
     file_rel_path_venv_uv = os.path.join(
         file_rel_path_venv_bin,
         name_uv_package,
     )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    file_basename_uv_venv = f"{name_uv_package}.venv"
+
+    file_ext_lock = "lock"
+
+    # FT_75_87_82_46.entry_script.md: see `write_launch_record` (the fast launcher entry script uses the same names):
+    dir_pycache = "__pycache__"
+    file_ext_launch_record = "launch.json"
+
+    # FT_75_87_82_46.entry_script.md: env vars changing the bootstrap result (their values are saved in the launch record):
+    launch_record_env_var_names: list[str] = [
+        EnvVar.var_PROTOPRIMER_CONF_BASENAME.value,
+        EnvVar.var_PROTOPRIMER_VENV_DRIVER.value,
+        EnvVar.var_PROTOPRIMER_UV_TOOLS_DIR.value,
+        EnvVar.var_PROTOPRIMER_HOST_CONF.value,
+    ]
+
+    # FT_75_87_82_46.entry_script.md: env vars set in the middle of the bootstrap (the fast launcher falls back to `start_app`):
+    fast_launch_miss_env_var_names: list[str] = [
+        EnvVar.var_PROTOPRIMER_PROTO_CODE.value,
+        EnvVar.var_PROTOPRIMER_MAIN_FUNC.value,
+        EnvVar.var_PROTOPRIMER_PY_EXEC.value,
+        EnvVar.var_PROTOPRIMER_START_ID.value,
+        EnvVar.var_PROTOPRIMER_LAUNCH_RECORD.value,
+        EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value,
+        EnvVar.var_PROTOPRIMER_MOCKED_RESTART.value,
+    ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    # See `InstallMode.install_combined`:
+    file_basename_resolved_requirements = "resolved_requirements.txt"
+
+    # See `InstallMode.install_locked`:
+    install_lock_digest_prefix = "# install_input_digest: "
+
+    # See `acquire_file_lock`:
+    default_file_lock_timeout_sec = 10 * 60
+
+    file_lock_poll_interval_sec = 0.1
+
+    # See `ConfWatchReporter`:
+    conf_watch_poll_interval_sec = 0.25
 
     log_section_delimiter = "=" * 5
 
-    min_lines_between_generated_boilerplate = 20
+    # Increment on any incompatible change in the structure of the documents produced by `build_effective_conf_document`:
+    effective_conf_schema_version = 1
 
+    min_lines_between_generated_boilerplate = 20
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # TODO: TODO_24_49_18_17.fix_proto_code_terms.md: rename to `*_KERNEL_COPY` or `*_PROTO_KERNEL`?
     # FT_56_85_65_41.generated_boilerplate.md
     func_get_proto_code_generated_boilerplate_single_header = lambda module_obj: (
@@ -1276,18 +2364,18 @@ class ConfConstGeneral:
 ################################################################################
 """
     )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # FT_56_85_65_41.generated_boilerplate.md
     func_get_proto_code_generated_boilerplate_multiple_body = lambda module_obj: (
         f"""
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 """
     )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     relative_path_field_note: str = f"The path is relative to the `{PathName.path_ref_root.value}` dir specified in the `{ConfField.field_ref_root_dir_rel_path.value}` field."
-    common_field_global_note: str = f"This field can be specified in global config (see `{ConfLeap.leap_client.name}`) but it is override-able by local environment-specific config (see `{ConfLeap.leap_env.name}`)."
+    common_field_global_note: str = f"This field can be specified in global config (see `{ConfLeap.leap_client.name}`) but it is override-able by local environment-specific config (see `{ConfLeap.leap_env.name}`), host config (see `{ConfLeap.leap_host.name}`), and user config (see `{ConfLeap.leap_user.name}`)."
     common_field_local_note: str = f"This local environment-specific field overrides the global one (see description in `{ConfLeap.leap_client.name}`)."
-    func_note_derived_based_on_common = lambda field_name: f"This value is derived from `{field_name}` in `{ConfLeap.leap_client.name}` (override-able in `{ConfLeap.leap_env.name}`) - see description there."
+    func_note_derived_based_on_common = lambda field_name: f"This value is derived from `{field_name}` in `{ConfLeap.leap_client.name}` (override-able in `{ConfLeap.leap_env.name}`, `{ConfLeap.leap_host.name}`, `{ConfLeap.leap_user.name}`) - see description there."
     func_note_derived_based_on_conf_leap_field = lambda field_name, conf_leap: f"This value is derived from `{field_name}` - see description in `{conf_leap.name}`."
 
 
@@ -1298,28 +2386,45 @@ class ConfConstInput:
 
     file_abs_path_script = ConfConstGeneral.input_based
     dir_abs_path_current = ConfConstGeneral.input_based
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     default_proto_conf_dir_rel_path: str = f"{ConfConstGeneral.name_proto_code}"
 
     conf_file_ext = "json"
 
+    # A `*.conf.py` conf file (next to the JSON one with the same stem) takes precedence (see `read_conf_file`).
+    # Note: not just `*.py` - the stem may match `proto_code` (e.g. `proto_kernel.json` vs `proto_kernel.py`):
+    py_conf_file_ext = "conf.py"
+    # The var a `*.py` conf file assigns the conf data (`dict`) to:
+    py_conf_data_var_name = "conf_data"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # Next FT_89_41_35_82.conf_leap.md: `ConfLeap.leap_primer`:
     default_file_basename_conf_primer = f"{ConfConstGeneral.name_protoprimer_package}.{conf_file_ext}"
 
     ext_env_var_VIRTUAL_ENV: str = "VIRTUAL_ENV"
     ext_env_var_PATH: str = "PATH"
     ext_env_var_PYTHONPATH: str = "PYTHONPATH"
+    ext_env_var_PYTHONHOME: str = "PYTHONHOME"
+    ext_env_var_XDG_CONFIG_HOME: str = "XDG_CONFIG_HOME"
+
+    # Next FT_89_41_35_82.conf_leap.md: `ConfLeap.leap_user` (when `XDG_CONFIG_HOME` is not set):
+    default_user_conf_base_dir_rel_path: str = ".config"
 
     default_PROTOPRIMER_STDERR_LOG_LEVEL: str = "WARNING"
 
     default_PROTOPRIMER_PY_EXEC: str = StateStride.stride_py_unknown.name
 
+    default_PROTOPRIMER_ASYNC_FILE_LOG: str = str(False)
+
+    default_PROTOPRIMER_FILE_LOG_FORMAT: str = LogFormat.log_format_text.value
+
+    default_PROTOPRIMER_DIRECT_EXEC: str = str(False)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 class ConfConstPrimer:
     """
     Constants for FT_89_41_35_82.conf_leap.md / leap_primer
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     default_client_conf_dir_rel_path: str = f"{ConfDst.dst_global.value}"
 
     # Next FT_89_41_35_82.conf_leap.md: `ConfLeap.leap_client`:
@@ -1336,12 +2441,12 @@ class ConfConstClient:
     """
     Constants for FT_89_41_35_82.conf_leap.md / leap_client
     """
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     common_env_name = "common_env"
 
     # TODO: Is this used? If link_name is not specified, the env conf dir becomes ref root dir:
     default_dir_rel_path_leap_env_link_name: str = os.path.join(ConfDst.dst_local.value)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # FT_59_95_81_63.env_layout.md / max layout
     default_default_env_dir_rel_path: str = os.path.join(
         # TODO: Use constant:
@@ -1358,13 +2463,13 @@ class ConfConstClient:
     )
 
     default_pyproject_toml_basename = "pyproject.toml"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 class ConfConstEnv:
     """
     Constants for FT_89_41_35_82.conf_leap.md / leap_env
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     default_dir_rel_path_venv = str(KeyWord.key_venv.value)
 
     default_dir_rel_path_log = str(KeyWord.key_log.value)
@@ -1377,6 +2482,12 @@ class ConfConstEnv:
     #       The default is `uv` only if it is supported by the selected `python` version:
     default_venv_driver = VenvDriverType.venv_uv.name
 
+    # FT_73_95_31_84.venv_driver.md: no shared dir by default = `uv` is installed under `local_cache`:
+    default_uv_tools_dir_abs_path = None
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    # FT_73_95_31_84.venv_driver.md: no pinned version by default = the latest `uv` is installed:
+    default_required_uv_version = None
+
     default_version_constraints_file_basename = "constraints.txt"
 
     default_project_descriptors = [
@@ -1386,13 +2497,15 @@ class ConfConstEnv:
             ConfField.field_install_group.value: None,
         },
     ]
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     default_install_specs = []
 
+    default_install_mode = InstallMode.install_per_group.name
+
     # FT_84_11_73_28.supported_python_versions.md:
     latest_known_python_version = "3.14"
 
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 class CustomArgumentParser(argparse.ArgumentParser):
     def __init__(
         self,
@@ -1412,8 +2525,8 @@ class CustomArgumentParser(argparse.ArgumentParser):
         message,
     ):
         raise ValueError(message)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 def _create_parent_argparser():
     parent_argparser = CustomArgumentParser(add_help=False)
     parent_argparser.add_argument(
@@ -1496,7 +2609,22 @@ def _create_child_argparser(parent_argparsers):
             description=sub_command_desc,
         )
         parser_eval.set_defaults(sub_command=SubCommand.command_eval.value)
-
+        parser_eval.add_argument(
+            SyntaxArg.arg_watch,
+            action="store_true",
+            dest=ParsedArg.name_watch_conf.value,
+            help="Keep running and re-print effective config on every change of the conf files.",
+        )
+        parser_eval.add_argument(
+            SyntaxArg.arg_format,
+            type=str,
+            choices=[conf_format.value for conf_format in EffectiveConfigFormat],
+            default=EffectiveConfigFormat.format_text.value,
+            dest=ParsedArg.name_conf_format.value,
+            metavar=ParsedArg.name_conf_format.value,
+            help=f"Output format: `{EffectiveConfigFormat.format_text.value}` (per `{ConfLeap.__name__}`), `{EffectiveConfigFormat.format_json.value}` (single schema-versioned document with per-field provenance), or `{EffectiveConfigFormat.format_ndjson.value}` (one field with its provenance per line).",
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _create_check_parser(sub_command_parsers):
         sub_command_desc = "Check the environment configuration."
         parser_check = sub_command_parsers.add_parser(
@@ -1505,7 +2633,7 @@ def _create_child_argparser(parent_argparsers):
             description=sub_command_desc,
         )
         parser_check.set_defaults(sub_command=SubCommand.command_check.value)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     child_argparser = CustomArgumentParser(
         description=f"The early [{PrimerRuntime.runtime_proto.value}] environment bootstrapper [{KeyWord.key_primer.value}].",
         parents=parent_argparsers,
@@ -1519,7 +2647,7 @@ def _create_child_argparser(parent_argparsers):
         metavar="sub_command",
     )
     child_argparsers.required = False
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     _create_boot_parser(child_argparsers)
     _create_reset_parser(child_argparsers)
     _create_eval_parser(child_argparsers)
@@ -1528,7 +2656,7 @@ def _create_child_argparser(parent_argparsers):
     # noinspection PyUnreachableCode
     if False:
         _create_check_parser(child_argparsers)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     return child_argparser
 
 
@@ -1540,7 +2668,7 @@ def parse_args(remaining_argv=None) -> argparse.Namespace:
     which can be placed anywhere:
     * ... -q boot (option before sub command `SubCommand.command_boot`)
     * ... boot -q (option after sub command `SubCommand.command_boot`)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     See also: FT_62_88_55_10.CLI_compatibility.md
     """
 
@@ -1553,7 +2681,7 @@ def parse_args(remaining_argv=None) -> argparse.Namespace:
         parsed_args,
         remaining_argv,
     ) = parent_argparser.parse_known_args(remaining_argv)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # Phase 2: parse sub command args:
     child_argparser = _create_child_argparser(
         parent_argparsers=[
@@ -1563,7 +2691,7 @@ def parse_args(remaining_argv=None) -> argparse.Namespace:
     if (
         SyntaxArg.arg_h not in remaining_argv
         and SyntaxArg.arg_help not in remaining_argv
-        #
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     ):
         try:
             # Try to parse with `SubCommand.command_boot` as the default sub command:
@@ -1609,10 +2737,6 @@ class RunStrategy:
     See related:
     *   `SubCommand`
     *   FT_11_27_29_83.sub_command.md
-
-    TODO: FT_77_15_06_50.dynamic_DAG.md:
-          Currently, `RunStrategy` is degenerated into single implementation `ExitCodeReporter`.
-          Is it even needed (unless make it useful beyond that)?
     """
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def execute_strategy(
@@ -1652,6 +2776,139 @@ class ExitCodeReporter(RunStrategy):
         sys.exit(exit_code)
 
 
+class ConfWatchReporter(RunStrategy):
+    """
+    Re-evaluates the state on every change of the conf files (until interrupted).
+
+    See: FT_19_44_42_19.effective_config.md
+
+    The `EnvContext` is kept warm: on change, only the states loading the changed conf file
+    (and the states depending on them) are re-evaluated - others reuse their cached values.
+    It polls file stats (rather than relying on platform-specific notifications).
+    """
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def __init__(
+        self,
+        env_ctx: EnvContext,
+        poll_interval_sec: float = ConfConstGeneral.conf_watch_poll_interval_sec,
+    ):
+        super().__init__()
+        self.env_ctx: EnvContext = env_ctx
+        self.poll_interval_sec: float = poll_interval_sec
+
+    def execute_strategy(
+        self,
+        state_node: StateNode,
+    ) -> None:
+        try:
+            self._eval_watched_state(state_node.state_name)
+            watched_file_stats = self._stat_watched_files(self._get_watched_files())
+            while True:
+                time.sleep(self.poll_interval_sec)
+                curr_file_stats = self._stat_watched_files(watched_file_stats.keys())
+                # The first item of the watched file key is the state to re-evaluate:
+                changed_states = {watched_file[0] for watched_file, file_stat in curr_file_stats.items() if watched_file_stats[watched_file] != file_stat}
+                if len(changed_states) == 0:
+                    continue
+                self._invalidate_states(changed_states, state_node.state_name)
+                self._eval_watched_state(state_node.state_name)
+                watched_file_stats = self._stat_watched_files(self._get_watched_files())
+        except KeyboardInterrupt:
+            sys.exit(0)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _eval_watched_state(
+        self,
+        state_name: str,
+    ) -> None:
+        try:
+            self.env_ctx.eval_state(state_name)
+        except Exception as e:
+            # Keep watching (the error may be fixed by the next change):
+            logger.error(f"failed to evaluate `state_name` [{state_name}]: {e}")
+        logger.info(f"watching conf files (press Ctrl+C to stop)")
+
+    def _get_watched_files(self) -> list[tuple[str, str]]:
+        return list_evaluated_conf_files(self.env_ctx)
+
+    @staticmethod
+    def _stat_watched_files(
+        watched_files: typing.Iterable[tuple[str, str]],
+    ) -> dict[tuple[str, str], tuple[int, int] | None]:
+        watched_file_stats: dict[tuple[str, str], tuple[int, int] | None] = {}
+        for watched_state_name, watched_file_abs_path in watched_files:
+            try:
+                # Use `lstat` to see the symlink itself (not its target):
+                file_stat = os.lstat(watched_file_abs_path)
+                watched_file_stats[(watched_state_name, watched_file_abs_path)] = (file_stat.st_mtime_ns, file_stat.st_size)
+            except FileNotFoundError:
+                watched_file_stats[(watched_state_name, watched_file_abs_path)] = None
+        return watched_file_stats
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _invalidate_states(
+        self,
+        changed_states: set[str],
+        target_state_name: str,
+    ) -> None:
+        """
+        Drop cached values of the `changed_states` and all states depending on them.
+
+        Only the states the `target_state_name` depends on are dropped (to avoid re-running anything else).
+        """
+        state_nodes: dict[str, StateNode] = self.env_ctx._state_graph.state_nodes
+
+        target_dependencies: set[str] = set()
+        pending_states: list[str] = [target_state_name]
+        while len(pending_states) > 0:
+            state_name = pending_states.pop()
+            if state_name not in target_dependencies and state_name in state_nodes:
+                target_dependencies.add(state_name)
+                pending_states.extend(state_nodes[state_name].get_parent_states())
+
+        invalidated_states: set[str] = set()
+        pending_states = list(changed_states)
+        while len(pending_states) > 0:
+            state_name = pending_states.pop()
+            if state_name in invalidated_states or state_name not in target_dependencies:
+                continue
+            invalidated_states.add(state_name)
+            pending_states.extend(child_state_name for child_state_name in target_dependencies if state_name in state_nodes[child_state_name].get_parent_states())
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        for state_name in invalidated_states:
+            state_node = state_nodes[state_name]
+            if isinstance(state_node, AbstractCachingStateNode):
+                state_node.is_cached = False
+                state_node.cached_value = None
+        logger.info(f"conf files changed - re-evaluating states: {sorted(invalidated_states)}")
+
+
+def list_evaluated_conf_files(env_ctx: EnvContext) -> list[tuple[str, str]]:
+    """
+    List conf files as (state to re-evaluate, file path) pairs (see `ConfWatchReporter` and `write_launch_record`).
+
+    The paths are taken from the states already evaluated (a conf file change may also change paths).
+    """
+    conf_files: list[tuple[str, str]] = []
+    for data_state_name, path_state_name in [
+        (EnvState.state_primer_conf_file_data_loaded.name, EnvState.state_primer_conf_file_abs_path_inited.name),
+        (EnvState.state_client_conf_file_data_loaded.name, EnvState.state_global_conf_file_abs_path_inited.name),
+        (EnvState.state_local_conf_symlink_abs_path_inited.name, EnvState.state_local_conf_symlink_abs_path_inited.name),
+        (EnvState.state_env_conf_file_data_loaded.name, EnvState.state_local_conf_file_abs_path_inited.name),
+        (EnvState.state_host_conf_file_data_loaded.name, EnvState.state_host_conf_file_abs_path_inited.name),
+        (EnvState.state_user_conf_file_data_loaded.name, EnvState.state_user_conf_file_abs_path_inited.name),
+    ]:
+        path_state_node = env_ctx._state_graph.state_nodes.get(path_state_name, None)
+        if not isinstance(path_state_node, AbstractCachingStateNode) or not path_state_node.is_cached:
+            continue
+        file_abs_path: str | None = path_state_node.cached_value
+        if file_abs_path is None:
+            continue
+        conf_files.append((data_state_name, file_abs_path))
+        if data_state_name != path_state_name:
+            # See `read_conf_file`:
+            conf_files.append((data_state_name, get_py_conf_file_abs_path(file_abs_path)))
+    return conf_files
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 ########################################################################################################################
 
 
@@ -1668,10 +2925,10 @@ class StateNode(typing.Generic[ValueType]):
     ):
         self.env_ctx: EnvContext = env_ctx
         self.state_name: str = state_name
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         # Ensure no duplicates:
         assert len(parent_states) == len(set(parent_states))
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         self.parent_states: list[str] = parent_states
 
         assert type(state_name) is str
@@ -1766,8 +3023,12 @@ class AbstractCachingStateNode(StateNode[ValueType]):
                 self.eval_parent_state(state_name)
 
             # See FT_30_24_95_65.state_idempotency.md
-            self.cached_value = self._eval_state_once()
-            logger.debug(f"state [{self.state_name}] evaluated value [{self.cached_value}]")
+            log_state_name_token = log_state_name.set(self.state_name)
+            try:
+                self.cached_value = self._eval_state_once()
+                logger.debug("state [%s] evaluated value [%s]", self.state_name, self.cached_value)
+            finally:
+                log_state_name.reset(log_state_name_token)
             self.is_cached = True
 
         return self.cached_value
@@ -1776,13 +3037,56 @@ class AbstractCachingStateNode(StateNode[ValueType]):
         raise NotImplementedError()
 
 
+class MergedConfData:
+    """
+    Layered view of conf data from multiple `ConfLeap`-s merged once (see `EnvState.state_merged_conf_data_loaded`).
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    Implements config overrides: FT_23_37_64_44.global_vs_local.md
+    """
+
+    def __init__(
+        self,
+        # Ordered from the highest to the lowest priority:
+        ordered_conf_leap_data: list[tuple[ConfLeap, dict]],
+    ):
+        self.field_values: dict[str, DataValueType] = {}
+        # The `ConfLeap` the field value is taken from (provenance - see `describe_field_provenance`):
+        self.field_conf_leaps: dict[str, ConfLeap] = {}
+        for conf_leap, conf_data in reversed(ordered_conf_leap_data):
+            used_field_names: list[str] | None = get_used_conf_field_names(conf_leap)
+            for field_name, field_value in conf_data.items():
+                if used_field_names is not None and field_name not in used_field_names:
+                    # A field the `ConfLeap` does not read overrides nothing:
+                    continue
+                self.field_values[field_name] = field_value
+                self.field_conf_leaps[field_name] = conf_leap
+
+    def get_value_or_default(
+        self,
+        field_name: str,
+        default_field_value: DataValueType,
+    ) -> DataValueType:
+        return self.field_values.get(field_name, default_field_value)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_conf_leap(
+        self,
+        field_name: str,
+    ) -> ConfLeap | None:
+        """
+        Return the `ConfLeap` which sets the field value (or `None` if the default value applies).
+        """
+        return self.field_conf_leaps.get(field_name, None)
+
+
 class AbstractOverriddenFieldCachingStateNode(AbstractCachingStateNode[ValueType]):
     """
-    Base class that overrides field values from `ConfLeap.leap_client` and `ConfLeap.leap_env`.
+    Base class that overrides field values from `ConfLeap.leap_client` by `ConfLeap.leap_env`, `ConfLeap.leap_host`, `ConfLeap.leap_user`.
+
+    Subclasses must list `EnvState.state_merged_conf_data_loaded` in their parent states.
 
     See: FT_00_22_19_59.derived_config.md
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def _get_overridden_value_or_default(
         self,
         field_name: str,
@@ -1791,19 +3095,18 @@ class AbstractOverriddenFieldCachingStateNode(AbstractCachingStateNode[ValueType
         """
         Implements config overrides: FT_23_37_64_44.global_vs_local.md
         """
-
-        state_client_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_client_conf_file_data_loaded.name)
-        state_env_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_env_conf_file_data_loaded.name)
-        field_value: DataValueType
-        if field_name in state_env_conf_file_data_loaded:
-            field_value = state_env_conf_file_data_loaded[field_name]
-        else:
-            field_value = state_client_conf_file_data_loaded.get(field_name, default_field_value)
-        return field_value
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        # Keep `get_used_conf_field_names` in sync with the fields actually read:
+        assert field_name in ConfConstGeneral.overridden_field_names, f"`{field_name}` is not listed in `{ConfConstGeneral.__name__}.overridden_field_names`"
+        state_merged_conf_data_loaded: MergedConfData = self.eval_parent_state(EnvState.state_merged_conf_data_loaded.name)
+        return state_merged_conf_data_loaded.get_value_or_default(
+            field_name,
+            default_field_value,
+        )
 
 
 ########################################################################################################################
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 # noinspection PyPep8Naming
 @trivial_factory
@@ -1818,14 +3121,14 @@ class Bootstrapper_state_input_py_exec_var_loaded(AbstractCachingStateNode[State
                 ConfConstInput.default_PROTOPRIMER_PY_EXEC,
             )
         ]
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return self.env_ctx.set_max_stride(py_exec)
 
 
 # noinspection PyPep8Naming
 @trivial_factory
 class Bootstrapper_state_is_app_defined(AbstractCachingStateNode[bool]):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     _state_name = staticmethod(lambda: EnvState.state_is_app_defined.name)
 
     def _eval_state_once(self) -> ValueType:
@@ -1839,7 +3142,7 @@ class Bootstrapper_state_is_app_defined(AbstractCachingStateNode[bool]):
 # noinspection PyPep8Naming
 @trivial_factory
 class Bootstrapper_state_input_is_stderr_log_enabled(AbstractCachingStateNode[bool]):
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     _parent_states = staticmethod(lambda: [EnvState.state_is_app_defined.name])
     _state_name = staticmethod(lambda: EnvState.state_input_is_stderr_log_enabled.name)
 
@@ -1850,7 +3153,7 @@ class Bootstrapper_state_input_is_stderr_log_enabled(AbstractCachingStateNode[bo
         else:
             self.env_ctx._is_log_enabled = EnvVar.var_PROTOPRIMER_STDERR_LOG_LEVEL.value in os.environ
         return self.env_ctx._is_log_enabled
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 # noinspection PyPep8Naming
 @trivial_factory
@@ -1863,7 +3166,7 @@ class Bootstrapper_state_input_stderr_log_level_var_loaded(AbstractCachingStateN
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_input_stderr_log_level_var_loaded.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
 
         loaded_stderr_level: str = os.getenv(
@@ -1874,7 +3177,7 @@ class Bootstrapper_state_input_stderr_log_level_var_loaded(AbstractCachingStateN
             logging,
             ConfConstInput.default_PROTOPRIMER_STDERR_LOG_LEVEL,
         )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         state_input_stderr_log_level_var_loaded: int
         try:
             state_input_stderr_log_level_var_loaded = int(loaded_stderr_level)
@@ -1892,11 +3195,11 @@ class Bootstrapper_state_input_stderr_log_level_var_loaded(AbstractCachingStateN
                 logger.warning(f"Unrecognized log level value [{loaded_stderr_level}] for `{EnvVar.var_PROTOPRIMER_STDERR_LOG_LEVEL.value}`")
                 defined_value = default_stderr_log_level
             assert isinstance(defined_value, int)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
             state_input_stderr_log_level_var_loaded = defined_value
 
         return state_input_stderr_log_level_var_loaded
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 # noinspection PyPep8Naming
 @trivial_factory
@@ -1914,10 +3217,10 @@ class Bootstrapper_state_default_stderr_log_handler_configured(AbstractCachingSt
         assert state_input_stderr_log_level_var_loaded >= 0
 
         stderr_handler: logging.Handler = _configure_primer_stderr_log_handler(state_input_stderr_log_level_var_loaded)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return stderr_handler
 
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 # noinspection PyPep8Naming
 @conditional_factory
 class Bootstrapper_state_args_parsed_is_app(AbstractCachingStateNode[argparse.Namespace]):
@@ -1936,11 +3239,11 @@ class Bootstrapper_state_args_parsed_not_is_app(AbstractCachingStateNode[argpars
 
     def _eval_state_once(self) -> ValueType:
         raise AssertionError(f"`{EnvState.state_args_parsed.name}` must not be reachable in this context")
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 # noinspection PyPep8Naming
 class Factory_state_args_parsed(NodeFactory[StateStride]):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def create_state_node(self) -> StateNode[ValueType]:
         if self.env_ctx._is_app:
             return Bootstrapper_state_args_parsed_is_app(self.env_ctx)
@@ -1959,9 +3262,9 @@ class Bootstrapper_state_input_stderr_log_level_eval_finalized_is_app(AbstractCa
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_input_stderr_log_level_eval_finalized.name)
-
-    def _eval_state_once(self) -> ValueType:
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _eval_state_once(self) -> ValueType:
+
         state_input_stderr_log_level_var_loaded: int = self.eval_parent_state(EnvState.state_input_stderr_log_level_var_loaded.name)
 
         parsed_args = self.eval_parent_state(EnvState.state_args_parsed.name)
@@ -2086,45 +3389,95 @@ class Bootstrapper_state_input_sub_command_arg_loaded_func_start_app(AbstractCac
         return self.env_ctx._sub_command
 
 
-# TODO: FT_77_15_06_50.dynamic_DAG.md:
-#       Avoid `arg` in the name (CLI is not available for all use cases).
+# TODO: FT_77_15_06_50.dynamic_DAG.md:
+#       Avoid `arg` in the name (CLI is not available for all use cases).
+# noinspection PyPep8Naming
+@conditional_factory
+class Bootstrapper_state_input_sub_command_arg_loaded_func_call_lib(AbstractCachingStateNode[SubCommand]):
+
+    _state_name = staticmethod(lambda: EnvState.state_input_sub_command_arg_loaded.name)
+
+    def _eval_state_once(self) -> ValueType:
+        self.env_ctx._sub_command = None
+        return None
+
+
+# TODO: FT_77_15_06_50.dynamic_DAG.md:
+#       Avoid `arg` in the name (CLI is not available for all use cases).
+# noinspection PyPep8Naming
+class Factory_state_input_sub_command_arg_loaded(NodeFactory[SubCommand]):
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def create_state_node(self) -> StateNode[ValueType]:
+        if self.env_ctx._is_app:
+            return Bootstrapper_state_input_sub_command_arg_loaded_is_app(self.env_ctx)
+        elif self.env_ctx._entry_func == EntryFunc.func_start_app:
+            return Bootstrapper_state_input_sub_command_arg_loaded_func_start_app(self.env_ctx)
+        elif self.env_ctx._entry_func == EntryFunc.func_call_lib:
+            return Bootstrapper_state_input_sub_command_arg_loaded_func_call_lib(self.env_ctx)
+        else:
+            raise AssertionError(self.env_ctx._entry_func)
+
+
+# noinspection PyPep8Naming
+@conditional_factory
+class Bootstrapper_state_input_conf_format_arg_loaded_is_app(AbstractCachingStateNode[EffectiveConfigFormat]):
+
+    _parent_states = staticmethod(lambda: [EnvState.state_args_parsed.name])
+    _state_name = staticmethod(lambda: EnvState.state_input_conf_format_arg_loaded.name)
+
+    def _eval_state_once(self) -> ValueType:
+        state_args_parsed: argparse.Namespace = self.eval_parent_state(EnvState.state_args_parsed.name)
+        return EffectiveConfigFormat(
+            getattr(
+                state_args_parsed,
+                ParsedArg.name_conf_format.value,
+                # NOTE: The value is only set for `SubCommand.command_eval`, otherwise, this default is used:
+                EffectiveConfigFormat.format_text.value,
+            )
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 # noinspection PyPep8Naming
 @conditional_factory
-class Bootstrapper_state_input_sub_command_arg_loaded_func_call_lib(AbstractCachingStateNode[SubCommand]):
+class Bootstrapper_state_input_conf_format_arg_loaded_not_is_app(AbstractCachingStateNode[EffectiveConfigFormat]):
 
-    _state_name = staticmethod(lambda: EnvState.state_input_sub_command_arg_loaded.name)
+    _state_name = staticmethod(lambda: EnvState.state_input_conf_format_arg_loaded.name)
 
     def _eval_state_once(self) -> ValueType:
-        self.env_ctx._sub_command = None
-        return None
+        return EffectiveConfigFormat.format_text
 
 
-# TODO: FT_77_15_06_50.dynamic_DAG.md:
-#       Avoid `arg` in the name (CLI is not available for all use cases).
 # noinspection PyPep8Naming
-class Factory_state_input_sub_command_arg_loaded(NodeFactory[SubCommand]):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+class Factory_state_input_conf_format_arg_loaded(NodeFactory[EffectiveConfigFormat]):
+
     def create_state_node(self) -> StateNode[ValueType]:
         if self.env_ctx._is_app:
-            return Bootstrapper_state_input_sub_command_arg_loaded_is_app(self.env_ctx)
-        elif self.env_ctx._entry_func == EntryFunc.func_start_app:
-            return Bootstrapper_state_input_sub_command_arg_loaded_func_start_app(self.env_ctx)
-        elif self.env_ctx._entry_func == EntryFunc.func_call_lib:
-            return Bootstrapper_state_input_sub_command_arg_loaded_func_call_lib(self.env_ctx)
+            return Bootstrapper_state_input_conf_format_arg_loaded_is_app(self.env_ctx)
         else:
-            raise AssertionError(self.env_ctx._entry_func)
-
+            return Bootstrapper_state_input_conf_format_arg_loaded_not_is_app(self.env_ctx)
 
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 # noinspection PyPep8Naming
 @conditional_factory
 class Bootstrapper_state_print_conf_finalized_is_app(AbstractCachingStateNode[bool]):
+    """
+    Enables printing effective config per `ConfLeap` (as each of them is loaded).
 
-    _parent_states = staticmethod(lambda: [EnvState.state_input_sub_command_arg_loaded.name])
+    Other `EffectiveConfigFormat`-s are printed at once by `EnvState.state_effective_conf_data_printed`.
+    """
+
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_input_sub_command_arg_loaded.name,
+            EnvState.state_input_conf_format_arg_loaded.name,
+        ]
+    )
     _state_name = staticmethod(lambda: EnvState.state_print_conf_finalized.name)
 
     def _eval_state_once(self) -> ValueType:
         sub_command: SubCommand = self.eval_parent_state(EnvState.state_input_sub_command_arg_loaded.name)
-        return sub_command == SubCommand.command_eval
+        state_input_conf_format_arg_loaded: EffectiveConfigFormat = self.eval_parent_state(EnvState.state_input_conf_format_arg_loaded.name)
+        return sub_command == SubCommand.command_eval and state_input_conf_format_arg_loaded == EffectiveConfigFormat.format_text
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 # noinspection PyPep8Naming
@@ -2255,12 +3608,49 @@ class Factory_state_input_final_state_eval_finalized(NodeFactory[StateStride]):
             raise AssertionError(self.env_ctx._entry_func)
 
 
+# noinspection PyPep8Naming
+@conditional_factory
+class Bootstrapper_state_input_watch_conf_arg_loaded_is_app(AbstractCachingStateNode[bool]):
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    _parent_states = staticmethod(lambda: [EnvState.state_args_parsed.name])
+    _state_name = staticmethod(lambda: EnvState.state_input_watch_conf_arg_loaded.name)
+
+    def _eval_state_once(self) -> ValueType:
+        state_args_parsed: argparse.Namespace = self.eval_parent_state(EnvState.state_args_parsed.name)
+        return getattr(
+            state_args_parsed,
+            ParsedArg.name_watch_conf.value,
+            # NOTE: The value is only set for `SubCommand.command_eval`, otherwise, this default is used:
+            False,
+        )
+
+
+# noinspection PyPep8Naming
+@conditional_factory
+class Bootstrapper_state_input_watch_conf_arg_loaded_not_is_app(AbstractCachingStateNode[bool]):
+
+    _state_name = staticmethod(lambda: EnvState.state_input_watch_conf_arg_loaded.name)
+
+    def _eval_state_once(self) -> ValueType:
+        return False
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+# noinspection PyPep8Naming
+class Factory_state_input_watch_conf_arg_loaded(NodeFactory[bool]):
+
+    def create_state_node(self) -> StateNode[ValueType]:
+        if self.env_ctx._is_app:
+            return Bootstrapper_state_input_watch_conf_arg_loaded_is_app(self.env_ctx)
+        else:
+            return Bootstrapper_state_input_watch_conf_arg_loaded_not_is_app(self.env_ctx)
+
+
 # noinspection PyPep8Naming
 @trivial_factory
 class Bootstrapper_state_func_boot_env_executed(AbstractCachingStateNode[bool]):
     """
     This is a special node - it traverses ALL nodes for `EntryFunc` cases with parsed args.
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     BUT: It does not depend on ALL nodes - instead, re-executes the graph with a new target.
     """
 
@@ -2269,10 +3659,11 @@ class Bootstrapper_state_func_boot_env_executed(AbstractCachingStateNode[bool]):
             EnvState.state_input_stderr_log_level_handler_configured.name,
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_input_final_state_eval_finalized.name,
+            EnvState.state_input_watch_conf_arg_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_func_boot_env_executed.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
 
         state_input_sub_command_arg_loaded: SubCommand = self.eval_parent_state(EnvState.state_input_sub_command_arg_loaded.name)
@@ -2284,7 +3675,11 @@ class Bootstrapper_state_func_boot_env_executed(AbstractCachingStateNode[bool]):
         if state_input_sub_command_arg_loaded is None:
             raise ValueError(f"sub command is not defined")
         elif state_input_sub_command_arg_loaded == SubCommand.command_eval:
-            selected_strategy = ExitCodeReporter(self.env_ctx)
+            state_input_watch_conf_arg_loaded: bool = self.eval_parent_state(EnvState.state_input_watch_conf_arg_loaded.name)
+            if state_input_watch_conf_arg_loaded:
+                selected_strategy = ConfWatchReporter(self.env_ctx)
+            else:
+                selected_strategy = ExitCodeReporter(self.env_ctx)
             # TODO: FT_77_15_06_50.dynamic_DAG.md:
             #       How does it comply with `EnvContext._forced_final_state`?
             state_node = self.env_ctx._state_graph.get_state_node(EnvState.state_effective_conf_data_printed.name)
@@ -2709,8 +4104,8 @@ class Bootstrapper_state_primer_conf_file_abs_path_inited(AbstractCachingStateNo
                 proto_code_dir_abs_path,
                 candidate_basename,
             )
-            logger.debug(f"candidate conf file name: {candidate_conf_file_abs_path}")
-            if os.path.exists(candidate_conf_file_abs_path):
+            logger.debug("candidate conf file name: %s", candidate_conf_file_abs_path)
+            if conf_file_exists(candidate_conf_file_abs_path):
                 return candidate_conf_file_abs_path
 
         # Use `ConfConstInput.default_file_basename_conf_primer` even if not found
@@ -2740,8 +4135,8 @@ class Bootstrapper_state_primer_conf_file_data_loaded(AbstractCachingStateNode[d
         state_primer_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_primer_conf_file_abs_path_inited.name)
 
         file_data: dict
-        if os.path.exists(state_primer_conf_file_abs_path_inited):
-            file_data = read_json_file(state_primer_conf_file_abs_path_inited)
+        if conf_file_exists(state_primer_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_primer_conf_file_abs_path_inited)
         else:
             # TODO: Be able to detect min scenario and avoid warning:
             warn_once_at_state_stride(
@@ -2781,6 +4176,25 @@ class Bootstrapper_state_primer_conf_file_data_loaded(AbstractCachingStateNode[d
         return file_data
 
 
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_primer_conf_data_verified(AbstractCachingStateNode[bool]):
+    """
+    Validates `ConfLeap.leap_primer` data before its fields are used (see `EnvState.state_conf_data_verified`).
+    """
+
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_primer_conf_file_data_loaded.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: EnvState.state_primer_conf_data_verified.name)
+
+    def _eval_state_once(self) -> ValueType:
+        validate_conf_data(ConfLeap.leap_primer, self.eval_parent_state(EnvState.state_primer_conf_file_data_loaded.name))
+        return True
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 # noinspection PyPep8Naming
 @trivial_factory
 class Bootstrapper_state_ref_root_dir_abs_path_inited(AbstractCachingStateNode[str]):
@@ -2789,6 +4203,7 @@ class Bootstrapper_state_ref_root_dir_abs_path_inited(AbstractCachingStateNode[s
         lambda: [
             EnvState.state_proto_code_file_abs_path_inited.name,
             EnvState.state_primer_conf_file_data_loaded.name,
+            EnvState.state_primer_conf_data_verified.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_ref_root_dir_abs_path_inited.name)
@@ -2828,6 +4243,7 @@ class Bootstrapper_state_global_conf_dir_abs_path_inited(AbstractCachingStateNod
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_primer_conf_file_data_loaded.name,
+            EnvState.state_primer_conf_data_verified.name,
             EnvState.state_ref_root_dir_abs_path_inited.name,
         ]
     )
@@ -2840,7 +4256,7 @@ class Bootstrapper_state_global_conf_dir_abs_path_inited(AbstractCachingStateNod
         state_primer_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_primer_conf_file_data_loaded.name)
 
         field_client_config_dir_rel_path: str | None = state_primer_conf_file_data_loaded.get(ConfField.field_global_conf_dir_rel_path.value, None)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         state_global_conf_dir_abs_path_inited: str | None
         if field_client_config_dir_rel_path is None:
             state_global_conf_dir_abs_path_inited = os.path.join(
@@ -2852,7 +4268,7 @@ class Bootstrapper_state_global_conf_dir_abs_path_inited(AbstractCachingStateNod
                 state_ref_root_dir_abs_path_inited,
                 field_client_config_dir_rel_path,
             )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         return state_global_conf_dir_abs_path_inited
 
 
@@ -2867,14 +4283,14 @@ class Bootstrapper_state_global_conf_file_abs_path_inited(AbstractCachingStateNo
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_global_conf_file_abs_path_inited.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
 
         state_primer_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_primer_conf_file_abs_path_inited.name)
         conf_file_base_name = os.path.basename(state_primer_conf_file_abs_path_inited)
 
         state_global_conf_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_global_conf_dir_abs_path_inited.name)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         state_global_conf_file_abs_path_inited: str = os.path.join(
             state_global_conf_dir_abs_path_inited,
             conf_file_base_name,
@@ -2894,14 +4310,14 @@ class Bootstrapper_state_client_conf_file_data_loaded(AbstractCachingStateNode[d
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_client_conf_file_data_loaded.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
         state_print_conf_finalized: bool = self.eval_parent_state(EnvState.state_print_conf_finalized.name)
         state_global_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_global_conf_file_abs_path_inited.name)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         file_data: dict
-        if os.path.exists(state_global_conf_file_abs_path_inited):
-            file_data = read_json_file(state_global_conf_file_abs_path_inited)
+        if conf_file_exists(state_global_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_global_conf_file_abs_path_inited)
         else:
             # TODO: Be able to detect min scenario and avoid warning:
             warn_once_at_state_stride(
@@ -2923,6 +4339,25 @@ class Bootstrapper_state_client_conf_file_data_loaded(AbstractCachingStateNode[d
         return file_data
 
 
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_client_conf_data_verified(AbstractCachingStateNode[bool]):
+    """
+    Validates `ConfLeap.leap_client` data before its fields are used (see `EnvState.state_conf_data_verified`).
+    """
+
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_client_conf_file_data_loaded.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: EnvState.state_client_conf_data_verified.name)
+
+    def _eval_state_once(self) -> ValueType:
+        validate_conf_data(ConfLeap.leap_client, self.eval_parent_state(EnvState.state_client_conf_file_data_loaded.name))
+        return True
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 # noinspection PyPep8Naming
 @conditional_factory
 class Base_state_selected_env_dir_rel_path(AbstractCachingStateNode[str]):
@@ -3020,6 +4455,7 @@ class Bootstrapper_state_selected_env_dir_rel_path_inited_is_app(Base_state_sele
             EnvState.state_args_parsed.name,
             EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_client_conf_file_data_loaded.name,
+            EnvState.state_client_conf_data_verified.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_selected_env_dir_rel_path_inited.name)
@@ -3043,6 +4479,7 @@ class Bootstrapper_state_selected_env_dir_rel_path_inited_not_is_app(Base_state_
         lambda: [
             EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_client_conf_file_data_loaded.name,
+            EnvState.state_client_conf_data_verified.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_selected_env_dir_rel_path_inited.name)
@@ -3053,13 +4490,13 @@ class Bootstrapper_state_selected_env_dir_rel_path_inited_not_is_app(Base_state_
 
 # noinspection PyPep8Naming
 class Factory_state_selected_env_dir_rel_path_inited(NodeFactory[StateStride]):
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def create_state_node(self) -> StateNode[ValueType]:
         if self.env_ctx._is_app:
             return Bootstrapper_state_selected_env_dir_rel_path_inited_is_app(self.env_ctx)
         else:
             return Bootstrapper_state_selected_env_dir_rel_path_inited_not_is_app(self.env_ctx)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 # noinspection PyPep8Naming
 @trivial_factory
@@ -3069,11 +4506,12 @@ class Bootstrapper_state_local_conf_symlink_abs_path_inited(AbstractCachingState
         lambda: [
             EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_client_conf_file_data_loaded.name,
+            EnvState.state_client_conf_data_verified.name,
             EnvState.state_selected_env_dir_rel_path_inited.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_local_conf_symlink_abs_path_inited.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
 
         state_ref_root_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_ref_root_dir_abs_path_inited.name)
@@ -3086,7 +4524,7 @@ class Bootstrapper_state_local_conf_symlink_abs_path_inited(AbstractCachingState
         if state_selected_env_dir_rel_path_inited is None:
             # No symlink target => no `conf_leap` => use `client_conf` instead of `env_conf`:
             return state_ref_root_dir_abs_path_inited
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         state_client_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_client_conf_file_data_loaded.name)
         client_env_conf_link_name_dir_rel_path: str | None = state_client_conf_file_data_loaded.get(ConfField.field_local_conf_symlink_rel_path.value, None)
 
@@ -3101,7 +4539,7 @@ class Bootstrapper_state_local_conf_symlink_abs_path_inited(AbstractCachingState
                 state_ref_root_dir_abs_path_inited,
                 client_env_conf_link_name_dir_rel_path,
             )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         if os.path.exists(state_local_conf_symlink_abs_path_inited):
             if os.path.islink(state_local_conf_symlink_abs_path_inited):
                 if os.path.isdir(state_local_conf_symlink_abs_path_inited):
@@ -3176,8 +4614,8 @@ class Bootstrapper_state_env_conf_file_data_loaded(AbstractCachingStateNode[dict
         state_local_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_conf_file_abs_path_inited.name)
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         file_data: dict
-        if os.path.exists(state_local_conf_file_abs_path_inited):
-            file_data = read_json_file(state_local_conf_file_abs_path_inited)
+        if conf_file_exists(state_local_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_local_conf_file_abs_path_inited)
         else:
             # TODO: Be able to detect min scenario and avoid warning:
             # TODO: Still warn when required for some fields:
@@ -3204,23 +4642,201 @@ class Bootstrapper_state_env_conf_file_data_loaded(AbstractCachingStateNode[dict
 
 # noinspection PyPep8Naming
 @trivial_factory
-class Bootstrapper_required_python_version_inited(AbstractOverriddenFieldCachingStateNode[str]):
+class Bootstrapper_state_host_conf_file_abs_path_inited(AbstractCachingStateNode[str]):
+    """
+    The `ConfLeap.leap_host` conf file is optional and specified only via `EnvVar.var_PROTOPRIMER_HOST_CONF`.
+    """
+
+    _state_name = staticmethod(lambda: EnvState.state_host_conf_file_abs_path_inited.name)
+
+    def _eval_state_once(self) -> ValueType:
+        host_conf_file_any_path: str | None = os.environ.get(EnvVar.var_PROTOPRIMER_HOST_CONF.value, None)
+        if host_conf_file_any_path is None:
+            return None
+        return os.path.abspath(os.path.expanduser(host_conf_file_any_path))
+
+
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_host_conf_file_data_loaded(AbstractCachingStateNode[dict]):
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_print_conf_finalized.name,
+            EnvState.state_host_conf_file_abs_path_inited.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: EnvState.state_host_conf_file_data_loaded.name)
+
+    def _eval_state_once(self) -> ValueType:
+        state_print_conf_finalized: bool = self.eval_parent_state(EnvState.state_print_conf_finalized.name)
+        state_host_conf_file_abs_path_inited: str | None = self.eval_parent_state(EnvState.state_host_conf_file_abs_path_inited.name)
+
+        file_data: dict
+        if state_host_conf_file_abs_path_inited is None:
+            file_data = {}
+        elif conf_file_exists(state_host_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_host_conf_file_abs_path_inited)
+        else:
+            # Unlike the default paths, the explicitly specified path must exist:
+            raise AssertionError(f"`{EnvVar.var_PROTOPRIMER_HOST_CONF.value}` [{state_host_conf_file_abs_path_inited}] does not exist.")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        if _can_print_effective_config(self, state_print_conf_finalized):
+            print(
+                json.dumps(
+                    {
+                        ConfLeap.leap_host.name: file_data,
+                    },
+                    indent=4,
+                )
+            )
+
+        return file_data
+
+
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_user_conf_file_abs_path_inited(AbstractCachingStateNode[str]):
+
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_primer_conf_file_abs_path_inited.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: EnvState.state_user_conf_file_abs_path_inited.name)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _eval_state_once(self) -> ValueType:
+
+        state_primer_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_primer_conf_file_abs_path_inited.name)
+        conf_file_base_name = os.path.basename(state_primer_conf_file_abs_path_inited)
+
+        return os.path.join(
+            get_user_conf_dir_abs_path(),
+            conf_file_base_name,
+        )
+
+
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_user_conf_file_data_loaded(AbstractCachingStateNode[dict]):
+
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_print_conf_finalized.name,
+            EnvState.state_user_conf_file_abs_path_inited.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: EnvState.state_user_conf_file_data_loaded.name)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _eval_state_once(self) -> ValueType:
+        state_print_conf_finalized: bool = self.eval_parent_state(EnvState.state_print_conf_finalized.name)
+        state_user_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_user_conf_file_abs_path_inited.name)
+
+        file_data: dict
+        if conf_file_exists(state_user_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_user_conf_file_abs_path_inited)
+        else:
+            file_data = {}
+
+        if _can_print_effective_config(self, state_print_conf_finalized):
+            print(
+                json.dumps(
+                    {
+                        ConfLeap.leap_user.name: file_data,
+                    },
+                    indent=4,
+                )
+            )
+
+        return file_data
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_conf_data_verified(AbstractCachingStateNode[bool]):
+    """
+    Validates data of all `ConfLeap`-s with files (before any restart or subprocess),
+    so that misconfiguration fails fast instead of half-way through `venv` preparation.
+
+    The `ConfLeap.leap_primer` and `ConfLeap.leap_client` data are validated earlier
+    (by `EnvState.state_primer_conf_data_verified` and `EnvState.state_client_conf_data_verified`)
+    because some of their fields are used to find the conf files of the other `ConfLeap`-s.
+    """
+
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_primer_conf_data_verified.name,
+            EnvState.state_client_conf_data_verified.name,
+            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+            EnvState.state_user_conf_file_data_loaded.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: EnvState.state_conf_data_verified.name)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _eval_state_once(self) -> ValueType:
+        for conf_leap, conf_data_state_name in [
+            (ConfLeap.leap_env, EnvState.state_env_conf_file_data_loaded.name),
+            (ConfLeap.leap_host, EnvState.state_host_conf_file_data_loaded.name),
+            (ConfLeap.leap_user, EnvState.state_user_conf_file_data_loaded.name),
+        ]:
+            validate_conf_data(conf_leap, self.eval_parent_state(conf_data_state_name))
+        return True
+
+
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_merged_conf_data_loaded(AbstractCachingStateNode[MergedConfData]):
+    """
+    Merges `ConfLeap.leap_user` over `ConfLeap.leap_host` over `ConfLeap.leap_env` over `ConfLeap.leap_client`
+    once for all `AbstractOverriddenFieldCachingStateNode`-s.
+    """
 
     _parent_states = staticmethod(
         lambda: [
-            EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_client_conf_file_data_loaded.name,
             EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+            EnvState.state_user_conf_file_data_loaded.name,
+            EnvState.state_conf_data_verified.name,
         ]
     )
-    _state_name = staticmethod(lambda: EnvState.state_required_python_version_inited.name)
+    _state_name = staticmethod(lambda: EnvState.state_merged_conf_data_loaded.name)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _eval_state_once(self) -> ValueType:
+        state_client_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_client_conf_file_data_loaded.name)
+        state_env_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_env_conf_file_data_loaded.name)
+        state_host_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_host_conf_file_data_loaded.name)
+        state_user_conf_file_data_loaded: dict = self.eval_parent_state(EnvState.state_user_conf_file_data_loaded.name)
+
+        return MergedConfData(
+            [
+                (ConfLeap.leap_user, state_user_conf_file_data_loaded),
+                (ConfLeap.leap_host, state_host_conf_file_data_loaded),
+                (ConfLeap.leap_env, state_env_conf_file_data_loaded),
+                (ConfLeap.leap_client, state_client_conf_file_data_loaded),
+            ]
+        )
+
+
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_required_python_version_inited(AbstractOverriddenFieldCachingStateNode[str]):
 
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_ref_root_dir_abs_path_inited.name,
+            EnvState.state_merged_conf_data_loaded.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: EnvState.state_required_python_version_inited.name)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
         state_required_python_version_inited: str | None = self._get_overridden_value_or_default(
             ConfField.field_required_python_version.value,
             None,
         )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         state_ref_root_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_ref_root_dir_abs_path_inited.name)
 
         if state_required_python_version_inited is None:
@@ -3231,24 +4847,23 @@ class Bootstrapper_required_python_version_inited(AbstractOverriddenFieldCaching
             state_required_python_version_inited = read_text_file(python_version_file_abs_path).strip()
 
         assert state_required_python_version_inited is not None
-        logger.debug(f"raw `state_required_python_version_inited` [{state_required_python_version_inited}]")
+        logger.debug("raw `state_required_python_version_inited` [%s]", state_required_python_version_inited)
 
         # normalize:
         python_version: tuple[int, int, int] = parse_python_version(state_required_python_version_inited)
         state_required_python_version_inited = f"{python_version[0]}.{python_version[1]}.{python_version[2]}"
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return state_required_python_version_inited
 
 
 # noinspection PyPep8Naming
 @trivial_factory
 class Bootstrapper_state_python_selector_file_abs_path_inited(AbstractOverriddenFieldCachingStateNode[str]):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_ref_root_dir_abs_path_inited.name,
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_python_selector_file_abs_path_inited.name)
@@ -3259,7 +4874,7 @@ class Bootstrapper_state_python_selector_file_abs_path_inited(AbstractOverridden
             ConfField.field_python_selector_file_rel_path.value,
             None,
         )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         state_python_selector_file_abs_path_inited: str | None
         if python_selector_file_rel_path is not None:
             state_ref_root_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_ref_root_dir_abs_path_inited.name)
@@ -3269,7 +4884,7 @@ class Bootstrapper_state_python_selector_file_abs_path_inited(AbstractOverridden
             )
         else:
             state_python_selector_file_abs_path_inited = None
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         return state_python_selector_file_abs_path_inited
 
 
@@ -3286,11 +4901,11 @@ class Bootstrapper_state_selected_python_file_abs_path_inited(AbstractCachingSta
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_selected_python_file_abs_path_inited.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
 
         state_python_selector_file_abs_path_inited: str | None = self.eval_parent_state(EnvState.state_python_selector_file_abs_path_inited.name)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         state_required_python_version_inited: str = self.eval_parent_state(EnvState.state_required_python_version_inited.name)
 
         required_python_version: tuple[int, int, int] = parse_python_version(state_required_python_version_inited)
@@ -3310,8 +4925,7 @@ class Bootstrapper_state_local_venv_dir_abs_path_inited(AbstractOverriddenFieldC
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_ref_root_dir_abs_path_inited.name,
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_local_venv_dir_abs_path_inited.name)
@@ -3342,8 +4956,7 @@ class Bootstrapper_state_local_log_dir_abs_path_inited(AbstractOverriddenFieldCa
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_ref_root_dir_abs_path_inited.name,
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_local_log_dir_abs_path_inited.name)
@@ -3374,8 +4987,7 @@ class Bootstrapper_state_local_tmp_dir_abs_path_inited(AbstractOverriddenFieldCa
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_ref_root_dir_abs_path_inited.name,
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_local_tmp_dir_abs_path_inited.name)
@@ -3406,8 +5018,7 @@ class Bootstrapper_state_local_cache_dir_abs_path_inited(AbstractOverriddenField
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_ref_root_dir_abs_path_inited.name,
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_local_cache_dir_abs_path_inited.name)
@@ -3437,8 +5048,7 @@ class Bootstrapper_state_venv_driver_inited(AbstractOverriddenFieldCachingStateN
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     _parent_states = staticmethod(
         lambda: [
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
             EnvState.state_selected_python_file_abs_path_inited.name,
         ]
     )
@@ -3487,8 +5097,7 @@ class Bootstrapper_state_version_constraints_file_basename_inited(AbstractOverri
 
     _parent_states = staticmethod(
         lambda: [
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_version_constraints_file_basename_inited.name)
@@ -3506,8 +5115,7 @@ class Bootstrapper_state_project_descriptors_inited(AbstractOverriddenFieldCachi
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     _parent_states = staticmethod(
         lambda: [
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_project_descriptors_inited.name)
@@ -3528,8 +5136,7 @@ class Bootstrapper_state_install_specs_inited(AbstractOverriddenFieldCachingStat
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     _parent_states = staticmethod(
         lambda: [
-            EnvState.state_client_conf_file_data_loaded.name,
-            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_install_specs_inited.name)
@@ -3576,6 +5183,12 @@ class Bootstrapper_state_derived_conf_data_loaded(AbstractCachingStateNode[dict]
             # `ConfLeap.leap_env`
             # nothing specific
             # ===
+            # `ConfLeap.leap_host`
+            EnvState.state_host_conf_file_abs_path_inited.name,
+            # ===
+            # `ConfLeap.leap_user`
+            EnvState.state_user_conf_file_abs_path_inited.name,
+            # ===
             # `ConfLeap.leap_derived`
             EnvState.state_required_python_version_inited.name,
             EnvState.state_selected_python_file_abs_path_inited.name,
@@ -3594,6 +5207,8 @@ class Bootstrapper_state_derived_conf_data_loaded(AbstractCachingStateNode[dict]
             EnvState.state_primer_conf_file_data_loaded.name,
             EnvState.state_client_conf_file_data_loaded.name,
             EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+            EnvState.state_user_conf_file_data_loaded.name,
             *self.derived_data_env_states,
         ]
 
@@ -3633,13 +5248,87 @@ class Bootstrapper_state_effective_conf_data_printed(AbstractCachingStateNode[in
     Implements: FT_19_44_42_19.effective_config.md
     """
 
-    _parent_states = staticmethod(lambda: [EnvState.state_derived_conf_data_loaded.name])
+    _parent_states = staticmethod(
+        lambda: [
+            EnvState.state_input_sub_command_arg_loaded.name,
+            EnvState.state_input_conf_format_arg_loaded.name,
+            EnvState.state_proto_code_file_abs_path_inited.name,
+            EnvState.state_primer_conf_file_abs_path_inited.name,
+            EnvState.state_primer_conf_file_data_loaded.name,
+            EnvState.state_global_conf_file_abs_path_inited.name,
+            EnvState.state_client_conf_file_data_loaded.name,
+            EnvState.state_local_conf_file_abs_path_inited.name,
+            EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_host_conf_file_abs_path_inited.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+            EnvState.state_user_conf_file_abs_path_inited.name,
+            EnvState.state_user_conf_file_data_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
+            EnvState.state_derived_conf_data_loaded.name,
+        ]
+    )
     _state_name = staticmethod(lambda: EnvState.state_effective_conf_data_printed.name)
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
-        # Nothing to do:
-        # If we reach this state,
-        # then, transitively, effective configs for all `ConfLeap.*` has been printed.
+        state_input_sub_command_arg_loaded: SubCommand = self.eval_parent_state(EnvState.state_input_sub_command_arg_loaded.name)
+        state_input_conf_format_arg_loaded: EffectiveConfigFormat = self.eval_parent_state(EnvState.state_input_conf_format_arg_loaded.name)
+
+        if state_input_conf_format_arg_loaded == EffectiveConfigFormat.format_text:
+            # Nothing to do:
+            # If we reach this state,
+            # then, transitively, effective configs for all `ConfLeap.*` has been printed.
+            return 0
+
+        if (
+            state_input_sub_command_arg_loaded != SubCommand.command_eval
+            # See `_can_print_effective_config`:
+            or self.env_ctx.get_stride() != StateStride.stride_py_arbitrary
+        ):
+            return 0
+
+        # The `ConfLeap`-s overriding each other are listed from the lowest to the highest priority:
+        conf_leap_sources: list[tuple[ConfLeap, str | None, dict]] = [
+            (
+                ConfLeap.leap_input,
+                None,
+                {
+                    EnvState.state_proto_code_file_abs_path_inited.name: self.eval_parent_state(EnvState.state_proto_code_file_abs_path_inited.name),
+                    EnvState.state_primer_conf_file_abs_path_inited.name: self.eval_parent_state(EnvState.state_primer_conf_file_abs_path_inited.name),
+                },
+            ),
+        ]
+        for conf_leap, conf_file_state, conf_data_state in [
+            (ConfLeap.leap_primer, EnvState.state_primer_conf_file_abs_path_inited, EnvState.state_primer_conf_file_data_loaded),
+            (ConfLeap.leap_client, EnvState.state_global_conf_file_abs_path_inited, EnvState.state_client_conf_file_data_loaded),
+            (ConfLeap.leap_env, EnvState.state_local_conf_file_abs_path_inited, EnvState.state_env_conf_file_data_loaded),
+            (ConfLeap.leap_host, EnvState.state_host_conf_file_abs_path_inited, EnvState.state_host_conf_file_data_loaded),
+            (ConfLeap.leap_user, EnvState.state_user_conf_file_abs_path_inited, EnvState.state_user_conf_file_data_loaded),
+        ]:
+            # The host conf file path is `None` when it is not configured:
+            conf_file_abs_path: str | None = self.eval_parent_state(conf_file_state.name)
+            conf_leap_sources.append(
+                (
+                    conf_leap,
+                    None if conf_file_abs_path is None else get_loaded_conf_file_abs_path(conf_file_abs_path),
+                    self.eval_parent_state(conf_data_state.name),
+                )
+            )
+        conf_leap_sources.append(
+            (
+                ConfLeap.leap_derived,
+                None,
+                self.eval_parent_state(EnvState.state_derived_conf_data_loaded.name),
+            )
+        )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        write_effective_conf_document(
+            conf_leap_sources,
+            # The same data the overridden fields are read from (the single provenance source):
+            self.eval_parent_state(EnvState.state_merged_conf_data_loaded.name),
+            state_input_conf_format_arg_loaded,
+            sys.stdout,
+        )
+        sys.stdout.flush()
         return 0
 
 
@@ -3721,7 +5410,7 @@ class Bootstrapper_state_stride_py_required_reached_prepare_venv(AbstractCaching
         ), f"Configured `python` [{state_selected_python_file_abs_path_inited}] must be outside of configured `venv` [{state_local_venv_dir_abs_path_inited}]"
 
         path_to_curr_python = get_path_to_curr_python()
-        logger.debug(f"path_to_curr_python: {path_to_curr_python}")
+        logger.debug("path_to_curr_python: %s", path_to_curr_python)
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         assert not is_sub_path(
             path_to_curr_python,
@@ -3801,6 +5490,7 @@ class Bootstrapper_state_reboot_triggered_is_app(AbstractCachingStateNode[bool])
             EnvState.state_local_conf_symlink_abs_path_inited.name,
             EnvState.state_local_venv_dir_abs_path_inited.name,
             EnvState.state_local_tmp_dir_abs_path_inited.name,
+            EnvState.state_local_cache_dir_abs_path_inited.name,
             EnvState.state_version_constraints_file_basename_inited.name,
             EnvState.state_stride_py_required_reached.name,
         ]
@@ -3831,17 +5521,21 @@ class Bootstrapper_state_reboot_triggered_is_app(AbstractCachingStateNode[bool])
             return False
 
         state_local_venv_dir_abs_path_inited = self.eval_parent_state(EnvState.state_local_venv_dir_abs_path_inited.name)
+        state_local_cache_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_cache_dir_abs_path_inited.name)
+        # Mutate `venv` under the lock held until `release_venv_lock`:
+        hold_venv_lock(get_venv_lock_file_abs_path(state_local_cache_dir_abs_path_inited, state_local_venv_dir_abs_path_inited))
+
         if os.path.exists(state_local_venv_dir_abs_path_inited):
 
             # Move old `venv` to temporary directory:
 
             state_local_tmp_dir_abs_path_inited = self.eval_parent_state(EnvState.state_local_tmp_dir_abs_path_inited.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
             moved_venv_dir = os.path.join(
                 state_local_tmp_dir_abs_path_inited,
                 f"venv.before.{state_input_start_id_var_loaded}",
             )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
             logger.info(f"moving `venv` dir from [{state_local_venv_dir_abs_path_inited}] to [{moved_venv_dir}]")
 
             shutil.move(
@@ -3858,14 +5552,14 @@ class Bootstrapper_state_reboot_triggered_is_app(AbstractCachingStateNode[bool])
         if os.path.exists(constraints_txt_path):
             logger.info(f"removing version constraints file [{constraints_txt_path}]")
             os.remove(constraints_txt_path)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return True
 
 
 # noinspection PyPep8Naming
 @conditional_factory
 class Bootstrapper_state_reboot_triggered_not_is_app(AbstractCachingStateNode[bool]):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     _state_name = staticmethod(lambda: EnvState.state_reboot_triggered.name)
 
     def _eval_state_once(self) -> ValueType:
@@ -3880,14 +5574,15 @@ class Factory_state_reboot_triggered(NodeFactory[bool]):
             return Bootstrapper_state_reboot_triggered_is_app(self.env_ctx)
         else:
             return Bootstrapper_state_reboot_triggered_not_is_app(self.env_ctx)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 # noinspection PyPep8Naming
 @conditional_factory
-class Bootstrapper_state_venv_driver_prepared_is_app(AbstractCachingStateNode[VenvDriverBase]):
+class Bootstrapper_state_venv_driver_prepared_is_app(AbstractOverriddenFieldCachingStateNode[VenvDriverBase]):
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_input_sub_command_arg_loaded.name,
+            EnvState.state_merged_conf_data_loaded.name,
             EnvState.state_required_python_version_inited.name,
             EnvState.state_selected_python_file_abs_path_inited.name,
             EnvState.state_local_venv_dir_abs_path_inited.name,
@@ -3897,11 +5592,11 @@ class Bootstrapper_state_venv_driver_prepared_is_app(AbstractCachingStateNode[Ve
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_venv_driver_prepared.name)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def _eval_state_once(self) -> ValueType:
 
         state_input_sub_command_arg_loaded: SubCommand = self.eval_parent_state(EnvState.state_input_sub_command_arg_loaded.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         state_required_python_version_inited: str = self.eval_parent_state(EnvState.state_required_python_version_inited.name)
 
         state_selected_python_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_selected_python_file_abs_path_inited.name)
@@ -3919,6 +5614,11 @@ class Bootstrapper_state_venv_driver_prepared_is_app(AbstractCachingStateNode[Ve
                 selected_python_file_abs_path=state_selected_python_file_abs_path_inited,
                 state_local_venv_dir_abs_path_inited=state_local_venv_dir_abs_path_inited,
                 state_local_cache_dir_abs_path_inited=state_local_cache_dir_abs_path_inited,
+                uv_tools_dir_abs_path=self._get_uv_tools_dir_abs_path(),
+                required_uv_version=self._get_overridden_value_or_default(
+                    ConfField.field_required_uv_version.value,
+                    ConfConstEnv.default_required_uv_version,
+                ),
             )
         elif VenvDriverType.venv_pip == state_venv_driver_inited:
             # Nothing to do:
@@ -3933,7 +5633,25 @@ class Bootstrapper_state_venv_driver_prepared_is_app(AbstractCachingStateNode[Ve
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return venv_driver
 
+    def _get_uv_tools_dir_abs_path(self) -> str | None:
+        """
+        See: FT_73_95_31_84.venv_driver.md
+        """
+        uv_tools_dir_abs_path: str | None = os.environ.get(EnvVar.var_PROTOPRIMER_UV_TOOLS_DIR.value, None)
+        if uv_tools_dir_abs_path is None:
+            uv_tools_dir_abs_path = self._get_overridden_value_or_default(
+                ConfField.field_uv_tools_dir_abs_path.value,
+                ConfConstEnv.default_uv_tools_dir_abs_path,
+            )
+        if uv_tools_dir_abs_path is None:
+            return None
+
+        uv_tools_dir_abs_path = os.path.expanduser(uv_tools_dir_abs_path)
+        if not os.path.isabs(uv_tools_dir_abs_path):
+            raise AssertionError(f"`{ConfField.field_uv_tools_dir_abs_path.value}` must specify absolute path [{uv_tools_dir_abs_path}]")
+        return os.path.normpath(uv_tools_dir_abs_path)
 
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 # noinspection PyPep8Naming
 @conditional_factory
 class Bootstrapper_state_venv_driver_prepared_not_is_app(AbstractCachingStateNode[VenvDriverBase]):
@@ -3971,6 +5689,7 @@ class Bootstrapper_state_stride_py_venv_reached_is_app(AbstractCachingStateNode[
             EnvState.state_local_conf_file_abs_path_inited.name,
             EnvState.state_selected_python_file_abs_path_inited.name,
             EnvState.state_local_venv_dir_abs_path_inited.name,
+            EnvState.state_local_cache_dir_abs_path_inited.name,
             EnvState.state_reboot_triggered.name,
             EnvState.state_venv_driver_prepared.name,
         ]
@@ -3992,6 +5711,7 @@ class Bootstrapper_state_stride_py_venv_reached_is_app(AbstractCachingStateNode[
 
         state_selected_python_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_selected_python_file_abs_path_inited.name)
         state_local_venv_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_venv_dir_abs_path_inited.name)
+        state_local_cache_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_cache_dir_abs_path_inited.name)
 
         state_venv_driver_prepared: VenvDriverBase = self.eval_parent_state(EnvState.state_venv_driver_prepared.name)
 
@@ -4000,7 +5720,7 @@ class Bootstrapper_state_stride_py_venv_reached_is_app(AbstractCachingStateNode[
             ConfConstGeneral.file_rel_path_venv_python,
         )
         path_to_curr_python: str = get_path_to_curr_python()
-        logger.debug(f"path_to_curr_python: {path_to_curr_python}")
+        logger.debug("path_to_curr_python: %s", path_to_curr_python)
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         # TODO: FT_77_15_06_50.dynamic_DAG.md:
         #       Review and clarify `SubCommand.command_start`, `EnvContext._is_app`, ...
@@ -4026,21 +5746,34 @@ class Bootstrapper_state_stride_py_venv_reached_is_app(AbstractCachingStateNode[
                     raise AssertionError(f"Current `python` [{path_to_curr_python}] must point to the same file as the selected one [{state_selected_python_file_abs_path_inited}].")
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         assert self.env_ctx.get_stride().value <= StateStride.stride_py_required.value
-        if not os.path.exists(state_local_venv_dir_abs_path_inited):
-            if state_input_sub_command_arg_loaded == SubCommand.command_start:
-                # The `venv` is supposed to be ready in `SubCommand.command_start`:
-                raise AssertionError(f"`venv` [{state_local_venv_dir_abs_path_inited}] is supposed to be ready in `SubCommand` [{state_input_sub_command_arg_loaded.name}] execute `SubCommand` [{SubCommand.command_boot.name}] to prepare it.")
-            else:
-                state_venv_driver_prepared.create_venv(state_local_venv_dir_abs_path_inited)
+        # Concurrent runs in the same client repo: only `SubCommand.command_start` does not mutate `venv`:
+        venv_lock_file_abs_path: str = get_venv_lock_file_abs_path(state_local_cache_dir_abs_path_inited, state_local_venv_dir_abs_path_inited)
+        venv_lock_context: typing.ContextManager
+        if state_input_sub_command_arg_loaded == SubCommand.command_start:
+            # Wait for any concurrent run still mutating `venv`:
+            venv_lock_context = acquire_file_lock(venv_lock_file_abs_path, is_exclusive=False)
         else:
-            logger.info(f"reusing existing `venv` [{state_local_venv_dir_abs_path_inited}]")
-            if state_input_sub_command_arg_loaded == SubCommand.command_start:
-                # Skip `venv` type validation:
-                pass
+            # Mutate `venv` under the lock held until `release_venv_lock` (including the next `python`):
+            hold_venv_lock(venv_lock_file_abs_path)
+            venv_lock_context = contextlib.nullcontext()
+            # The fast launcher entry script does not wait for the lock - make it fall back to `start_app` (which does):
+            delete_launch_records(state_proto_code_file_abs_path_inited)
+        with venv_lock_context:
+            if not os.path.exists(state_local_venv_dir_abs_path_inited):
+                if state_input_sub_command_arg_loaded == SubCommand.command_start:
+                    # The `venv` is supposed to be ready in `SubCommand.command_start`:
+                    raise AssertionError(f"`venv` [{state_local_venv_dir_abs_path_inited}] is supposed to be ready in `SubCommand` [{state_input_sub_command_arg_loaded.name}] execute `SubCommand` [{SubCommand.command_boot.name}] to prepare it.")
+                else:
+                    state_venv_driver_prepared.create_venv(state_local_venv_dir_abs_path_inited)
             else:
-                if not state_venv_driver_prepared.is_mine_venv(state_local_venv_dir_abs_path_inited):
-                    raise AssertionError(f"`venv` [{state_local_venv_dir_abs_path_inited}] was not created by this driver [{state_venv_driver_prepared.get_type().name}] retry with [{SubCommand.command_reboot.value}] sub command.")
-
+                logger.info(f"reusing existing `venv` [{state_local_venv_dir_abs_path_inited}]")
+                if state_input_sub_command_arg_loaded == SubCommand.command_start:
+                    # Skip `venv` type validation:
+                    pass
+                else:
+                    if not state_venv_driver_prepared.is_mine_venv(state_local_venv_dir_abs_path_inited):
+                        raise AssertionError(f"`venv` [{state_local_venv_dir_abs_path_inited}] was not created by this driver [{state_venv_driver_prepared.get_type().name}] retry with [{SubCommand.command_reboot.value}] sub command.")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return switch_python(
             curr_python_path=state_selected_python_file_abs_path_inited,
             next_py_exec=self.env_ctx.set_max_stride(state_stride_py_venv_reached),
@@ -4048,7 +5781,7 @@ class Bootstrapper_state_stride_py_venv_reached_is_app(AbstractCachingStateNode[
             start_id=state_input_start_id_var_loaded,
             proto_code_abs_file_path=state_proto_code_file_abs_path_inited,
         )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 # noinspection PyPep8Naming
 @conditional_factory
@@ -4059,10 +5792,11 @@ class Bootstrapper_state_stride_py_venv_reached_not_is_app(AbstractCachingStateN
             EnvState.state_input_start_id_var_loaded.name,
             EnvState.state_proto_code_file_abs_path_inited.name,
             EnvState.state_local_venv_dir_abs_path_inited.name,
+            EnvState.state_local_cache_dir_abs_path_inited.name,
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_stride_py_venv_reached.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
         state_stride: StateStride = StateStride.stride_py_venv
 
@@ -4072,15 +5806,39 @@ class Bootstrapper_state_stride_py_venv_reached_not_is_app(AbstractCachingStateN
         state_input_start_id_var_loaded: str = self.eval_parent_state(EnvState.state_input_start_id_var_loaded.name)
         state_proto_code_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_proto_code_file_abs_path_inited.name)
         state_local_venv_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_venv_dir_abs_path_inited.name)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-        # The `venv` is supposed to be ready when called as `func_start_app`:
-        if not os.path.exists(state_local_venv_dir_abs_path_inited):
-            raise AssertionError(f"`venv` [{state_local_venv_dir_abs_path_inited}] is not found, run `{SubCommand.command_boot.value}` first")
+        state_local_cache_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_cache_dir_abs_path_inited.name)
 
         venv_path_to_python: str = os.path.join(
             state_local_venv_dir_abs_path_inited,
             ConfConstGeneral.file_rel_path_venv_python,
         )
+
+        # The `venv` is supposed to be ready when called as `func_start_app`:
+        # wait for any concurrent run still mutating it (see `hold_venv_lock`)
+        # to verify (and record) only the `venv` it leaves complete:
+        with acquire_file_lock(
+            get_venv_lock_file_abs_path(state_local_cache_dir_abs_path_inited, state_local_venv_dir_abs_path_inited),
+            is_exclusive=False,
+        ):
+            if not os.path.exists(state_local_venv_dir_abs_path_inited):
+                raise AssertionError(f"`venv` [{state_local_venv_dir_abs_path_inited}] is not found, run `{SubCommand.command_boot.value}` first")
+            if not os.path.exists(venv_path_to_python):
+                raise AssertionError(f"`venv` [{state_local_venv_dir_abs_path_inited}] has no `python` [{venv_path_to_python}], run `{SubCommand.command_reboot.value}` to re-create it")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+            # FT_66_02_54_56.context_isolation.md: do not pass it to the next `python` (and the app):
+            launch_record_abs_path: str | None = os.environ.pop(EnvVar.var_PROTOPRIMER_LAUNCH_RECORD.value, None)
+            if launch_record_abs_path is not None:
+                write_launch_record(
+                    launch_record_abs_path,
+                    venv_path_to_python,
+                    [
+                        state_proto_code_file_abs_path_inited,
+                        venv_path_to_python,
+                        os.path.join(state_local_venv_dir_abs_path_inited, ConfConstGeneral.venv_config_file_basename),
+                        *[conf_file_abs_path for _, conf_file_abs_path in list_evaluated_conf_files(self.env_ctx)],
+                    ],
+                )
+
         return switch_python(
             curr_python_path=get_path_to_curr_python(),
             next_py_exec=self.env_ctx.set_max_stride(state_stride),
@@ -4088,7 +5846,7 @@ class Bootstrapper_state_stride_py_venv_reached_not_is_app(AbstractCachingStateN
             start_id=state_input_start_id_var_loaded,
             proto_code_abs_file_path=state_proto_code_file_abs_path_inited,
         )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 # noinspection PyPep8Naming
 class Factory_state_stride_py_venv_reached(NodeFactory[StateStride]):
@@ -4098,17 +5856,20 @@ class Factory_state_stride_py_venv_reached(NodeFactory[StateStride]):
             return Bootstrapper_state_stride_py_venv_reached_is_app(self.env_ctx)
         else:
             return Bootstrapper_state_stride_py_venv_reached_not_is_app(self.env_ctx)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 # noinspection PyPep8Naming
 @conditional_factory
-class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingStateNode[bool]):
+class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractOverriddenFieldCachingStateNode[bool]):
 
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_local_conf_symlink_abs_path_inited.name,
+            EnvState.state_merged_conf_data_loaded.name,
+            EnvState.state_local_venv_dir_abs_path_inited.name,
+            EnvState.state_local_cache_dir_abs_path_inited.name,
             EnvState.state_version_constraints_file_basename_inited.name,
             EnvState.state_project_descriptors_inited.name,
             EnvState.state_install_specs_inited.name,
@@ -4117,9 +5878,9 @@ class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingSta
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_protoprimer_package_installed.name)
-
-    def _eval_state_once(self) -> ValueType:
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def _eval_state_once(self) -> ValueType:
+
         state_input_sub_command_arg_loaded: SubCommand = self.eval_parent_state(EnvState.state_input_sub_command_arg_loaded.name)
 
         # TODO: FT_77_15_06_50.dynamic_DAG.md:
@@ -4138,9 +5899,9 @@ class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingSta
         state_local_conf_symlink_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_conf_symlink_abs_path_inited.name)
 
         state_project_descriptors_inited: list[dict] = self.eval_parent_state(EnvState.state_project_descriptors_inited.name)
-
-        state_install_specs_inited: list[dict] = self.eval_parent_state(EnvState.state_install_specs_inited.name)
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        state_install_specs_inited: list[dict] = self.eval_parent_state(EnvState.state_install_specs_inited.name)
+
         state_venv_driver_prepared: VenvDriverBase = self.eval_parent_state(EnvState.state_venv_driver_prepared.name)
 
         state_version_constraints_file_basename_inited: str = self.eval_parent_state(EnvState.state_version_constraints_file_basename_inited.name)
@@ -4150,6 +5911,11 @@ class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingSta
         if not install_packages:
             return False
 
+        state_local_venv_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_venv_dir_abs_path_inited.name)
+        state_local_cache_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_cache_dir_abs_path_inited.name)
+        # Mutate `venv` under the lock held until `release_venv_lock`:
+        hold_venv_lock(get_venv_lock_file_abs_path(state_local_cache_dir_abs_path_inited, state_local_venv_dir_abs_path_inited))
+
         constraints_txt_path = os.path.join(
             state_local_conf_symlink_abs_path_inited,
             state_version_constraints_file_basename_inited,
@@ -4160,11 +5926,11 @@ class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingSta
                 constraints_txt_path,
                 "",
             )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         if len(state_project_descriptors_inited) == 0:
             logger.warning(f"{ValueName.value_project_descriptors.value} is empty - nothing to install")
             return True
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         # Group `project_descriptor`-s into `install_group`-s:
         grouped_descriptors: dict[str | None, list[dict]] = {}
         for project_descriptor in state_project_descriptors_inited:
@@ -4178,27 +5944,10 @@ class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingSta
         ordered_install_groups: list[str | None] = []
         for install_spec_item in state_install_specs_inited:
 
-            # The `install_specs` is a list of singleton dict-s:
-            # (where each key is one of the `install_group`-s)
-            if not isinstance(install_spec_item, dict) or len(install_spec_item) != 1:
-                raise AssertionError(
-                    f"invalid item in `{ConfField.field_install_specs.value}` "
-                    f"(must be a single-item `dict`): "
-                    f"[{install_spec_item}]"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-                )
-
+            # The `install_specs` is a list of singleton dict-s (validated by `EnvState.state_conf_data_verified`):
             install_group_name = list(install_spec_item.keys())[0]
             install_spec_obj = install_spec_item[install_group_name]
-
-            if not isinstance(install_spec_obj, dict):
-                raise AssertionError(
-                    f"invalid value of `{install_group_name}` "
-                    f"in `{ConfField.field_install_specs.value}` (must be a `dict`): "
-                    f"[{install_spec_obj}]"
-                    #
-                )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
             extra_command_args: list[str] = install_spec_obj.get(ConfField.field_extra_command_args.value, [])
 
             if install_group_name in grouped_descriptors:
@@ -4208,7 +5957,7 @@ class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingSta
                 logger.warning(
                     f"`{install_group_name}` from `{ConfField.field_install_specs.value}` "
                     f"is not found in `{ConfField.field_project_descriptors.value}`"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+                    #
                 )
 
         # Add `install_group`-s not listed in `install_specs`:
@@ -4217,21 +5966,133 @@ class Bootstrapper_state_protoprimer_package_installed_is_app(AbstractCachingSta
                 ordered_install_groups.append(install_group)
                 group_to_extra_args[install_group] = []
 
-        # Install groups one by one:
-        for install_group in ordered_install_groups:
-            group_descriptors = grouped_descriptors[install_group]
-            logger.info(f"installing group: [{install_group}]")
-
-            state_venv_driver_prepared.install_dependencies(
+        install_mode: InstallMode = InstallMode[
+            self._get_overridden_value_or_default(
+                ConfField.field_install_mode.value,
+                ConfConstEnv.default_install_mode,
+            )
+        ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        if install_mode != InstallMode.install_per_group:
+            verify_combined_index_command_args(group_to_extra_args)
+
+        if install_mode == InstallMode.install_per_group:
+            # Install groups one by one:
+            for install_group in ordered_install_groups:
+                group_descriptors = grouped_descriptors[install_group]
+                logger.info(f"installing group: [{install_group}]")
+
+                state_venv_driver_prepared.install_dependencies(
+                    state_ref_root_dir_abs_path_inited,
+                    get_path_to_curr_python(),
+                    constraints_txt_path,
+                    group_descriptors,
+                    group_to_extra_args[install_group],
+                )
+        else:
+            self._install_combined(
+                install_mode,
+                state_venv_driver_prepared,
                 state_ref_root_dir_abs_path_inited,
-                get_path_to_curr_python(),
                 constraints_txt_path,
-                group_descriptors,
-                group_to_extra_args[install_group],
+                [grouped_descriptors[install_group] for install_group in ordered_install_groups],
+                [group_to_extra_args[install_group] for install_group in ordered_install_groups],
             )
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return True
 
+    @staticmethod
+    def _install_combined(
+        install_mode: InstallMode,
+        venv_driver: VenvDriverBase,
+        ref_root_dir_abs_path: str,
+        constraints_file_abs_path: str,
+        ordered_group_descriptors: list[list[dict]],
+        ordered_group_extra_args: list[list[str]],
+    ) -> None:
+        """
+        Implements `InstallMode.install_combined`, `InstallMode.install_synced`, and `InstallMode.install_locked`:
+        (at most) a single resolver run for all `install_group`-s.
+        """
+
+        combined_descriptors: list[dict] = []
+        for group_descriptors in ordered_group_descriptors:
+            combined_descriptors.extend(group_descriptors)
+
+        # NOTE: Args are combined per group (not per arg) to keep values with their options (e.g. `--index-url URL`):
+        combined_extra_args: list[str] = []
+        seen_extra_args: list[list[str]] = []
+        for group_extra_args in ordered_group_extra_args:
+            if group_extra_args not in seen_extra_args:
+                seen_extra_args.append(group_extra_args)
+                combined_extra_args.extend(group_extra_args)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        if install_mode == InstallMode.install_locked:
+            lock_file_abs_path: str = get_install_lock_file_abs_path(constraints_file_abs_path)
+            install_input_digest: str = get_install_input_digest(
+                ref_root_dir_abs_path,
+                combined_descriptors,
+                combined_extra_args,
+            )
+            if read_install_lock_digest(lock_file_abs_path) == install_input_digest:
+                logger.info(f"installing from up-to-date lock file [{lock_file_abs_path}] without resolver run")
+            else:
+                logger.info(f"generating lock file [{lock_file_abs_path}] by a single resolver run")
+                with tempfile.TemporaryDirectory() as tmp_dir_abs_path:
+                    resolved_file_abs_path = os.path.join(
+                        tmp_dir_abs_path,
+                        ConfConstGeneral.file_basename_resolved_requirements,
+                    )
+                    venv_driver.resolve_dependencies(
+                        ref_root_dir_abs_path,
+                        get_path_to_curr_python(),
+                        constraints_file_abs_path,
+                        combined_descriptors,
+                        combined_extra_args,
+                        resolved_file_abs_path,
+                        is_hashed=True,
+                    )
+                    write_install_lock_file(
+                        resolved_file_abs_path,
+                        lock_file_abs_path,
+                        install_input_digest,
+                    )
+            venv_driver.install_locked_dependencies(
+                ref_root_dir_abs_path,
+                get_path_to_curr_python(),
+                lock_file_abs_path,
+                combined_descriptors,
+                combined_extra_args,
+            )
+            return
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        logger.info(f"installing [{len(ordered_group_descriptors)}] group(s) by a single resolver run")
+        with tempfile.TemporaryDirectory() as tmp_dir_abs_path:
+            resolved_file_abs_path = os.path.join(
+                tmp_dir_abs_path,
+                ConfConstGeneral.file_basename_resolved_requirements,
+            )
+            venv_driver.resolve_dependencies(
+                ref_root_dir_abs_path,
+                get_path_to_curr_python(),
+                constraints_file_abs_path,
+                combined_descriptors,
+                combined_extra_args,
+                resolved_file_abs_path,
+            )
+            if install_mode == InstallMode.install_synced:
+                venv_driver.sync_resolved_dependencies(
+                    get_path_to_curr_python(),
+                    resolved_file_abs_path,
+                    combined_extra_args,
+                )
+            else:
+                venv_driver.install_resolved_dependencies(
+                    get_path_to_curr_python(),
+                    resolved_file_abs_path,
+                    combined_extra_args,
+                )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 # noinspection PyPep8Naming
 @conditional_factory
@@ -4251,8 +6112,8 @@ class Factory_state_protoprimer_package_installed(NodeFactory[bool]):
             return Bootstrapper_state_protoprimer_package_installed_is_app(self.env_ctx)
         else:
             return Bootstrapper_state_protoprimer_package_installed_not_is_app(self.env_ctx)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 # noinspection PyPep8Naming
 @conditional_factory
 class Bootstrapper_state_version_constraints_generated_is_app(AbstractCachingStateNode[bool]):
@@ -4264,6 +6125,8 @@ class Bootstrapper_state_version_constraints_generated_is_app(AbstractCachingSta
         lambda: [
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_local_conf_symlink_abs_path_inited.name,
+            EnvState.state_local_venv_dir_abs_path_inited.name,
+            EnvState.state_local_cache_dir_abs_path_inited.name,
             EnvState.state_version_constraints_file_basename_inited.name,
             EnvState.state_venv_driver_prepared.name,
             EnvState.state_protoprimer_package_installed.name,
@@ -4294,6 +6157,11 @@ class Bootstrapper_state_version_constraints_generated_is_app(AbstractCachingSta
 
         state_version_constraints_file_basename_inited: str = self.eval_parent_state(EnvState.state_version_constraints_file_basename_inited.name)
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        state_local_venv_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_venv_dir_abs_path_inited.name)
+        state_local_cache_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_cache_dir_abs_path_inited.name)
+        # Normally, already held (inherited from the previous `python`):
+        hold_venv_lock(get_venv_lock_file_abs_path(state_local_cache_dir_abs_path_inited, state_local_venv_dir_abs_path_inited))
+
         state_venv_driver_prepared.pin_versions(
             get_path_to_curr_python(),
             os.path.join(
@@ -4310,11 +6178,11 @@ class Bootstrapper_state_version_constraints_generated_is_app(AbstractCachingSta
 class Bootstrapper_state_version_constraints_generated_not_is_app(AbstractCachingStateNode[bool]):
 
     _state_name = staticmethod(lambda: EnvState.state_version_constraints_generated.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def _eval_state_once(self) -> ValueType:
         return False
 
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 # noinspection PyPep8Naming
 class Factory_state_version_constraints_generated(NodeFactory[bool]):
 
@@ -4410,6 +6278,8 @@ class Bootstrapper_state_proto_code_updated_is_app(AbstractCachingStateNode[bool
         lambda: [
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_proto_code_file_abs_path_inited.name,
+            EnvState.state_local_venv_dir_abs_path_inited.name,
+            EnvState.state_local_cache_dir_abs_path_inited.name,
             EnvState.state_stride_deps_updated_reached.name,
         ]
     )
@@ -4424,7 +6294,7 @@ class Bootstrapper_state_proto_code_updated_is_app(AbstractCachingStateNode[bool
             return False
 
         state_input_sub_command_arg_loaded: SubCommand = self.eval_parent_state(EnvState.state_input_sub_command_arg_loaded.name)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         # TODO: FT_77_15_06_50.dynamic_DAG.md:
         #       Review and clarify `SubCommand.command_start`, `EnvContext._is_app`, ...
         if state_input_sub_command_arg_loaded == SubCommand.command_start:
@@ -4432,7 +6302,7 @@ class Bootstrapper_state_proto_code_updated_is_app(AbstractCachingStateNode[bool
             # is to update sources, but that has to be done in `SubCommand.command_boot`.
             # Skip:
             return False
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         state_proto_code_file_abs_path_inited = self.eval_parent_state(EnvState.state_proto_code_file_abs_path_inited.name)
         assert os.path.isabs(state_proto_code_file_abs_path_inited)
         assert not os.path.islink(state_proto_code_file_abs_path_inited)
@@ -4445,7 +6315,7 @@ class Bootstrapper_state_proto_code_updated_is_app(AbstractCachingStateNode[bool
             logger.warning(
                 f"Module `{ConfConstGeneral.name_protoprimer_package}` is missing in `venv`. "
                 f"{get_import_error_hint(ConfConstGeneral.name_protoprimer_package)} "
-                #
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
             )
             # These must be "instant" conditions.
             # No module => no update:
@@ -4456,11 +6326,10 @@ class Bootstrapper_state_proto_code_updated_is_app(AbstractCachingStateNode[bool
         # generated code inside generated code inside generated code ...
         generated_content_single_header: str = protoprimer.primer_kernel.ConfConstGeneral.func_get_proto_code_generated_boilerplate_single_header(protoprimer.primer_kernel)
         generated_content_multiple_body: str = protoprimer.primer_kernel.ConfConstGeneral.func_get_proto_code_generated_boilerplate_multiple_body(protoprimer.primer_kernel)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         # Use `primer_kernel` from installed package as the source for `proto_code` update:
         primer_kernel_abs_path = os.path.abspath(str(protoprimer.primer_kernel.__file__))
         primer_kernel_text: str = read_text_file(primer_kernel_abs_path)
-        proto_code_text_old: str = read_text_file(state_proto_code_file_abs_path_inited)
 
         # Update body:
         proto_code_text_with_body = _replace_multiple_body_in_empty_lines(
@@ -4468,20 +6337,30 @@ class Bootstrapper_state_proto_code_updated_is_app(AbstractCachingStateNode[bool
             boilerplate_text=generated_content_multiple_body,
             min_lines_between=ConfConstGeneral.min_lines_between_generated_boilerplate,
         )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         # Update header:
         proto_code_text_new = _replace_single_header_in_empty_lines(
             input_text=proto_code_text_with_body,
             boilerplate_text=generated_content_single_header,
         )
 
-        logger.debug(f"writing `primer_kernel_abs_path` [{primer_kernel_abs_path}] over `state_proto_code_file_abs_path_inited` [{state_proto_code_file_abs_path_inited}]")
-        write_text_file(
-            file_path=state_proto_code_file_abs_path_inited,
-            file_data=proto_code_text_new,
-        )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        state_local_venv_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_venv_dir_abs_path_inited.name)
+        state_local_cache_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_cache_dir_abs_path_inited.name)
+        # Normally, already held (inherited from the previous `python`):
+        hold_venv_lock(get_venv_lock_file_abs_path(state_local_cache_dir_abs_path_inited, state_local_venv_dir_abs_path_inited))
+
+        proto_code_text_old: str = read_text_file(state_proto_code_file_abs_path_inited)
         is_updated: bool = proto_code_text_old != proto_code_text_new
+        # Avoid rewriting the same content (concurrent runs may be loading the `proto_code` file):
+        if is_updated:
+            logger.debug("writing `primer_kernel_abs_path` [%s] over `state_proto_code_file_abs_path_inited` [%s]", primer_kernel_abs_path, state_proto_code_file_abs_path_inited)
+            write_text_file(
+                file_path=state_proto_code_file_abs_path_inited,
+                file_data=proto_code_text_new,
+            )
+            # The next stride (the same `venv` `python`) loads the bytecode instead of compiling the new source:
+            cache_proto_code_bytecode(state_proto_code_file_abs_path_inited)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         return is_updated
 
 
@@ -4537,6 +6416,9 @@ class Bootstrapper_state_stride_src_updated_reached(AbstractCachingStateNode[Sta
 
         state_input_start_id_var_loaded: str = self.eval_parent_state(EnvState.state_input_start_id_var_loaded.name)
 
+        # The `venv` mutations (if any) are complete:
+        release_venv_lock()
+
         return switch_python(
             curr_python_path=venv_path_to_python,
             next_py_exec=self.env_ctx.set_max_stride(state_stride_src_updated_reached),
@@ -4544,12 +6426,12 @@ class Bootstrapper_state_stride_src_updated_reached(AbstractCachingStateNode[Sta
             start_id=state_input_start_id_var_loaded,
             proto_code_abs_file_path=state_proto_code_file_abs_path_inited,
         )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 # noinspection PyPep8Naming
 @conditional_factory
 class Bootstrapper_state_input_command_line_is_app(AbstractCachingStateNode[str]):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     _parent_states = staticmethod(lambda: [EnvState.state_args_parsed.name])
     _state_name = staticmethod(lambda: EnvState.state_input_command_line.name)
 
@@ -4565,12 +6447,12 @@ class Bootstrapper_state_input_command_line_is_app(AbstractCachingStateNode[str]
 # noinspection PyPep8Naming
 @conditional_factory
 class Bootstrapper_state_input_command_line_not_is_app(AbstractCachingStateNode[str]):
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     _state_name = staticmethod(lambda: EnvState.state_input_command_line.name)
 
     def _eval_state_once(self) -> ValueType:
         return None
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 # noinspection PyPep8Naming
 class Factory_state_input_command_line(NodeFactory[str]):
@@ -4590,7 +6472,7 @@ class Bootstrapper_state_command_executed(AbstractCachingStateNode[int]):
     """
     If `ParsedArg.name_command`, this state replaces the current process with a shell executing the given command.
     """
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     _parent_states = staticmethod(
         lambda: [
             EnvState.state_local_venv_dir_abs_path_inited.name,
@@ -4600,7 +6482,7 @@ class Bootstrapper_state_command_executed(AbstractCachingStateNode[int]):
         ]
     )
     _state_name = staticmethod(lambda: EnvState.state_command_executed.name)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def _eval_state_once(self) -> ValueType:
 
         assert self.env_ctx.get_stride().value >= StateStride.stride_src_updated.value
@@ -4612,6 +6494,12 @@ class Bootstrapper_state_command_executed(AbstractCachingStateNode[int]):
         state_local_cache_dir_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_cache_dir_abs_path_inited.name)
 
         shell_driver: ShellDriverBase = _get_shell_driver(state_local_cache_dir_abs_path_inited)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        if command_line is not None and is_direct_exec_enabled():
+            return shell_driver.exec_command(
+                command_line,
+                state_local_venv_dir_abs_path_inited,
+            )
 
         return shell_driver.run_shell(
             False,
@@ -4621,7 +6509,7 @@ class Bootstrapper_state_command_executed(AbstractCachingStateNode[int]):
 
 
 ########################################################################################################################
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 class EnvState(enum.Enum):
     """
@@ -4630,7 +6518,7 @@ class EnvState(enum.Enum):
     NOTE: Only `str` names of the enum items are supposed to be used (any value is ignored).
     The value of `AbstractCachingStateNode` assigned is the default implementation for the state,
     and the only reason it is assigned is purely for the quick navigation across the source code in the IDE.
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     FT_68_54_41_96.state_dependency.md
 
     TODO: FT_77_15_06_50.dynamic_DAG.md:
@@ -4643,7 +6531,7 @@ class EnvState(enum.Enum):
     state_is_app_defined = Bootstrapper_state_is_app_defined
 
     state_input_is_stderr_log_enabled = Bootstrapper_state_input_is_stderr_log_enabled
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     state_input_stderr_log_level_var_loaded = Bootstrapper_state_input_stderr_log_level_var_loaded
 
     state_default_stderr_log_handler_configured = Bootstrapper_state_default_stderr_log_handler_configured
@@ -4651,25 +6539,29 @@ class EnvState(enum.Enum):
     state_args_parsed = Factory_state_args_parsed
 
     state_input_stderr_log_level_eval_finalized = Factory_state_input_stderr_log_level_eval_finalized
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     state_input_stderr_log_level_handler_configured = Bootstrapper_state_input_stderr_log_level_handler_configured
 
     # TODO: FT_77_15_06_50.dynamic_DAG.md:
     #       Avoid `arg` in the name (CLI is not available for all use cases).
     state_input_sub_command_arg_loaded = Factory_state_input_sub_command_arg_loaded
 
+    state_input_conf_format_arg_loaded = Factory_state_input_conf_format_arg_loaded
+
     state_print_conf_finalized = Factory_state_print_conf_finalized
 
     state_prepare_venv_finalized = Factory_state_prepare_venv_finalized
 
     state_input_final_state_eval_finalized = Factory_state_input_final_state_eval_finalized
 
+    state_input_watch_conf_arg_loaded = Factory_state_input_watch_conf_arg_loaded
+
     state_func_boot_env_executed = Bootstrapper_state_func_boot_env_executed
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     state_func_start_app_executed = Factory_state_func_start_app_executed
 
     state_func_call_lib_executed = Factory_state_func_call_lib_executed
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # Special case: triggers everything:
     state_everything_executed = Factory_state_everything_executed
 
@@ -4686,9 +6578,11 @@ class EnvState(enum.Enum):
 
     # `ConfLeap.leap_primer`:
     state_primer_conf_file_data_loaded = Bootstrapper_state_primer_conf_file_data_loaded
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-    state_ref_root_dir_abs_path_inited = Bootstrapper_state_ref_root_dir_abs_path_inited
 
+    state_primer_conf_data_verified = Bootstrapper_state_primer_conf_data_verified
+
+    state_ref_root_dir_abs_path_inited = Bootstrapper_state_ref_root_dir_abs_path_inited
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     state_global_conf_dir_abs_path_inited = Bootstrapper_state_global_conf_dir_abs_path_inited
 
     state_global_conf_file_abs_path_inited = Bootstrapper_state_global_conf_file_abs_path_inited
@@ -4696,6 +6590,8 @@ class EnvState(enum.Enum):
     # `ConfLeap.leap_client`:
     state_client_conf_file_data_loaded = Bootstrapper_state_client_conf_file_data_loaded
 
+    state_client_conf_data_verified = Bootstrapper_state_client_conf_data_verified
+
     state_selected_env_dir_rel_path_inited = Factory_state_selected_env_dir_rel_path_inited
 
     state_local_conf_symlink_abs_path_inited = Bootstrapper_state_local_conf_symlink_abs_path_inited
@@ -4705,16 +6601,30 @@ class EnvState(enum.Enum):
     # `ConfLeap.leap_env`:
     state_env_conf_file_data_loaded = Bootstrapper_state_env_conf_file_data_loaded
 
+    # `ConfLeap.leap_host`:
+    state_host_conf_file_abs_path_inited = Bootstrapper_state_host_conf_file_abs_path_inited
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    state_host_conf_file_data_loaded = Bootstrapper_state_host_conf_file_data_loaded
+
+    # `ConfLeap.leap_user`:
+    state_user_conf_file_abs_path_inited = Bootstrapper_state_user_conf_file_abs_path_inited
+
+    state_user_conf_file_data_loaded = Bootstrapper_state_user_conf_file_data_loaded
+
+    state_conf_data_verified = Bootstrapper_state_conf_data_verified
+
+    state_merged_conf_data_loaded = Bootstrapper_state_merged_conf_data_loaded
+
     state_required_python_version_inited = Bootstrapper_required_python_version_inited
 
     # TODO: TODO_41_10_50_01.implement_env_selector.md: What is the FT (feature_topic)?
     state_python_selector_file_abs_path_inited = Bootstrapper_state_python_selector_file_abs_path_inited
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     state_selected_python_file_abs_path_inited = Bootstrapper_state_selected_python_file_abs_path_inited
 
     # TODO: log, tmp, venv, ... dirs should better be configured at client level:
     state_local_venv_dir_abs_path_inited = Bootstrapper_state_local_venv_dir_abs_path_inited
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # TODO: log, tmp, venv, ... dirs should better be configured at client level:
     state_local_log_dir_abs_path_inited = Bootstrapper_state_local_log_dir_abs_path_inited
 
@@ -4731,12 +6641,12 @@ class EnvState(enum.Enum):
     state_project_descriptors_inited = Bootstrapper_state_project_descriptors_inited
 
     state_install_specs_inited = Bootstrapper_state_install_specs_inited
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # `ConfLeap.leap_derived`:
     state_derived_conf_data_loaded = Bootstrapper_state_derived_conf_data_loaded
 
     state_effective_conf_data_printed = Bootstrapper_state_effective_conf_data_printed
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     state_default_file_log_handler_configured = Bootstrapper_state_default_file_log_handler_configured
 
     # restart: `StateStride.stride_py_arbitrary` -> `StateStride.stride_py_required`:
@@ -4752,14 +6662,14 @@ class EnvState(enum.Enum):
     state_protoprimer_package_installed = Factory_state_protoprimer_package_installed
 
     state_version_constraints_generated = Factory_state_version_constraints_generated
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # restart: `StateStride.stride_py_venv` -> `StateStride.stride_deps_updated`:
     # TODO: rename - "reached" sounds weird (and makes no sense):
     state_stride_deps_updated_reached = Factory_state_stride_deps_updated_reached
 
     # TODO: rename according to the final name:
     state_proto_code_updated = Factory_state_proto_code_updated
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # restart: `StateStride.stride_deps_updated` -> `StateStride.stride_src_updated`:
     state_stride_src_updated_reached = Bootstrapper_state_stride_src_updated_reached
 
@@ -4775,14 +6685,14 @@ class TargetState(enum.Enum):
 
     # A special state that triggers execution of everything else:
     target_everything_executed = EnvState.state_everything_executed
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # FT_85_17_35_21.call_lib.md
     # FT_00_22_19_59.derived_config.md
     target_derived_config_loaded = EnvState.state_derived_conf_data_loaded
 
     # # FT_05_08_64_67.start_app.md
     target_venv_activated = EnvState.state_stride_py_venv_reached
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     # FT_85_17_35_21.boot_env.md
     # The final state before switching to `PrimerRuntime.runtime_meta`:
     target_proto_bootstrap_completed = EnvState.state_command_executed
@@ -4796,7 +6706,7 @@ class StateGraph:
     def __init__(self):
         self.state_nodes: dict[str, StateNode] = {}
         self.state_factories: dict[str, NodeFactory] = {}
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def register_factory(
         self,
         state_name: str,
@@ -4830,7 +6740,7 @@ class StateGraph:
     ) -> StateNode:
         if state_name not in self.state_nodes:
             self.state_nodes[state_name] = self.state_factories[state_name].create_state_node()
-            logger.debug(f"instantiated `state_node` class [{self.state_nodes[state_name].__class__}] for `state_name` [{state_name}]")
+            logger.debug("instantiated `state_node` class [%s] for `state_name` [%s]", self.state_nodes[state_name].__class__, state_name)
         return self.state_nodes[state_name]
 
     def eval_state(
@@ -5033,23 +6943,39 @@ class ContextBuilder:
 class StateStrideFilter(logging.Filter):
     """
     This filter sets `StateStride` values for each log entry without filtering any record.
+
+    It is added to the output handlers (not to the `logger`):
+    it is skipped for any record below the handler level (the `logger` is set to `logging.NOTSET`).
     """
 
-    def filter(
-        self,
-        record,
-    ):
-        record.py_exec_name = StateStride[
+    def __init__(self):
+        super().__init__()
+        self.py_exec_name: StateStride = StateStride.stride_py_unknown
+        self.load_py_exec_name()
+
+    def load_py_exec_name(self) -> None:
+        """
+        The `EnvVar.var_PROTOPRIMER_PY_EXEC` is constant for the process (it only changes via `os.execve`),
+        except when the handlers are reused with `EnvVar.var_PROTOPRIMER_MOCKED_RESTART` (see `_find_existing_log_handler`).
+        """
+        self.py_exec_name = StateStride[
             os.getenv(
                 EnvVar.var_PROTOPRIMER_PY_EXEC.value,
                 ConfConstInput.default_PROTOPRIMER_PY_EXEC,
             )
         ]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def filter(
+        self,
+        record,
+    ):
+        record.py_exec_name = self.py_exec_name
         record.state_stride = log_stride.get(StateStride.stride_py_unknown)
+        record.state_name = log_state_name.get(None)
         # Do not filter:
         return True
 
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 class UtcTimeFormatter(logging.Formatter):
     """
     Custom formatter with the proper timestamp.
@@ -5068,7 +6994,10 @@ class UtcTimeFormatter(logging.Formatter):
         )
         self.print_date = print_date
         self.print_time = print_time
-
+        # The timestamp prefix (up to seconds) is reused for all records within the same second:
+        # (whole `tuple` is replaced to keep it consistent between threads)
+        self.cached_second_prefix: tuple[int, str] = (-1, "")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def formatTime(
         self,
         record,
@@ -5076,29 +7005,41 @@ class UtcTimeFormatter(logging.Formatter):
     ):
         if not self.print_date and not self.print_time:
             return ""
+
+        created_second = int(record.created)
+        # Same rounding as `datetime.datetime.fromtimestamp` (to microseconds):
+        created_micros = round((record.created - created_second) * 1000000)
+        if created_micros >= 1000000:
+            created_second += 1
+            created_micros -= 1000000
+        cached_second, second_prefix = self.cached_second_prefix
+        if cached_second != created_second:
+            second_prefix = self._format_second_prefix(created_second)
+            self.cached_second_prefix = (created_second, second_prefix)
+
+        if not self.print_time:
+            return second_prefix
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        return f"{second_prefix}.{created_micros // 1000:03d}Z"
+
+    def _format_second_prefix(
+        self,
+        created_second: int,
+    ) -> str:
         log_timestamp = datetime.datetime.fromtimestamp(
-            record.created,
+            created_second,
             datetime.timezone.utc,
         )
-        iso_str = log_timestamp.isoformat(timespec="milliseconds").replace(
-            "+00:00",
-            "Z",
-        )
-
         if self.print_date and self.print_time:
-            return iso_str
-
-        date_part, time_part = iso_str.split("T")
-
-        if self.print_date:
-            return date_part
+            return log_timestamp.strftime("%Y-%m-%dT%H:%M:%S")
+        elif self.print_date:
+            return log_timestamp.strftime("%Y-%m-%d")
         else:
-            return time_part
+            return log_timestamp.strftime("%H:%M:%S")
 
 
 class DefaultFileLogFormatter(UtcTimeFormatter):
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def __init__(
         self,
         fmt: str = "%(asctime)s pid:%(process)d %(levelname)s %(filename)s:%(lineno)d %(message)s",
@@ -5108,7 +7049,7 @@ class DefaultFileLogFormatter(UtcTimeFormatter):
             print_time=True,
             fmt=fmt,
         )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 class _PrimerFileLogFormatter(DefaultFileLogFormatter):
 
@@ -5119,11 +7060,155 @@ class _PrimerFileLogFormatter(DefaultFileLogFormatter):
         )
 
 
+class JsonFileLogFormatter(UtcTimeFormatter):
+    """
+    FT_38_73_38_52.log_verbosity.md: formats each log record as a single-line JSON object (JSON lines).
+
+    Unlike the text format, multi-line messages (and stack traces) do not break log parsers.
+    The `StateStride` fields are set by `StateStrideFilter` (otherwise, they are `null`).
+    """
+
+    def __init__(
+        self,
+        start_id: str,
+    ):
+        super().__init__(
+            print_date=True,
+            print_time=True,
+        )
+        self.start_id: str = start_id
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def format(
+        self,
+        record,
+    ) -> str:
+        py_exec_name: StateStride | None = getattr(record, "py_exec_name", None)
+        state_stride: StateStride | None = getattr(record, "state_stride", None)
+        log_entry: dict = {
+            "time": self.formatTime(record),
+            "start_id": self.start_id,
+            "pid": record.process,
+            "level": record.levelname,
+            "py_exec_name": None if py_exec_name is None else py_exec_name.name,
+            "state_stride": None if state_stride is None else state_stride.name,
+            "state_name": getattr(record, "state_name", None),
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            # The same as `logging.Formatter.format` (see also `QueuedLogHandler.prepare`):
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            log_entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(log_entry)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+class _PrimerJsonFileLogFormatter(JsonFileLogFormatter):
+    pass
+
+
+def get_file_log_format() -> LogFormat:
+    """
+    See `EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT`.
+    """
+    file_log_format: str = os.getenv(
+        EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value,
+        ConfConstInput.default_PROTOPRIMER_FILE_LOG_FORMAT,
+    )
+    for log_format in LogFormat:
+        if log_format.value == file_log_format:
+            return log_format
+    raise AssertionError(f"`{EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value}` must be one of {[log_format.value for log_format in LogFormat]}: [{file_log_format}]")
+
+
+class QueuedLogHandler(logging.handlers.QueueHandler):
+    """
+    Hands log records over to a background thread (`logging.handlers.QueueListener`) writing them via `target_handler`.
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    It does not block the caller on every write and flush of the `target_handler` (e.g. a slow file system).
+    Any filters (e.g. `StateStrideFilter`) must be added to this handler (they run in the caller thread).
+    """
+
+    def __init__(
+        self,
+        target_handler: logging.Handler,
+    ):
+        super().__init__(queue.SimpleQueue())
+        self.target_handler: logging.Handler = target_handler
+        self.queue_listener = logging.handlers.QueueListener(
+            self.queue,
+            target_handler,
+            respect_handler_level=True,
+        )
+        self.is_closed: bool = False
+        self.queue_listener.start()
+
+    def prepare(
+        self,
+        record: logging.LogRecord,
+    ) -> logging.LogRecord:
+        """
+        Unlike the default `prepare`, keep the record for the `target_handler` formatter (e.g. `JsonFileLogFormatter`):
+        only the message is merged with its args, `exc_info` and `stack_info` are kept.
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        The `exc_text` is rendered in the caller thread (while the exception is still current).
+        """
+        prepared_record: logging.LogRecord = copy.copy(record)
+        prepared_record.message = record.getMessage()
+        prepared_record.msg = prepared_record.message
+        prepared_record.args = None
+        if record.exc_info and not record.exc_text:
+            prepared_record.exc_text = (self.target_handler.formatter or logging.Formatter()).formatException(record.exc_info)
+        return prepared_record
+
+    def flush(self) -> None:
+        """
+        Block until all queued records are written (e.g. before `os.execve` replaces the process).
+        """
+        if self.is_closed:
+            return
+        # The `stop` writes all already queued records before it returns:
+        self.queue_listener.stop()
+        self.target_handler.flush()
+        self.queue_listener.start()
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def close(self) -> None:
+        # `logging.shutdown` may close it again (after explicit `close`):
+        if not self.is_closed:
+            self.is_closed = True
+            self.queue_listener.stop()
+            self.target_handler.close()
+        super().close()
+
+
+def is_async_file_log_enabled() -> bool:
+    """
+    See `EnvVar.var_PROTOPRIMER_ASYNC_FILE_LOG`.
+    """
+    return str_to_bool(
+        os.getenv(
+            EnvVar.var_PROTOPRIMER_ASYNC_FILE_LOG.value,
+            ConfConstInput.default_PROTOPRIMER_ASYNC_FILE_LOG,
+        )
+    )
+
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+def flush_log_handlers() -> None:
+    """
+    Ensure no log records are lost when `os.execve` replaces the process (see `QueuedLogHandler`).
+    """
+    for log_handler in logger.handlers:
+        log_handler.flush()
+
+
 class DefaultStderrLogFormatter(UtcTimeFormatter):
     """
     Custom formatter with color and format based on log level for stderr.
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     color_reset = TermColor.reset_style.value
     color_set = {
         "CRITICAL": TermColor.fore_bold_dark_red.value,
@@ -5136,7 +7221,7 @@ class DefaultStderrLogFormatter(UtcTimeFormatter):
         # NOTE: Level `logging.NOTSET` (below `logging.DEBUG`) is not printed.
         #       And numerical levels like 5 have no given names (making `logging.DEBUG` practically the lowest).
     }
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     def __init__(
         self,
         verbosity_level: int,
@@ -5215,7 +7300,7 @@ class _PrimerStderrLogFormatter(DefaultStderrLogFormatter):
 def _find_existing_log_handler(
     handler_class: type[logging.StreamHandler],
     formatter_class: type,
-) -> logging.StreamHandler | None:
+) -> logging.Handler | None:
     """
     Prevent duplicate handler (when `os.execv*` calls restart `main` again in tests).
     """
@@ -5223,17 +7308,23 @@ def _find_existing_log_handler(
         return None
     log_handler: logging.Handler
     for log_handler in logger.handlers:
-        if isinstance(log_handler, handler_class):
-            if isinstance(log_handler.formatter, formatter_class):
+        # See `QueuedLogHandler`:
+        output_handler: logging.Handler = log_handler.target_handler if isinstance(log_handler, QueuedLogHandler) else log_handler
+        if isinstance(output_handler, handler_class):
+            if isinstance(output_handler.formatter, formatter_class):
+                for log_filter in log_handler.filters:
+                    if isinstance(log_filter, StateStrideFilter):
+                        # The restart is mocked (the process is not replaced):
+                        log_filter.load_py_exec_name()
                 return log_handler
     return None
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 def _configure_primer_stderr_log_handler(state_input_stderr_log_level_var_loaded: int) -> logging.Handler:
     """
     Implements for `stderr` log: FT_38_73_38_52.log_verbosity.md
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     # Log everything (the filters are supposed to be set on output handlers instead):
     logger.setLevel(logging.NOTSET)
 
@@ -5248,7 +7339,7 @@ def _configure_primer_stderr_log_handler(state_input_stderr_log_level_var_loaded
         stderr_handler.addFilter(StateStrideFilter())
         stderr_handler.setFormatter(_PrimerStderrLogFormatter(state_input_stderr_log_level_var_loaded))
         logger.addHandler(stderr_handler)
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     stderr_handler.setLevel(state_input_stderr_log_level_var_loaded)
     return stderr_handler
 
@@ -5262,7 +7353,7 @@ def _configure_primer_file_log_handler(
     """
     Implements for log file: FT_38_73_38_52.log_verbosity.md
     """
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     log_file_basename = f"{script_name}.{state_input_start_id_var_loaded}.log"
     log_file_abs_path = os.path.join(
         state_local_log_dir_abs_path_inited,
@@ -5274,10 +7365,16 @@ def _configure_primer_file_log_handler(
     # Increase the log level at most to what is used by stderr:
     if state_input_stderr_log_level_handler_configured.level < file_log_level:
         file_log_level = state_input_stderr_log_level_handler_configured.level
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    file_log_formatter: logging.Formatter
+    if get_file_log_format() == LogFormat.log_format_json:
+        file_log_formatter = _PrimerJsonFileLogFormatter(state_input_start_id_var_loaded)
+    else:
+        file_log_formatter = _PrimerFileLogFormatter()
 
-    file_handler: logging.StreamHandler | None = _find_existing_log_handler(
+    file_handler: logging.Handler | None = _find_existing_log_handler(
         logging.FileHandler,
-        _PrimerFileLogFormatter,
+        type(file_log_formatter),
     )
 
     if file_handler is None:
@@ -5285,21 +7382,23 @@ def _configure_primer_file_log_handler(
             state_local_log_dir_abs_path_inited,
             exist_ok=True,
         )
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
         if not os.path.exists(log_file_abs_path):
             # Explain missing logs to avoid confusion:
             write_text_file(
                 log_file_abs_path,
                 f"""
 {ConfConstGeneral.log_section_delimiter} file log starts at [{StateStride.stride_py_arbitrary.name}] after its config is resolved {ConfConstGeneral.log_section_delimiter}
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 """,
             )
 
         file_handler = logging.FileHandler(log_file_abs_path)
         assert file_handler is not None
+        file_handler.setFormatter(file_log_formatter)
+        if is_async_file_log_enabled():
+            file_handler = QueuedLogHandler(file_handler)
         file_handler.addFilter(StateStrideFilter())
-        file_handler.setFormatter(_PrimerFileLogFormatter())
         logger.addHandler(file_handler)
 
     file_handler.setLevel(file_log_level)
@@ -5367,6 +7466,59 @@ def find_python_version_file(curr_dir_any_path=".") -> str | None:
     return None
 
 
+def stat_launch_file(file_abs_path: str) -> list[int] | None:
+    """
+    The same stat values as compared by the fast launcher entry script (see `write_launch_record`).
+    """
+    try:
+        # Use `lstat` to see the symlink itself (not its target):
+        file_stat = os.lstat(file_abs_path)
+        return [file_stat.st_mtime_ns, file_stat.st_size]
+    except FileNotFoundError:
+        return None
+
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+def write_launch_record(
+    launch_record_abs_path: str,
+    venv_python_abs_path: str,
+    fingerprint_file_abs_paths: list[str],
+) -> None:
+    """
+    Writes the launch record for the fast launcher entry script (see `generate_entry_script_content`):
+    while none of the fingerprint files (and none of `ConfConstGeneral.launch_record_env_var_names` values) changes,
+    it `os.execv`-s to `venv_python_abs_path` without loading `proto_kernel`.
+    """
+    launch_record_data: dict = {
+        "venv_python": venv_python_abs_path,
+        "file_stats": {file_abs_path: stat_launch_file(file_abs_path) for file_abs_path in fingerprint_file_abs_paths},
+        "env_vars": {env_var_name: os.environ.get(env_var_name, None) for env_var_name in ConfConstGeneral.launch_record_env_var_names},
+    }
+    logger.info("writing launch record [%s]", launch_record_abs_path)
+    pathlib.Path(os.path.dirname(launch_record_abs_path)).mkdir(
+        parents=True,
+        exist_ok=True,
+    )
+    write_text_file_atomically(
+        launch_record_abs_path,
+        json.dumps(launch_record_data, indent=4),
+    )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def delete_launch_records(proto_code_abs_path: str) -> None:
+    """
+    Deletes all launch records (see `write_launch_record`) under `__pycache__` next to `proto_code_abs_path`.
+
+    It is called under the exclusive `venv` lock (see `hold_venv_lock`) before mutating `venv`.
+    """
+    for launch_record_path in pathlib.Path(os.path.dirname(proto_code_abs_path), ConfConstGeneral.dir_pycache).glob(f"*.{ConfConstGeneral.file_ext_launch_record}"):
+        logger.info("deleting launch record [%s]", launch_record_path)
+        try:
+            launch_record_path.unlink()
+        except FileNotFoundError:
+            # Deleted by a concurrent run:
+            pass
+
+
 def switch_python(
     curr_python_path: str,
     next_py_exec: StateStride,
@@ -5405,7 +7557,27 @@ def switch_python(
     if proto_code_abs_file_path is not None:
         required_environ[EnvVar.var_PROTOPRIMER_PROTO_CODE.value] = proto_code_abs_file_path
 
-    logger.info(f"switching from current `python` executable [{curr_python_path}][{curr_py_exec.name}] to [{next_python_path}][{next_py_exec.name}] with `{EnvVar.var_PROTOPRIMER_PROTO_CODE.value}`[{proto_code_abs_file_path}] exec_argv: {exec_argv}" "\n" "\n" f"{ConfConstGeneral.log_section_delimiter} before: [{curr_py_exec.name}] <<< restart >>> after: [{next_py_exec.name}] {ConfConstGeneral.log_section_delimiter}" "\n")
+    logger.info(
+        "switching from current `python` executable [%s][%s] to [%s][%s] with `%s`[%s] exec_argv: %s" "\n" "\n" "%s before: [%s] <<< restart >>> after: [%s] %s" "\n",
+        curr_python_path,
+        curr_py_exec.name,
+        next_python_path,
+        next_py_exec.name,
+        EnvVar.var_PROTOPRIMER_PROTO_CODE.value,
+        proto_code_abs_file_path,
+        exec_argv,
+        ConfConstGeneral.log_section_delimiter,
+        curr_py_exec.name,
+        next_py_exec.name,
+        ConfConstGeneral.log_section_delimiter,
+    )
+
+    venv_lock_fd_str: str | None = required_environ.get(EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value, None)
+    if venv_lock_fd_str is not None and os.environ.get(EnvVar.var_PROTOPRIMER_MOCKED_RESTART.value, None) is None:
+        # Keep holding the lock in the next `python` (see `hold_venv_lock`):
+        os.set_inheritable(int(venv_lock_fd_str), True)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    flush_log_handlers()
 
     os.execve(
         path=next_python_path,
@@ -5455,62 +7627,495 @@ def is_sub_path(
         return False
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
-def rel_path(
-    target_any_path: str,
-    source_any_path: str,
-) -> str:
+def rel_path(
+    target_any_path: str,
+    source_any_path: str,
+) -> str:
+    """
+    `PurePath` compares `str` paths (without looking at the filesystem or resolving symlinks).
+    """
+    return str(pathlib.PurePath(target_any_path).relative_to(pathlib.PurePath(source_any_path)))
+
+
+def is_same_file(
+    l_abs_path: str,
+    r_abs_path: str,
+) -> bool:
+    return pathlib.Path(l_abs_path).samefile(pathlib.Path(r_abs_path))
+
+
+def get_path_to_curr_python() -> str:
+    return sys.executable
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_path_to_base_python() -> str:
+
+    executable_basename: str = os.path.basename(sys.executable)
+
+    # Try the current `executable_basename` first.
+    # In some cases (e.g. on `macOS` with `homebrew`),
+    # there are no simple basenames like `python`, instead, there are versioned ones like `python3.10`:
+    path_to_next_python: str = os.path.join(
+        sys.base_prefix,
+        ConfConstGeneral.file_rel_path_venv_bin,
+        executable_basename,
+    )
+    if os.path.exists(path_to_next_python):
+        return path_to_next_python
+
+    path_to_next_python = os.path.join(
+        sys.base_prefix,
+        ConfConstGeneral.file_rel_path_venv_python,
+    )
+    return path_to_next_python
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_script_command_line():
+    return get_shell_command_line(sys.argv)
+
+
+def get_shell_command_line(arg_list: list[str]):
+    command_line = " ".join(shlex.quote(arg_item) for arg_item in arg_list)
+    return command_line
+
+
+def read_json_file(file_path: str) -> dict:
+    with open(file_path, "r", encoding="utf-8") as file_obj:
+        return json.load(file_obj)
+
+
+def get_py_conf_file_abs_path(conf_file_abs_path: str) -> str:
+    """
+    Return path to the `*.conf.py` conf file which replaces the given (JSON) `conf_file_abs_path`.
+    """
+    return f"{os.path.splitext(conf_file_abs_path)[0]}.{ConfConstInput.py_conf_file_ext}"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_user_conf_dir_abs_path() -> str:
+    """
+    Return the dir with `ConfLeap.leap_user` conf file (per XDG Base Directory spec).
+    """
+    user_conf_base_dir_abs_path: str | None = os.environ.get(ConfConstInput.ext_env_var_XDG_CONFIG_HOME, None)
+    if not user_conf_base_dir_abs_path:
+        user_conf_base_dir_abs_path = os.path.join(
+            os.path.expanduser("~"),
+            ConfConstInput.default_user_conf_base_dir_rel_path,
+        )
+    return os.path.join(
+        user_conf_base_dir_abs_path,
+        ConfConstGeneral.name_protoprimer_package,
+    )
+
+
+def conf_file_exists(conf_file_abs_path: str) -> bool:
+    return os.path.exists(get_py_conf_file_abs_path(conf_file_abs_path)) or os.path.exists(conf_file_abs_path)
+
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+def get_loaded_conf_file_abs_path(conf_file_abs_path: str) -> str:
+    """
+    Return path to the conf file `read_conf_file` loads for the given (JSON) `conf_file_abs_path`.
+    """
+    py_conf_file_abs_path: str = get_py_conf_file_abs_path(conf_file_abs_path)
+    if os.path.exists(py_conf_file_abs_path):
+        return py_conf_file_abs_path
+    return conf_file_abs_path
+
+
+def read_conf_file(conf_file_abs_path: str) -> dict:
+    """
+    Read conf data from the `*.conf.py` conf file (if it exists) or from the JSON `conf_file_abs_path` (fallback).
+
+    See: FT_48_62_07_98.config_format.md
+
+    The `*.conf.py` conf file is imported (rather than `exec`-ed) to reuse its bytecode cached in `__pycache__`.
+    """
+    py_conf_file_abs_path: str = get_loaded_conf_file_abs_path(conf_file_abs_path)
+    if py_conf_file_abs_path == conf_file_abs_path:
+        return read_json_file(conf_file_abs_path)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    py_conf_module = import_proto_module(
+        f"{ConfConstGeneral.name_protoprimer_package}_conf_{pathlib.Path(conf_file_abs_path).stem}",
+        py_conf_file_abs_path,
+    )
+    conf_data = getattr(py_conf_module, ConfConstInput.py_conf_data_var_name, None)
+    if not isinstance(conf_data, dict):
+        raise AssertionError(f"`{ConfConstInput.py_conf_data_var_name}` [{type(conf_data).__name__}] is not a `dict` in [{py_conf_file_abs_path}]")
+    return conf_data
+
+
+# Validates a (possibly nested) field value given its path (for error messages):
+ConfFieldValidator = typing.Callable[[str, typing.Any], None]
+
+
+def compile_str_validator(
+    is_nullable: bool = False,
+    path_type: PathType = PathType.path_any,
+) -> ConfFieldValidator:
+
+    def validate_str(
+        field_path: str,
+        field_value,
+    ) -> None:
+        if field_value is None and is_nullable:
+            return
+        if not isinstance(field_value, str):
+            raise AssertionError(f"Field `{field_path}` must be a `str`{' or `null`' if is_nullable else ''}: [{field_value}]")
+        if path_type == PathType.path_rel and os.path.isabs(field_value):
+            raise AssertionError(f"Field `{field_path}` must be a relative path: [{field_value}]")
+        if path_type == PathType.path_abs and not os.path.isabs(os.path.expanduser(field_value)):
+            raise AssertionError(f"Field `{field_path}` must specify absolute path: [{field_value}]")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    return validate_str
+
+
+def compile_enum_name_validator(
+    enum_class: type[enum.Enum],
+) -> ConfFieldValidator:
+
+    enum_names: list[str] = [enum_item.name for enum_item in enum_class]
+
+    def validate_enum_name(
+        field_path: str,
+        field_value,
+    ) -> None:
+        if field_value not in enum_names:
+            raise AssertionError(f"Field `{field_path}` must be one of {enum_names}: [{field_value}]")
+
+    return validate_enum_name
+
+
+def compile_list_validator(
+    item_validator: ConfFieldValidator,
+) -> ConfFieldValidator:
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def validate_list(
+        field_path: str,
+        field_value,
+    ) -> None:
+        if not isinstance(field_value, list):
+            raise AssertionError(f"Field `{field_path}` must be a `list`: [{field_value}]")
+        for item_index, item_value in enumerate(field_value):
+            item_validator(f"{field_path}[{item_index}]", item_value)
+
+    return validate_list
+
+
+def compile_dict_validator(
+    field_validators: dict[str, ConfFieldValidator],
+) -> ConfFieldValidator:
+    """
+    Unknown fields are not validated (they are reported as unused by the `eval` sub command instead).
+    """
+
+    def validate_dict(
+        field_path: str,
+        field_value,
+    ) -> None:
+        if not isinstance(field_value, dict):
+            raise AssertionError(f"Field `{field_path}` must be a `dict`: [{field_value}]")
+        for child_field_name, child_field_value in field_value.items():
+            child_field_validator: ConfFieldValidator | None = field_validators.get(child_field_name, None)
+            if child_field_validator is not None:
+                child_field_validator(f"{field_path}.{child_field_name}", child_field_value)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    return validate_dict
+
+
+def compile_singleton_dict_validator(
+    value_validator: ConfFieldValidator,
+) -> ConfFieldValidator:
+
+    def validate_singleton_dict(
+        field_path: str,
+        field_value,
+    ) -> None:
+        if not isinstance(field_value, dict) or len(field_value) != 1:
+            raise AssertionError(f"Field `{field_path}` must be a single-item `dict`: [{field_value}]")
+        for item_key, item_value in field_value.items():
+            value_validator(f"{field_path}.{item_key}", item_value)
+
+    return validate_singleton_dict
+
+
+def compile_conf_data_validator() -> ConfFieldValidator:
+    """
+    Compile the schema of all `ConfField`-s (for every `ConfLeap`) into a single validator.
+    """
+    list_of_str_validator = compile_list_validator(compile_str_validator())
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    project_descriptor_validator = compile_dict_validator(
+        {
+            ConfField.field_build_root_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            ConfField.field_install_extras.value: list_of_str_validator,
+            ConfField.field_install_group.value: compile_str_validator(is_nullable=True),
+        }
+    )
+
+    install_spec_validator = compile_dict_validator(
+        {
+            ConfField.field_extra_command_args.value: list_of_str_validator,
+        }
+    )
+
+    return compile_dict_validator(
+        {
+            # `ConfLeap.leap_primer`-specific:
+            ConfField.field_ref_root_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            ConfField.field_global_conf_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            # `ConfLeap.leap_client`-specific:
+            ConfField.field_local_conf_symlink_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            ConfField.field_default_env_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            # Common overridable fields:
+            ConfField.field_required_python_version.value: compile_str_validator(is_nullable=True),
+            ConfField.field_python_selector_file_rel_path.value: compile_str_validator(is_nullable=True, path_type=PathType.path_rel),
+            ConfField.field_local_venv_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            ConfField.field_local_log_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            ConfField.field_local_tmp_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            ConfField.field_local_cache_dir_rel_path.value: compile_str_validator(path_type=PathType.path_rel),
+            ConfField.field_venv_driver.value: compile_enum_name_validator(VenvDriverType),
+            ConfField.field_uv_tools_dir_abs_path.value: compile_str_validator(is_nullable=True, path_type=PathType.path_abs),
+            ConfField.field_required_uv_version.value: compile_str_validator(is_nullable=True),
+            ConfField.field_version_constraints_file_basename.value: compile_str_validator(),
+            ConfField.field_project_descriptors.value: compile_list_validator(project_descriptor_validator),
+            # The `install_specs` is a list of singleton dict-s (where each key is one of the `install_group`-s):
+            ConfField.field_install_specs.value: compile_list_validator(compile_singleton_dict_validator(install_spec_validator)),
+            ConfField.field_install_mode.value: compile_enum_name_validator(InstallMode),
+        }
+    )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+# Compiled once (on import) rather than per validated conf file:
+_conf_data_validator: ConfFieldValidator = compile_conf_data_validator()
+
+
+def validate_conf_data(
+    conf_leap: ConfLeap,
+    conf_data: dict,
+) -> None:
     """
-    `PurePath` compares `str` paths (without looking at the filesystem or resolving symlinks).
+    Validate conf data loaded for the `conf_leap` (in one pass) - see `EnvState.state_conf_data_verified`.
     """
-    return str(pathlib.PurePath(target_any_path).relative_to(pathlib.PurePath(source_any_path)))
-
+    _conf_data_validator(conf_leap.name, conf_data)
+    if conf_leap in [ConfLeap.leap_host, ConfLeap.leap_user]:
+        for field_name in conf_data.keys():
+            if field_name not in ConfConstGeneral.host_tuning_field_names:
+                raise AssertionError(f"Field `{conf_leap.name}.{field_name}` is not a host-tuning field (only these are allowed in `{conf_leap.name}`): {ConfConstGeneral.host_tuning_field_names}")
 
-def is_same_file(
-    l_abs_path: str,
-    r_abs_path: str,
-) -> bool:
-    return pathlib.Path(l_abs_path).samefile(pathlib.Path(r_abs_path))
 
+def get_used_conf_field_names(
+    conf_leap: ConfLeap,
+) -> list[str] | None:
+    """
+    Return top-level fields the `protoprimer` reads from the `conf_leap` data (any other field is unused).
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    Return `None` for `ConfLeap`-s which are not loaded from conf files (all their fields are used).
+    """
+    if conf_leap == ConfLeap.leap_primer:
+        return [
+            ConfField.field_ref_root_dir_rel_path.value,
+            ConfField.field_global_conf_dir_rel_path.value,
+        ]
+    elif conf_leap == ConfLeap.leap_client:
+        return [
+            ConfField.field_local_conf_symlink_rel_path.value,
+            ConfField.field_default_env_dir_rel_path.value,
+            *ConfConstGeneral.overridden_field_names,
+        ]
+    elif conf_leap == ConfLeap.leap_env:
+        return list(ConfConstGeneral.overridden_field_names)
+    elif conf_leap in [
+        ConfLeap.leap_host,
+        ConfLeap.leap_user,
+    ]:
+        return list(ConfConstGeneral.host_tuning_field_names)
+    else:
+        return None
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
-def get_path_to_curr_python() -> str:
-    return sys.executable
+def get_source_conf_field_name(
+    derived_state_name: str,
+) -> str | None:
+    """
+    Return the conf field the `ConfLeap.leap_derived` value is derived from (or `None` if it is not derived from a conf field).
+    """
+    return {
+        EnvState.state_ref_root_dir_abs_path_inited.name: ConfField.field_ref_root_dir_rel_path.value,
+        EnvState.state_global_conf_dir_abs_path_inited.name: ConfField.field_global_conf_dir_rel_path.value,
+        EnvState.state_local_conf_symlink_abs_path_inited.name: ConfField.field_local_conf_symlink_rel_path.value,
+        EnvState.state_required_python_version_inited.name: ConfField.field_required_python_version.value,
+        EnvState.state_local_venv_dir_abs_path_inited.name: ConfField.field_local_venv_dir_rel_path.value,
+        EnvState.state_local_log_dir_abs_path_inited.name: ConfField.field_local_log_dir_rel_path.value,
+        EnvState.state_local_tmp_dir_abs_path_inited.name: ConfField.field_local_tmp_dir_rel_path.value,
+        EnvState.state_local_cache_dir_abs_path_inited.name: ConfField.field_local_cache_dir_rel_path.value,
+        EnvState.state_venv_driver_inited.name: ConfField.field_venv_driver.value,
+        EnvState.state_version_constraints_file_basename_inited.name: ConfField.field_version_constraints_file_basename.value,
+        EnvState.state_project_descriptors_inited.name: ConfField.field_project_descriptors.value,
+    }.get(derived_state_name, None)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def create_merged_conf_data(
+    conf_leap_sources: list[tuple[ConfLeap, str | None, dict]],
+) -> MergedConfData:
+    """
+    Merges `conf_leap_sources` the same way `EnvState.state_merged_conf_data_loaded` does.
+
+    See `describe_field_provenance` for the `conf_leap_sources`.
+    """
+    return MergedConfData(
+        [
+            (conf_leap, conf_data)
+            # `MergedConfData` expects the highest priority first:
+            for conf_leap, conf_file_abs_path, conf_data in reversed(conf_leap_sources)
+            if conf_leap
+            in [
+                ConfLeap.leap_client,
+                ConfLeap.leap_env,
+                ConfLeap.leap_host,
+                ConfLeap.leap_user,
+            ]
+        ]
+    )
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
-def get_path_to_base_python() -> str:
+def describe_field_provenance(
+    conf_leap_sources: list[tuple[ConfLeap, str | None, dict]],
+    merged_conf_data: MergedConfData,
+) -> list[dict]:
+    """
+    Lists top-level fields of all given `conf_leap_sources` with their `FieldProvenance`.
 
-    executable_basename: str = os.path.basename(sys.executable)
+    Each item of the `conf_leap_sources` is a `ConfLeap`, the conf file its data is loaded from, and the data.
+    The effective source of each field (`source_conf_leap` and `source_conf_file_abs_path`)
+    is taken from the `merged_conf_data` (see `EnvState.state_merged_conf_data_loaded`).
 
-    # Try the current `executable_basename` first.
-    # In some cases (e.g. on `macOS` with `homebrew`),
-    # there are no simple basenames like `python`, instead, there are versioned ones like `python3.10`:
-    path_to_next_python: str = os.path.join(
-        sys.base_prefix,
-        ConfConstGeneral.file_rel_path_venv_bin,
-        executable_basename,
-    )
-    if os.path.exists(path_to_next_python):
-        return path_to_next_python
+    The `ConfLeap.leap_input` and `ConfLeap.leap_derived` fields never override anything.
+    """
 
-    path_to_next_python = os.path.join(
-        sys.base_prefix,
-        ConfConstGeneral.file_rel_path_venv_python,
-    )
-    return path_to_next_python
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    conf_file_abs_paths: dict[ConfLeap, str | None] = {conf_leap: conf_file_abs_path for conf_leap, conf_file_abs_path, conf_data in conf_leap_sources}
+    primer_conf_data: dict = {conf_leap: conf_data for conf_leap, conf_file_abs_path, conf_data in conf_leap_sources}.get(ConfLeap.leap_primer, {})
 
-def get_script_command_line():
-    return get_shell_command_line(sys.argv)
+    def get_source_conf_leap(field_name: str) -> ConfLeap | None:
+        # `ConfLeap.leap_primer` is consumed before (and is not part of) the `MergedConfData`:
+        if field_name in get_used_conf_field_names(ConfLeap.leap_primer):
+            return ConfLeap.leap_primer if field_name in primer_conf_data else None
+        return merged_conf_data.get_conf_leap(field_name)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def create_field_record(
+        conf_leap: ConfLeap,
+        field_name: str,
+        field_value: DataValueType,
+        field_provenance: FieldProvenance,
+        source_conf_leap: ConfLeap | None,
+    ) -> dict:
+        return {
+            "conf_leap": conf_leap.name,
+            "conf_file_abs_path": conf_file_abs_paths[conf_leap],
+            "field_name": field_name,
+            "field_value": field_value,
+            "field_provenance": field_provenance.name,
+            "source_conf_leap": None if source_conf_leap is None else source_conf_leap.name,
+            "source_conf_file_abs_path": conf_file_abs_paths.get(source_conf_leap, None),
+        }
 
+    field_records: list[dict] = []
+    for conf_leap, conf_file_abs_path, conf_data in conf_leap_sources:
+        used_field_names: list[str] | None = get_used_conf_field_names(conf_leap)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+        if conf_leap == ConfLeap.leap_derived:
+            for field_name, field_value in conf_data.items():
+                source_field_name: str | None = get_source_conf_field_name(field_name)
+                if source_field_name is None:
+                    # Derived from the `ConfLeap.leap_input` (e.g. conf file paths):
+                    field_records.append(create_field_record(conf_leap, field_name, field_value, FieldProvenance.provenance_set, None))
+                    continue
+                source_conf_leap = get_source_conf_leap(source_field_name)
+                field_provenance = FieldProvenance.provenance_defaulted if source_conf_leap is None else FieldProvenance.provenance_set
+                field_records.append(create_field_record(conf_leap, field_name, field_value, field_provenance, source_conf_leap))
+            continue
+
+        if used_field_names is None:
+            # All `ConfLeap.leap_input` fields are set by the `ConfLeap.leap_input` itself:
+            for field_name, field_value in conf_data.items():
+                field_records.append(create_field_record(conf_leap, field_name, field_value, FieldProvenance.provenance_set, conf_leap))
+            continue
+
+        # The used fields (including missing ones) are listed first:
+        field_names: list[str] = list(used_field_names)
+        field_names.extend(field_name for field_name in conf_data.keys() if field_name not in field_names)
+        for field_name in field_names:
+            field_provenance: FieldProvenance
+            source_conf_leap: ConfLeap | None
+            if field_name not in used_field_names:
+                field_provenance = FieldProvenance.provenance_unused
+                source_conf_leap = None
+            else:
+                source_conf_leap = get_source_conf_leap(field_name)
+                if source_conf_leap is None:
+                    field_provenance = FieldProvenance.provenance_defaulted
+                elif field_name not in conf_data:
+                    field_provenance = FieldProvenance.provenance_inherited
+                elif source_conf_leap == conf_leap:
+                    field_provenance = FieldProvenance.provenance_set
+                else:
+                    field_provenance = FieldProvenance.provenance_overridden
+            field_records.append(create_field_record(conf_leap, field_name, conf_data.get(field_name, None), field_provenance, source_conf_leap))
+    return field_records
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
-def get_shell_command_line(arg_list: list[str]):
-    command_line = " ".join(shlex.quote(arg_item) for arg_item in arg_list)
-    return command_line
+def build_effective_conf_document(
+    conf_leap_sources: list[tuple[ConfLeap, str | None, dict]],
+    merged_conf_data: MergedConfData,
+) -> dict:
+    """
+    Builds a single JSON-serializable document with the effective config of all `conf_leap_sources`.
 
+    See `describe_field_provenance` for the `conf_leap_sources` and `merged_conf_data`.
+    """
+    return {
+        "schema_version": ConfConstGeneral.effective_conf_schema_version,
+        "conf_leaps": {
+            conf_leap.name: {
+                "conf_file_abs_path": conf_file_abs_path,
+                "conf_data": conf_data,
+            }
+            for conf_leap, conf_file_abs_path, conf_data in conf_leap_sources
+        },
+        "fields": describe_field_provenance(conf_leap_sources, merged_conf_data),
+    }
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
-def read_json_file(file_path: str) -> dict:
-    with open(file_path, "r", encoding="utf-8") as file_obj:
-        return json.load(file_obj)
+def write_effective_conf_document(
+    conf_leap_sources: list[tuple[ConfLeap, str | None, dict]],
+    merged_conf_data: MergedConfData,
+    conf_format: EffectiveConfigFormat,
+    text_sink: typing.TextIO,
+) -> None:
+    """
+    Writes the effective config of all `conf_leap_sources` to `text_sink` as a machine-readable `conf_format`.
 
+    See `describe_field_provenance` for the `conf_leap_sources` and `merged_conf_data`.
+    """
+    if conf_format == EffectiveConfigFormat.format_json:
+        json.dump(
+            build_effective_conf_document(conf_leap_sources, merged_conf_data),
+            text_sink,
+            indent=4,
+        )
+        text_sink.write(os.linesep)
+    elif conf_format == EffectiveConfigFormat.format_ndjson:
+        for field_record in describe_field_provenance(conf_leap_sources, merged_conf_data):
+            text_sink.write(
+                json.dumps(
+                    {
+                        "schema_version": ConfConstGeneral.effective_conf_schema_version,
+                        **field_record,
+                    },
+                )
+                + os.linesep
+            )
+    else:
+        raise ValueError(f"Unsupported `{EffectiveConfigFormat.__name__}` value: {conf_format}")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 def write_json_file(
     file_path: str,
@@ -5523,7 +8128,7 @@ def write_json_file(
             indent=4,
         )
         file_obj.write("\n")
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 def read_text_file(file_path: str) -> str:
     with open(file_path, "r", encoding="utf-8") as file_obj:
@@ -5536,13 +8141,28 @@ def write_text_file(
 ) -> None:
     with open(file_path, "w", encoding="utf-8") as file_obj:
         file_obj.write(file_data)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def write_text_file_atomically(
+    file_path: str,
+    file_data: str,
+) -> None:
+    """
+    Writes a temporary file next to the `file_path` and renames it (concurrent readers never see a partial file).
+    """
+    tmp_file_path = f"{file_path}.{os.getpid()}.tmp"
+    write_text_file(
+        tmp_file_path,
+        file_data,
+    )
+    os.replace(tmp_file_path, file_path)
 
 
 def _is_blank_line(line: str) -> bool:
     stripped = line.strip()
     return stripped == "" or stripped == "#"
 
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 def _replace_single_header_in_empty_lines(
     input_text: str,
     boilerplate_text: str,
@@ -5555,7 +8175,7 @@ def _replace_single_header_in_empty_lines(
     boilerplate_height = len(boilerplate_lines)
     output_lines = input_lines[:1] + boilerplate_lines + input_lines[1 + boilerplate_height :]
     return "\n".join(output_lines) + "\n"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 
 def _replace_multiple_body_in_empty_lines(
     input_text: str,
@@ -5596,6 +8216,173 @@ def assert_proto_kernel_is_stand_alone(proto_kernel_abs_path: str) -> None:
             raise AssertionError(f"`proto_kernel_abs_path` [{proto_kernel_abs_path}] cannot be from site packages [{package_dir}]")
 
 
+@contextlib.contextmanager
+def acquire_file_lock(
+    lock_file_abs_path: str,
+    is_exclusive: bool = True,
+    timeout_sec: float = ConfConstGeneral.default_file_lock_timeout_sec,
+):
+    """
+    Hold an advisory lock on the `lock_file_abs_path` (created if missing) within the `with` block.
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    The lock is readers/writer:
+    *   `is_exclusive=True` is for writers (mutating the guarded files),
+    *   `is_exclusive=False` is for readers (concurrent with other readers, but waiting for writers).
+
+    The writer records itself in the lock file to report the holder to the waiting processes.
+
+    On platforms without `fcntl` (non-POSIX), the block runs without the lock.
+
+    See also `hold_venv_lock` to hold the lock beyond a single block.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        logger.debug(f"no `fcntl` to lock [{lock_file_abs_path}]")
+        yield
+        return
+
+    os.makedirs(os.path.dirname(lock_file_abs_path), exist_ok=True)
+    with open(lock_file_abs_path, "a+") as lock_file_obj:
+        _lock_file_obj(
+            lock_file_obj,
+            lock_file_abs_path,
+            is_exclusive,
+            timeout_sec,
+        )
+        try:
+            yield
+        finally:
+            if is_exclusive:
+                lock_file_obj.truncate(0)
+                lock_file_obj.flush()
+            fcntl.flock(lock_file_obj.fileno(), fcntl.LOCK_UN)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def _lock_file_obj(
+    lock_file_obj: typing.TextIO,
+    lock_file_abs_path: str,
+    is_exclusive: bool,
+    timeout_sec: float,
+) -> None:
+    import fcntl
+
+    lock_type: int = fcntl.LOCK_EX if is_exclusive else fcntl.LOCK_SH
+    lock_name: str = "exclusive" if is_exclusive else "shared"
+    start_time: float = time.monotonic()
+    is_waiting: bool = False
+    while True:
+        try:
+            fcntl.flock(lock_file_obj.fileno(), lock_type | fcntl.LOCK_NB)
+            break
+        except BlockingIOError:
+            waited_sec: float = time.monotonic() - start_time
+            if waited_sec >= timeout_sec:
+                raise AssertionError(f"timed out after [{waited_sec:.1f}] sec waiting for {lock_name} lock [{lock_file_abs_path}] held by [{_read_file_lock_holder(lock_file_obj)}]")
+            if not is_waiting:
+                is_waiting = True
+                logger.info(f"waiting for {lock_name} lock [{lock_file_abs_path}] held by [{_read_file_lock_holder(lock_file_obj)}]")
+            time.sleep(ConfConstGeneral.file_lock_poll_interval_sec)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    if is_exclusive:
+        lock_file_obj.seek(0)
+        lock_file_obj.truncate()
+        lock_file_obj.write(f"pid={os.getpid()} {get_script_command_line()}")
+        lock_file_obj.flush()
+
+
+def _read_file_lock_holder(lock_file_obj: typing.TextIO) -> str:
+    lock_file_obj.seek(0)
+    lock_holder: str = lock_file_obj.read().strip()
+    if lock_holder == "":
+        # Readers do not record themselves:
+        return "shared lock readers"
+    return lock_holder
+
+
+def get_venv_lock_file_abs_path(
+    local_cache_dir_abs_path: str,
+    local_venv_dir_abs_path: str,
+) -> str:
+    """
+    The lock (under the `local_cache` dir) guarding all `venv` mutations by concurrent runs in the same client repo.
+    """
+    return os.path.join(
+        local_cache_dir_abs_path,
+        f"{os.path.basename(os.path.normpath(local_venv_dir_abs_path))}.{ConfConstGeneral.file_ext_lock}",
+    )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_held_venv_lock_fd(venv_lock_file_abs_path: str) -> int | None:
+    """
+    Return the file descriptor of the `venv_lock_file_abs_path` if `hold_venv_lock` holds it
+    (in this or any previous `python` process of the run - see `EnvVar.var_PROTOPRIMER_VENV_LOCK_FD`).
+    """
+    lock_file_fd_str: str | None = os.environ.get(EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value, None)
+    if lock_file_fd_str is None:
+        return None
+    try:
+        lock_file_fd = int(lock_file_fd_str)
+        if os.path.samestat(os.fstat(lock_file_fd), os.stat(venv_lock_file_abs_path)):
+            return lock_file_fd
+    except (OSError, ValueError):
+        pass
+    logger.warning(f"ignoring `{EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value}` [{lock_file_fd_str}] which does not hold the lock [{venv_lock_file_abs_path}]")
+    del os.environ[EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value]
+    return None
+
+
+def hold_venv_lock(venv_lock_file_abs_path: str) -> None:
+    """
+    Hold the exclusive `venv_lock_file_abs_path` (see `get_venv_lock_file_abs_path`) until `release_venv_lock`.
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    Unlike `acquire_file_lock` (a single block), the lock is held across the entire `venv`-mutating sequence of the run
+    (re-creating `venv`, installing packages, generating version constraints, updating `proto_code`)
+    which spans several `python` processes: `switch_python` passes the locked file descriptor to the next one.
+    """
+    if get_held_venv_lock_fd(venv_lock_file_abs_path) is not None:
+        return
+    try:
+        import fcntl
+    except ImportError:
+        logger.debug(f"no `fcntl` to lock [{venv_lock_file_abs_path}]")
+        return
+
+    os.makedirs(os.path.dirname(venv_lock_file_abs_path), exist_ok=True)
+    lock_file_fd: int = os.open(venv_lock_file_abs_path, os.O_RDWR | os.O_CREAT)
+    try:
+        # The descriptor outlives the file object:
+        with open(lock_file_fd, "r+", closefd=False) as lock_file_obj:
+            _lock_file_obj(
+                lock_file_obj,
+                venv_lock_file_abs_path,
+                is_exclusive=True,
+                timeout_sec=ConfConstGeneral.default_file_lock_timeout_sec,
+            )
+    except BaseException:
+        os.close(lock_file_fd)
+        raise
+    os.environ[EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value] = str(lock_file_fd)
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def release_venv_lock() -> None:
+    """
+    Release the lock held by `hold_venv_lock` (if any).
+    """
+    lock_file_fd_str: str | None = os.environ.pop(EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value, None)
+    if lock_file_fd_str is None:
+        return
+    import fcntl
+
+    lock_file_fd = int(lock_file_fd_str)
+    try:
+        with open(lock_file_fd, "r+", closefd=False) as lock_file_obj:
+            lock_file_obj.truncate(0)
+        fcntl.flock(lock_file_fd, fcntl.LOCK_UN)
+    finally:
+        os.close(lock_file_fd)
+
+
 def is_venv() -> bool:
     # NOTE: `VIRTUAL_ENV` is not asserted because it is only set for `shell` by `source`-ing `venv/bin/activate`.
     #       Most of the commands avoid using `shell` (that is the goal for `protoprimer`).
@@ -5644,12 +8431,208 @@ def get_venv_type(local_venv_dir_abs_path: str) -> VenvDriverType:
         raise AssertionError(f"Cannot determine `venv` type by file [{venv_cfg_file_abs_path}]")
 
 
+def get_uv_version(uv_exec_abs_path: str) -> str:
+    """
+    Executes a `uv` binary and retrieves its version (e.g. "0.8.0" from "uv 0.8.0 (0b2357294 2025-07-17)").
+    """
+    cmd_output: str = subprocess.check_output(
+        [
+            uv_exec_abs_path,
+            "--version",
+        ],
+        universal_newlines=True,
+    )
+    return cmd_output.split()[1]
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_versioned_uv_venv_basename(uv_version: str) -> str:
+    """
+    Return basename of the shared `venv` with the given `uv` version (e.g. "uv-0.8.0.venv").
+
+    See: FT_73_95_31_84.venv_driver.md
+    """
+    return f"{ConfConstGeneral.name_uv_package}-{uv_version}.{ConfConstEnv.default_dir_rel_path_venv}"
+
+
+def normalize_package_name(package_name: str) -> str:
+    """
+    See: https://packaging.python.org/en/latest/specifications/name-normalization/
+    """
+    return re.sub(r"[-_.]+", "-", package_name).lower()
+
+
+def read_resolved_requirements(resolved_file_abs_path: str) -> tuple[set[str], set[str]]:
+    """
+    Reads a requirements file produced by `VenvDriverBase.resolve_dependencies`.
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    Returns normalized package names and abs paths of `--editable` projects.
+    """
+    resolved_package_names: set[str] = set()
+    resolved_editable_abs_paths: set[str] = set()
+    for resolved_line in read_text_file(resolved_file_abs_path).splitlines():
+        # Drop comments and line continuations (e.g. before `--hash` options):
+        resolved_line = resolved_line.split(" #", 1)[0].rstrip("\\").strip()
+        if resolved_line == "" or resolved_line.startswith("#") or resolved_line.startswith("--hash"):
+            continue
+        line_tokens: list[str] = resolved_line.split()
+        if line_tokens[0] in ["-e", "--editable"]:
+            editable_path: str = line_tokens[1].split("[", 1)[0]
+            if editable_path.startswith("file:"):
+                editable_path = urllib.request.url2pathname(urllib.parse.urlparse(editable_path).path)
+            resolved_editable_abs_paths.add(os.path.normpath(editable_path))
+        elif not line_tokens[0].startswith("-"):
+            package_name_match = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", line_tokens[0])
+            if package_name_match is not None:
+                resolved_package_names.add(normalize_package_name(package_name_match.group(0)))
+    return resolved_package_names, resolved_editable_abs_paths
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_stray_package_names(
+    installed_packages: list[dict],
+    resolved_file_abs_path: str,
+) -> list[str]:
+    """
+    Select installed packages (in the `pip list --format=json` format) which are not in the `resolved_file_abs_path`
+    (see `VenvDriverBase.sync_resolved_dependencies`).
+    """
+    resolved_package_names, resolved_editable_abs_paths = read_resolved_requirements(resolved_file_abs_path)
+    stray_package_names: list[str] = []
+    for installed_package in installed_packages:
+        package_name: str = normalize_package_name(installed_package["name"])
+        if package_name in resolved_package_names or package_name in ConfConstGeneral.venv_bootstrap_package_names:
+            continue
+        editable_project_location: str | None = installed_package.get("editable_project_location", None)
+        if editable_project_location is not None and os.path.normpath(editable_project_location) in resolved_editable_abs_paths:
+            continue
+        stray_package_names.append(installed_package["name"])
+    return stray_package_names
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_index_command_args(extra_command_args: list[str]) -> list[str]:
+    """
+    Select the package index options (normalized to `--option=value`) from the `extra_command_args`.
+    """
+    index_options: dict[str, str] = {
+        "--index-url": "--index-url",
+        "-i": "--index-url",
+        "--extra-index-url": "--extra-index-url",
+    }
+    index_command_args: list[str] = []
+    arg_index = 0
+    while arg_index < len(extra_command_args):
+        command_arg = extra_command_args[arg_index]
+        option_name, has_value, option_value = command_arg.partition("=")
+        if option_name in index_options:
+            if not has_value:
+                arg_index += 1
+                if arg_index >= len(extra_command_args):
+                    raise AssertionError(f"option [{command_arg}] has no value in `{ConfField.field_extra_command_args.value}` {extra_command_args}")
+                option_value = extra_command_args[arg_index]
+            index_command_args.append(f"{index_options[option_name]}={option_value}")
+        arg_index += 1
+    return index_command_args
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def verify_combined_index_command_args(group_to_extra_args: dict[str | None, list[str]]) -> None:
+    """
+    A single resolver run (see `InstallMode.install_combined`) uses one set of package indexes for all `install_group`-s:
+    the `install_group`-s which specify package indexes must specify the same ones.
+    """
+    first_install_group: str | None = None
+    first_index_command_args: list[str] | None = None
+    for install_group, extra_command_args in group_to_extra_args.items():
+        index_command_args = get_index_command_args(extra_command_args)
+        if len(index_command_args) == 0:
+            continue
+        if first_index_command_args is None:
+            first_install_group = install_group
+            first_index_command_args = index_command_args
+        elif sorted(index_command_args) != sorted(first_index_command_args):
+            raise AssertionError(f"`{ConfField.field_install_group.value}`-s [{first_install_group}] and [{install_group}] specify conflicting package indexes " f"{first_index_command_args} and {index_command_args} in `{ConfField.field_extra_command_args.value}`: " f"use the same package indexes or `{ConfField.field_install_mode.value}` [{InstallMode.install_per_group.name}]")
+
+
+def get_install_lock_file_abs_path(constraints_file_abs_path: str) -> str:
+    """
+    See `InstallMode.install_locked`: e.g. `constraints.txt` -> `constraints.lock.txt`.
+    """
+    constraints_file_base, constraints_file_ext = os.path.splitext(constraints_file_abs_path)
+    return f"{constraints_file_base}.{ConfConstGeneral.file_ext_lock}{constraints_file_ext}"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def get_install_input_digest(
+    ref_root_dir_abs_path: str,
+    project_descriptors: list[dict],
+    extra_command_args: list[str],
+) -> str:
+    """
+    Digest of everything the lock file depends on (see `InstallMode.install_locked`).
+
+    The lock lists hashes of only those archives selected for the current interpreter and platform
+    (this function runs in the `venv` python), so the interpreter version, ABI, and platform are included.
+
+    NOTE: The version constraints file is not included - it is re-generated from `venv` on every boot.
+    """
+    install_target: list[str | None] = [
+        ".".join(str(version_part) for version_part in sys.version_info[:3]),
+        sys.implementation.cache_tag,
+        sysconfig.get_config_var("SOABI"),
+        sysconfig.get_platform(),
+    ]
+    input_hash = hashlib.sha256()
+    input_hash.update(json.dumps([project_descriptors, extra_command_args, install_target], sort_keys=True).encode("utf-8"))
+    for project_descriptor in project_descriptors:
+        pyproject_toml_abs_path = os.path.join(
+            ref_root_dir_abs_path,
+            project_descriptor[ConfField.field_build_root_dir_rel_path.value],
+            ConfConstClient.default_pyproject_toml_basename,
+        )
+        if os.path.isfile(pyproject_toml_abs_path):
+            with open(pyproject_toml_abs_path, "rb") as file_obj:
+                input_hash.update(file_obj.read())
+    return f"sha256:{input_hash.hexdigest()}"
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def read_install_lock_digest(lock_file_abs_path: str) -> str | None:
+    if not os.path.isfile(lock_file_abs_path):
+        return None
+    with open(lock_file_abs_path, "r", encoding="utf-8") as file_obj:
+        first_line: str = file_obj.readline().rstrip("\n")
+    if first_line.startswith(ConfConstGeneral.install_lock_digest_prefix):
+        return first_line[len(ConfConstGeneral.install_lock_digest_prefix) :]
+    return None
+
+
+def write_install_lock_file(
+    resolved_file_abs_path: str,
+    lock_file_abs_path: str,
+    install_input_digest: str,
+) -> None:
+    """
+    Writes the lock file from the hashed output of `VenvDriverBase.resolve_dependencies`.
+
+    The `--editable` entries are dropped (the projects are installed separately):
+    they are not allowed with `--require-hashes`.
+    """
+    lock_lines: list[str] = [
+        f"{ConfConstGeneral.install_lock_digest_prefix}{install_input_digest}",
+    ]
+    for resolved_line in read_text_file(resolved_file_abs_path).splitlines():
+        if resolved_line.startswith("-e ") or resolved_line.startswith("--editable "):
+            continue
+        lock_lines.append(resolved_line)
+    logger.info(f"writing lock file [{lock_file_abs_path}]")
+    write_text_file(
+        lock_file_abs_path,
+        "".join(f"{lock_line}\n" for lock_line in lock_lines),
+    )
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
 def get_python_version(path_to_python: str) -> tuple[int, int, int]:
     """
     Executes a `python` binary and retrieves its version as a numeric tuple.
     """
     import ast
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     cmd_args: list[str] = [
         path_to_python,
         "-c",
@@ -5664,7 +8647,7 @@ def get_python_version(path_to_python: str) -> tuple[int, int, int]:
         isinstance(python_version, tuple)
         and len(python_version) == 3
         and all(isinstance(i, int) for i in python_version)
-        #
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     ), f"invalid `python` version format: {python_version}"
     return python_version
 
@@ -5677,7 +8660,7 @@ def parse_python_version(python_version: str) -> tuple[int, int, int]:
     *   "3" -> (3.0.0)
     """
     import re
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     def _parse_version_int(version_part: str) -> int:
         number_match = re.search(r"\d+", version_part)
         return int(number_match.group()) if number_match else 0
@@ -5685,7 +8668,30 @@ def parse_python_version(python_version: str) -> tuple[int, int, int]:
     version_parts: tuple[str, str, str] = tuple((python_version.split(".") + ["0", "0", "0"])[:3])
     version_tuple: tuple[int, int, int] = tuple(_parse_version_int(part) for part in version_parts)
     return version_tuple
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def cache_proto_code_bytecode(proto_code_abs_path: str) -> str | None:
+    """
+    Pre-compile `proto_code` into the standard `__pycache__` layout (the `.pyc` file `importlib` checks for it).
+
+    All loaders (`import_proto_module` and the entry scripts) use `importlib.util.spec_from_file_location`
+    which reuses that bytecode while the source is unchanged.
+
+    Returns `None` if no bytecode is written (e.g. `sys.dont_write_bytecode` or read-only dir).
+    """
+    if sys.dont_write_bytecode:
+        return None
+    import py_compile
 
+    try:
+        return py_compile.compile(
+            proto_code_abs_path,
+            doraise=True,
+        )
+    except (OSError, py_compile.PyCompileError) as compile_error:
+        logger.debug("bytecode is not cached for [%s]: %s", proto_code_abs_path, compile_error)
+        return None
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 def import_proto_module(
     proto_module_name: str,
@@ -5693,6 +8699,8 @@ def import_proto_module(
 ):
     """
     Import a module from an absolute path.
+
+    Its bytecode is cached in `__pycache__` next to it (see `cache_proto_code_bytecode`).
     """
     import types
     import importlib.util
@@ -5731,16 +8739,16 @@ def select_python_file_abs_path(
         SelectorFunc.select_python_file_abs_path.value,
     )
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-    logger.debug(f"running `{SelectorFunc.select_python_file_abs_path.value}` from `{proto_module_name}`")
+    logger.debug("running `%s` from `%s`", SelectorFunc.select_python_file_abs_path.value, proto_module_name)
     selected_python_abs_path: str | None = external_select_python_file_abs_path(required_version)
-    logger.debug(f"returned `selected_python_abs_path` value [{selected_python_abs_path}]")
+    logger.debug("returned `selected_python_abs_path` value [%s]", selected_python_abs_path)
 
     if selected_python_abs_path is not None:
         assert isinstance(selected_python_abs_path, str)
         try:
-            logger.debug(f"trying `python` version of `selected_python_abs_path` [{selected_python_abs_path}]")
+            logger.debug("trying `python` version of `selected_python_abs_path` [%s]", selected_python_abs_path)
             python_version: tuple[int, int, int] = get_python_version(selected_python_abs_path)
-            logger.debug(f"`python` version of `selected_python_abs_path` [{selected_python_abs_path}] is [{python_version}]")
+            logger.debug("`python` version of `selected_python_abs_path` [%s] is [%s]", selected_python_abs_path, python_version)
         except (subprocess.CalledProcessError, FileNotFoundError):
             logger.warning(f"`python` in `selected_python_abs_path` [{selected_python_abs_path}] failed without returning its version")
             selected_python_abs_path = None
@@ -5770,7 +8778,7 @@ def search_python_file_abs_path_by_basename(required_version: tuple[int, int, in
         f"python",
     ]
     for python_basename in python_basenames:
-        logger.debug(f"trying `python_basename` [{python_basename}]")
+        logger.debug("trying `python_basename` [%s]", python_basename)
 ########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
         # TODO: This will not work on Windows:
         # noinspection PyDeprecation
@@ -5783,7 +8791,7 @@ def search_python_file_abs_path_by_basename(required_version: tuple[int, int, in
             # but its `stdlib` lives under the `uv` store path.
             python_abs_path = os.path.realpath(python_abs_path)
             try:
-                logger.debug(f"checking version of `python_abs_path` [{python_abs_path}]")
+                logger.debug("checking version of `python_abs_path` [%s]", python_abs_path)
                 python_version: tuple[int, int, int] = get_python_version(python_abs_path)
                 logger.info(f"`python_abs_path` [{python_abs_path}] returned its version [{python_version}]")
                 return python_abs_path
@@ -5868,34 +8876,80 @@ def get_config(conf_leap: ConfLeap) -> dict:
     TODO: Maybe support proto_kernel_abs_path (default to None) to override _proto_kernel_abs_path?
     """
 
+    if conf_leap not in _conf_leap_to_state:
+        raise ValueError(f"Unsupported `ConfLeap` value: {conf_leap}")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    env_ctx = _eval_config_context(_conf_leap_to_state[conf_leap])
+    return env_ctx.eval_state(_conf_leap_to_state[conf_leap])
+
+
+class ConfigSnapshot:
+    """
+    UC_54_26_66_63.lib_access_to_config_data.md:
+    Immutable config data for every supported `ConfLeap` from a single evaluation (see `get_config_snapshot`).
+    """
+
+    __slots__ = ("_conf_leap_to_data",)
+
+    def __init__(
+        self,
+        conf_leap_to_data: dict[ConfLeap, dict],
+    ):
+        object.__setattr__(self, "_conf_leap_to_data", copy.deepcopy(conf_leap_to_data))
+
+    def __setattr__(self, attr_name, attr_value):
+        raise AttributeError(f"`{ConfigSnapshot.__name__}` is immutable")
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    def get_config(self, conf_leap: ConfLeap) -> dict:
+        """
+        Same as the `get_config` function, but without any evaluation (returns a copy which is safe to modify).
+        """
+        if conf_leap not in self._conf_leap_to_data:
+            raise ValueError(f"Unsupported `ConfLeap` value: {conf_leap}")
+        return copy.deepcopy(self._conf_leap_to_data[conf_leap])
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """
+    UC_54_26_66_63.lib_access_to_config_data.md:
+    Retrieve config data for all supported `ConfLeap`-s by a single evaluation
+    (instead of calling `get_config` per `ConfLeap` where each call re-evaluates the entire graph).
+    """
+    # `EnvState.state_derived_conf_data_loaded` depends on the states of all other `ConfLeap`-s:
+    env_ctx = _eval_config_context(EnvState.state_derived_conf_data_loaded.name)
+    return ConfigSnapshot({conf_leap: env_ctx.eval_state(state_name) for conf_leap, state_name in _conf_leap_to_state.items()})
+
+
+_conf_leap_to_state: dict[ConfLeap, str] = {
+    ConfLeap.leap_primer: EnvState.state_primer_conf_file_data_loaded.name,
+    ConfLeap.leap_client: EnvState.state_client_conf_file_data_loaded.name,
+    ConfLeap.leap_env: EnvState.state_env_conf_file_data_loaded.name,
+    ConfLeap.leap_host: EnvState.state_host_conf_file_data_loaded.name,
+    ConfLeap.leap_user: EnvState.state_user_conf_file_data_loaded.name,
+    ConfLeap.leap_derived: EnvState.state_derived_conf_data_loaded.name,
+}
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
+def _eval_config_context(final_state: str) -> EnvContext:
+
     # FT_96_50_58_75.context_propagation.md
     # Assume (no verification) that `_proto_kernel_abs_path` was set to a stand-alone to load config.
     # None of `EnvVar.*` can be used to ensure FT_66_02_54_56.context_isolation.md.
     if False:
         assert_proto_kernel_is_stand_alone(_proto_kernel_abs_path)
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
-    _conf_leap_to_state: dict[ConfLeap, str] = {
-        ConfLeap.leap_primer: EnvState.state_primer_conf_file_data_loaded.name,
-        ConfLeap.leap_client: EnvState.state_client_conf_file_data_loaded.name,
-        ConfLeap.leap_env: EnvState.state_env_conf_file_data_loaded.name,
-        ConfLeap.leap_derived: EnvState.state_derived_conf_data_loaded.name,
-    }
-
-    if conf_leap not in _conf_leap_to_state:
-        raise ValueError(f"Unsupported `ConfLeap` value: {conf_leap}")
 
     env_ctx = (
         ContextBuilder()
         .entry_func(EntryFunc.func_call_lib)
         .state_stride(StateStride.stride_py_arbitrary)
-        .forced_final_state(_conf_leap_to_state[conf_leap])
+        .forced_final_state(final_state)
         #
         .build_context()
     )
     env_ctx.eval_state(TargetState.target_everything_executed.value.name)
-    return env_ctx.eval_state(_conf_leap_to_state[conf_leap])
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+    return env_ctx
 
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 def boot_env(venv_main_func: str):
     """
     This is a helper function for an FT_75_87_82_46.entry_script.md
@@ -5915,7 +8969,7 @@ def start_app(venv_main_func: str):
     """
     This is a helper function for an FT_75_87_82_46.entry_script.md
     which implements FT_05_08_64_67.start_app.md.
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     The function fails if `venv` is not created.
     In that case, the user must trigger the bootstrap manually
     (via a script which calls `boot_env` function).
@@ -5924,7 +8978,7 @@ def start_app(venv_main_func: str):
         EntryFunc.func_start_app,
         venv_main_func,
     )
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
 
 def _start_main(
     entry_func: EntryFunc,
@@ -5937,7 +8991,7 @@ def _start_main(
     os.environ[EnvVar.var_PROTOPRIMER_PROTO_CODE.value] = os.path.abspath(__file__)
 
     os.environ[EnvVar.var_PROTOPRIMER_MAIN_FUNC.value] = venv_main_func
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     module_name: str
     func_name: str
     if ConfConstGeneral.module_func_separator in venv_main_func:
@@ -5950,7 +9004,7 @@ def _start_main(
         )
     else:
         raise ValueError(f"The specified main function [{venv_main_func}] does not match expected format `module_name:function_name`.")
-
+########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
     curr_py_exec = StateStride[
         os.getenv(
             EnvVar.var_PROTOPRIMER_PY_EXEC.value,
@@ -5959,7 +9013,7 @@ def _start_main(
     ]
 
     installed_kernel_name = f"{ConfConstGeneral.name_protoprimer_package}.{ConfConstGeneral.name_primer_kernel_module}"
-########### !!!!! GENERATED CONTENT - ANY CHANGES WILL BE LOST !!!!! ###########
+
     try:
         if curr_py_exec.value >= StateStride.stride_src_updated.value:
             # FT_74_10_40_33.DAG_extension.md:
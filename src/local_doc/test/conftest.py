@@ -1,9 +1,13 @@
 import pytest
 
-from local_test.mock_environ import mock_and_restore_environ
+from local_test.mock_environ import (
+    isolate_host_conf_environ,
+    mock_and_restore_environ,
+)
 
 
 @pytest.fixture(autouse=True)
-def mock_and_restore_env_vars():
+def mock_and_restore_env_vars(tmp_path_factory):
     with mock_and_restore_environ():
+        isolate_host_conf_environ(str(tmp_path_factory.mktemp("home")))
         yield
@@ -60,6 +60,10 @@ class StateMeta(enum.Enum):
         env_state=EnvState.state_input_sub_command_arg_loaded,
         sub_graph=SubGraph.graph_input,
     )
+    state_input_conf_format_arg_loaded = StateNodeMeta(
+        env_state=EnvState.state_input_conf_format_arg_loaded,
+        sub_graph=SubGraph.graph_input,
+    )
     state_print_conf_finalized = StateNodeMeta(
         env_state=EnvState.state_print_conf_finalized,
         sub_graph=SubGraph.graph_input,
@@ -72,6 +76,10 @@ class StateMeta(enum.Enum):
         env_state=EnvState.state_input_final_state_eval_finalized,
         sub_graph=SubGraph.graph_input,
     )
+    state_input_watch_conf_arg_loaded = StateNodeMeta(
+        env_state=EnvState.state_input_watch_conf_arg_loaded,
+        sub_graph=SubGraph.graph_input,
+    )
     state_func_boot_env_executed = StateNodeMeta(
         env_state=EnvState.state_func_boot_env_executed,
         sub_graph=None,
@@ -112,6 +120,10 @@ class StateMeta(enum.Enum):
         env_state=EnvState.state_primer_conf_file_data_loaded,
         sub_graph=SubGraph.graph_config,
     )
+    state_primer_conf_data_verified = StateNodeMeta(
+        env_state=EnvState.state_primer_conf_data_verified,
+        sub_graph=SubGraph.graph_config,
+    )
     state_ref_root_dir_abs_path_inited = StateNodeMeta(
         env_state=EnvState.state_ref_root_dir_abs_path_inited,
         sub_graph=SubGraph.graph_config,
@@ -128,6 +140,10 @@ class StateMeta(enum.Enum):
         env_state=EnvState.state_client_conf_file_data_loaded,
         sub_graph=SubGraph.graph_config,
     )
+    state_client_conf_data_verified = StateNodeMeta(
+        env_state=EnvState.state_client_conf_data_verified,
+        sub_graph=SubGraph.graph_config,
+    )
     state_selected_env_dir_rel_path_inited = StateNodeMeta(
         env_state=EnvState.state_selected_env_dir_rel_path_inited,
         sub_graph=SubGraph.graph_config,
@@ -144,6 +160,30 @@ class StateMeta(enum.Enum):
         env_state=EnvState.state_env_conf_file_data_loaded,
         sub_graph=SubGraph.graph_config,
     )
+    state_host_conf_file_abs_path_inited = StateNodeMeta(
+        env_state=EnvState.state_host_conf_file_abs_path_inited,
+        sub_graph=SubGraph.graph_config,
+    )
+    state_host_conf_file_data_loaded = StateNodeMeta(
+        env_state=EnvState.state_host_conf_file_data_loaded,
+        sub_graph=SubGraph.graph_config,
+    )
+    state_user_conf_file_abs_path_inited = StateNodeMeta(
+        env_state=EnvState.state_user_conf_file_abs_path_inited,
+        sub_graph=SubGraph.graph_config,
+    )
+    state_user_conf_file_data_loaded = StateNodeMeta(
+        env_state=EnvState.state_user_conf_file_data_loaded,
+        sub_graph=SubGraph.graph_config,
+    )
+    state_conf_data_verified = StateNodeMeta(
+        env_state=EnvState.state_conf_data_verified,
+        sub_graph=SubGraph.graph_config,
+    )
+    state_merged_conf_data_loaded = StateNodeMeta(
+        env_state=EnvState.state_merged_conf_data_loaded,
+        sub_graph=SubGraph.graph_config,
+    )
     state_required_python_version_inited = StateNodeMeta(
         env_state=EnvState.state_required_python_version_inited,
         sub_graph=SubGraph.graph_config,
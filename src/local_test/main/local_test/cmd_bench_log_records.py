@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import time
+
+from protoprimer.primer_kernel import (
+    _PrimerFileLogFormatter,
+    StateStrideFilter,
+)
+
+logger = logging.getLogger()
+
+
+def bench_log_records(record_count: int) -> float:
+    """
+    Micro-benchmark: enrich and format log records (as for the primer file log).
+
+    Returns elapsed seconds.
+    """
+    log_stream = io.StringIO()
+    log_handler = logging.StreamHandler(log_stream)
+    log_handler.setLevel(logging.DEBUG)
+    log_handler.setFormatter(_PrimerFileLogFormatter())
+    log_handler.addFilter(StateStrideFilter())
+
+    bench_logger = logging.getLogger(f"{__name__}.{bench_log_records.__name__}")
+    bench_logger.propagate = False
+    bench_logger.setLevel(logging.DEBUG)
+    bench_logger.addHandler(log_handler)
+    try:
+        start_time = time.perf_counter()
+        for record_index in range(record_count):
+            bench_logger.debug("record %d", record_index)
+        return time.perf_counter() - start_time
+    finally:
+        bench_logger.removeHandler(log_handler)
+
+
+def custom_main():
+    arg_parser = argparse.ArgumentParser(
+        description="Measure the time to enrich (`StateStrideFilter`) and format (`_PrimerFileLogFormatter`) log records.",
+    )
+    arg_parser.add_argument(
+        "--record_count",
+        type=int,
+        default=100000,
+    )
+    parsed_args = arg_parser.parse_args()
+
+    elapsed_sec = bench_log_records(parsed_args.record_count)
+    logger.info(f"logged [{parsed_args.record_count}] records in [{elapsed_sec:.3f}] sec")
+
+
+if __name__ == "__main__":
+    custom_main()
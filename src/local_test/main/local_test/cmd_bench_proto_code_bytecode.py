@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    cache_proto_code_bytecode,
+    ConfConstGeneral,
+    import_proto_module,
+)
+
+logger = logging.getLogger()
+
+
+def _time_proto_code_load(proto_code_abs_path: str) -> float:
+    start_time = time.perf_counter()
+    import_proto_module("proto_kernel", proto_code_abs_path)
+    return time.perf_counter() - start_time
+
+
+def bench_proto_code_bytecode(load_count: int) -> tuple[float, float]:
+    """
+    Micro-benchmark: load `proto_code` (as every stride does) with and without cached bytecode.
+
+    Returns median elapsed seconds per load: (compiled from source, loaded from cached bytecode).
+    """
+    orig_dont_write_bytecode = sys.dont_write_bytecode
+    sys.dont_write_bytecode = False
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir_abs_path:
+            proto_code_abs_path = os.path.join(tmp_dir_abs_path, ConfConstGeneral.default_proto_code_basename)
+            shutil.copyfile(primer_kernel.__file__, proto_code_abs_path)
+            pycache_dir_abs_path = os.path.dirname(cache_proto_code_bytecode(proto_code_abs_path))
+
+            source_load_secs: list[float] = []
+            bytecode_load_secs: list[float] = []
+            for _ in range(load_count):
+                shutil.rmtree(pycache_dir_abs_path)
+                source_load_secs.append(_time_proto_code_load(proto_code_abs_path))
+
+                cache_proto_code_bytecode(proto_code_abs_path)
+                bytecode_load_secs.append(_time_proto_code_load(proto_code_abs_path))
+    finally:
+        sys.dont_write_bytecode = orig_dont_write_bytecode
+
+    return statistics.median(source_load_secs), statistics.median(bytecode_load_secs)
+
+
+def custom_main():
+    arg_parser = argparse.ArgumentParser(
+        description="Measure the time to load `proto_code` compiled from source against loaded from cached bytecode (`cache_proto_code_bytecode`).",
+    )
+    arg_parser.add_argument(
+        "--load_count",
+        type=int,
+        default=20,
+    )
+    parsed_args = arg_parser.parse_args()
+
+    source_load_sec, bytecode_load_sec = bench_proto_code_bytecode(parsed_args.load_count)
+    logger.info(f"median of [{parsed_args.load_count}] `proto_code` loads: from source in [{source_load_sec * 1000:.1f}] ms, from bytecode in [{bytecode_load_sec * 1000:.1f}] ms")
+
+
+if __name__ == "__main__":
+    custom_main()
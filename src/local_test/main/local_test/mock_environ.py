@@ -2,6 +2,11 @@ import os
 from contextlib import contextmanager
 from unittest import mock
 
+from protoprimer.primer_kernel import (
+    ConfConstInput,
+    EnvVar,
+)
+
 
 @contextmanager
 def mock_and_restore_environ():
@@ -10,3 +15,17 @@ def mock_and_restore_environ():
     """
     with mock.patch.dict(os.environ):
         yield
+
+
+def isolate_host_conf_environ(home_dir_abs_path: str) -> None:
+    """
+    Hide conf files of the host running the tests (`ConfLeap.leap_host` and `ConfLeap.leap_user`).
+
+    Call it under `mock_and_restore_environ` (it modifies `os.environ`).
+    """
+    os.environ["HOME"] = home_dir_abs_path
+    os.environ[ConfConstInput.ext_env_var_XDG_CONFIG_HOME] = os.path.join(
+        home_dir_abs_path,
+        ConfConstInput.default_user_conf_base_dir_rel_path,
+    )
+    os.environ.pop(EnvVar.var_PROTOPRIMER_HOST_CONF.value, None)
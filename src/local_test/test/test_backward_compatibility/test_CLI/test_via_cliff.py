@@ -52,6 +52,20 @@ class Eval(Command):
     Print effective config.
     """
 
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            dest="watch_conf",
+        )
+        parser.add_argument(
+            "--format",
+            dest="conf_format",
+            metavar="conf_format",
+        )
+        return parser
+
     def take_action(self, parsed_args):
         pass
 
@@ -0,0 +1,21 @@
+from local_test.cmd_bench_log_records import bench_log_records
+from local_test.name_assertion import assert_test_module_name_embeds_str
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(
+        bench_log_records.__name__,
+    )
+
+
+def test_bench_log_records(capsys):
+
+    # when:
+
+    elapsed_sec = bench_log_records(10)
+
+    # then:
+
+    assert elapsed_sec >= 0
+    # The benchmark logger does not propagate records (e.g. to stderr):
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,20 @@
+from local_test.cmd_bench_proto_code_bytecode import bench_proto_code_bytecode
+from local_test.name_assertion import assert_test_module_name_embeds_str
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(
+        bench_proto_code_bytecode.__name__,
+    )
+
+
+def test_bench_proto_code_bytecode():
+
+    # when:
+
+    source_load_sec, bytecode_load_sec = bench_proto_code_bytecode(1)
+
+    # then:
+
+    assert source_load_sec > 0
+    assert bytecode_load_sec > 0
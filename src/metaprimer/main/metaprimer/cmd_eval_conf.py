@@ -1,22 +1,28 @@
 from __future__ import annotations
 
+import argparse
 import logging
 import os
 import sys
 
 from metaprimer.conf_renderer import (
-    RenderConfigVisitor,
+    AbstractConfLeapRootNode,
+    build_conf_leap_root_node,
     RootNode_client,
     RootNode_derived,
     RootNode_env,
+    RootNode_host,
     RootNode_input,
     RootNode_primer,
+    RootNode_user,
+    write_effective_config,
 )
-from metaprimer.script_lib import configure_script
+from metaprimer.script_lib import configure_script_snapshot
 from protoprimer.primer_kernel import (
+    ConfigSnapshot,
     ConfLeap,
+    EffectiveConfigFormat,
     EnvState,
-    get_config,
 )
 
 logger = logging.getLogger()
@@ -24,48 +30,90 @@ logger = logging.getLogger()
 
 def custom_main():
 
-    derived_data: dict = configure_script(script_basename=os.path.basename(sys.argv[0]))
+    parsed_args = _init_arg_parser().parse_args()
+
+    config_snapshot: ConfigSnapshot = configure_script_snapshot(script_basename=os.path.basename(sys.argv[0]))
+    derived_data: dict = config_snapshot.get_config(ConfLeap.leap_derived)
 
     state_proto_code_file_abs_path_inited = derived_data[EnvState.state_proto_code_file_abs_path_inited.name]
     state_primer_conf_file_abs_path_inited = derived_data[EnvState.state_primer_conf_file_abs_path_inited.name]
     state_global_conf_file_abs_path_inited = derived_data[EnvState.state_global_conf_file_abs_path_inited.name]
     state_local_conf_file_abs_path_inited = derived_data[EnvState.state_local_conf_file_abs_path_inited.name]
+    state_host_conf_file_abs_path_inited = derived_data[EnvState.state_host_conf_file_abs_path_inited.name]
+    state_user_conf_file_abs_path_inited = derived_data[EnvState.state_user_conf_file_abs_path_inited.name]
 
-    conf_input = RootNode_input(
-        node_indent=0,
-        orig_data={
-            EnvState.state_proto_code_file_abs_path_inited.name: state_proto_code_file_abs_path_inited,
-            EnvState.state_primer_conf_file_abs_path_inited.name: state_primer_conf_file_abs_path_inited,
-        },
-    )
-    print(RenderConfigVisitor().render_node(conf_input))
+    conf_leap_root_nodes: list[AbstractConfLeapRootNode] = [
+        build_conf_leap_root_node(
+            RootNode_input,
+            node_indent=0,
+            orig_data={
+                EnvState.state_proto_code_file_abs_path_inited.name: state_proto_code_file_abs_path_inited,
+                EnvState.state_primer_conf_file_abs_path_inited.name: state_primer_conf_file_abs_path_inited,
+            },
+        ),
+        build_conf_leap_root_node(
+            RootNode_primer,
+            node_indent=0,
+            orig_data=config_snapshot.get_config(ConfLeap.leap_primer),
+            state_primer_conf_file_abs_path_inited=state_primer_conf_file_abs_path_inited,
+        ),
+        build_conf_leap_root_node(
+            RootNode_client,
+            node_indent=0,
+            orig_data=config_snapshot.get_config(ConfLeap.leap_client),
+            state_global_conf_file_abs_path_inited=state_global_conf_file_abs_path_inited,
+        ),
+        build_conf_leap_root_node(
+            RootNode_env,
+            node_indent=0,
+            orig_data=config_snapshot.get_config(ConfLeap.leap_env),
+            state_local_conf_file_abs_path_inited=state_local_conf_file_abs_path_inited,
+        ),
+        # The `ConfLeap`-s overriding each other are listed from the lowest to the highest priority:
+        build_conf_leap_root_node(
+            RootNode_host,
+            node_indent=0,
+            orig_data=config_snapshot.get_config(ConfLeap.leap_host),
+            state_host_conf_file_abs_path_inited=state_host_conf_file_abs_path_inited,
+        ),
+        build_conf_leap_root_node(
+            RootNode_user,
+            node_indent=0,
+            orig_data=config_snapshot.get_config(ConfLeap.leap_user),
+            state_user_conf_file_abs_path_inited=state_user_conf_file_abs_path_inited,
+        ),
+        build_conf_leap_root_node(
+            RootNode_derived,
+            node_indent=0,
+            orig_data=derived_data,
+        ),
+    ]
 
-    conf_primer = RootNode_primer(
-        node_indent=0,
-        orig_data=get_config(ConfLeap.leap_primer),
-        state_primer_conf_file_abs_path_inited=state_primer_conf_file_abs_path_inited,
+    write_effective_config(
+        conf_leap_root_nodes,
+        EffectiveConfigFormat(parsed_args.config_format),
+        sys.stdout,
     )
-    print(RenderConfigVisitor().render_node(conf_primer))
 
-    conf_client = RootNode_client(
-        node_indent=0,
-        orig_data=get_config(ConfLeap.leap_client),
-        state_global_conf_file_abs_path_inited=state_global_conf_file_abs_path_inited,
-    )
-    print(RenderConfigVisitor().render_node(conf_client))
 
-    conf_env = RootNode_env(
-        node_indent=0,
-        orig_data=get_config(ConfLeap.leap_env),
-        state_local_conf_file_abs_path_inited=state_local_conf_file_abs_path_inited,
+def _init_arg_parser() -> argparse.ArgumentParser:
+
+    arg_parser = argparse.ArgumentParser(
+        description="Print effective config for all `ConfLeap`-s.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
-    print(RenderConfigVisitor().render_node(conf_env))
 
-    conf_derived = RootNode_derived(
-        node_indent=0,
-        orig_data=derived_data,
+    arg_parser.add_argument(
+        "--format",
+        dest="config_format",
+        metavar="config_format",
+        type=str,
+        choices=[config_format.value for config_format in EffectiveConfigFormat],
+        default=EffectiveConfigFormat.format_text.value,
+        help="Output format: annotated `python`-like text (for humans) or schema-versioned JSON with per-field provenance (for tools).",
     )
-    print(RenderConfigVisitor().render_node(conf_derived))
+
+    return arg_parser
 
 
 if __name__ == "__main__":
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import enum
+import hashlib
+import io
 import json
 import os
 from types import CodeType
 from typing import (
     Any,
     Generic,
+    TextIO,
 )
 
 from protoprimer.primer_kernel import (
@@ -17,13 +20,19 @@ from protoprimer.primer_kernel import (
     ConfConstInput,
     ConfField,
     ConfLeap,
+    conf_file_exists,
+    create_merged_conf_data,
+    EffectiveConfigFormat,
     EntryFunc,
     ContextBuilder,
     EnvContext,
     EnvState,
+    EnvVar,
+    get_loaded_conf_file_abs_path,
+    InstallMode,
     missing_conf_file_message,
     PathName,
-    read_json_file,
+    read_conf_file,
     SelectorFunc,
     SubCommand,
     SyntaxArg,
@@ -32,6 +41,7 @@ from protoprimer.primer_kernel import (
     ValueType,
     VenvDriverType,
     warn_once_at_state_stride,
+    write_effective_conf_document,
 )
 
 
@@ -74,58 +84,169 @@ class AbstractConfigVisitor:
         pass
 
 
+class _CommentingTextSink:
+    """
+    Comments out lines written to it (with indent) and forwards them to the wrapped `text_sink`.
+
+    It is the streaming equivalent of commenting out the entire rendered text of a node:
+    lines are joined by `os.linesep` (without the trailing one) - only the current line is buffered.
+    """
+
+    def __init__(
+        self,
+        text_sink: TextIO,
+        config_node: "AbstractConfigNode",
+    ):
+        self.text_sink: TextIO = text_sink
+        self.config_node: "AbstractConfigNode" = config_node
+        self.pending_line: str = ""
+        self.is_first_line: bool = True
+
+    def write(
+        self,
+        rendered_text: str,
+    ) -> None:
+        self.pending_line += rendered_text
+        while os.linesep in self.pending_line:
+            rendered_line, self.pending_line = self.pending_line.split(os.linesep, 1)
+            self._write_line(rendered_line)
+
+    def close(
+        self,
+    ) -> None:
+        if self.pending_line:
+            self._write_line(self.pending_line)
+            self.pending_line = ""
+
+    def _write_line(
+        self,
+        rendered_line: str,
+    ) -> None:
+        if not self.is_first_line:
+            self.text_sink.write(os.linesep)
+        self.is_first_line = False
+        self.text_sink.write(
+            rendered_line[: self.config_node.node_indent]
+            + f"{self.config_node.note_color.value}# "
+            + rendered_line[self.config_node.node_indent :]
+            + f"{TermColor.reset_style.value}"
+            #
+        )
+
+
+class _LastCharDroppingTextSink:
+    """
+    Forwards text to the wrapped `text_sink` holding back the last char written - it is dropped on `close`.
+    """
+
+    def __init__(
+        self,
+        text_sink: TextIO,
+    ):
+        self.text_sink: TextIO = text_sink
+        self.last_char: str = ""
+
+    def write(
+        self,
+        rendered_text: str,
+    ) -> None:
+        if not rendered_text:
+            return
+        self.text_sink.write(self.last_char + rendered_text[:-1])
+        self.last_char = rendered_text[-1]
+
+    def close(
+        self,
+    ) -> None:
+        self.last_char = ""
+
+
 class RenderConfigVisitor(AbstractConfigVisitor):
     """
     Render a JSON-like data structure into data coded in `python` (with annotations as comments).
 
     It renders loaded config as: FT_19_44_42_19.effective_config.md
+
+    The rendered text is written to `text_sink` while visiting (see `write_node`)
+    which lets callers (e.g. `eval`) print it incrementally.
+    `render_node` is an adapter which collects the rendered text into `str`.
     """
 
     def __init__(
         self,
         is_quiet: bool = False,
+        text_sink: TextIO | None = None,
     ):
         self.is_quiet: bool = is_quiet
-        self.rendered_value: str = ""
+        self.text_sink: TextIO | None = text_sink
+        # Total size of the text written so far (to know whether a child node rendered anything):
+        self.written_size: int = 0
 
     def render_node(
         self,
         config_node: "AbstractConfigNode",
     ) -> str:
-        s: str = ""
+        prev_text_sink = self.text_sink
+        self.text_sink = io.StringIO()
+        try:
+            self.write_node(config_node)
+            return self.text_sink.getvalue()
+        finally:
+            self.text_sink = prev_text_sink
+
+    def write_node(
+        self,
+        config_node: "AbstractConfigNode",
+    ) -> None:
         if not self.is_quiet:
-            s += " " * config_node.node_indent + os.linesep
-        s += self._render_node_annotation(config_node)
+            self._write(" " * config_node.node_indent + os.linesep)
+        self._write_node_annotation(config_node)
 
-        rendered_value: str = self._render_node_value(config_node)
         if config_node.is_present:
-            s += rendered_value
-        else:
-            s += self._comment_with_indent(
-                rendered_value,
+            config_node.accept_visitor(self)
+        elif not self.is_quiet:
+            self._visit_with_text_sink(
                 config_node,
+                _CommentingTextSink(self.text_sink, config_node),
             )
-        return s
 
-    def _render_node_annotation(
+    def _write(
+        self,
+        rendered_text: str,
+    ) -> None:
+        self.written_size += len(rendered_text)
+        self.text_sink.write(rendered_text)
+
+    def _visit_with_text_sink(
         self,
         config_node: "AbstractConfigNode",
-    ) -> str:
+        filter_text_sink: _CommentingTextSink | _LastCharDroppingTextSink,
+    ) -> None:
+        prev_text_sink = self.text_sink
+        self.text_sink = filter_text_sink
+        try:
+            config_node.accept_visitor(self)
+        finally:
+            self.text_sink = prev_text_sink
+        filter_text_sink.close()
+
+    def _write_node_annotation(
+        self,
+        config_node: "AbstractConfigNode",
+    ) -> None:
         if self.is_quiet:
-            return ""
+            return
         note_text = config_node.note_text
         if len(note_text.strip()) == 0:
-            return ""
+            return
         annotation_lines = note_text.splitlines()
-        s = ""
         for annotation_line in annotation_lines:
-            s += (
+            self._write(
                 " " * config_node.node_indent
                 + f"{config_node.note_color.value}# {annotation_line}{TermColor.reset_style.value}"
                 + os.linesep
                 #
             )
-        return s
 
     @staticmethod
     def _render_node_name(
@@ -135,39 +256,21 @@ class RenderConfigVisitor(AbstractConfigVisitor):
             return ""
         return f"{json.dumps(config_node.node_name)}: "
 
-    def _render_node_value(
-        self,
-        config_node: "AbstractConfigNode",
-    ) -> str:
-        config_node.accept_visitor(self)
-        return self.rendered_value
-
-    def _comment_with_indent(
+    def _write_child_node(
         self,
-        rendered_text: str,
-        config_node: "AbstractConfigNode",
-    ) -> str:
-        if self.is_quiet:
-            return ""
-        deactivated_lines = []
-        rendered_lines = rendered_text.splitlines()
-        for rendered_line in rendered_lines:
-            deactivated_lines.append(
-                rendered_line[: config_node.node_indent]
-                + f"{config_node.note_color.value}# "
-                + rendered_line[config_node.node_indent :]
-                + f"{TermColor.reset_style.value}"
-                #
-            )
-        return os.linesep.join(deactivated_lines)
+        child_node: "AbstractConfigNode",
+    ) -> None:
+        written_size = self.written_size
+        self.write_node(child_node)
+        if self.written_size > written_size or not self.is_quiet:
+            self._write(os.linesep)
 
     def visit_dict(
         self,
         dict_node: "AbstractDictNode",
         **kwargs,
     ):
-        s: str = ""
-        s += (
+        self._write(
             " " * dict_node.node_indent
             + self._render_node_name(dict_node)
             + "{"
@@ -175,20 +278,15 @@ class RenderConfigVisitor(AbstractConfigVisitor):
             #
         )
         for child_name, child_node in dict_node.child_nodes.items():
-            rendered_child = self.render_node(child_node)
-            s += rendered_child
-            if rendered_child or not self.is_quiet:
-                s += os.linesep
-        s += " " * dict_node.node_indent + "},"
-        self.rendered_value = s
+            self._write_child_node(child_node)
+        self._write(" " * dict_node.node_indent + "},")
 
     def visit_list(
         self,
         list_node: "AbstractListNode",
         **kwargs,
     ):
-        s: str = ""
-        s += (
+        self._write(
             " " * list_node.node_indent
             + self._render_node_name(list_node)
             + "["
@@ -196,21 +294,16 @@ class RenderConfigVisitor(AbstractConfigVisitor):
             #
         )
         for child_node in list_node.child_nodes:
-            rendered_child = self.render_node(child_node)
-            s += rendered_child
-            if rendered_child or not self.is_quiet:
-                s += os.linesep
-        s += " " * list_node.node_indent + "],"
-        self.rendered_value = s
+            self._write_child_node(child_node)
+        self._write(" " * list_node.node_indent + "],")
 
     def visit_value(
         self,
         value_node: "AbstractValueNode",
         **kwargs,
     ):
-        s: str = ""
         if isinstance(value_node.orig_data, str):
-            s += (
+            self._write(
                 " " * value_node.node_indent
                 + self._render_node_name(value_node)
                 # Use double-quote for `str`:
@@ -219,27 +312,87 @@ class RenderConfigVisitor(AbstractConfigVisitor):
                 #
             )
         else:
-            s += (
+            self._write(
                 " " * value_node.node_indent
                 + self._render_node_name(value_node)
                 + f"{repr(value_node.orig_data)}"
                 + ","
                 #
             )
-        self.rendered_value = s
 
     def visit_root(
         self,
         root_node: "AbstractRootNode",
         **kwargs,
     ):
+        self._write(" " * root_node.node_indent + f"{root_node.node_name} = (" + os.linesep)
         # Remove the last char (which is supposed to be `,`):
-        rendered_child: str = self.render_node(root_node.child_node)[:-1]
-        s: str = ""
-        s += " " * root_node.node_indent + f"{root_node.node_name} = (" + os.linesep
-        s += rendered_child + os.linesep
-        s += " " * root_node.node_indent + ")"
-        self.rendered_value = s
+        prev_text_sink = self.text_sink
+        self.text_sink = _LastCharDroppingTextSink(prev_text_sink)
+        try:
+            self.write_node(root_node.child_node)
+        finally:
+            self.text_sink.close()
+            self.text_sink = prev_text_sink
+        self._write(os.linesep)
+        self._write(" " * root_node.node_indent + ")")
+
+
+class ExtractDataVisitor(AbstractConfigVisitor):
+    """
+    Extracts effective data from config nodes directly (without rendering them by `RenderConfigVisitor`).
+
+    The extracted data is the same as the one compiled from the rendered `python` code:
+    nodes which are not present (rendered as comments) are skipped.
+    """
+
+    def __init__(
+        self,
+    ):
+        self.extracted_value: Any = None
+
+    def extract_data(
+        self,
+        config_node: "AbstractConfigNode",
+    ) -> Any:
+        config_node.accept_visitor(self)
+        return self.extracted_value
+
+    def visit_dict(
+        self,
+        dict_node: "AbstractDictNode",
+        **kwargs,
+    ):
+        extracted_dict: dict = {}
+        for child_node in dict_node.child_nodes.values():
+            if child_node.is_present:
+                extracted_dict[child_node.node_name] = self.extract_data(child_node)
+        self.extracted_value = extracted_dict
+
+    def visit_list(
+        self,
+        list_node: "AbstractListNode",
+        **kwargs,
+    ):
+        extracted_list: list = []
+        for child_node in list_node.child_nodes:
+            if child_node.is_present:
+                extracted_list.append(self.extract_data(child_node))
+        self.extracted_value = extracted_list
+
+    def visit_value(
+        self,
+        value_node: "AbstractValueNode",
+        **kwargs,
+    ):
+        self.extracted_value = value_node.orig_data
+
+    def visit_root(
+        self,
+        root_node: "AbstractRootNode",
+        **kwargs,
+    ):
+        self.extracted_value = self.extract_data(root_node.child_node)
 
 
 class ConfigBuilderVisitor(AbstractConfigVisitor):
@@ -607,9 +760,19 @@ class AbstractRootNode(AbstractConfigNode[ValueType]):
 
     def compile_effective_config(
         self,
+    ) -> Any:
+        """
+        Produces effective config data (as if the rendered config was compiled).
+        """
+        return ExtractDataVisitor().extract_data(self)
+
+    def compile_rendered_config(
+        self,
     ) -> Any:
         """
         Produces rendered config and compiles it to access data.
+
+        This is slower than `compile_effective_config` - it is used to verify the rendered config is valid `python`.
         """
         generated_code = RenderConfigVisitor().render_node(self)
         # TODO: Instead, maybe configure rendering without colors?
@@ -650,6 +813,9 @@ class AbstractConfLeapRootNode(AbstractRootNode):
             child_builder=child_builder,
             **kwargs,
         )
+        self.conf_leap: ConfLeap = conf_leap
+        # The file the `ConfLeap.*` data is loaded from (`None` if it is not loaded from a file):
+        self.conf_file_abs_path: str | None = None
 
 
 class AbstractConfLeapNodeBuilder(ConfigBuilderVisitor):
@@ -685,61 +851,38 @@ class AbstractConfLeapNodeBuilder(ConfigBuilderVisitor):
     ):
         # Common overridable `global` and `local` fields: FT_23_37_64_44.global_vs_local.md
 
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_required_python_version.value,
-            node_class=Node_field_required_python_version,
-            conf_leap=conf_leap,
-        )
-
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_python_selector_file_rel_path.value,
-            node_class=Node_field_python_selector_file_rel_path,
-            conf_leap=conf_leap,
-        )
-
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_local_venv_dir_rel_path.value,
-            node_class=Node_field_local_venv_dir_rel_path,
-            conf_leap=conf_leap,
-        )
-
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_local_log_dir_rel_path.value,
-            node_class=Node_field_local_log_dir_rel_path,
-            conf_leap=conf_leap,
-        )
-
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_local_tmp_dir_rel_path.value,
-            node_class=Node_field_local_tmp_dir_rel_path,
-            conf_leap=conf_leap,
-        )
-
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_local_cache_dir_rel_path.value,
-            node_class=Node_field_local_cache_dir_rel_path,
-            conf_leap=conf_leap,
-        )
-
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_venv_driver.value,
-            node_class=Node_field_venv_driver,
-            conf_leap=conf_leap,
-        )
-
-        self._create_used_dict_field(
-            dict_node=dict_node,
-            field_name=ConfField.field_project_descriptors.value,
-            node_class=Node_field_project_descriptors,
-            conf_leap=conf_leap,
-        )
+        for field_name, node_class in [
+            (ConfField.field_required_python_version.value, Node_field_required_python_version),
+            (ConfField.field_python_selector_file_rel_path.value, Node_field_python_selector_file_rel_path),
+            (ConfField.field_local_venv_dir_rel_path.value, Node_field_local_venv_dir_rel_path),
+            (ConfField.field_local_log_dir_rel_path.value, Node_field_local_log_dir_rel_path),
+            (ConfField.field_local_tmp_dir_rel_path.value, Node_field_local_tmp_dir_rel_path),
+            (ConfField.field_local_cache_dir_rel_path.value, Node_field_local_cache_dir_rel_path),
+            (ConfField.field_venv_driver.value, Node_field_venv_driver),
+            (ConfField.field_uv_tools_dir_abs_path.value, Node_field_uv_tools_dir_abs_path),
+            (ConfField.field_required_uv_version.value, Node_field_required_uv_version),
+            (ConfField.field_version_constraints_file_basename.value, Node_field_version_constraints_file_basename),
+            (ConfField.field_project_descriptors.value, Node_field_project_descriptors),
+            (ConfField.field_install_specs.value, Node_field_install_specs),
+            (ConfField.field_install_mode.value, Node_field_install_mode),
+        ]:
+            if (
+                conf_leap
+                in [
+                    ConfLeap.leap_host,
+                    ConfLeap.leap_user,
+                ]
+                and field_name not in ConfConstGeneral.host_tuning_field_names
+            ):
+                # Repo-specific fields are rejected in host-level conf files (see `validate_conf_data`):
+                continue
+
+            self._create_used_dict_field(
+                dict_node=dict_node,
+                field_name=field_name,
+                node_class=node_class,
+                conf_leap=conf_leap,
+            )
 
     @staticmethod
     def _create_unused_dict_fields(
@@ -889,6 +1032,7 @@ class RootNode_primer(AbstractConfLeapRootNode):
             **kwargs,
         )
         self.state_primer_conf_file_abs_path_inited: str = state_primer_conf_file_abs_path_inited
+        self.conf_file_abs_path = state_primer_conf_file_abs_path_inited
         self.note_text = f"The `{ConfLeap.leap_primer.name}` data is loaded from the [{self.state_primer_conf_file_abs_path_inited}] file."
 
 
@@ -992,6 +1136,7 @@ class RootNode_client(AbstractConfLeapRootNode):
             **kwargs,
         )
         self.state_global_conf_file_abs_path_inited: str = state_global_conf_file_abs_path_inited
+        self.conf_file_abs_path = state_global_conf_file_abs_path_inited
         self.note_text = f"The `{ConfLeap.leap_client.name}` data is loaded from the [{self.state_global_conf_file_abs_path_inited}] file."
 
 
@@ -1055,7 +1200,11 @@ class Node_field_required_python_version(AbstractValueNode[str]):
                 f"{ConfConstGeneral.common_field_global_note}\n"
                 #
             )
-        elif conf_leap == ConfLeap.leap_env:
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
 
 
@@ -1077,7 +1226,11 @@ class Node_field_python_selector_file_rel_path(AbstractValueNode[str]):
                 f"{ConfConstGeneral.common_field_global_note}\n"
                 #
             )
-        elif conf_leap == ConfLeap.leap_env:
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
 
 
@@ -1099,7 +1252,11 @@ class Node_field_local_venv_dir_rel_path(AbstractValueNode[str]):
                 f"{ConfConstGeneral.common_field_global_note}\n"
                 #
             )
-        elif conf_leap == ConfLeap.leap_env:
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
 
 
@@ -1121,7 +1278,11 @@ class Node_field_local_log_dir_rel_path(AbstractValueNode[str]):
                 f"{ConfConstGeneral.common_field_global_note}\n"
                 #
             )
-        elif conf_leap == ConfLeap.leap_env:
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
 
 
@@ -1143,7 +1304,11 @@ class Node_field_local_tmp_dir_rel_path(AbstractValueNode[str]):
                 f"{ConfConstGeneral.common_field_global_note}\n"
                 #
             )
-        elif conf_leap == ConfLeap.leap_env:
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
 
 
@@ -1165,7 +1330,11 @@ class Node_field_local_cache_dir_rel_path(AbstractValueNode[str]):
                 f"{ConfConstGeneral.common_field_global_note}\n"
                 #
             )
-        elif conf_leap == ConfLeap.leap_env:
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
 
 
@@ -1188,10 +1357,117 @@ class Node_field_venv_driver(AbstractValueNode[str]):
                 f"{ConfConstGeneral.common_field_global_note}\n"
                 #
             )
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
+            self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
+
+
+# noinspection PyPep8Naming
+class Node_field_uv_tools_dir_abs_path(AbstractValueNode[str]):
+
+    def __init__(
+        self,
+        conf_leap: ConfLeap,
+        **kwargs,
+    ):
+        super().__init__(
+            **kwargs,
+        )
+        if conf_leap == ConfLeap.leap_client:
+            self.note_text = (
+                f"Field `{ConfField.field_uv_tools_dir_abs_path.value}` points to the host-level dir to install `uv` once for all client repos (with `{VenvDriverType.venv_uv.name}`).\n"
+                f"The path must be absolute (`~` is expanded). Env var `{EnvVar.var_PROTOPRIMER_UV_TOOLS_DIR.value}` overrides this field.\n"
+                f"{ConfConstGeneral.common_field_global_note}\n"
+                #
+            )
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
+            self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
+
+
+# noinspection PyPep8Naming
+class Node_field_required_uv_version(AbstractValueNode[str]):
+
+    def __init__(
+        self,
+        conf_leap: ConfLeap,
+        **kwargs,
+    ):
+        super().__init__(
+            **kwargs,
+        )
+        if conf_leap == ConfLeap.leap_client:
+            self.note_text = (
+                f"Field `{ConfField.field_required_uv_version.value}` pins the `uv` version to install (with `{VenvDriverType.venv_uv.name}`).\n"
+                f"If it is not set, the latest `uv` is installed (and, with `{ConfField.field_uv_tools_dir_abs_path.value}`, reused until its symlink is removed).\n"
+                f"{ConfConstGeneral.common_field_global_note}\n"
+                #
+            )
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
+            self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
+
+
+# noinspection PyPep8Naming
+class Node_field_version_constraints_file_basename(AbstractValueNode[str]):
+
+    def __init__(
+        self,
+        conf_leap: ConfLeap,
+        **kwargs,
+    ):
+        super().__init__(
+            **kwargs,
+        )
+        if conf_leap == ConfLeap.leap_client:
+            self.note_text = (
+                f"Field `{ConfField.field_version_constraints_file_basename.value}` is the basename of the file with pinned package versions (default: `{ConfConstEnv.default_version_constraints_file_basename}`).\n"
+                f"The file is kept in the local config dir (see `{ConfField.field_local_conf_symlink_rel_path.value}`) and re-pinned on `{SubCommand.command_reboot.value}`.\n"
+                f"{ConfConstGeneral.common_field_global_note}\n"
+                #
+            )
         elif conf_leap == ConfLeap.leap_env:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
 
 
+# noinspection PyPep8Naming
+class Node_field_install_mode(AbstractValueNode[str]):
+
+    def __init__(
+        self,
+        conf_leap: ConfLeap,
+        **kwargs,
+    ):
+        super().__init__(
+            **kwargs,
+        )
+        if conf_leap == ConfLeap.leap_client:
+            self.note_text = (
+                f"Field `{ConfField.field_install_mode.value}` selects how `{ConfField.field_install_specs.value}` are resolved and installed:\n"
+                f'*   specify "{InstallMode.install_per_group.name}" (default) to run the resolver per `{ConfField.field_install_group.value}`,\n'
+                f'*   specify "{InstallMode.install_combined.name}" to run the resolver once for all `{ConfField.field_install_group.value}`-s,\n'
+                f'*   specify "{InstallMode.install_synced.name}" to also uninstall stray packages,\n'
+                f'*   specify "{InstallMode.install_locked.name}" to install from the lock file until the install inputs change.\n'
+                f"{ConfConstGeneral.common_field_global_note}\n"
+                #
+            )
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
+            self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
+
+
 # noinspection PyPep8Naming
 class Builder_Node_field_project_descriptors(AbstractConfLeapNodeBuilder):
 
@@ -1233,7 +1509,11 @@ class Node_field_project_descriptors(AbstractListNode):
                 f"Instead, the `{ConfConstGeneral.name_protoprimer_package}` relies on `{ConfConstClient.default_pyproject_toml_basename}` file per `python` project to specify these dependencies.\n"
                 f"See `{EnvState.state_project_descriptors_inited.name}` in `{ConfLeap.leap_derived.name}`.\n"
             )
-        elif conf_leap == ConfLeap.leap_env:
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
             self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
         elif conf_leap == ConfLeap.leap_derived:
             self.note_text = f"{ConfConstGeneral.func_note_derived_based_on_common(ConfField.field_project_descriptors.value)}\n"
@@ -1342,6 +1622,33 @@ class Node_field_install_extras(AbstractListNode):
             )
 
 
+# noinspection PyPep8Naming
+class Node_field_install_specs(AbstractListNode):
+
+    def __init__(
+        self,
+        conf_leap: ConfLeap,
+        **kwargs,
+    ):
+        super().__init__(
+            child_builder=ConfigBuilderVisitor(),
+            **kwargs,
+        )
+        if conf_leap == ConfLeap.leap_client:
+            self.note_text = (
+                f"Field `{ConfField.field_install_specs.value}` lists extra install args per `{ConfField.field_install_group.value}` (see `{ConfField.field_project_descriptors.value}`):\n"
+                f'*   each item is a single-item `dict` keyed by the `{ConfField.field_install_group.value}` (e.g. {{"group_name": {{"{ConfField.field_extra_command_args.value}": ["--index-url", "..."]}}}}).\n'
+                f"{ConfConstGeneral.common_field_global_note}\n"
+                #
+            )
+        elif conf_leap in [
+            ConfLeap.leap_env,
+            ConfLeap.leap_host,
+            ConfLeap.leap_user,
+        ]:
+            self.note_text = f"{ConfConstGeneral.common_field_local_note}\n"
+
+
 ########################################################################################################################
 # `ConfLeap.leap_env` node types.
 # See: FT_19_44_42_19.effective_config.md
@@ -1381,9 +1688,99 @@ class RootNode_env(AbstractConfLeapRootNode):
             **kwargs,
         )
         self.state_local_conf_file_abs_path_inited: str = state_local_conf_file_abs_path_inited
+        self.conf_file_abs_path = state_local_conf_file_abs_path_inited
         self.note_text = f"The `{ConfLeap.leap_env.name}` data is loaded from the [{self.state_local_conf_file_abs_path_inited}] file."
 
 
+########################################################################################################################
+# `ConfLeap.leap_host` node types.
+# See: FT_19_44_42_19.effective_config.md
+
+
+# noinspection PyPep8Naming
+class Builder_RootNode_host(AbstractConfLeapNodeBuilder):
+
+    def visit_dict(
+        self,
+        dict_node: AbstractDictNode,
+        **kwargs,
+    ) -> None:
+
+        self._create_common_fields(
+            dict_node=dict_node,
+            conf_leap=ConfLeap.leap_host,
+        )
+
+        self._create_unused_dict_fields(dict_node)
+
+
+# noinspection PyPep8Naming
+class RootNode_host(AbstractConfLeapRootNode):
+    """
+    Root node for `ConfLeap.leap_host`.
+    """
+
+    def __init__(
+        self,
+        state_host_conf_file_abs_path_inited: str | None,
+        **kwargs,
+    ):
+        super().__init__(
+            conf_leap=ConfLeap.leap_host,
+            child_builder=Builder_RootNode_host(),
+            **kwargs,
+        )
+        self.state_host_conf_file_abs_path_inited: str | None = state_host_conf_file_abs_path_inited
+        self.conf_file_abs_path = state_host_conf_file_abs_path_inited
+        if self.state_host_conf_file_abs_path_inited is None:
+            self.note_text = f"The `{ConfLeap.leap_host.name}` data is not loaded - `{EnvVar.var_PROTOPRIMER_HOST_CONF.value}` env var is not set."
+        else:
+            self.note_text = f"The `{ConfLeap.leap_host.name}` data is loaded from the [{self.state_host_conf_file_abs_path_inited}] file (see `{EnvVar.var_PROTOPRIMER_HOST_CONF.value}` env var)."
+
+
+########################################################################################################################
+# `ConfLeap.leap_user` node types.
+# See: FT_19_44_42_19.effective_config.md
+
+
+# noinspection PyPep8Naming
+class Builder_RootNode_user(AbstractConfLeapNodeBuilder):
+
+    def visit_dict(
+        self,
+        dict_node: AbstractDictNode,
+        **kwargs,
+    ) -> None:
+
+        self._create_common_fields(
+            dict_node=dict_node,
+            conf_leap=ConfLeap.leap_user,
+        )
+
+        self._create_unused_dict_fields(dict_node)
+
+
+# noinspection PyPep8Naming
+class RootNode_user(AbstractConfLeapRootNode):
+    """
+    Root node for `ConfLeap.leap_user`.
+    """
+
+    def __init__(
+        self,
+        state_user_conf_file_abs_path_inited: str,
+        **kwargs,
+    ):
+        super().__init__(
+            conf_leap=ConfLeap.leap_user,
+            child_builder=Builder_RootNode_user(),
+            **kwargs,
+        )
+        self.state_user_conf_file_abs_path_inited: str = state_user_conf_file_abs_path_inited
+        self.conf_file_abs_path = state_user_conf_file_abs_path_inited
+        self.note_text = f"The `{ConfLeap.leap_user.name}` data is loaded from the [{self.state_user_conf_file_abs_path_inited}] file."
+
+
 ########################################################################################################################
 # `ConfLeap.leap_derived` node types.
 # See: FT_19_44_42_19.effective_config.md
@@ -1500,6 +1897,35 @@ class Builder_RootNode_derived(AbstractConfLeapNodeBuilder):
         # `ConfLeap.leap_env`
         # nothing specific
 
+        # ===
+        # `ConfLeap.leap_host`
+
+        field_node = self._create_used_dict_field(
+            dict_node=dict_node,
+            field_name=EnvState.state_host_conf_file_abs_path_inited.name,
+            node_class=AbstractValueNode,
+            conf_leap=conf_leap,
+            **kwargs,
+        )
+        field_node.note_text = f"This value is derived from `{EnvVar.var_PROTOPRIMER_HOST_CONF.value}` env var (if set).\n"
+
+        # ===
+        # `ConfLeap.leap_user`
+
+        field_node = self._create_used_dict_field(
+            dict_node=dict_node,
+            field_name=EnvState.state_user_conf_file_abs_path_inited.name,
+            node_class=AbstractValueNode,
+            conf_leap=conf_leap,
+            **kwargs,
+        )
+        field_node.note_text = (
+            # TODO: It is not derived from just this:
+            #       *   dirname is from `XDG_CONFIG_HOME` (or `~/.config`)
+            #       *   basename is from `state_primer_conf_file_abs_path_inited`
+            f"{ConfConstGeneral.func_note_derived_based_on_conf_leap_field(EnvState.state_primer_conf_file_abs_path_inited.name, ConfLeap.leap_input)}\n"
+        )
+
         # ===
         # `ConfLeap.leap_derived`
 
@@ -1601,6 +2027,90 @@ class RootNode_derived(AbstractConfLeapRootNode):
         )
 
 
+########################################################################################################################
+# Memoized config trees.
+# See: FT_19_44_42_19.effective_config.md
+
+# Max number of built `RootNode_*` trees kept for reuse by `build_conf_leap_root_node`:
+conf_leap_root_node_cache_max_size: int = 64
+
+# The built `RootNode_*` trees by their `get_conf_leap_root_node_digest` (the least recently used first):
+_conf_leap_root_node_cache: dict[str, AbstractConfLeapRootNode] = {}
+
+
+def get_conf_leap_root_node_digest(
+    root_node_class: type[AbstractConfLeapRootNode],
+    **kwargs,
+) -> str:
+    """
+    Digest of everything the `RootNode_*` tree is built from (its class and all its constructor args).
+
+    NOTE: The `dict` keys are not sorted - their order is rendered (the digest must differ).
+    """
+    content_hash = hashlib.sha256()
+    content_hash.update(json.dumps([root_node_class.__name__, kwargs], default=repr).encode("utf-8"))
+    return f"sha256:{content_hash.hexdigest()}"
+
+
+def build_conf_leap_root_node(
+    root_node_class: type[AbstractConfLeapRootNode],
+    **kwargs,
+) -> AbstractConfLeapRootNode:
+    """
+    Build the `RootNode_*` tree or reuse the one already built from the same content.
+
+    Building runs all the `Builder_*` visitors while rendering (see `RenderConfigVisitor`)
+    only traverses the built tree without modifying it - the same tree can be rendered any number of times.
+    Therefore, the returned tree is shared and must not be modified.
+    """
+    root_node_digest = get_conf_leap_root_node_digest(root_node_class, **kwargs)
+    root_node: AbstractConfLeapRootNode | None = _conf_leap_root_node_cache.pop(root_node_digest, None)
+    if root_node is None:
+        root_node = root_node_class(**kwargs)
+    # (Re-)insert as the most recently used:
+    _conf_leap_root_node_cache[root_node_digest] = root_node
+    while len(_conf_leap_root_node_cache) > conf_leap_root_node_cache_max_size:
+        del _conf_leap_root_node_cache[next(iter(_conf_leap_root_node_cache))]
+    return root_node
+
+
+########################################################################################################################
+# Machine-readable effective config (with per-field provenance).
+# See: FT_19_44_42_19.effective_config.md
+
+
+def list_conf_leap_sources(
+    conf_leap_root_nodes: list[AbstractConfLeapRootNode],
+) -> list[tuple[ConfLeap, str | None, dict]]:
+    """
+    Converts `conf_leap_root_nodes` into `conf_leap_sources` (see `describe_field_provenance`).
+    """
+    return [(root_node.conf_leap, root_node.conf_file_abs_path, root_node.orig_data) for root_node in conf_leap_root_nodes]
+
+
+def write_effective_config(
+    conf_leap_root_nodes: list[AbstractConfLeapRootNode],
+    config_format: EffectiveConfigFormat,
+    text_sink: TextIO,
+) -> None:
+    """
+    Writes the effective config of all `conf_leap_root_nodes` to `text_sink` in the given `config_format`.
+    """
+    if config_format == EffectiveConfigFormat.format_text:
+        for root_node in conf_leap_root_nodes:
+            RenderConfigVisitor(text_sink=text_sink).write_node(root_node)
+            text_sink.write(os.linesep)
+    else:
+        # The same document as `./prime eval --format` (field provenance is defined by the kernel):
+        conf_leap_sources = list_conf_leap_sources(conf_leap_root_nodes)
+        write_effective_conf_document(
+            conf_leap_sources,
+            create_merged_conf_data(conf_leap_sources),
+            config_format,
+            text_sink,
+        )
+
+
 class RendererState(enum.Enum):
     """
     Names for the rendered versions of the states.
@@ -1609,6 +2119,8 @@ class RendererState(enum.Enum):
     state_primer_conf_file_data_loaded_rendered = enum.auto()
     state_client_conf_file_data_loaded_rendered = enum.auto()
     state_env_conf_file_data_loaded_rendered = enum.auto()
+    state_host_conf_file_data_loaded_rendered = enum.auto()
+    state_user_conf_file_data_loaded_rendered = enum.auto()
     state_derived_conf_data_loaded_rendered = enum.auto()
     state_all_conf_data_rendered = enum.auto()
 
@@ -1653,8 +2165,9 @@ class Bootstrapper_state_primer_conf_file_data_loaded_rendered(AbstractCachingSt
         state_primer_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_primer_conf_file_abs_path_inited.name)
 
         file_data: dict
-        if os.path.exists(state_primer_conf_file_abs_path_inited):
-            file_data = read_json_file(state_primer_conf_file_abs_path_inited)
+        # The same as the kernel (including `*.conf.py` conf files):
+        if conf_file_exists(state_primer_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_primer_conf_file_abs_path_inited)
         else:
             # TODO: Be able to detect min scenario and avoid warning:
             warn_once_at_state_stride(
@@ -1670,7 +2183,8 @@ class Bootstrapper_state_primer_conf_file_data_loaded_rendered(AbstractCachingSt
             # Print `ConfLeap.leap_input` data together:
             # ===
             # `ConfLeap.leap_input`:
-            conf_input = RootNode_input(
+            conf_input = build_conf_leap_root_node(
+                RootNode_input,
                 node_indent=0,
                 orig_data={
                     EnvState.state_proto_code_file_abs_path_inited.name: state_proto_code_file_abs_path_inited,
@@ -1681,10 +2195,12 @@ class Bootstrapper_state_primer_conf_file_data_loaded_rendered(AbstractCachingSt
 
             # ===
             # `ConfLeap.leap_primer`:
-            conf_primer = RootNode_primer(
+            conf_primer = build_conf_leap_root_node(
+                RootNode_primer,
                 node_indent=0,
                 orig_data=file_data,
-                state_primer_conf_file_abs_path_inited=state_primer_conf_file_abs_path_inited,
+                # Report the file the data is actually loaded from:
+                state_primer_conf_file_abs_path_inited=get_loaded_conf_file_abs_path(state_primer_conf_file_abs_path_inited),
             )
             print(RenderConfigVisitor().render_node(conf_primer))
 
@@ -1714,8 +2230,9 @@ class Bootstrapper_state_client_conf_file_data_loaded_rendered(AbstractCachingSt
         state_global_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_global_conf_file_abs_path_inited.name)
 
         file_data: dict
-        if os.path.exists(state_global_conf_file_abs_path_inited):
-            file_data = read_json_file(state_global_conf_file_abs_path_inited)
+        # The same as the kernel (including `*.conf.py` conf files):
+        if conf_file_exists(state_global_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_global_conf_file_abs_path_inited)
         else:
             # TODO: Be able to detect min scenario and avoid warning:
             warn_once_at_state_stride(
@@ -1727,10 +2244,12 @@ class Bootstrapper_state_client_conf_file_data_loaded_rendered(AbstractCachingSt
         if can_render_effective_config(self):
             state_input_stderr_log_level_eval_finalized: int = self.eval_parent_state(EnvState.state_input_stderr_log_level_eval_finalized.name)
 
-            conf_client = RootNode_client(
+            conf_client = build_conf_leap_root_node(
+                RootNode_client,
                 node_indent=0,
                 orig_data=file_data,
-                state_global_conf_file_abs_path_inited=state_global_conf_file_abs_path_inited,
+                # Report the file the data is actually loaded from:
+                state_global_conf_file_abs_path_inited=get_loaded_conf_file_abs_path(state_global_conf_file_abs_path_inited),
             )
             print(RenderConfigVisitor().render_node(conf_client))
 
@@ -1759,8 +2278,9 @@ class Bootstrapper_state_env_conf_file_data_loaded_rendered(AbstractCachingState
         state_local_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_local_conf_file_abs_path_inited.name)
 
         file_data: dict
-        if os.path.exists(state_local_conf_file_abs_path_inited):
-            file_data = read_json_file(state_local_conf_file_abs_path_inited)
+        # The same as the kernel (including `*.conf.py` conf files):
+        if conf_file_exists(state_local_conf_file_abs_path_inited):
+            file_data = read_conf_file(state_local_conf_file_abs_path_inited)
         else:
             # TODO: Be able to detect min scenario and avoid warning:
             # TODO: Still warn when required for some fields:
@@ -1775,16 +2295,88 @@ class Bootstrapper_state_env_conf_file_data_loaded_rendered(AbstractCachingState
         if can_render_effective_config(self):
             state_input_stderr_log_level_eval_finalized: int = self.eval_parent_state(EnvState.state_input_stderr_log_level_eval_finalized.name)
 
-            conf_env = RootNode_env(
+            conf_env = build_conf_leap_root_node(
+                RootNode_env,
                 node_indent=0,
                 orig_data=file_data,
-                state_local_conf_file_abs_path_inited=state_local_conf_file_abs_path_inited,
+                # Report the file the data is actually loaded from:
+                state_local_conf_file_abs_path_inited=get_loaded_conf_file_abs_path(state_local_conf_file_abs_path_inited),
             )
             print(RenderConfigVisitor().render_node(conf_env))
 
         return file_data
 
 
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_host_conf_file_data_loaded_rendered(AbstractCachingStateNode[dict]):
+    # TODO: TODO_28_48_19_20.api_to_traverse_config_when_primed.md:
+    #       With access to config, this will change from DAG to simple access of config via `custom_main`.
+
+    _parent_states = staticmethod(
+        lambda: [
+            RendererState.state_env_conf_file_data_loaded_rendered.name,
+            EnvState.state_input_sub_command_arg_loaded.name,
+            EnvState.state_host_conf_file_abs_path_inited.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: RendererState.state_host_conf_file_data_loaded_rendered.name)
+
+    def _eval_state_once(
+        self,
+    ) -> ValueType:
+        state_host_conf_file_abs_path_inited: str | None = self.eval_parent_state(EnvState.state_host_conf_file_abs_path_inited.name)
+        file_data: dict = self.eval_parent_state(EnvState.state_host_conf_file_data_loaded.name)
+
+        if can_render_effective_config(self):
+            conf_host = build_conf_leap_root_node(
+                RootNode_host,
+                node_indent=0,
+                orig_data=file_data,
+                # Report the file the data is actually loaded from:
+                state_host_conf_file_abs_path_inited=None if state_host_conf_file_abs_path_inited is None else get_loaded_conf_file_abs_path(state_host_conf_file_abs_path_inited),
+            )
+            print(RenderConfigVisitor().render_node(conf_host))
+
+        return file_data
+
+
+# noinspection PyPep8Naming
+@trivial_factory
+class Bootstrapper_state_user_conf_file_data_loaded_rendered(AbstractCachingStateNode[dict]):
+    # TODO: TODO_28_48_19_20.api_to_traverse_config_when_primed.md:
+    #       With access to config, this will change from DAG to simple access of config via `custom_main`.
+
+    _parent_states = staticmethod(
+        lambda: [
+            RendererState.state_host_conf_file_data_loaded_rendered.name,
+            EnvState.state_input_sub_command_arg_loaded.name,
+            EnvState.state_user_conf_file_abs_path_inited.name,
+            EnvState.state_user_conf_file_data_loaded.name,
+        ]
+    )
+    _state_name = staticmethod(lambda: RendererState.state_user_conf_file_data_loaded_rendered.name)
+
+    def _eval_state_once(
+        self,
+    ) -> ValueType:
+        state_user_conf_file_abs_path_inited: str = self.eval_parent_state(EnvState.state_user_conf_file_abs_path_inited.name)
+        file_data: dict = self.eval_parent_state(EnvState.state_user_conf_file_data_loaded.name)
+
+        if can_render_effective_config(self):
+            conf_user = build_conf_leap_root_node(
+                RootNode_user,
+                node_indent=0,
+                orig_data=file_data,
+                # Report the file the data is actually loaded from:
+                state_user_conf_file_abs_path_inited=get_loaded_conf_file_abs_path(state_user_conf_file_abs_path_inited),
+            )
+            print(RenderConfigVisitor().render_node(conf_user))
+
+        return file_data
+
+
 # noinspection PyPep8Naming
 @trivial_factory
 class Bootstrapper_state_derived_conf_data_loaded_rendered(AbstractCachingStateNode[dict]):
@@ -1820,6 +2412,12 @@ class Bootstrapper_state_derived_conf_data_loaded_rendered(AbstractCachingStateN
             # `ConfLeap.leap_env`
             # nothing specific
             # ===
+            # `ConfLeap.leap_host`
+            EnvState.state_host_conf_file_abs_path_inited.name,
+            # ===
+            # `ConfLeap.leap_user`
+            EnvState.state_user_conf_file_abs_path_inited.name,
+            # ===
             # `ConfLeap.leap_derived`
             EnvState.state_required_python_version_inited.name,
             EnvState.state_selected_python_file_abs_path_inited.name,
@@ -1833,7 +2431,7 @@ class Bootstrapper_state_derived_conf_data_loaded_rendered(AbstractCachingStateN
 
         # TODO: Is this needed given the list of dependencies in `derived_data_env_states`?
         parent_states = [
-            RendererState.state_env_conf_file_data_loaded_rendered.name,
+            RendererState.state_user_conf_file_data_loaded_rendered.name,
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_input_stderr_log_level_eval_finalized.name,
             *self.derived_data_env_states,
@@ -1863,7 +2461,8 @@ class Bootstrapper_state_derived_conf_data_loaded_rendered(AbstractCachingStateN
         if can_render_effective_config(self):
             state_input_stderr_log_level_eval_finalized: int = self.eval_parent_state(EnvState.state_input_stderr_log_level_eval_finalized.name)
 
-            conf_derived = RootNode_derived(
+            conf_derived = build_conf_leap_root_node(
+                RootNode_derived,
                 node_indent=0,
                 orig_data=config_data_derived,
             )
@@ -1914,6 +2513,14 @@ def customize_env_context():
         Bootstrapper_state_env_conf_file_data_loaded_rendered._state_name(),
         Bootstrapper_state_env_conf_file_data_loaded_rendered,
     )
+    env_ctx.register_factory(
+        Bootstrapper_state_host_conf_file_data_loaded_rendered._state_name(),
+        Bootstrapper_state_host_conf_file_data_loaded_rendered,
+    )
+    env_ctx.register_factory(
+        Bootstrapper_state_user_conf_file_data_loaded_rendered._state_name(),
+        Bootstrapper_state_user_conf_file_data_loaded_rendered,
+    )
     env_ctx.register_factory(
         Bootstrapper_state_derived_conf_data_loaded_rendered._state_name(),
         Bootstrapper_state_derived_conf_data_loaded_rendered,
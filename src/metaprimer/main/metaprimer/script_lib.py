@@ -5,12 +5,19 @@ import os
 import sys
 
 from protoprimer.primer_kernel import (
+    ConfigSnapshot,
     ConfLeap,
     DefaultFileLogFormatter,
     DefaultStderrLogFormatter,
     EnvState,
-    get_config,
+    get_config_snapshot,
     get_default_start_id,
+    get_file_log_format,
+    is_async_file_log_enabled,
+    JsonFileLogFormatter,
+    LogFormat,
+    QueuedLogHandler,
+    StateStrideFilter,
 )
 
 logger: logging.Logger = logging.getLogger()
@@ -33,16 +40,27 @@ def configure_stderr_log_handler(
 def configure_file_log_handler(
     file_path: str,
     log_level: int = logging.INFO,
-) -> logging.FileHandler:
+    start_id: str | None = None,
+) -> logging.Handler:
     """
     UC_81_50_97_17.do_not_reuse_logger.md
+
+    See also: FT_38_73_38_52.log_verbosity.md (`PROTOPRIMER_ASYNC_FILE_LOG`, `PROTOPRIMER_FILE_LOG_FORMAT`).
     """
     os.makedirs(
         os.path.dirname(file_path),
         exist_ok=True,
     )
-    log_handler = logging.FileHandler(file_path)
-    log_handler.setFormatter(DefaultFileLogFormatter())
+    log_handler: logging.Handler = logging.FileHandler(file_path)
+    if get_file_log_format() == LogFormat.log_format_json:
+        if start_id is None:
+            start_id = get_default_start_id()
+        log_handler.setFormatter(JsonFileLogFormatter(start_id))
+    else:
+        log_handler.setFormatter(DefaultFileLogFormatter())
+    if is_async_file_log_enabled():
+        log_handler = QueuedLogHandler(log_handler)
+    log_handler.addFilter(StateStrideFilter())
     log_handler.setLevel(log_level)
     logger.addHandler(log_handler)
     return log_handler
@@ -51,9 +69,19 @@ def configure_file_log_handler(
 def configure_script(
     script_basename: str,
 ) -> dict:
+    return configure_script_snapshot(script_basename).get_config(ConfLeap.leap_derived)
+
+
+def configure_script_snapshot(
+    script_basename: str,
+) -> ConfigSnapshot:
+    """
+    Same as `configure_script`, but returns config data for all `ConfLeap`-s (evaluated once).
+    """
     configure_stderr_log_handler(logging.INFO)
 
-    derived_data: dict = get_config(ConfLeap.leap_derived)
+    config_snapshot: ConfigSnapshot = get_config_snapshot()
+    derived_data: dict = config_snapshot.get_config(ConfLeap.leap_derived)
 
     log_dir_abs_path: str = derived_data[EnvState.state_local_log_dir_abs_path_inited.name]
 
@@ -65,6 +93,7 @@ def configure_script(
     configure_file_log_handler(
         log_file_abs_path,
         logging.INFO,
+        start_id,
     )
 
-    return derived_data
+    return config_snapshot
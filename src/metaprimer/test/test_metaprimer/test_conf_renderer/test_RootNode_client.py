@@ -62,48 +62,77 @@ leap_client = (
         \n\
         {TermColor.config_comment.value}# Field `required_python_version` selects `python` version.{TermColor.reset_style.value}
         {TermColor.config_comment.value}# The value specifies the version of `python` interpreter which is used to create `venv` (e.g. "{ConfConstEnv.latest_known_python_version}").{TermColor.reset_style.value}
-        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         "required_python_version": "{test_python_version}",
         \n\
         {TermColor.config_comment.value}# Field `python_selector_file_rel_path` specifies rel path to `python` selector.{TermColor.reset_style.value}
         {TermColor.config_comment.value}# The selector is a standalone script written in `python` which must implement `select_python_file_abs_path` function.{TermColor.reset_style.value}
-        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         "python_selector_file_rel_path": "path/to/test_python_selector.py",
         \n\
         {TermColor.config_comment.value}# Field `local_venv_dir_rel_path` points to the dir where `venv` (`python` virtual environment) is created.{TermColor.reset_style.value}
         {TermColor.config_comment.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         "local_venv_dir_rel_path": "venv",
         \n\
         {TermColor.config_comment.value}# Field `local_log_dir_rel_path` points to the dir with log files created for each script execution.{TermColor.reset_style.value}
         {TermColor.config_comment.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         "local_log_dir_rel_path": "log",
         \n\
         {TermColor.config_comment.value}# Field `local_tmp_dir_rel_path` points to the dir with temporary files created for some commands.{TermColor.reset_style.value}
         {TermColor.config_comment.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_comment.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         "local_tmp_dir_rel_path": "tmp",
         \n\
         {TermColor.config_missing.value}# Field `local_cache_dir_rel_path` points to the dir with cached files created for some commands.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "local_cache_dir_rel_path": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# Field `venv_driver` selects a tool to manage packages:{TermColor.reset_style.value}
         {TermColor.config_missing.value}# *   specify "venv_pip" to use native `pip`,{TermColor.reset_style.value}
         {TermColor.config_missing.value}# *   specify "venv_uv" to use fast `uv`.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "venv_driver": None,{TermColor.reset_style.value}
         \n\
+        {TermColor.config_missing.value}# Field `uv_tools_dir_abs_path` points to the host-level dir to install `uv` once for all client repos (with `venv_uv`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# The path must be absolute (`~` is expanded). Env var `PROTOPRIMER_UV_TOOLS_DIR` overrides this field.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "uv_tools_dir_abs_path": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# Field `required_uv_version` pins the `uv` version to install (with `venv_uv`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# If it is not set, the latest `uv` is installed (and, with `uv_tools_dir_abs_path`, reused until its symlink is removed).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "required_uv_version": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# Field `version_constraints_file_basename` is the basename of the file with pinned package versions (default: `constraints.txt`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# The file is kept in the local config dir (see `local_conf_symlink_rel_path`) and re-pinned on `reboot`.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "version_constraints_file_basename": None,{TermColor.reset_style.value}
+        \n\
         {TermColor.config_missing.value}# Field `project_descriptors` lists `python` projects and their installation details.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# Note that the `protoprimer` does not manage package dependencies itself.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# Instead, the `protoprimer` relies on `pyproject.toml` file per `python` project to specify these dependencies.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# See `state_project_descriptors_inited` in `leap_derived`.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "project_descriptors": [{TermColor.reset_style.value}
         {TermColor.config_missing.value}# ],{TermColor.reset_style.value}
         \n\
+        {TermColor.config_missing.value}# Field `install_specs` lists extra install args per `install_group` (see `project_descriptors`):{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   each item is a single-item `dict` keyed by the `install_group` (e.g. {{"group_name": {{"extra_command_args": ["--index-url", "..."]}}}}).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_specs": [{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# ],{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# Field `install_mode` selects how `install_specs` are resolved and installed:{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_per_group" (default) to run the resolver per `install_group`,{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_combined" to run the resolver once for all `install_group`-s,{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_synced" to also uninstall stray packages,{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_locked" to install from the lock file until the install inputs change.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_mode": None,{TermColor.reset_style.value}
+        \n\
         {TermColor.config_unused.value}# This value is not used by the `protoprimer`.{TermColor.reset_style.value}
         "whatever_test": 5,
     }}
@@ -147,47 +176,76 @@ leap_client = (
         \n\
         {TermColor.config_missing.value}# Field `required_python_version` selects `python` version.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# The value specifies the version of `python` interpreter which is used to create `venv` (e.g. "{ConfConstEnv.latest_known_python_version}").{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "required_python_version": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# Field `python_selector_file_rel_path` specifies rel path to `python` selector.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# The selector is a standalone script written in `python` which must implement `select_python_file_abs_path` function.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "python_selector_file_rel_path": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# Field `local_venv_dir_rel_path` points to the dir where `venv` (`python` virtual environment) is created.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "local_venv_dir_rel_path": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# Field `local_log_dir_rel_path` points to the dir with log files created for each script execution.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "local_log_dir_rel_path": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# Field `local_tmp_dir_rel_path` points to the dir with temporary files created for some commands.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "local_tmp_dir_rel_path": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# Field `local_cache_dir_rel_path` points to the dir with cached files created for some commands.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# The path is relative to the `ref_root` dir specified in the `ref_root_dir_rel_path` field.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "local_cache_dir_rel_path": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# Field `venv_driver` selects a tool to manage packages:{TermColor.reset_style.value}
         {TermColor.config_missing.value}# *   specify "venv_pip" to use native `pip`,{TermColor.reset_style.value}
         {TermColor.config_missing.value}# *   specify "venv_uv" to use fast `uv`.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "venv_driver": None,{TermColor.reset_style.value}
         \n\
+        {TermColor.config_missing.value}# Field `uv_tools_dir_abs_path` points to the host-level dir to install `uv` once for all client repos (with `venv_uv`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# The path must be absolute (`~` is expanded). Env var `PROTOPRIMER_UV_TOOLS_DIR` overrides this field.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "uv_tools_dir_abs_path": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# Field `required_uv_version` pins the `uv` version to install (with `venv_uv`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# If it is not set, the latest `uv` is installed (and, with `uv_tools_dir_abs_path`, reused until its symlink is removed).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "required_uv_version": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# Field `version_constraints_file_basename` is the basename of the file with pinned package versions (default: `constraints.txt`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# The file is kept in the local config dir (see `local_conf_symlink_rel_path`) and re-pinned on `reboot`.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "version_constraints_file_basename": None,{TermColor.reset_style.value}
+        \n\
         {TermColor.config_missing.value}# Field `project_descriptors` lists `python` projects and their installation details.{TermColor.reset_style.value}
-        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# Note that the `protoprimer` does not manage package dependencies itself.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# Instead, the `protoprimer` relies on `pyproject.toml` file per `python` project to specify these dependencies.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# See `state_project_descriptors_inited` in `leap_derived`.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "project_descriptors": [{TermColor.reset_style.value}
         {TermColor.config_missing.value}# ],{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# Field `install_specs` lists extra install args per `install_group` (see `project_descriptors`):{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   each item is a single-item `dict` keyed by the `install_group` (e.g. {{"group_name": {{"extra_command_args": ["--index-url", "..."]}}}}).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_specs": [{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# ],{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# Field `install_mode` selects how `install_specs` are resolved and installed:{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_per_group" (default) to run the resolver per `install_group`,{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_combined" to run the resolver once for all `install_group`-s,{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_synced" to also uninstall stray packages,{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# *   specify "install_locked" to install from the lock file until the install inputs change.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This field can be specified in global config (see `leap_client`) but it is override-able by local environment-specific config (see `leap_env`), host config (see `leap_host`), and user config (see `leap_user`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_mode": None,{TermColor.reset_style.value}
     }}
 )\
 """
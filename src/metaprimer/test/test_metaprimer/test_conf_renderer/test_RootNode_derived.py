@@ -69,28 +69,34 @@ leap_derived = (
         {TermColor.config_missing.value}# This value is derived from `state_primer_conf_file_abs_path_inited` - see description in `leap_input`.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_local_conf_file_abs_path_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_missing.value}# This value is derived from `required_python_version` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This value is derived from `PROTOPRIMER_HOST_CONF` env var (if set).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "state_host_conf_file_abs_path_inited": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This value is derived from `state_primer_conf_file_abs_path_inited` - see description in `leap_input`.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "state_user_conf_file_abs_path_inited": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This value is derived from `required_python_version` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_required_python_version_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_missing.value}# This value is derived from `python_selector_file_rel_path` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This value is derived from `python_selector_file_rel_path` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_python_selector_file_abs_path_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_missing.value}# This value is derived from `local_venv_dir_rel_path` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This value is derived from `local_venv_dir_rel_path` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_local_venv_dir_abs_path_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_missing.value}# This value is derived from `local_log_dir_rel_path` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This value is derived from `local_log_dir_rel_path` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_local_log_dir_abs_path_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_missing.value}# This value is derived from `local_tmp_dir_rel_path` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This value is derived from `local_tmp_dir_rel_path` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_local_tmp_dir_abs_path_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_missing.value}# This value is derived from `local_cache_dir_rel_path` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This value is derived from `local_cache_dir_rel_path` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_local_cache_dir_abs_path_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_missing.value}# This value is derived from `venv_driver` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# This value is derived from `venv_driver` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "state_venv_driver_inited": None,{TermColor.reset_style.value}
         \n\
-        {TermColor.config_comment.value}# This value is derived from `project_descriptors` in `leap_client` (override-able in `leap_env`) - see description there.{TermColor.reset_style.value}
+        {TermColor.config_comment.value}# This value is derived from `project_descriptors` in `leap_client` (override-able in `leap_env`, `leap_host`, `leap_user`) - see description there.{TermColor.reset_style.value}
         "{EnvState.state_project_descriptors_inited.name}": [
             \n\
             {{
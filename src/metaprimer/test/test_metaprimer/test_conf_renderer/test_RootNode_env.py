@@ -68,6 +68,15 @@ leap_env = (
         {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "venv_driver": None,{TermColor.reset_style.value}
         \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "uv_tools_dir_abs_path": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "required_uv_version": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "version_constraints_file_basename": None,{TermColor.reset_style.value}
+        \n\
         {TermColor.config_comment.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
         "{ConfField.field_project_descriptors.value}": [
             \n\
@@ -88,6 +97,13 @@ leap_env = (
             }},
         ],
         \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_specs": [{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# ],{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_mode": None,{TermColor.reset_style.value}
+        \n\
         {TermColor.config_unused.value}# This value is not used by the `protoprimer`.{TermColor.reset_style.value}
         "whatever_test": 5,
     }}
@@ -135,8 +151,24 @@ leap_env = (
         {TermColor.config_missing.value}# "venv_driver": None,{TermColor.reset_style.value}
         \n\
         {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "uv_tools_dir_abs_path": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "required_uv_version": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "version_constraints_file_basename": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
         {TermColor.config_missing.value}# "project_descriptors": [{TermColor.reset_style.value}
         {TermColor.config_missing.value}# ],{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_specs": [{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# ],{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_mode": None,{TermColor.reset_style.value}
     }}
 )\
 """
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from metaprimer.conf_renderer import (
+    RenderConfigVisitor,
+    RootNode_user,
+)
+from protoprimer.primer_kernel import (
+    ConfField,
+    TermColor,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(RootNode_user.__name__)
+
+
+def test_render_user_config_data_with_repo_specific_fields():
+    state_user_conf_file_abs_path_inited = "/abs/path/to/user.json"
+
+    config_data = {
+        ConfField.field_local_cache_dir_rel_path.value: "cache.shared",
+        # Not a host-tuning field:
+        ConfField.field_local_venv_dir_rel_path.value: "venv.user",
+    }
+
+    root_node = RootNode_user(
+        node_indent=0,
+        orig_data=config_data,
+        state_user_conf_file_abs_path_inited=state_user_conf_file_abs_path_inited,
+    )
+
+    expected_output = f"""
+{TermColor.config_comment.value}# The `leap_user` data is loaded from the [/abs/path/to/user.json] file.{TermColor.reset_style.value}
+leap_user = (
+    \n\
+    {{
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "local_log_dir_rel_path": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "local_tmp_dir_rel_path": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_comment.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        "local_cache_dir_rel_path": "cache.shared",
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "venv_driver": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "uv_tools_dir_abs_path": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "required_uv_version": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_missing.value}# This local environment-specific field overrides the global one (see description in `leap_client`).{TermColor.reset_style.value}
+        {TermColor.config_missing.value}# "install_mode": None,{TermColor.reset_style.value}
+        \n\
+        {TermColor.config_unused.value}# This value is not used by the `protoprimer`.{TermColor.reset_style.value}
+        "local_venv_dir_rel_path": "venv.user",
+    }}
+)\
+"""
+    assert RenderConfigVisitor().render_node(root_node) == expected_output
@@ -169,9 +169,31 @@ def test_render_node_generates_compilable_python():
         config_data,
     )
 
-    effective_config = root_node.compile_effective_config()
+    effective_config = root_node.compile_rendered_config()
 
     assert effective_config == config_data
+    assert root_node.compile_effective_config() == effective_config
+
+
+def test_effective_config_skips_not_present_nodes():
+    config_data = copy.deepcopy(common_sample)
+
+    root_node = build_root_node(
+        some_var,
+        config_data,
+    )
+
+    # Set "c" and the 2nd item of "d" to not present:
+    root_node.child_node.child_nodes["c"].is_present = False
+    root_node.child_node.child_nodes["d"].child_nodes[1].is_present = False
+
+    effective_config = root_node.compile_effective_config()
+
+    expected_config = copy.deepcopy(common_sample)
+    del expected_config["c"]
+    expected_config["d"] = [1, 3]
+    assert effective_config == expected_config
+    assert root_node.compile_rendered_config() == effective_config
 
 
 def test_render_config_not_present():
@@ -445,6 +467,33 @@ some_var = (
     assert RenderConfigVisitor(is_quiet=True).render_node(root_node) == expected_output
 
 
+def test_write_node_streams_same_text_as_render_node():
+    """
+    Ensure `write_node` writes (incrementally) exactly the text returned by `render_node`.
+    """
+    config_data = copy.deepcopy(common_sample)
+    root_node = build_root_node(some_var, config_data)
+
+    assert isinstance(root_node.child_node, AbstractDictNode)
+    root_node.child_node.child_nodes["e"].is_present = False
+    f_node = root_node.child_node.child_nodes["f"]
+    assert isinstance(f_node, AbstractListNode)
+    f_node.child_nodes[2].is_present = False
+    f_node.child_nodes[3].is_present = False
+
+    for is_quiet in [False, True]:
+        written_texts: list[str] = []
+
+        class RecordingSink:
+            def write(self, text: str) -> None:
+                written_texts.append(text)
+
+        RenderConfigVisitor(is_quiet=is_quiet, text_sink=RecordingSink()).write_node(root_node)
+
+        assert "".join(written_texts) == RenderConfigVisitor(is_quiet=is_quiet).render_node(root_node)
+        assert len(written_texts) > 1
+
+
 def test_abstract_config_visitor():
     # Create an instance of the visitor
     visitor = conf_renderer.AbstractConfigVisitor()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from metaprimer import conf_renderer
+from metaprimer.conf_renderer import (
+    build_conf_leap_root_node,
+    RenderConfigVisitor,
+    RootNode_derived,
+    RootNode_env,
+)
+from protoprimer.primer_kernel import (
+    ConfField,
+    EnvState,
+)
+
+local_conf_file_abs_path = "/abs/path/to/local.json"
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(build_conf_leap_root_node.__name__)
+
+
+def _build_env_root_node(config_data: dict) -> RootNode_env:
+    return build_conf_leap_root_node(
+        RootNode_env,
+        node_indent=0,
+        orig_data=config_data,
+        state_local_conf_file_abs_path_inited=local_conf_file_abs_path,
+    )
+
+
+@patch.dict(f"{conf_renderer.__name__}._conf_leap_root_node_cache", clear=True)
+def test_same_content_reuses_built_tree():
+
+    # given:
+
+    root_node = _build_env_root_node({ConfField.field_local_venv_dir_rel_path.value: "venv"})
+    rendered_config = RenderConfigVisitor().render_node(root_node)
+
+    # when:
+
+    reused_root_node = _build_env_root_node({ConfField.field_local_venv_dir_rel_path.value: "venv"})
+
+    # then:
+
+    assert reused_root_node is root_node
+    # Rendering does not modify the built tree:
+    assert RenderConfigVisitor().render_node(reused_root_node) == rendered_config
+    assert rendered_config == RenderConfigVisitor().render_node(
+        RootNode_env(
+            node_indent=0,
+            orig_data={ConfField.field_local_venv_dir_rel_path.value: "venv"},
+            state_local_conf_file_abs_path_inited=local_conf_file_abs_path,
+        )
+    )
+
+
+@patch.dict(f"{conf_renderer.__name__}._conf_leap_root_node_cache", clear=True)
+def test_different_content_builds_new_tree():
+
+    # given:
+
+    root_node = _build_env_root_node({ConfField.field_local_venv_dir_rel_path.value: "venv"})
+
+    # when/then:
+
+    assert _build_env_root_node({ConfField.field_local_venv_dir_rel_path.value: "venv.local"}) is not root_node
+    # The order of `dict` keys is rendered:
+    assert _build_env_root_node({"a_test": 1, "b_test": 2}) is not _build_env_root_node({"b_test": 2, "a_test": 1})
+    # Same data with different constructor args:
+    assert build_conf_leap_root_node(
+        RootNode_derived,
+        node_indent=0,
+        orig_data={EnvState.state_local_venv_dir_abs_path_inited.name: "/abs/venv"},
+    ) is not build_conf_leap_root_node(
+        RootNode_derived,
+        node_indent=4,
+        orig_data={EnvState.state_local_venv_dir_abs_path_inited.name: "/abs/venv"},
+    )
+
+
+@patch(f"{conf_renderer.__name__}.conf_leap_root_node_cache_max_size", 2)
+@patch.dict(f"{conf_renderer.__name__}._conf_leap_root_node_cache", clear=True)
+def test_least_recently_used_tree_is_evicted():
+
+    # given:
+
+    root_node_1 = _build_env_root_node({"field_test": 1})
+    root_node_2 = _build_env_root_node({"field_test": 2})
+    # Use `root_node_1` again (to make `root_node_2` the least recently used):
+    assert _build_env_root_node({"field_test": 1}) is root_node_1
+
+    # when:
+
+    _build_env_root_node({"field_test": 3})
+
+    # then:
+
+    assert len(conf_renderer._conf_leap_root_node_cache) == 2
+    assert _build_env_root_node({"field_test": 1}) is root_node_1
+    assert _build_env_root_node({"field_test": 2}) is not root_node_2
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from local_test.integrated_helper import test_python_version
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from metaprimer.conf_renderer import (
+    AbstractConfLeapRootNode,
+    list_conf_leap_sources,
+    RootNode_client,
+    RootNode_env,
+    RootNode_host,
+    RootNode_primer,
+    RootNode_user,
+    write_effective_config,
+)
+from protoprimer.primer_kernel import (
+    build_effective_conf_document,
+    ConfConstGeneral,
+    ConfField,
+    ConfLeap,
+    create_merged_conf_data,
+    describe_field_provenance,
+    EffectiveConfigFormat,
+    FieldProvenance,
+    get_used_conf_field_names,
+)
+
+global_conf_file_abs_path = "/abs/path/to/global.json"
+local_conf_file_abs_path = "/abs/path/to/local.json"
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(write_effective_config.__name__)
+
+
+def _build_conf_leap_root_nodes() -> list:
+    return [
+        RootNode_client(
+            node_indent=0,
+            orig_data={
+                ConfField.field_required_python_version.value: test_python_version,
+                ConfField.field_local_venv_dir_rel_path.value: "venv",
+                ConfField.field_install_specs.value: [],
+                ConfField.field_version_constraints_file_basename.value: "pinned.txt",
+                "whatever_test": 5,
+            },
+            state_global_conf_file_abs_path_inited=global_conf_file_abs_path,
+        ),
+        RootNode_env(
+            node_indent=0,
+            orig_data={
+                ConfField.field_local_venv_dir_rel_path.value: "venv.local",
+            },
+            state_local_conf_file_abs_path_inited=local_conf_file_abs_path,
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "conf_leap_root_node",
+    [
+        RootNode_primer(
+            node_indent=0,
+            orig_data={},
+            state_primer_conf_file_abs_path_inited="/abs/path/to/primer.json",
+        ),
+        RootNode_client(
+            node_indent=0,
+            orig_data={},
+            state_global_conf_file_abs_path_inited=global_conf_file_abs_path,
+        ),
+        RootNode_env(
+            node_indent=0,
+            orig_data={},
+            state_local_conf_file_abs_path_inited=local_conf_file_abs_path,
+        ),
+        RootNode_host(
+            node_indent=0,
+            orig_data={},
+            state_host_conf_file_abs_path_inited="/abs/path/to/host.json",
+        ),
+        RootNode_user(
+            node_indent=0,
+            orig_data={},
+            state_user_conf_file_abs_path_inited="/abs/path/to/user.json",
+        ),
+    ],
+)
+def test_rendered_fields_match_used_fields(conf_leap_root_node: AbstractConfLeapRootNode):
+    """
+    The rendered (documented) fields and the fields consumed by the kernel must not diverge.
+    """
+
+    # when:
+
+    rendered_field_names = list(conf_leap_root_node.child_node.child_nodes.keys())
+
+    # then:
+
+    assert sorted(rendered_field_names) == sorted(get_used_conf_field_names(conf_leap_root_node.conf_leap))
+
+
+def test_field_provenance_is_defined_by_kernel():
+
+    # given:
+
+    conf_leap_root_nodes = _build_conf_leap_root_nodes()
+    text_sink = io.StringIO()
+
+    # when:
+
+    write_effective_config(
+        conf_leap_root_nodes,
+        EffectiveConfigFormat.format_json,
+        text_sink,
+    )
+
+    # then:
+
+    effective_conf_document = json.loads(text_sink.getvalue())
+    conf_leap_sources = list_conf_leap_sources(conf_leap_root_nodes)
+    assert effective_conf_document == build_effective_conf_document(conf_leap_sources, create_merged_conf_data(conf_leap_sources))
+    assert effective_conf_document["schema_version"] == ConfConstGeneral.effective_conf_schema_version
+    assert effective_conf_document["conf_leaps"][ConfLeap.leap_env.name] == {
+        "conf_file_abs_path": local_conf_file_abs_path,
+        "conf_data": {
+            ConfField.field_local_venv_dir_rel_path.value: "venv.local",
+        },
+    }
+    field_provenances = {(field_record["conf_leap"], field_record["field_name"]): field_record["field_provenance"] for field_record in effective_conf_document["fields"]}
+    assert field_provenances[(ConfLeap.leap_client.name, ConfField.field_install_specs.value)] == FieldProvenance.provenance_set.name
+    assert field_provenances[(ConfLeap.leap_client.name, ConfField.field_version_constraints_file_basename.value)] == FieldProvenance.provenance_set.name
+    assert field_provenances[(ConfLeap.leap_client.name, ConfField.field_local_venv_dir_rel_path.value)] == FieldProvenance.provenance_overridden.name
+    assert field_provenances[(ConfLeap.leap_client.name, "whatever_test")] == FieldProvenance.provenance_unused.name
+    assert field_provenances[(ConfLeap.leap_env.name, ConfField.field_required_python_version.value)] == FieldProvenance.provenance_inherited.name
+    assert field_provenances[(ConfLeap.leap_env.name, ConfField.field_venv_driver.value)] == FieldProvenance.provenance_defaulted.name
+
+
+def test_ndjson_format_is_one_field_per_line():
+
+    # given:
+
+    conf_leap_root_nodes = _build_conf_leap_root_nodes()
+    text_sink = io.StringIO()
+
+    # when:
+
+    write_effective_config(
+        conf_leap_root_nodes,
+        EffectiveConfigFormat.format_ndjson,
+        text_sink,
+    )
+
+    # then:
+
+    conf_leap_sources = list_conf_leap_sources(conf_leap_root_nodes)
+    field_records = [json.loads(output_line) for output_line in text_sink.getvalue().splitlines()]
+    assert field_records == [
+        {
+            "schema_version": ConfConstGeneral.effective_conf_schema_version,
+            **field_record,
+        }
+        for field_record in describe_field_provenance(conf_leap_sources, create_merged_conf_data(conf_leap_sources))
+    ]
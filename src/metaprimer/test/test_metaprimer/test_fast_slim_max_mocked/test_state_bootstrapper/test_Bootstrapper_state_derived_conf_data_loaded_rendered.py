@@ -6,13 +6,14 @@ from metaprimer import conf_renderer
 from metaprimer.conf_renderer import customize_env_context
 from metaprimer.conf_renderer import (
     Bootstrapper_state_derived_conf_data_loaded_rendered,
-    Bootstrapper_state_env_conf_file_data_loaded_rendered,
+    Bootstrapper_state_user_conf_file_data_loaded_rendered,
 )
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
     Bootstrapper_required_python_version_inited,
     Bootstrapper_state_global_conf_dir_abs_path_inited,
     Bootstrapper_state_global_conf_file_abs_path_inited,
+    Bootstrapper_state_host_conf_file_abs_path_inited,
     Factory_state_input_sub_command_arg_loaded,
     Factory_state_input_stderr_log_level_eval_finalized,
     Bootstrapper_state_local_cache_dir_abs_path_inited,
@@ -27,6 +28,7 @@ from protoprimer.primer_kernel import (
     Bootstrapper_state_ref_root_dir_abs_path_inited,
     Factory_state_selected_env_dir_rel_path_inited,
     Bootstrapper_state_selected_python_file_abs_path_inited,
+    Bootstrapper_state_user_conf_file_abs_path_inited,
     Bootstrapper_state_venv_driver_inited,
     EnvState,
 )
@@ -47,6 +49,8 @@ def test_relationship():
 @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_required_python_version_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
@@ -55,9 +59,9 @@ def test_relationship():
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_venv_driver_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_project_descriptors_inited.__name__}.create_state_node")
-@patch(f"{conf_renderer.__name__}.{Bootstrapper_state_env_conf_file_data_loaded_rendered.__name__}.create_state_node")
+@patch(f"{conf_renderer.__name__}.{Bootstrapper_state_user_conf_file_data_loaded_rendered.__name__}.create_state_node")
 def test_state_evaluation(
-    mock_create_state_env_conf_file_data_loaded_rendered,
+    mock_create_state_user_conf_file_data_loaded_rendered,
     mock_create_state_project_descriptors_inited,
     mock_create_state_venv_driver_inited,
     mock_create_state_local_cache_dir_abs_path_inited,
@@ -66,6 +70,8 @@ def test_state_evaluation(
     mock_create_state_local_venv_dir_abs_path_inited,
     mock_create_state_selected_python_file_abs_path_inited,
     mock_create_required_python_version_inited,
+    mock_create_state_user_conf_file_abs_path_inited,
+    mock_create_state_host_conf_file_abs_path_inited,
     mock_create_state_local_conf_file_abs_path_inited,
     mock_create_state_local_conf_symlink_abs_path_inited,
     mock_create_state_selected_env_dir_rel_path_inited,
@@ -95,6 +101,8 @@ def test_state_evaluation(
     mock_create_state_selected_env_dir_rel_path_inited.return_value.eval_own_state.return_value = "envs/default"
     mock_create_state_local_conf_symlink_abs_path_inited.return_value.eval_own_state.return_value = "/mock/ref_root/conf.json"
     mock_create_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "/mock/envs/default/conf.json"
+    mock_create_state_host_conf_file_abs_path_inited.return_value.eval_own_state.return_value = None
+    mock_create_state_user_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "/mock/home/.config/protoprimer/conf.json"
     mock_create_required_python_version_inited.return_value.eval_own_state.return_value = "3.11"
     mock_create_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python3"
     mock_create_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock/venv"
@@ -118,3 +126,5 @@ def test_state_evaluation(
     assert result[EnvState.state_local_venv_dir_abs_path_inited.name] == "/mock/venv"
     assert result[EnvState.state_local_cache_dir_abs_path_inited.name] == "/mock/cache"
     assert result[EnvState.state_project_descriptors_inited.name] == []
+    assert result[EnvState.state_host_conf_file_abs_path_inited.name] is None
+    assert result[EnvState.state_user_conf_file_abs_path_inited.name] == "/mock/home/.config/protoprimer/conf.json"
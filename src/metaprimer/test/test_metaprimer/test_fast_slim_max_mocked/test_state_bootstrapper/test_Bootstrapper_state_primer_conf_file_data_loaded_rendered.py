@@ -1,4 +1,5 @@
 import json
+import pathlib
 from logging import WARNING
 from unittest.mock import patch
 
@@ -15,8 +16,10 @@ from protoprimer.primer_kernel import (
     Bootstrapper_state_primer_conf_file_abs_path_inited,
     Factory_state_proto_code_file_abs_path_inited,
     Bootstrapper_state_stride_src_updated_reached,
+    ConfConstInput,
     EnvState,
     StateStride,
+    SubCommand,
 )
 
 
@@ -66,6 +69,50 @@ def test_conf_file_exists(
     assert state_value == {"test": "data"}
 
 
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_stride_src_updated_reached.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_stderr_log_level_eval_finalized.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_abs_path_inited.__name__}.create_state_node")
+def test_py_conf_file_exists(
+    mock_factory_primer_conf_file_abs_path_inited,
+    mock_factory_proto_code_file_abs_path_inited,
+    mock_factory_input_sub_command_arg_loaded,
+    mock_factory_input_stderr_log_level_eval_finalized,
+    mock_factory_stride_src_updated_reached,
+    env_ctx,
+    tmp_path,
+    capsys,
+):
+
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        Bootstrapper_state_primer_conf_file_data_loaded_rendered._state_name(),
+    )
+
+    mock_file_path = str(tmp_path / "primer.json")
+    mock_py_file_path = str(tmp_path / f"primer.{ConfConstInput.py_conf_file_ext}")
+    mock_factory_primer_conf_file_abs_path_inited.return_value.eval_own_state.return_value = mock_file_path
+    mock_factory_proto_code_file_abs_path_inited.return_value.eval_own_state.return_value = str(tmp_path / "proto_kernel.py")
+    mock_factory_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_boot
+    # The `*.conf.py` conf file takes precedence over the JSON one (the same as in the kernel):
+    pathlib.Path(mock_file_path).write_text(json.dumps({"test": "json_data"}))
+    pathlib.Path(mock_py_file_path).write_text(f"{ConfConstInput.py_conf_data_var_name} = {{'test': 'py_data'}}\n")
+
+    # when:
+
+    state_value = env_ctx.eval_state(
+        Bootstrapper_state_primer_conf_file_data_loaded_rendered._state_name(),
+    )
+
+    # then:
+
+    assert state_value == {"test": "py_data"}
+    assert f"is loaded from the [{mock_py_file_path}] file" in capsys.readouterr().out
+
+
 @patch(f"{primer_kernel.__name__}.EnvContext.get_stride")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_stride_src_updated_reached.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_stderr_log_level_eval_finalized.__name__}.create_state_node")
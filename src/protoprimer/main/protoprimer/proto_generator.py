@@ -12,9 +12,13 @@ def generate_entry_script_content(
     module_name: str,
     func_name: str,
     env_vars: Dict[str, str] = None,
+    is_fast_launch: bool = False,
 ) -> str:
     """
     Generates: FT_75_87_82_46.entry_script.md
+
+    If `is_fast_launch`, the script checks the launch record (see `primer_kernel.write_launch_record`)
+    to `os.execv` directly into the `venv` and falls back to `proto_kernel` only on a miss.
     """
 
     env_vars_lines = ""
@@ -36,11 +40,98 @@ def generate_entry_script_content(
     else:
         raise AssertionError(f"Unrecognized `sub_command` [{sub_command}]")
 
+    if is_fast_launch and entry_func != "start_app":
+        # The `boot_env` is supposed to (re-)bootstrap the `venv` every time:
+        raise AssertionError(f"`is_fast_launch` is not supported for `sub_command` [{sub_command}]")
+
     proto_kernel_rel_path = os.path.relpath(
         proto_kernel_abs_path,
         os.path.dirname(entry_script_abs_path),
     )
 
+    fast_launch_func = ""
+    main_lines = f"""
+    proto_kernel = import_proto_kernel("{proto_kernel_rel_path}")
+    proto_kernel.{entry_func}("{module_name}:{func_name}")
+"""
+    if is_fast_launch:
+        fast_launch_func = """
+def fast_launch(proto_kernel_rel_path: str, venv_main_func: str) -> bool:
+    \"""
+    `protoprimer` entry script boilerplate function to start `venv_main_func` without loading `proto_kernel`.
+
+    It returns `False` on a launch record miss (`proto_kernel` writes the record on its way to the `venv`).
+    \"""
+
+    import json
+    import os
+    import sys
+
+    proto_kernel_abs_path = os.path.normpath(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            proto_kernel_rel_path,
+        )
+    )
+    launch_record_abs_path = os.path.join(
+        os.path.dirname(proto_kernel_abs_path),
+        "__pycache__",
+        "proto_kernel." + venv_main_func.replace(":", ".") + ".launch.json",
+    )
+
+    # Env vars set in the middle of the bootstrap (see `ConfConstGeneral.fast_launch_miss_env_var_names`):
+    for env_var_name in [
+        "PROTOPRIMER_PROTO_CODE",
+        "PROTOPRIMER_MAIN_FUNC",
+        "PROTOPRIMER_PY_EXEC",
+        "PROTOPRIMER_START_ID",
+        "PROTOPRIMER_LAUNCH_RECORD",
+        "PROTOPRIMER_VENV_LOCK_FD",
+        "PROTOPRIMER_MOCKED_RESTART",
+    ]:
+        if env_var_name in os.environ:
+            return False
+
+    try:
+        with open(launch_record_abs_path, "r", encoding="utf-8") as launch_record_file:
+            launch_record = json.load(launch_record_file)
+        for file_abs_path, file_stat in launch_record["file_stats"].items():
+            try:
+                curr_file_stat = os.lstat(file_abs_path)
+                curr_file_stat = [curr_file_stat.st_mtime_ns, curr_file_stat.st_size]
+            except FileNotFoundError:
+                curr_file_stat = None
+            if curr_file_stat != file_stat:
+                raise ValueError(file_abs_path)
+        # Env vars changing the bootstrap result (see `ConfConstGeneral.launch_record_env_var_names`):
+        for env_var_name, env_var_value in launch_record["env_vars"].items():
+            if os.environ.get(env_var_name, None) != env_var_value:
+                raise ValueError(env_var_name)
+        venv_python_abs_path = launch_record["venv_python"]
+    except (OSError, ValueError, KeyError):
+        os.environ["PROTOPRIMER_LAUNCH_RECORD"] = launch_record_abs_path
+        return False
+
+    # Compare `venv` dirs (`sys.executable` may differ by symlinks):
+    if not os.path.samefile(sys.prefix, os.path.dirname(os.path.dirname(venv_python_abs_path))):
+        # FT_28_25_63_06.isolated_python.md:
+        os.execv(venv_python_abs_path, [venv_python_abs_path, "-I", *sys.argv])
+
+    import importlib
+
+    module_name, func_name = venv_main_func.split(":", 1)
+    selected_main = getattr(importlib.import_module(module_name), func_name)
+    # FT_96_50_58_75.context_propagation.md:
+    setattr(importlib.import_module("protoprimer.primer_kernel"), "_proto_kernel_abs_path", proto_kernel_abs_path)
+    selected_main()
+    return True
+"""
+        main_lines = f"""
+    if not fast_launch("{proto_kernel_rel_path}", "{module_name}:{func_name}"):
+        proto_kernel = import_proto_kernel("{proto_kernel_rel_path}")
+        proto_kernel.{entry_func}("{module_name}:{func_name}")
+"""
+
     return f"""#!/usr/bin/env python3
 
 def import_proto_kernel(proto_kernel_rel_path: str):
@@ -63,12 +154,9 @@ def import_proto_kernel(proto_kernel_rel_path: str):
     assert module_spec.loader is not None
     module_spec.loader.exec_module(loaded_proto_module)
     return loaded_proto_module
-
+{fast_launch_func}
 if __name__ == "__main__":
     import os
 
 {env_vars_lines}
-
-    proto_kernel = import_proto_kernel("{proto_kernel_rel_path}")
-    proto_kernel.{entry_func}("{module_name}:{func_name}")
-"""
+{main_lines}"""
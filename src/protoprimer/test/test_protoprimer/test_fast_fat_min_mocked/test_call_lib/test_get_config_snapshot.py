@@ -0,0 +1,100 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from local_test.repo_tree import change_to_known_repo_path
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    ConfField,
+    ConfigSnapshot,
+    ConfLeap,
+    EnvState,
+    get_config,
+    get_config_snapshot,
+)
+
+_lconf_expected_target = "dst/default_env"
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_config_snapshot.__name__)
+
+
+@pytest.fixture
+def proto_kernel_abs_path():
+    with change_to_known_repo_path("."):
+        if not os.path.islink("./lconf") or os.readlink("./lconf") != _lconf_expected_target:
+            pytest.skip(f"`./lconf` does not point to {_lconf_expected_target}")
+        abs_path = os.path.abspath("./cmd/proto_code/proto_kernel.py")
+        with patch("protoprimer.primer_kernel.get_proto_kernel_abs_path", return_value=abs_path):
+            yield abs_path
+
+
+def test_snapshot_matches_get_config(proto_kernel_abs_path):
+
+    # given:
+
+    # when:
+
+    config_snapshot = get_config_snapshot()
+
+    # then:
+
+    for conf_leap in [
+        ConfLeap.leap_primer,
+        ConfLeap.leap_client,
+        ConfLeap.leap_env,
+        ConfLeap.leap_host,
+        ConfLeap.leap_user,
+        ConfLeap.leap_derived,
+    ]:
+        assert config_snapshot.get_config(conf_leap) == get_config(conf_leap)
+
+
+@patch(f"{primer_kernel.__name__}._eval_config_context")
+def test_graph_is_evaluated_once(mock_eval_config_context):
+
+    # given:
+
+    mock_eval_config_context.return_value.eval_state.side_effect = lambda state_name: {"state_name": state_name}
+
+    # when:
+
+    config_snapshot = get_config_snapshot()
+
+    # then:
+
+    mock_eval_config_context.assert_called_once_with(EnvState.state_derived_conf_data_loaded.name)
+    assert config_snapshot.get_config(ConfLeap.leap_primer) == {"state_name": EnvState.state_primer_conf_file_data_loaded.name}
+    assert config_snapshot.get_config(ConfLeap.leap_client) == {"state_name": EnvState.state_client_conf_file_data_loaded.name}
+    assert config_snapshot.get_config(ConfLeap.leap_env) == {"state_name": EnvState.state_env_conf_file_data_loaded.name}
+    assert config_snapshot.get_config(ConfLeap.leap_host) == {"state_name": EnvState.state_host_conf_file_data_loaded.name}
+    assert config_snapshot.get_config(ConfLeap.leap_user) == {"state_name": EnvState.state_user_conf_file_data_loaded.name}
+    assert config_snapshot.get_config(ConfLeap.leap_derived) == {"state_name": EnvState.state_derived_conf_data_loaded.name}
+
+
+def test_snapshot_is_immutable():
+
+    # given:
+
+    orig_data = {
+        ConfField.field_install_specs.value: [],
+    }
+    config_snapshot = ConfigSnapshot({ConfLeap.leap_client: orig_data})
+
+    # when:
+
+    orig_data[ConfField.field_install_specs.value].append("modified")
+    config_snapshot.get_config(ConfLeap.leap_client)[ConfField.field_install_specs.value].append("modified")
+
+    # then:
+
+    assert config_snapshot.get_config(ConfLeap.leap_client) == {
+        ConfField.field_install_specs.value: [],
+    }
+    with pytest.raises(AttributeError):
+        config_snapshot.some_attr = None
+    with pytest.raises(ValueError):
+        config_snapshot.get_config(ConfLeap.leap_input)
@@ -107,21 +107,31 @@ class TestEvaluatedStateSets:
             EnvState.state_input_stderr_log_level_handler_configured.name,
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_input_final_state_eval_finalized.name,
+            EnvState.state_input_watch_conf_arg_loaded.name,
             EnvState.state_input_proto_code_file_abs_path_var_loaded.name,
             EnvState.state_input_start_id_var_loaded.name,
             EnvState.state_stride_py_arbitrary_reached.name,
             EnvState.state_proto_code_file_abs_path_inited.name,
+            EnvState.state_input_conf_format_arg_loaded.name,
             EnvState.state_print_conf_finalized.name,
             EnvState.state_primer_conf_file_abs_path_inited.name,
             EnvState.state_primer_conf_file_data_loaded.name,
+            EnvState.state_primer_conf_data_verified.name,
             EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_global_conf_dir_abs_path_inited.name,
             EnvState.state_global_conf_file_abs_path_inited.name,
             EnvState.state_client_conf_file_data_loaded.name,
+            EnvState.state_client_conf_data_verified.name,
             EnvState.state_selected_env_dir_rel_path_inited.name,
             EnvState.state_local_conf_symlink_abs_path_inited.name,
             EnvState.state_local_conf_file_abs_path_inited.name,
             EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_host_conf_file_abs_path_inited.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+            EnvState.state_user_conf_file_abs_path_inited.name,
+            EnvState.state_user_conf_file_data_loaded.name,
+            EnvState.state_conf_data_verified.name,
+            EnvState.state_merged_conf_data_loaded.name,
             EnvState.state_local_venv_dir_abs_path_inited.name,
             EnvState.state_local_cache_dir_abs_path_inited.name,
             EnvState.state_version_constraints_file_basename_inited.name,
@@ -203,15 +213,24 @@ class TestEvaluatedStateSets:
             EnvState.state_print_conf_finalized.name,
             EnvState.state_primer_conf_file_abs_path_inited.name,
             EnvState.state_primer_conf_file_data_loaded.name,
+            EnvState.state_primer_conf_data_verified.name,
             EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_global_conf_dir_abs_path_inited.name,
             EnvState.state_global_conf_file_abs_path_inited.name,
             EnvState.state_client_conf_file_data_loaded.name,
+            EnvState.state_client_conf_data_verified.name,
             EnvState.state_selected_env_dir_rel_path_inited.name,
             EnvState.state_local_conf_symlink_abs_path_inited.name,
             EnvState.state_local_conf_file_abs_path_inited.name,
             EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_host_conf_file_abs_path_inited.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+            EnvState.state_user_conf_file_abs_path_inited.name,
+            EnvState.state_user_conf_file_data_loaded.name,
+            EnvState.state_conf_data_verified.name,
+            EnvState.state_merged_conf_data_loaded.name,
             EnvState.state_local_venv_dir_abs_path_inited.name,
+            EnvState.state_local_cache_dir_abs_path_inited.name,
             EnvState.state_stride_py_venv_reached.name,
             EnvState.state_func_start_app_executed.name,
             EnvState.state_everything_executed.name,
@@ -274,14 +293,22 @@ class TestEvaluatedStateSets:
             EnvState.state_proto_code_file_abs_path_inited.name,
             EnvState.state_primer_conf_file_abs_path_inited.name,
             EnvState.state_primer_conf_file_data_loaded.name,
+            EnvState.state_primer_conf_data_verified.name,
             EnvState.state_ref_root_dir_abs_path_inited.name,
             EnvState.state_global_conf_dir_abs_path_inited.name,
             EnvState.state_global_conf_file_abs_path_inited.name,
             EnvState.state_client_conf_file_data_loaded.name,
+            EnvState.state_client_conf_data_verified.name,
             EnvState.state_selected_env_dir_rel_path_inited.name,
             EnvState.state_local_conf_symlink_abs_path_inited.name,
             EnvState.state_local_conf_file_abs_path_inited.name,
             EnvState.state_env_conf_file_data_loaded.name,
+            EnvState.state_host_conf_file_abs_path_inited.name,
+            EnvState.state_host_conf_file_data_loaded.name,
+            EnvState.state_user_conf_file_abs_path_inited.name,
+            EnvState.state_user_conf_file_data_loaded.name,
+            EnvState.state_conf_data_verified.name,
+            EnvState.state_merged_conf_data_loaded.name,
             EnvState.state_required_python_version_inited.name,
             EnvState.state_python_selector_file_abs_path_inited.name,
             EnvState.state_selected_python_file_abs_path_inited.name,
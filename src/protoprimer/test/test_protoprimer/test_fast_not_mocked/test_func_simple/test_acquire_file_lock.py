@@ -0,0 +1,104 @@
+import fcntl
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import acquire_file_lock
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(acquire_file_lock.__name__)
+
+
+def _try_lock(
+    lock_file_abs_path: str,
+    lock_type: int,
+) -> bool:
+    # A separate open file description conflicts with the lock held via another one (even in the same process):
+    with open(lock_file_abs_path, "a+") as lock_file_obj:
+        try:
+            fcntl.flock(lock_file_obj.fileno(), lock_type | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+
+def test_exclusive_lock_blocks_readers_and_writers(tmp_path):
+
+    # given:
+
+    lock_file_abs_path = str(tmp_path / "sub_dir" / "venv.lock")
+
+    # when:
+
+    with acquire_file_lock(lock_file_abs_path):
+
+        # then:
+
+        assert not _try_lock(lock_file_abs_path, fcntl.LOCK_SH)
+        assert not _try_lock(lock_file_abs_path, fcntl.LOCK_EX)
+        with open(lock_file_abs_path, "r") as lock_file_obj:
+            assert lock_file_obj.read().startswith(f"pid={os.getpid()} ")
+
+    assert _try_lock(lock_file_abs_path, fcntl.LOCK_EX)
+    with open(lock_file_abs_path, "r") as lock_file_obj:
+        assert lock_file_obj.read() == ""
+
+
+def test_shared_lock_blocks_only_writers(tmp_path):
+
+    # given:
+
+    lock_file_abs_path = str(tmp_path / "venv.lock")
+
+    # when:
+
+    with acquire_file_lock(lock_file_abs_path, is_exclusive=False):
+
+        # then:
+
+        assert _try_lock(lock_file_abs_path, fcntl.LOCK_SH)
+        assert not _try_lock(lock_file_abs_path, fcntl.LOCK_EX)
+
+
+def test_timeout_reports_lock_holder(tmp_path):
+
+    # given:
+
+    lock_file_abs_path = str(tmp_path / "venv.lock")
+
+    with acquire_file_lock(lock_file_abs_path):
+
+        # when/then:
+
+        with pytest.raises(AssertionError, match=rf"waiting for shared lock \[{lock_file_abs_path}\] held by \[pid={os.getpid()} "):
+            with acquire_file_lock(
+                lock_file_abs_path,
+                is_exclusive=False,
+                timeout_sec=0.2,
+            ):
+                pass
+
+
+def test_no_lock_without_fcntl(tmp_path):
+
+    # given:
+
+    lock_file_abs_path = str(tmp_path / "venv.lock")
+    is_block_run = False
+
+    # when:
+
+    # Mimic non-POSIX platforms (`import fcntl` fails):
+    with patch.dict(sys.modules, {"fcntl": None}):
+        with acquire_file_lock(lock_file_abs_path):
+            is_block_run = True
+
+            # then:
+
+            assert _try_lock(lock_file_abs_path, fcntl.LOCK_EX)
+
+    assert is_block_run
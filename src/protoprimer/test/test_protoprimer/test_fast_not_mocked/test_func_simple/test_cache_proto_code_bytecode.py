@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import shutil
+import sys
+from unittest.mock import patch
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    cache_proto_code_bytecode,
+    ConfConstGeneral,
+    import_proto_module,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(cache_proto_code_bytecode.__name__)
+
+
+def _load_proto_kernel(proto_code_abs_path: str) -> list[str]:
+    """
+    Load `proto_code` (the same way as entry scripts do) and return the list of source files compiled.
+    """
+    compiled_file_abs_paths: list[str] = []
+    orig_source_to_code = importlib.machinery.SourceFileLoader.source_to_code
+
+    def counting_source_to_code(self, data, path, *args, **kwargs):
+        compiled_file_abs_paths.append(path)
+        return orig_source_to_code(self, data, path, *args, **kwargs)
+
+    with patch.object(importlib.machinery.SourceFileLoader, "source_to_code", counting_source_to_code):
+        import_proto_module("proto_kernel", proto_code_abs_path)
+    return compiled_file_abs_paths
+
+
+def test_cache_proto_code_bytecode(tmp_path, monkeypatch):
+    """
+    Every stride loading `proto_code` with cached bytecode skips compiling its source.
+
+    See `cmd/bench_proto_code_bytecode` to measure the time (outside the unit tests).
+    """
+
+    # given:
+
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    proto_code_abs_path = str(tmp_path / ConfConstGeneral.default_proto_code_basename)
+    shutil.copyfile(primer_kernel.__file__, proto_code_abs_path)
+
+    # when:
+
+    cached_file_abs_path = cache_proto_code_bytecode(proto_code_abs_path)
+    compiled_file_abs_paths = _load_proto_kernel(proto_code_abs_path)
+
+    # then:
+
+    assert cached_file_abs_path == importlib.util.cache_from_source(proto_code_abs_path)
+    assert compiled_file_abs_paths == []
+
+
+def test_cache_proto_code_bytecode_disabled(tmp_path, monkeypatch):
+
+    # given:
+
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    proto_code_abs_path = str(tmp_path / ConfConstGeneral.default_proto_code_basename)
+    shutil.copyfile(primer_kernel.__file__, proto_code_abs_path)
+
+    # when:
+
+    cached_file_abs_path = cache_proto_code_bytecode(proto_code_abs_path)
+
+    # then:
+
+    assert cached_file_abs_path is None
+    # Without cached bytecode, every stride compiles the source:
+    assert _load_proto_kernel(proto_code_abs_path) == [proto_code_abs_path]
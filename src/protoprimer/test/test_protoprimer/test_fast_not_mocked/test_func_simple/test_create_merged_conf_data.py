@@ -0,0 +1,52 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ConfField,
+    ConfLeap,
+    create_merged_conf_data,
+    EnvState,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(create_merged_conf_data.__name__)
+
+
+def test_later_conf_leap_overrides():
+
+    # given:
+
+    conf_leap_sources = [
+        (
+            ConfLeap.leap_input,
+            None,
+            {
+                EnvState.state_proto_code_file_abs_path_inited.name: "/abs/path/to/proto_kernel.py",
+            },
+        ),
+        (
+            ConfLeap.leap_client,
+            "/abs/path/to/global.json",
+            {
+                ConfField.field_local_venv_dir_rel_path.value: "venv",
+                ConfField.field_local_log_dir_rel_path.value: "log",
+            },
+        ),
+        (
+            ConfLeap.leap_env,
+            "/abs/path/to/local.json",
+            {
+                ConfField.field_local_venv_dir_rel_path.value: "venv.local",
+            },
+        ),
+    ]
+
+    # when:
+
+    merged_conf_data = create_merged_conf_data(conf_leap_sources)
+
+    # then:
+
+    assert merged_conf_data.get_conf_leap(ConfField.field_local_venv_dir_rel_path.value) == ConfLeap.leap_env
+    assert merged_conf_data.get_conf_leap(ConfField.field_local_log_dir_rel_path.value) == ConfLeap.leap_client
+    # Only conf file data is merged:
+    assert merged_conf_data.get_conf_leap(EnvState.state_proto_code_file_abs_path_inited.name) is None
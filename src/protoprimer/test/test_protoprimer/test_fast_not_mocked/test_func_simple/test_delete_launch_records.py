@@ -0,0 +1,44 @@
+import os
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    delete_launch_records,
+    write_launch_record,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(delete_launch_records.__name__)
+
+
+def test_only_launch_records_are_deleted(tmp_path):
+
+    # given:
+
+    proto_code_abs_path = str(tmp_path / "proto_kernel.py")
+    pycache_dir_abs_path = tmp_path / "__pycache__"
+    launch_record_abs_paths = [
+        str(pycache_dir_abs_path / "proto_kernel.my_module.my_func.launch.json"),
+        str(pycache_dir_abs_path / "proto_kernel.my_module.other_func.launch.json"),
+    ]
+    for launch_record_abs_path in launch_record_abs_paths:
+        write_launch_record(launch_record_abs_path, "/venv/bin/python", [])
+    bytecode_abs_path = pycache_dir_abs_path / "proto_kernel.cpython-311.pyc"
+    bytecode_abs_path.write_bytes(b"")
+
+    # when:
+
+    delete_launch_records(proto_code_abs_path)
+
+    # then:
+
+    for launch_record_abs_path in launch_record_abs_paths:
+        assert not os.path.exists(launch_record_abs_path)
+    assert bytecode_abs_path.exists()
+
+
+def test_no_pycache_dir(tmp_path):
+
+    # when/then:
+
+    delete_launch_records(str(tmp_path / "proto_kernel.py"))
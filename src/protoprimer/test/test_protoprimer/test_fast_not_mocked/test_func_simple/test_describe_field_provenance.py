@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+from local_test.integrated_helper import test_python_version
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ConfField,
+    ConfLeap,
+    create_merged_conf_data,
+    describe_field_provenance,
+    EnvState,
+    FieldProvenance,
+)
+
+proto_code_file_abs_path = "/abs/path/to/proto_kernel.py"
+primer_conf_file_abs_path = "/abs/path/to/primer.json"
+global_conf_file_abs_path = "/abs/path/to/global.json"
+local_conf_file_abs_path = "/abs/path/to/local.json"
+host_conf_file_abs_path = "/abs/path/to/host.json"
+user_conf_file_abs_path = "/abs/path/to/user.json"
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(describe_field_provenance.__name__)
+
+
+def _build_conf_leap_sources() -> list[tuple[ConfLeap, str | None, dict]]:
+    return [
+        (
+            ConfLeap.leap_input,
+            None,
+            {
+                EnvState.state_proto_code_file_abs_path_inited.name: proto_code_file_abs_path,
+                EnvState.state_primer_conf_file_abs_path_inited.name: primer_conf_file_abs_path,
+            },
+        ),
+        (
+            ConfLeap.leap_primer,
+            primer_conf_file_abs_path,
+            {
+                ConfField.field_ref_root_dir_rel_path.value: ".",
+            },
+        ),
+        (
+            ConfLeap.leap_client,
+            global_conf_file_abs_path,
+            {
+                ConfField.field_required_python_version.value: test_python_version,
+                ConfField.field_local_venv_dir_rel_path.value: "venv",
+                ConfField.field_install_specs.value: [],
+                ConfField.field_version_constraints_file_basename.value: "pinned.txt",
+                "whatever_test": 5,
+            },
+        ),
+        (
+            ConfLeap.leap_env,
+            local_conf_file_abs_path,
+            {
+                ConfField.field_local_venv_dir_rel_path.value: "venv.local",
+            },
+        ),
+        (
+            ConfLeap.leap_derived,
+            None,
+            {
+                EnvState.state_ref_root_dir_abs_path_inited.name: "/abs/path/to",
+                EnvState.state_required_python_version_inited.name: test_python_version,
+                EnvState.state_local_venv_dir_abs_path_inited.name: "/abs/path/to/venv.local",
+                EnvState.state_local_tmp_dir_abs_path_inited.name: "/abs/path/to/tmp",
+                EnvState.state_global_conf_file_abs_path_inited.name: global_conf_file_abs_path,
+            },
+        ),
+    ]
+
+
+def _describe_field_provenance(conf_leap_sources: list[tuple[ConfLeap, str | None, dict]]) -> list[dict]:
+    return describe_field_provenance(
+        conf_leap_sources,
+        create_merged_conf_data(conf_leap_sources),
+    )
+
+
+def _select_field_record(
+    field_records: list[dict],
+    conf_leap: ConfLeap,
+    field_name: str,
+) -> dict:
+    return [field_record for field_record in field_records if field_record["conf_leap"] == conf_leap.name and field_record["field_name"] == field_name][0]
+
+
+def test_field_provenance():
+
+    # given:
+
+    conf_leap_sources = _build_conf_leap_sources()
+
+    # when:
+
+    field_records = _describe_field_provenance(conf_leap_sources)
+
+    # then:
+
+    assert _select_field_record(field_records, ConfLeap.leap_client, ConfField.field_required_python_version.value) == {
+        "conf_leap": ConfLeap.leap_client.name,
+        "conf_file_abs_path": global_conf_file_abs_path,
+        "field_name": ConfField.field_required_python_version.value,
+        "field_value": test_python_version,
+        "field_provenance": FieldProvenance.provenance_set.name,
+        "source_conf_leap": ConfLeap.leap_client.name,
+        "source_conf_file_abs_path": global_conf_file_abs_path,
+    }
+    assert _select_field_record(field_records, ConfLeap.leap_client, ConfField.field_local_venv_dir_rel_path.value) == {
+        "conf_leap": ConfLeap.leap_client.name,
+        "conf_file_abs_path": global_conf_file_abs_path,
+        "field_name": ConfField.field_local_venv_dir_rel_path.value,
+        "field_value": "venv",
+        "field_provenance": FieldProvenance.provenance_overridden.name,
+        "source_conf_leap": ConfLeap.leap_env.name,
+        "source_conf_file_abs_path": local_conf_file_abs_path,
+    }
+    assert _select_field_record(field_records, ConfLeap.leap_client, "whatever_test")["field_provenance"] == FieldProvenance.provenance_unused.name
+    assert _select_field_record(field_records, ConfLeap.leap_env, ConfField.field_local_venv_dir_rel_path.value)["field_provenance"] == FieldProvenance.provenance_set.name
+
+
+def test_defaulted_only_when_no_conf_leap_sets_field():
+
+    # given:
+
+    conf_leap_sources = _build_conf_leap_sources()
+
+    # when:
+
+    field_records = _describe_field_provenance(conf_leap_sources)
+
+    # then:
+    # Missing in `leap_env`, but set in `leap_client`:
+
+    assert _select_field_record(field_records, ConfLeap.leap_env, ConfField.field_required_python_version.value) == {
+        "conf_leap": ConfLeap.leap_env.name,
+        "conf_file_abs_path": local_conf_file_abs_path,
+        "field_name": ConfField.field_required_python_version.value,
+        "field_value": None,
+        "field_provenance": FieldProvenance.provenance_inherited.name,
+        "source_conf_leap": ConfLeap.leap_client.name,
+        "source_conf_file_abs_path": global_conf_file_abs_path,
+    }
+
+    # then:
+    # Not set by any `ConfLeap`:
+
+    for conf_leap in [
+        ConfLeap.leap_client,
+        ConfLeap.leap_env,
+    ]:
+        assert _select_field_record(field_records, conf_leap, ConfField.field_venv_driver.value)["field_provenance"] == FieldProvenance.provenance_defaulted.name
+        assert _select_field_record(field_records, conf_leap, ConfField.field_venv_driver.value)["source_conf_leap"] is None
+
+
+def test_consumed_fields_are_not_unused():
+
+    # given:
+
+    conf_leap_sources = _build_conf_leap_sources()
+
+    # when:
+
+    field_records = _describe_field_provenance(conf_leap_sources)
+
+    # then:
+    # Fields consumed by the kernel are reported as set (even if they have no rendered note):
+
+    assert _select_field_record(field_records, ConfLeap.leap_client, ConfField.field_install_specs.value)["field_provenance"] == FieldProvenance.provenance_set.name
+    assert _select_field_record(field_records, ConfLeap.leap_client, ConfField.field_version_constraints_file_basename.value)["field_provenance"] == FieldProvenance.provenance_set.name
+
+
+def test_input_fields_are_not_overridden():
+
+    # given:
+
+    conf_leap_sources = _build_conf_leap_sources()
+
+    # when:
+
+    field_records = _describe_field_provenance(conf_leap_sources)
+
+    # then:
+    # The same keys in `leap_derived` do not override `leap_input`:
+
+    assert _select_field_record(field_records, ConfLeap.leap_input, EnvState.state_primer_conf_file_abs_path_inited.name) == {
+        "conf_leap": ConfLeap.leap_input.name,
+        "conf_file_abs_path": None,
+        "field_name": EnvState.state_primer_conf_file_abs_path_inited.name,
+        "field_value": primer_conf_file_abs_path,
+        "field_provenance": FieldProvenance.provenance_set.name,
+        "source_conf_leap": ConfLeap.leap_input.name,
+        "source_conf_file_abs_path": None,
+    }
+
+
+def test_derived_fields_have_source():
+
+    # given:
+
+    conf_leap_sources = _build_conf_leap_sources()
+
+    # when:
+
+    field_records = _describe_field_provenance(conf_leap_sources)
+
+    # then:
+
+    assert _select_field_record(field_records, ConfLeap.leap_derived, EnvState.state_local_venv_dir_abs_path_inited.name) == {
+        "conf_leap": ConfLeap.leap_derived.name,
+        "conf_file_abs_path": None,
+        "field_name": EnvState.state_local_venv_dir_abs_path_inited.name,
+        "field_value": "/abs/path/to/venv.local",
+        "field_provenance": FieldProvenance.provenance_set.name,
+        "source_conf_leap": ConfLeap.leap_env.name,
+        "source_conf_file_abs_path": local_conf_file_abs_path,
+    }
+    assert _select_field_record(field_records, ConfLeap.leap_derived, EnvState.state_ref_root_dir_abs_path_inited.name)["source_conf_leap"] == ConfLeap.leap_primer.name
+    assert _select_field_record(field_records, ConfLeap.leap_derived, EnvState.state_required_python_version_inited.name)["source_conf_file_abs_path"] == global_conf_file_abs_path
+
+    # then:
+    # Not set by any `ConfLeap`:
+
+    assert _select_field_record(field_records, ConfLeap.leap_derived, EnvState.state_local_tmp_dir_abs_path_inited.name)["field_provenance"] == FieldProvenance.provenance_defaulted.name
+
+    # then:
+    # Not derived from a conf field:
+
+    assert _select_field_record(field_records, ConfLeap.leap_derived, EnvState.state_global_conf_file_abs_path_inited.name)["source_conf_leap"] is None
+
+
+def test_unused_field_does_not_override():
+
+    # given:
+
+    conf_leap_sources = [
+        (
+            ConfLeap.leap_client,
+            global_conf_file_abs_path,
+            {
+                ConfField.field_local_conf_symlink_rel_path.value: "conf.local",
+            },
+        ),
+        (
+            ConfLeap.leap_env,
+            local_conf_file_abs_path,
+            {
+                # Not read from `ConfLeap.leap_env`:
+                ConfField.field_local_conf_symlink_rel_path.value: "conf.env",
+            },
+        ),
+    ]
+
+    # when:
+
+    field_records = _describe_field_provenance(conf_leap_sources)
+
+    # then:
+
+    assert _select_field_record(field_records, ConfLeap.leap_client, ConfField.field_local_conf_symlink_rel_path.value)["field_provenance"] == FieldProvenance.provenance_set.name
+    assert _select_field_record(field_records, ConfLeap.leap_env, ConfField.field_local_conf_symlink_rel_path.value)["field_provenance"] == FieldProvenance.provenance_unused.name
+
+
+def test_field_provenance_with_host_and_user():
+
+    # given:
+
+    conf_leap_sources = [
+        *_build_conf_leap_sources(),
+        (
+            ConfLeap.leap_host,
+            host_conf_file_abs_path,
+            {
+                ConfField.field_local_cache_dir_rel_path.value: "cache.host",
+            },
+        ),
+        (
+            ConfLeap.leap_user,
+            user_conf_file_abs_path,
+            {
+                ConfField.field_local_cache_dir_rel_path.value: "cache.user",
+            },
+        ),
+    ]
+
+    # when:
+
+    field_records = _describe_field_provenance(conf_leap_sources)
+
+    # then:
+
+    assert _select_field_record(field_records, ConfLeap.leap_host, ConfField.field_local_cache_dir_rel_path.value)["field_provenance"] == FieldProvenance.provenance_overridden.name
+    assert _select_field_record(field_records, ConfLeap.leap_user, ConfField.field_local_cache_dir_rel_path.value) == {
+        "conf_leap": ConfLeap.leap_user.name,
+        "conf_file_abs_path": user_conf_file_abs_path,
+        "field_name": ConfField.field_local_cache_dir_rel_path.value,
+        "field_value": "cache.user",
+        "field_provenance": FieldProvenance.provenance_set.name,
+        "source_conf_leap": ConfLeap.leap_user.name,
+        "source_conf_file_abs_path": user_conf_file_abs_path,
+    }
+    assert _select_field_record(field_records, ConfLeap.leap_client, ConfField.field_local_cache_dir_rel_path.value)["field_provenance"] == FieldProvenance.provenance_inherited.name
+
+    # then:
+    # Repo-specific fields are not listed for host-level conf files:
+
+    assert not [field_record for field_record in field_records if field_record["conf_leap"] == ConfLeap.leap_user.name and field_record["field_name"] == ConfField.field_local_venv_dir_rel_path.value]
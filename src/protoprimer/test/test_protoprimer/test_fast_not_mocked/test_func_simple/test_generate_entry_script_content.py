@@ -1,5 +1,20 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
 from local_test.name_assertion import assert_test_module_name_embeds_str
-from protoprimer.primer_kernel import SubCommand
+from protoprimer.primer_kernel import (
+    ConfConstGeneral,
+    EnvVar,
+    remove_protoprimer_env_vars,
+    SubCommand,
+    write_launch_record,
+)
 from protoprimer.proto_generator import generate_entry_script_content
 
 
@@ -52,3 +67,167 @@ def test_generate_entry_script_content_with_env_vars():
 
     assert '    os.environ["MY_VAR"] = "my_value"' in generated_content
     assert '     os.environ["MY_VAR"] = "my_value"' not in generated_content
+
+
+def test_generate_entry_script_content_fast_launch_with_boot_fails():
+
+    # when/then:
+
+    with pytest.raises(AssertionError):
+        generate_entry_script_content(
+            SubCommand.command_boot.value,
+            "/dummy/path/proto_kernel.py",
+            "/dummy/path/entry.py",
+            "my_module",
+            "my_func",
+            is_fast_launch=True,
+        )
+
+
+def _create_fast_launch_script(tmp_path) -> str:
+    """
+    Generates the fast launcher with a fake `proto_kernel` (which reports a launch record miss).
+    """
+    proto_kernel_abs_path = tmp_path / "proto_code" / "proto_kernel.py"
+    proto_kernel_abs_path.parent.mkdir()
+    proto_kernel_abs_path.write_text("import os\n" "def start_app(venv_main_func):\n" "    print('miss:', os.environ['PROTOPRIMER_LAUNCH_RECORD'])\n")
+    (tmp_path / "my_module.py").write_text("def my_func():\n" "    print('hit')\n")
+    entry_script_abs_path = tmp_path / "entry_script"
+    entry_script_abs_path.write_text(
+        generate_entry_script_content(
+            SubCommand.command_start.value,
+            str(proto_kernel_abs_path),
+            str(entry_script_abs_path),
+            "my_module",
+            "my_func",
+            is_fast_launch=True,
+        )
+    )
+    return str(entry_script_abs_path)
+
+
+def _run_fast_launch_script(
+    entry_script_abs_path: str,
+    extra_env_vars: dict[str, str] | None = None,
+) -> str:
+    env_vars = os.environ.copy()
+    remove_protoprimer_env_vars(env_vars)
+    env_vars.update(extra_env_vars or {})
+    return subprocess.run(
+        [sys.executable, entry_script_abs_path],
+        env=env_vars,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stdout
+
+
+def test_generate_entry_script_content_fast_launch(tmp_path):
+
+    # given:
+
+    entry_script_abs_path = _create_fast_launch_script(tmp_path)
+    proto_kernel_abs_path = str(tmp_path / "proto_code" / "proto_kernel.py")
+    launch_record_abs_path = str(tmp_path / "proto_code" / "__pycache__" / "proto_kernel.my_module.my_func.launch.json")
+
+    # when/then: no launch record yet
+
+    assert _run_fast_launch_script(entry_script_abs_path) == f"miss: {launch_record_abs_path}\n"
+
+    # given:
+
+    # The current `python` is the `venv` to launch (no `os.execv`):
+    write_launch_record(
+        launch_record_abs_path,
+        os.path.join(sys.prefix, ConfConstGeneral.file_rel_path_venv_python),
+        [proto_kernel_abs_path],
+    )
+
+    # when/then: the launch record is used
+
+    assert _run_fast_launch_script(entry_script_abs_path) == "hit\n"
+
+    # given:
+
+    proto_kernel_stat = os.stat(proto_kernel_abs_path)
+    os.utime(proto_kernel_abs_path, ns=(proto_kernel_stat.st_atime_ns, proto_kernel_stat.st_mtime_ns + 1_000_000_000))
+
+    # when/then: the fingerprint file changed
+
+    assert _run_fast_launch_script(entry_script_abs_path) == f"miss: {launch_record_abs_path}\n"
+
+
+def test_generate_entry_script_content_fast_launch_env_vars(tmp_path):
+
+    # given:
+
+    entry_script_abs_path = _create_fast_launch_script(tmp_path)
+    proto_kernel_abs_path = str(tmp_path / "proto_code" / "proto_kernel.py")
+    launch_record_abs_path = str(tmp_path / "proto_code" / "__pycache__" / "proto_kernel.my_module.my_func.launch.json")
+    host_conf_env_vars = {
+        EnvVar.var_PROTOPRIMER_HOST_CONF.value: str(tmp_path / "host.json"),
+    }
+
+    with patch.dict(f"{os.__name__}.environ", host_conf_env_vars):
+        write_launch_record(
+            launch_record_abs_path,
+            os.path.join(sys.prefix, ConfConstGeneral.file_rel_path_venv_python),
+            [proto_kernel_abs_path],
+        )
+
+    # when/then: the same value of the env var changing the bootstrap result
+
+    assert _run_fast_launch_script(entry_script_abs_path, host_conf_env_vars) == "hit\n"
+
+    # when/then: the env var not changing the bootstrap result
+
+    assert (
+        _run_fast_launch_script(
+            entry_script_abs_path,
+            {
+                **host_conf_env_vars,
+                EnvVar.var_PROTOPRIMER_ASYNC_FILE_LOG.value: "true",
+                EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value: "json",
+                EnvVar.var_PROTOPRIMER_DIRECT_EXEC.value: "true",
+            },
+        )
+        == "hit\n"
+    )
+
+    # when/then: the env var changing the bootstrap result is missing
+
+    assert _run_fast_launch_script(entry_script_abs_path) == f"miss: {launch_record_abs_path}\n"
+
+    # when/then: the env var set in the middle of the bootstrap
+
+    assert (
+        _run_fast_launch_script(
+            entry_script_abs_path,
+            {
+                **host_conf_env_vars,
+                EnvVar.var_PROTOPRIMER_PY_EXEC.value: "stride_py_venv",
+                EnvVar.var_PROTOPRIMER_LAUNCH_RECORD.value: launch_record_abs_path,
+            },
+        )
+        == f"miss: {launch_record_abs_path}\n"
+    )
+
+
+def test_generate_entry_script_content_fast_launch_miss_env_var_names(tmp_path):
+
+    # when:
+
+    entry_script_content = generate_entry_script_content(
+        SubCommand.command_start.value,
+        str(tmp_path / "proto_code" / "proto_kernel.py"),
+        str(tmp_path / "entry_script"),
+        "my_module",
+        "my_func",
+        is_fast_launch=True,
+    )
+
+    # then:
+
+    for env_var_name in ConfConstGeneral.fast_launch_miss_env_var_names:
+        assert f'"{env_var_name}"' in entry_script_content
+    assert set(ConfConstGeneral.fast_launch_miss_env_var_names).isdisjoint(ConfConstGeneral.launch_record_env_var_names)
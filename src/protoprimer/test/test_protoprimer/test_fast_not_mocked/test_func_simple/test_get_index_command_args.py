@@ -0,0 +1,41 @@
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import get_index_command_args
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_index_command_args.__name__)
+
+
+def test_index_options_are_normalized():
+
+    # when:
+
+    index_command_args = get_index_command_args(
+        [
+            "--no-cache-dir",
+            "--index-url",
+            "https://example.com/simple",
+            "--extra-index-url=https://extra.example.com/simple",
+            "-i",
+            "https://other.example.com/simple",
+        ]
+    )
+
+    # then:
+
+    assert index_command_args == [
+        "--index-url=https://example.com/simple",
+        "--extra-index-url=https://extra.example.com/simple",
+        "--index-url=https://other.example.com/simple",
+    ]
+
+
+def test_no_index_options():
+    assert get_index_command_args(["--no-cache-dir"]) == []
+
+
+def test_index_option_without_value():
+    with pytest.raises(AssertionError, match=r"option \[--index-url\] has no value"):
+        get_index_command_args(["--index-url"])
@@ -0,0 +1,62 @@
+import sysconfig
+from unittest.mock import patch
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ConfField,
+    get_install_input_digest,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_install_input_digest.__name__)
+
+
+def test_digest_changes_only_with_inputs(tmp_path):
+
+    # given:
+
+    (tmp_path / "project1").mkdir()
+    pyproject_toml_path = tmp_path / "project1" / "pyproject.toml"
+    pyproject_toml_path.write_text('[project]\ndependencies = ["requests"]\n')
+    project_descriptors = [
+        {
+            ConfField.field_build_root_dir_rel_path.value: "project1",
+        },
+    ]
+
+    # when:
+
+    initial_digest = get_install_input_digest(str(tmp_path), project_descriptors, [])
+
+    # then:
+
+    assert initial_digest.startswith("sha256:")
+    assert get_install_input_digest(str(tmp_path), project_descriptors, []) == initial_digest
+    assert get_install_input_digest(str(tmp_path), project_descriptors, ["--index-url", "https://example.com/simple"]) != initial_digest
+
+    pyproject_toml_path.write_text('[project]\ndependencies = ["requests", "pyyaml"]\n')
+    assert get_install_input_digest(str(tmp_path), project_descriptors, []) != initial_digest
+
+
+def test_digest_changes_with_install_target(tmp_path):
+
+    # given:
+
+    project_descriptors = [
+        {
+            ConfField.field_build_root_dir_rel_path.value: "project1",
+        },
+    ]
+    initial_digest = get_install_input_digest(str(tmp_path), project_descriptors, [])
+
+    # when/then:
+
+    with patch(f"{sysconfig.__name__}.{sysconfig.get_platform.__name__}", return_value="mock-platform"):
+        assert get_install_input_digest(str(tmp_path), project_descriptors, []) != initial_digest
+
+    with patch(f"{sysconfig.__name__}.{sysconfig.get_config_var.__name__}", return_value="mock-soabi"):
+        assert get_install_input_digest(str(tmp_path), project_descriptors, []) != initial_digest
+
+    with patch("sys.version_info", (3, 7, 0)):
+        assert get_install_input_digest(str(tmp_path), project_descriptors, []) != initial_digest
@@ -0,0 +1,33 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ConfConstInput,
+    get_loaded_conf_file_abs_path,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_loaded_conf_file_abs_path.__name__)
+
+
+def test_json_conf_file_without_py_conf_file(tmp_path):
+
+    # given:
+
+    conf_file_abs_path = str(tmp_path / "proto_kernel.json")
+
+    # when/then:
+
+    assert get_loaded_conf_file_abs_path(conf_file_abs_path) == conf_file_abs_path
+
+
+def test_py_conf_file_takes_precedence(tmp_path):
+
+    # given:
+
+    conf_file_abs_path = str(tmp_path / "proto_kernel.json")
+    py_conf_file_abs_path = tmp_path / f"proto_kernel.{ConfConstInput.py_conf_file_ext}"
+    py_conf_file_abs_path.write_text(f"{ConfConstInput.py_conf_data_var_name} = {{}}\n")
+
+    # when/then:
+
+    assert get_loaded_conf_file_abs_path(conf_file_abs_path) == str(py_conf_file_abs_path)
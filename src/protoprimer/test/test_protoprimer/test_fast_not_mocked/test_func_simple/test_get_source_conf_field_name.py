@@ -0,0 +1,34 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ConfConstGeneral,
+    ConfField,
+    EnvState,
+    get_source_conf_field_name,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_source_conf_field_name.__name__)
+
+
+def test_derived_from_conf_field():
+
+    # when:
+
+    source_field_name = get_source_conf_field_name(EnvState.state_local_venv_dir_abs_path_inited.name)
+
+    # then:
+
+    assert source_field_name == ConfField.field_local_venv_dir_rel_path.value
+    assert source_field_name in ConfConstGeneral.overridden_field_names
+
+
+def test_not_derived_from_conf_field():
+
+    # when:
+
+    source_field_name = get_source_conf_field_name(EnvState.state_global_conf_file_abs_path_inited.name)
+
+    # then:
+
+    assert source_field_name is None
@@ -0,0 +1,35 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import get_stray_package_names
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_stray_package_names.__name__)
+
+
+def test_stray_packages_exclude_resolved_and_bootstrap_packages(tmp_path):
+
+    # given:
+
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+    with open(resolved_file_abs_path, "w") as resolved_file:
+        resolved_file.write("--editable /tmp/project1\nrequests==2.32.3\n")
+    installed_packages = [
+        {"name": "pip", "version": "25.0"},
+        {"name": "setuptools", "version": "80.0"},
+        {"name": "Wheel", "version": "0.45.0"},
+        {"name": "Requests", "version": "2.32.3"},
+        {"name": "project1", "version": "0.0.0", "editable_project_location": "/tmp/project1"},
+        {"name": "project_removed", "version": "0.0.0", "editable_project_location": "/tmp/project_removed"},
+        {"name": "stray-package", "version": "1.0"},
+    ]
+
+    # when:
+
+    stray_package_names = get_stray_package_names(installed_packages, resolved_file_abs_path)
+
+    # then:
+
+    assert stray_package_names == [
+        "project_removed",
+        "stray-package",
+    ]
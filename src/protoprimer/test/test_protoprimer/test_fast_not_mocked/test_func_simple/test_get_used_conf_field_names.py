@@ -0,0 +1,76 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ConfConstGeneral,
+    ConfField,
+    ConfLeap,
+    get_used_conf_field_names,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_used_conf_field_names.__name__)
+
+
+def test_overridden_fields_are_used_by_client_and_env():
+
+    # when:
+
+    client_field_names = get_used_conf_field_names(ConfLeap.leap_client)
+    env_field_names = get_used_conf_field_names(ConfLeap.leap_env)
+
+    # then:
+
+    for field_name in ConfConstGeneral.overridden_field_names:
+        assert field_name in client_field_names
+        assert field_name in env_field_names
+    assert ConfField.field_install_specs.value in env_field_names
+    assert ConfField.field_version_constraints_file_basename.value in env_field_names
+    assert ConfField.field_default_env_dir_rel_path.value in client_field_names
+    assert ConfField.field_default_env_dir_rel_path.value not in env_field_names
+
+
+def test_host_and_user_use_host_tuning_fields_only():
+
+    for conf_leap in [
+        ConfLeap.leap_host,
+        ConfLeap.leap_user,
+    ]:
+
+        # when:
+
+        used_field_names = get_used_conf_field_names(conf_leap)
+
+        # then:
+
+        assert used_field_names == ConfConstGeneral.host_tuning_field_names
+        assert ConfField.field_install_specs.value not in used_field_names
+
+
+def test_primer_fields():
+
+    # when:
+
+    used_field_names = get_used_conf_field_names(ConfLeap.leap_primer)
+
+    # then:
+
+    assert used_field_names == [
+        ConfField.field_ref_root_dir_rel_path.value,
+        ConfField.field_global_conf_dir_rel_path.value,
+    ]
+
+
+def test_non_file_conf_leaps():
+
+    for conf_leap in [
+        ConfLeap.leap_input,
+        ConfLeap.leap_derived,
+    ]:
+
+        # when:
+
+        used_field_names = get_used_conf_field_names(conf_leap)
+
+        # then:
+
+        assert used_field_names is None
@@ -0,0 +1,10 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import get_venv_lock_file_abs_path
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_venv_lock_file_abs_path.__name__)
+
+
+def test_lock_file_is_under_local_cache_dir():
+    assert get_venv_lock_file_abs_path("/client/.cache", "/client/venv/") == "/client/.cache/venv.lock"
@@ -0,0 +1,93 @@
+import fcntl
+import os
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    EnvVar,
+    get_held_venv_lock_fd,
+    hold_venv_lock,
+    release_venv_lock,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(hold_venv_lock.__name__)
+
+
+def _try_lock(
+    lock_file_abs_path: str,
+    lock_type: int,
+) -> bool:
+    with open(lock_file_abs_path, "a+") as lock_file_obj:
+        try:
+            fcntl.flock(lock_file_obj.fileno(), lock_type | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+
+def test_lock_is_held_until_released(tmp_path):
+
+    # given:
+
+    lock_file_abs_path = str(tmp_path / "local_cache" / "venv.lock")
+
+    # when:
+
+    hold_venv_lock(lock_file_abs_path)
+
+    # then:
+
+    lock_file_fd = get_held_venv_lock_fd(lock_file_abs_path)
+    assert lock_file_fd is not None
+    assert os.environ[EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value] == str(lock_file_fd)
+    assert not _try_lock(lock_file_abs_path, fcntl.LOCK_SH)
+    with open(lock_file_abs_path, "r") as lock_file_obj:
+        assert lock_file_obj.read().startswith(f"pid={os.getpid()} ")
+
+    # Holding again (e.g. by the next state) reuses the same lock:
+    hold_venv_lock(lock_file_abs_path)
+    assert get_held_venv_lock_fd(lock_file_abs_path) == lock_file_fd
+
+    release_venv_lock()
+
+    assert EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value not in os.environ
+    assert _try_lock(lock_file_abs_path, fcntl.LOCK_EX)
+    with open(lock_file_abs_path, "r") as lock_file_obj:
+        assert lock_file_obj.read() == ""
+
+
+def test_stale_lock_fd_is_ignored(tmp_path):
+
+    # given:
+
+    lock_file_abs_path = str(tmp_path / "venv.lock")
+    other_file_abs_path = str(tmp_path / "other_file")
+    with open(other_file_abs_path, "w") as other_file_obj:
+        # The inherited descriptor points to a different file:
+        os.environ[EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value] = str(other_file_obj.fileno())
+
+        # when:
+
+        hold_venv_lock(lock_file_abs_path)
+
+    # then:
+
+    lock_file_fd = get_held_venv_lock_fd(lock_file_abs_path)
+    assert lock_file_fd is not None
+    assert not _try_lock(lock_file_abs_path, fcntl.LOCK_SH)
+
+    release_venv_lock()
+
+    assert _try_lock(lock_file_abs_path, fcntl.LOCK_EX)
+
+
+def test_release_without_hold_does_nothing():
+
+    # given:
+
+    assert EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value not in os.environ
+
+    # when/then:
+
+    release_venv_lock()
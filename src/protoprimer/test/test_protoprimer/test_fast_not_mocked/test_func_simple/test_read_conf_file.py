@@ -0,0 +1,89 @@
+import os
+import socket
+import sys
+
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    conf_file_exists,
+    ConfField,
+    read_conf_file,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(read_conf_file.__name__)
+
+
+def test_json_conf_file_is_fallback(tmp_path):
+
+    # given:
+
+    conf_file_abs_path = str(tmp_path / "protoprimer.json")
+    with open(conf_file_abs_path, "w") as conf_file:
+        conf_file.write('{"local_venv_dir_rel_path": "venv"}')
+
+    # when:
+
+    conf_data = read_conf_file(conf_file_abs_path)
+
+    # then:
+
+    assert conf_file_exists(conf_file_abs_path)
+    assert conf_data == {
+        ConfField.field_local_venv_dir_rel_path.value: "venv",
+    }
+
+
+def test_py_conf_file_takes_precedence(tmp_path, monkeypatch):
+
+    # given:
+
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    conf_file_abs_path = str(tmp_path / "protoprimer.json")
+    with open(conf_file_abs_path, "w") as conf_file:
+        conf_file.write('{"local_venv_dir_rel_path": "venv"}')
+    with open(str(tmp_path / "protoprimer.conf.py"), "w") as conf_file:
+        conf_file.write('import socket\nconf_data = {"local_venv_dir_rel_path": "venv." + socket.gethostname()}\n')
+
+    # when:
+
+    conf_data = read_conf_file(conf_file_abs_path)
+
+    # then:
+
+    assert conf_data == {
+        ConfField.field_local_venv_dir_rel_path.value: f"venv.{socket.gethostname()}",
+    }
+    # The bytecode is cached for subsequent loads:
+    assert len(os.listdir(str(tmp_path / "__pycache__"))) == 1
+
+
+def test_py_conf_file_without_json_conf_file(tmp_path):
+
+    # given:
+
+    conf_file_abs_path = str(tmp_path / "protoprimer.json")
+    assert not conf_file_exists(conf_file_abs_path)
+    with open(str(tmp_path / "protoprimer.conf.py"), "w") as conf_file:
+        conf_file.write("conf_data = {}\n")
+
+    # when/then:
+
+    assert conf_file_exists(conf_file_abs_path)
+    assert read_conf_file(conf_file_abs_path) == {}
+
+
+def test_py_conf_file_without_conf_data(tmp_path):
+
+    # given:
+
+    conf_file_abs_path = str(tmp_path / "protoprimer.json")
+    with open(str(tmp_path / "protoprimer.conf.py"), "w") as conf_file:
+        conf_file.write("conf_data = []\n")
+
+    # when/then:
+
+    with pytest.raises(AssertionError):
+        read_conf_file(conf_file_abs_path)
@@ -0,0 +1,63 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import read_resolved_requirements
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(read_resolved_requirements.__name__)
+
+
+def test_uv_pip_compile_output(tmp_path):
+
+    # given:
+
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+    with open(resolved_file_abs_path, "w") as resolved_file:
+        resolved_file.write(
+            """\
+# This file was autogenerated by uv via the following command:
+#    uv pip compile --output-file resolved_requirements.txt resolved_requirements.txt.in
+-e file:///tmp/project1
+    # via -r resolved_requirements.txt.in
+Charset_Normalizer==3.4.0 \\
+    --hash=sha256:0123456789abcdef
+    # via requests
+requests==2.32.3  # via project1
+tool @ https://example.com/tool-1.0.tar.gz
+--index-url https://example.com/simple
+"""
+        )
+
+    # when:
+
+    resolved_package_names, resolved_editable_abs_paths = read_resolved_requirements(resolved_file_abs_path)
+
+    # then:
+
+    assert resolved_package_names == {
+        "charset-normalizer",
+        "requests",
+        "tool",
+    }
+    assert resolved_editable_abs_paths == {
+        "/tmp/project1",
+    }
+
+
+def test_editable_with_extras(tmp_path):
+
+    # given:
+
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+    with open(resolved_file_abs_path, "w") as resolved_file:
+        resolved_file.write("--editable /tmp/project1/[extra1]\n")
+
+    # when:
+
+    resolved_package_names, resolved_editable_abs_paths = read_resolved_requirements(resolved_file_abs_path)
+
+    # then:
+
+    assert resolved_package_names == set()
+    assert resolved_editable_abs_paths == {
+        "/tmp/project1",
+    }
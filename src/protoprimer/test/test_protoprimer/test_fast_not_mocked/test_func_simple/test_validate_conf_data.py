@@ -0,0 +1,195 @@
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ConfConstEnv,
+    ConfField,
+    ConfLeap,
+    InstallMode,
+    validate_conf_data,
+    VenvDriverType,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(validate_conf_data.__name__)
+
+
+def test_valid_conf_data():
+    validate_conf_data(
+        ConfLeap.leap_client,
+        {
+            ConfField.field_default_env_dir_rel_path.value: "dst/default_env",
+            ConfField.field_required_python_version.value: None,
+            ConfField.field_venv_driver.value: VenvDriverType.venv_pip.name,
+            ConfField.field_uv_tools_dir_abs_path.value: "~/.cache/protoprimer/uv",
+            ConfField.field_project_descriptors.value: ConfConstEnv.default_project_descriptors,
+            ConfField.field_install_specs.value: [
+                {
+                    "group1": {
+                        ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"],
+                    },
+                },
+            ],
+            ConfField.field_install_mode.value: InstallMode.install_combined.name,
+            # Unknown fields are not validated:
+            "whatever_test": 5,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "conf_data, error_message",
+    [
+        (
+            {
+                ConfField.field_local_venv_dir_rel_path.value: 5,
+            },
+            f"Field `leap_env.{ConfField.field_local_venv_dir_rel_path.value}` must be a `str`: [5]",
+        ),
+        (
+            {
+                ConfField.field_default_env_dir_rel_path.value: "/dst/default_env",
+            },
+            f"Field `leap_env.{ConfField.field_default_env_dir_rel_path.value}` must be a relative path: [/dst/default_env]",
+        ),
+        (
+            {
+                ConfField.field_local_cache_dir_rel_path.value: "/var/cache/shared",
+            },
+            f"Field `leap_env.{ConfField.field_local_cache_dir_rel_path.value}` must be a relative path: [/var/cache/shared]",
+        ),
+        (
+            {
+                ConfField.field_project_descriptors.value: [
+                    {
+                        ConfField.field_build_root_dir_rel_path.value: "/src/project1",
+                    },
+                ],
+            },
+            f"Field `leap_env.{ConfField.field_project_descriptors.value}[0].{ConfField.field_build_root_dir_rel_path.value}` must be a relative path: [/src/project1]",
+        ),
+        (
+            {
+                ConfField.field_uv_tools_dir_abs_path.value: "uv",
+            },
+            f"Field `leap_env.{ConfField.field_uv_tools_dir_abs_path.value}` must specify absolute path: [uv]",
+        ),
+        (
+            {
+                ConfField.field_venv_driver.value: "venv_conda",
+            },
+            f"Field `leap_env.{ConfField.field_venv_driver.value}` must be one of {[venv_driver.name for venv_driver in VenvDriverType]}: [venv_conda]",
+        ),
+        (
+            {
+                ConfField.field_project_descriptors.value: [
+                    {
+                        ConfField.field_install_extras.value: "extra1",
+                    },
+                ],
+            },
+            f"Field `leap_env.{ConfField.field_project_descriptors.value}[0].{ConfField.field_install_extras.value}` must be a `list`: [extra1]",
+        ),
+        (
+            {
+                ConfField.field_install_specs.value: [
+                    {
+                        "group1": {},
+                        "group2": {},
+                    },
+                ],
+            },
+            f"Field `leap_env.{ConfField.field_install_specs.value}[0]` must be a single-item `dict`: [{{'group1': {{}}, 'group2': {{}}}}]",
+        ),
+        (
+            {
+                ConfField.field_install_specs.value: [
+                    {
+                        "group1": [],
+                    },
+                ],
+            },
+            f"Field `leap_env.{ConfField.field_install_specs.value}[0].group1` must be a `dict`: [[]]",
+        ),
+    ],
+)
+def test_invalid_conf_data(
+    conf_data: dict,
+    error_message: str,
+):
+    with pytest.raises(AssertionError) as exc_info:
+        validate_conf_data(ConfLeap.leap_env, conf_data)
+    assert str(exc_info.value) == error_message
+
+
+@pytest.mark.parametrize(
+    "conf_leap",
+    [
+        ConfLeap.leap_host,
+        ConfLeap.leap_user,
+    ],
+)
+def test_host_tuning_fields_only(
+    conf_leap: ConfLeap,
+):
+
+    # given:
+
+    validate_conf_data(
+        conf_leap,
+        {
+            ConfField.field_local_cache_dir_rel_path.value: "cache.shared",
+            ConfField.field_install_mode.value: InstallMode.install_combined.name,
+        },
+    )
+
+    # when/then:
+
+    with pytest.raises(AssertionError, match=f"Field `{conf_leap.name}.{ConfField.field_local_venv_dir_rel_path.value}` is not a host-tuning field"):
+        validate_conf_data(
+            conf_leap,
+            {
+                ConfField.field_local_venv_dir_rel_path.value: "venv.user",
+            },
+        )
+
+    # The install specs are repo-specific (the same conf file applies to every client repo on the host):
+    with pytest.raises(AssertionError, match=f"Field `{conf_leap.name}.{ConfField.field_install_specs.value}` is not a host-tuning field"):
+        validate_conf_data(
+            conf_leap,
+            {
+                ConfField.field_install_specs.value: [],
+            },
+        )
+
+
+@pytest.mark.parametrize(
+    "field_name",
+    [
+        ConfField.field_ref_root_dir_rel_path.value,
+        ConfField.field_global_conf_dir_rel_path.value,
+    ],
+)
+def test_primer_rel_path_fields(
+    field_name: str,
+):
+
+    # given:
+
+    validate_conf_data(
+        ConfLeap.leap_primer,
+        {
+            field_name: "..",
+        },
+    )
+
+    # when/then:
+
+    with pytest.raises(AssertionError, match=f"Field `leap_primer.{field_name}` must be a relative path"):
+        validate_conf_data(
+            ConfLeap.leap_primer,
+            {
+                field_name: "/abs/path",
+            },
+        )
@@ -0,0 +1,39 @@
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import verify_combined_index_command_args
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(verify_combined_index_command_args.__name__)
+
+
+def test_same_index_options_are_combined():
+    verify_combined_index_command_args(
+        {
+            "group1": ["--index-url", "https://example.com/simple", "--extra-index-url", "https://extra.example.com/simple"],
+            "group2": ["--extra-index-url=https://extra.example.com/simple", "--index-url=https://example.com/simple"],
+            # No index options:
+            None: [],
+        }
+    )
+
+
+def test_conflicting_index_options_fail():
+    with pytest.raises(AssertionError, match=r"`install_group`-s \[group1\] and \[group2\] specify conflicting package indexes"):
+        verify_combined_index_command_args(
+            {
+                "group1": ["--index-url", "https://example.com/simple"],
+                "group2": ["--index-url", "https://other.example.com/simple"],
+            }
+        )
+
+
+def test_extra_index_option_conflicts_with_its_absence():
+    with pytest.raises(AssertionError, match=r"conflicting package indexes"):
+        verify_combined_index_command_args(
+            {
+                "group1": ["--index-url", "https://example.com/simple"],
+                "group2": ["--index-url", "https://example.com/simple", "--extra-index-url", "https://extra.example.com/simple"],
+            }
+        )
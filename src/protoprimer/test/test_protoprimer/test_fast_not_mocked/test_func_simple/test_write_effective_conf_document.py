@@ -0,0 +1,119 @@
+import io
+import json
+
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    build_effective_conf_document,
+    ConfConstGeneral,
+    ConfField,
+    ConfLeap,
+    create_merged_conf_data,
+    describe_field_provenance,
+    EffectiveConfigFormat,
+    write_effective_conf_document,
+)
+
+local_conf_file_abs_path = "/abs/path/to/local.json"
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(write_effective_conf_document.__name__)
+
+
+def _build_conf_leap_sources() -> list:
+    return [
+        (
+            ConfLeap.leap_env,
+            local_conf_file_abs_path,
+            {
+                ConfField.field_local_venv_dir_rel_path.value: "venv.local",
+            },
+        ),
+        (
+            ConfLeap.leap_derived,
+            None,
+            {
+                "whatever_test": 5,
+            },
+        ),
+    ]
+
+
+def test_json_format_is_single_document():
+
+    # given:
+
+    conf_leap_sources = _build_conf_leap_sources()
+    text_sink = io.StringIO()
+
+    # when:
+
+    write_effective_conf_document(
+        conf_leap_sources,
+        create_merged_conf_data(conf_leap_sources),
+        EffectiveConfigFormat.format_json,
+        text_sink,
+    )
+
+    # then:
+
+    effective_conf_document = json.loads(text_sink.getvalue())
+    assert effective_conf_document == build_effective_conf_document(conf_leap_sources, create_merged_conf_data(conf_leap_sources))
+    assert effective_conf_document["schema_version"] == ConfConstGeneral.effective_conf_schema_version
+    assert effective_conf_document["conf_leaps"] == {
+        ConfLeap.leap_env.name: {
+            "conf_file_abs_path": local_conf_file_abs_path,
+            "conf_data": {
+                ConfField.field_local_venv_dir_rel_path.value: "venv.local",
+            },
+        },
+        ConfLeap.leap_derived.name: {
+            "conf_file_abs_path": None,
+            "conf_data": {
+                "whatever_test": 5,
+            },
+        },
+    }
+
+
+def test_ndjson_format_is_one_field_per_line():
+
+    # given:
+
+    conf_leap_sources = _build_conf_leap_sources()
+    text_sink = io.StringIO()
+
+    # when:
+
+    write_effective_conf_document(
+        conf_leap_sources,
+        create_merged_conf_data(conf_leap_sources),
+        EffectiveConfigFormat.format_ndjson,
+        text_sink,
+    )
+
+    # then:
+
+    field_records = [json.loads(output_line) for output_line in text_sink.getvalue().splitlines()]
+    assert field_records == [
+        {
+            "schema_version": ConfConstGeneral.effective_conf_schema_version,
+            **field_record,
+        }
+        for field_record in describe_field_provenance(conf_leap_sources, create_merged_conf_data(conf_leap_sources))
+    ]
+
+
+def test_text_format_is_not_supported():
+
+    # when/then:
+
+    with pytest.raises(ValueError):
+        write_effective_conf_document(
+            _build_conf_leap_sources(),
+            create_merged_conf_data(_build_conf_leap_sources()),
+            EffectiveConfigFormat.format_text,
+            io.StringIO(),
+        )
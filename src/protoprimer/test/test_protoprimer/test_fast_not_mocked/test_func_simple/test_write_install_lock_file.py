@@ -0,0 +1,69 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    get_install_lock_file_abs_path,
+    read_install_lock_digest,
+    write_install_lock_file,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(write_install_lock_file.__name__)
+
+
+def test_lock_file_is_next_to_constraints_file():
+    assert get_install_lock_file_abs_path("/lconf/constraints.txt") == "/lconf/constraints.lock.txt"
+
+
+def test_editable_entries_are_dropped(tmp_path):
+
+    # given:
+
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+    with open(resolved_file_abs_path, "w") as resolved_file:
+        resolved_file.write(
+            """\
+-e file:///tmp/project1
+    # via -r resolved_requirements.txt.in
+requests==2.32.3 \\
+    --hash=sha256:0123456789abcdef
+--editable /tmp/project2
+"""
+        )
+    lock_file_abs_path = str(tmp_path / "constraints.lock.txt")
+
+    # when:
+
+    write_install_lock_file(
+        resolved_file_abs_path,
+        lock_file_abs_path,
+        "sha256:fedcba",
+    )
+
+    # then:
+
+    with open(lock_file_abs_path) as lock_file:
+        assert (
+            lock_file.read()
+            == """\
+# install_input_digest: sha256:fedcba
+    # via -r resolved_requirements.txt.in
+requests==2.32.3 \\
+    --hash=sha256:0123456789abcdef
+"""
+        )
+    assert read_install_lock_digest(lock_file_abs_path) == "sha256:fedcba"
+
+
+def test_missing_or_foreign_lock_file_has_no_digest(tmp_path):
+
+    # given:
+
+    lock_file_abs_path = str(tmp_path / "constraints.lock.txt")
+
+    # when/then:
+
+    assert read_install_lock_digest(lock_file_abs_path) is None
+
+    with open(lock_file_abs_path, "w") as lock_file:
+        lock_file.write("requests==2.32.3\n")
+    assert read_install_lock_digest(lock_file_abs_path) is None
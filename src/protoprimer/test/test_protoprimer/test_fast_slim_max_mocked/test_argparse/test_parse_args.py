@@ -12,6 +12,7 @@ import pytest
 
 from protoprimer import primer_kernel as try_main
 from protoprimer.primer_kernel import (
+    EffectiveConfigFormat,
     parse_args,
     ParsedArg,
     SubCommand,
@@ -177,6 +178,30 @@ def test_parse_args_final_state():
             {
                 ParsedArg.name_sub_command.value: "eval",
                 ParsedArg.name_selected_env_dir.value: None,
+                ParsedArg.name_watch_conf.value: False,
+                ParsedArg.name_conf_format.value: EffectiveConfigFormat.format_text.value,
+                SyntaxArg.dest_quiet: 0,
+                SyntaxArg.dest_verbose: 0,
+            },
+        ),
+        (
+            ["eval", "--watch"],
+            {
+                ParsedArg.name_sub_command.value: "eval",
+                ParsedArg.name_selected_env_dir.value: None,
+                ParsedArg.name_watch_conf.value: True,
+                ParsedArg.name_conf_format.value: EffectiveConfigFormat.format_text.value,
+                SyntaxArg.dest_quiet: 0,
+                SyntaxArg.dest_verbose: 0,
+            },
+        ),
+        (
+            ["eval", "--format", "json"],
+            {
+                ParsedArg.name_sub_command.value: "eval",
+                ParsedArg.name_selected_env_dir.value: None,
+                ParsedArg.name_watch_conf.value: False,
+                ParsedArg.name_conf_format.value: EffectiveConfigFormat.format_json.value,
                 SyntaxArg.dest_quiet: 0,
                 SyntaxArg.dest_verbose: 0,
             },
@@ -74,6 +74,7 @@ class TestTopologicalSort:
             EnvState.state_input_stderr_log_level_handler_configured.name,
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_input_final_state_eval_finalized.name,
+            EnvState.state_input_watch_conf_arg_loaded.name,
             EnvState.state_func_boot_env_executed.name,
             EnvState.state_everything_executed.name,
         ]
@@ -165,6 +166,7 @@ class TestTopologicalSort:
             EnvState.state_input_stderr_log_level_handler_configured.name,
             EnvState.state_input_sub_command_arg_loaded.name,
             EnvState.state_input_final_state_eval_finalized.name,
+            EnvState.state_input_watch_conf_arg_loaded.name,
             EnvState.state_func_boot_env_executed.name,
             EnvState.state_everything_executed.name,
         ]
@@ -1,8 +1,16 @@
 import logging
+import os
 from unittest.mock import patch
 
 from local_test.name_assertion import assert_test_module_name_embeds_str
-from protoprimer.primer_kernel import DefaultFileLogFormatter
+from protoprimer.primer_kernel import (
+    DefaultFileLogFormatter,
+    EnvVar,
+    JsonFileLogFormatter,
+    LogFormat,
+    QueuedLogHandler,
+    StateStrideFilter,
+)
 from metaprimer.script_lib import configure_file_log_handler
 
 
@@ -35,3 +43,59 @@ def test_configure_file_log_handler(
     assert log_handler.level == log_level
 
     log_handler.close()
+
+
+@patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_ASYNC_FILE_LOG.value: str(True)})
+@patch("metaprimer.script_lib.logger")
+def test_configure_file_log_handler_async(
+    mock_logger,
+    tmp_path,
+):
+    # given:
+
+    log_level = logging.DEBUG
+    file_path = str(tmp_path / "test.log")
+
+    # when:
+
+    log_handler = configure_file_log_handler(
+        file_path,
+        log_level,
+    )
+
+    # then:
+
+    assert isinstance(log_handler, QueuedLogHandler)
+    assert isinstance(log_handler.target_handler, logging.FileHandler)
+    mock_logger.addHandler.assert_called_once_with(log_handler)
+    assert isinstance(log_handler.target_handler.formatter, DefaultFileLogFormatter)
+    assert log_handler.level == log_level
+
+    log_handler.close()
+
+
+@patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value: LogFormat.log_format_json.value})
+@patch("metaprimer.script_lib.logger")
+def test_configure_file_log_handler_json(
+    mock_logger,
+    tmp_path,
+):
+    # given:
+
+    file_path = str(tmp_path / "test.log")
+
+    # when:
+
+    log_handler = configure_file_log_handler(
+        file_path,
+        logging.INFO,
+        "test_start_id",
+    )
+
+    # then:
+
+    assert isinstance(log_handler.formatter, JsonFileLogFormatter)
+    assert log_handler.formatter.start_id == "test_start_id"
+    assert any(isinstance(log_filter, StateStrideFilter) for log_filter in log_handler.filters)
+
+    log_handler.close()
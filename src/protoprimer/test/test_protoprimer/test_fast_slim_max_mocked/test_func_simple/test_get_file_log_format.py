@@ -0,0 +1,33 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    EnvVar,
+    get_file_log_format,
+    LogFormat,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(get_file_log_format.__name__)
+
+
+@patch.dict(f"{os.__name__}.environ", {}, clear=True)
+def test_default_is_text():
+    assert get_file_log_format() == LogFormat.log_format_text
+
+
+@pytest.mark.parametrize("log_format", list(LogFormat))
+def test_selected_by_env_var(log_format):
+    with patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value: log_format.value}):
+        assert get_file_log_format() == log_format
+
+
+@patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value: "xml"})
+def test_unknown_value_fails():
+    with pytest.raises(AssertionError) as exc_info:
+        get_file_log_format()
+    assert str(exc_info.value) == f"`{EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value}` must be one of {[log_format.value for log_format in LogFormat]}: [xml]"
@@ -0,0 +1,22 @@
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import quote_fish_arg
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(quote_fish_arg.__name__)
+
+
+@pytest.mark.parametrize(
+    "arg_value, expected_quoted_arg",
+    [
+        ("/fake/venv", "'/fake/venv'"),
+        ("/fake/my venv", "'/fake/my venv'"),
+        ("it's", "'it\\'s'"),
+        ("back\\slash", "'back\\\\slash'"),
+        ("$PATH", "'$PATH'"),
+    ],
+)
+def test_quote_fish_arg(arg_value, expected_quoted_arg):
+    assert quote_fish_arg(arg_value) == expected_quoted_arg
@@ -0,0 +1,55 @@
+import os
+from unittest.mock import patch
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    EnvVar,
+    read_json_file,
+    stat_launch_file,
+    write_launch_record,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(write_launch_record.__name__)
+
+
+def test_write_launch_record(tmp_path):
+
+    # given:
+
+    existing_file_abs_path = str(tmp_path / "existing.json")
+    with open(existing_file_abs_path, "w") as existing_file:
+        existing_file.write("{}")
+    missing_file_abs_path = str(tmp_path / "missing.json")
+    launch_record_abs_path = str(tmp_path / "__pycache__" / "launch.json")
+
+    # when:
+
+    with patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_HOST_CONF.value: "/fake/host.json"}, clear=True):
+        write_launch_record(
+            launch_record_abs_path,
+            "/fake/venv/bin/python",
+            [
+                existing_file_abs_path,
+                missing_file_abs_path,
+            ],
+        )
+
+    # then:
+
+    existing_file_stat = os.lstat(existing_file_abs_path)
+    assert read_json_file(launch_record_abs_path) == {
+        "venv_python": "/fake/venv/bin/python",
+        "file_stats": {
+            existing_file_abs_path: [existing_file_stat.st_mtime_ns, 2],
+            missing_file_abs_path: None,
+        },
+        "env_vars": {
+            EnvVar.var_PROTOPRIMER_CONF_BASENAME.value: None,
+            EnvVar.var_PROTOPRIMER_VENV_DRIVER.value: None,
+            EnvVar.var_PROTOPRIMER_UV_TOOLS_DIR.value: None,
+            EnvVar.var_PROTOPRIMER_HOST_CONF.value: "/fake/host.json",
+        },
+    }
+    assert stat_launch_file(missing_file_abs_path) is None
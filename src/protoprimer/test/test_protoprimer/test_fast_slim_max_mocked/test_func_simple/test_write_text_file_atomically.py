@@ -0,0 +1,44 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    read_text_file,
+    write_text_file_atomically,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(write_text_file_atomically.__name__)
+
+
+def test_replaces_existing_file(tmp_path):
+    # given:
+    file_path = str(tmp_path / "test.txt")
+    with open(file_path, "w") as file_obj:
+        file_obj.write("old data")
+
+    # when:
+    write_text_file_atomically(file_path, "new data")
+
+    # then:
+    assert read_text_file(file_path) == "new data"
+    assert os.listdir(tmp_path) == ["test.txt"]
+
+
+def test_existing_file_is_intact_on_failed_write(tmp_path):
+    # given:
+    file_path = str(tmp_path / "test.txt")
+    with open(file_path, "w") as file_obj:
+        file_obj.write("old data")
+
+    # when:
+    with patch(f"{primer_kernel.__name__}.os.replace", side_effect=OSError("test error")):
+        with pytest.raises(OSError):
+            write_text_file_atomically(file_path, "new data")
+
+    # then:
+    assert read_text_file(file_path) == "old data"
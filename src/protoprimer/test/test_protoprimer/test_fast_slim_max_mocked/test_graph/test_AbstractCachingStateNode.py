@@ -1,10 +1,29 @@
-from unittest.mock import MagicMock
+from __future__ import annotations
+
+import io
+import json
+import logging
+import pathlib
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
 
 import pytest
 
+from local_test.fat_mocked_helper import (
+    fat_mock_wrapper,
+    run_primer_main,
+)
+from local_test.integrated_helper import create_max_layout
 from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    _PrimerFileLogFormatter,
+    _PrimerStderrLogFormatter,
     AbstractCachingStateNode,
+    log_state_name,
+    StateStrideFilter,
 )
 
 
@@ -58,3 +77,116 @@ def test_eval_state_once_raises_not_implemented_error():
     # when/then:
     with pytest.raises(NotImplementedError):
         state_node._eval_state_once()
+
+
+class ReprCountingDict(dict):
+    """
+    Config data which counts how many times it was converted to `str`.
+    """
+
+    repr_count: int = 0
+
+    def __repr__(self):
+        ReprCountingDict.repr_count += 1
+        return super().__repr__()
+
+    def __str__(self):
+        return self.__repr__()
+
+
+def _create_primer_log_handlers(stderr_log_level: int) -> list[logging.Handler]:
+    """
+    Same handler setup as the primer: `stderr` at the given level and the file log at most at `logging.INFO`.
+    """
+    stderr_handler = logging.StreamHandler(io.StringIO())
+    stderr_handler.addFilter(StateStrideFilter())
+    stderr_handler.setFormatter(_PrimerStderrLogFormatter(stderr_log_level))
+    stderr_handler.setLevel(stderr_log_level)
+    file_handler = logging.StreamHandler(io.StringIO())
+    file_handler.addFilter(StateStrideFilter())
+    file_handler.setFormatter(_PrimerFileLogFormatter())
+    file_handler.setLevel(min(logging.INFO, stderr_log_level))
+    return [stderr_handler, file_handler]
+
+
+@pytest.mark.parametrize(
+    "stderr_log_level, expected_repr_count",
+    [
+        # Default verbosity:
+        (logging.WARNING, 0),
+        # `-vv`:
+        (logging.DEBUG, 2),
+    ],
+)
+def test_evaluated_value_is_formatted_only_when_logged(
+    stderr_log_level,
+    expected_repr_count,
+):
+    # given:
+    state_node = _make_state_node(MagicMock(), [], "my_state")
+    state_node._eval_state_once = MagicMock(return_value=ReprCountingDict(conf_field=["conf_value"]))
+    ReprCountingDict.repr_count = 0
+
+    # when:
+    orig_log_level = primer_kernel.logger.level
+    # Same as the primer (see `_configure_primer_stderr_log_handler`):
+    primer_kernel.logger.setLevel(logging.NOTSET)
+    try:
+        with patch.object(primer_kernel.logger, "handlers", _create_primer_log_handlers(stderr_log_level)):
+            state_node.eval_own_state()
+    finally:
+        primer_kernel.logger.setLevel(orig_log_level)
+
+    # then:
+    assert ReprCountingDict.repr_count == expected_repr_count
+
+
+def test_state_name_is_set_for_log_records_during_evaluation():
+    # given:
+    state_node = _make_state_node(MagicMock(), [], "my_state")
+    state_node._eval_state_once = MagicMock(side_effect=lambda: log_state_name.get(None))
+
+    # when:
+    result = state_node.eval_own_state()
+
+    # then:
+    assert result == "my_state"
+    assert log_state_name.get(None) is None
+
+
+def test_default_verbosity_boot_does_not_format_conf_data(fs):
+    """
+    No conf data is formatted (`repr`-ed) for log messages filtered out at the default verbosity.
+    """
+
+    # given:
+
+    def read_counting_json_file(file_path: str) -> dict:
+        with open(file_path, "r", encoding="utf-8") as file_obj:
+            return json.load(file_obj, object_hook=ReprCountingDict)
+
+    mock_test_dir = fs.create_dir("/mock_test_dir")
+
+    with fat_mock_wrapper(fs):
+        (
+            proto_kernel_abs_path,
+            ref_root_abs_path,
+            project_dir_abs_path,
+        ) = create_max_layout(pathlib.Path(mock_test_dir.path))
+        ReprCountingDict.repr_count = 0
+
+        # when:
+
+        # Drop `pytest` log capturing handlers (they format every record) to keep only the primer ones:
+        with patch.object(logging.getLogger(), "handlers", []):
+            with patch.object(primer_kernel, "read_json_file", side_effect=read_counting_json_file) as mock_read_json_file:
+                run_primer_main(
+                    [
+                        str(proto_kernel_abs_path),
+                    ]
+                )
+
+    # then:
+
+    mock_read_json_file.assert_called()
+    assert ReprCountingDict.repr_count == 0
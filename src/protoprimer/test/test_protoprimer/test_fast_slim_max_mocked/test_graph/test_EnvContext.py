@@ -14,11 +14,14 @@ from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
     Bootstrapper_required_python_version_inited,
     Bootstrapper_state_client_conf_file_data_loaded,
+    Bootstrapper_state_conf_data_verified,
     Bootstrapper_state_env_conf_file_data_loaded,
+    Bootstrapper_state_host_conf_file_data_loaded,
     Bootstrapper_state_local_cache_dir_abs_path_inited,
     Bootstrapper_state_local_venv_dir_abs_path_inited,
     Bootstrapper_state_reboot_triggered_is_app,
     Bootstrapper_state_selected_python_file_abs_path_inited,
+    Bootstrapper_state_user_conf_file_data_loaded,
     ContextBuilder,
     EntryFunc,
     EnvContext,
@@ -57,6 +60,18 @@ class TestEnvContext(BasePyfakefsTestClass):
         f"{primer_kernel.__name__}.{Bootstrapper_state_reboot_triggered_is_app.__name__}.{StateNode.eval_own_state.__name__}",
         return_value=False,
     )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_conf_data_verified.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value=True,
+    )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value={},
+    )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value={},
+    )
     @patch(
         f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
         return_value={},
@@ -81,6 +96,9 @@ class TestEnvContext(BasePyfakefsTestClass):
         mock_state_local_cache_dir_abs_path_inited,
         mock_state_env_conf_file_data_loaded,
         mock_state_client_conf_file_data_loaded,
+        mock_state_host_conf_file_data_loaded,
+        mock_state_user_conf_file_data_loaded,
+        mock_state_conf_data_verified,
         mock_state_reboot_triggered,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_required_python_version_inited,
@@ -125,6 +143,18 @@ class TestEnvContext(BasePyfakefsTestClass):
         f"{primer_kernel.__name__}.{Bootstrapper_state_reboot_triggered_is_app.__name__}.{StateNode.eval_own_state.__name__}",
         return_value=False,
     )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_conf_data_verified.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value=True,
+    )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value={},
+    )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value={},
+    )
     @patch(
         f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
         return_value={},
@@ -149,6 +179,9 @@ class TestEnvContext(BasePyfakefsTestClass):
         mock_state_local_cache_dir_abs_path_inited,
         mock_state_env_conf_file_data_loaded,
         mock_state_client_conf_file_data_loaded,
+        mock_state_host_conf_file_data_loaded,
+        mock_state_user_conf_file_data_loaded,
+        mock_state_conf_data_verified,
         mock_state_reboot_triggered,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_required_python_version_inited,
@@ -193,6 +226,18 @@ class TestEnvContext(BasePyfakefsTestClass):
         f"{primer_kernel.__name__}.{Bootstrapper_state_reboot_triggered_is_app.__name__}.{StateNode.eval_own_state.__name__}",
         return_value=False,
     )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_conf_data_verified.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value=True,
+    )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value={},
+    )
+    @patch(
+        f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
+        return_value={},
+    )
     @patch(
         f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.{StateNode.eval_own_state.__name__}",
         return_value={},
@@ -215,6 +260,9 @@ class TestEnvContext(BasePyfakefsTestClass):
         mock_state_local_cache_dir_abs_path_inited,
         mock_state_env_conf_file_data_loaded,
         mock_state_client_conf_file_data_loaded,
+        mock_state_host_conf_file_data_loaded,
+        mock_state_user_conf_file_data_loaded,
+        mock_state_conf_data_verified,
         mock_state_reboot_triggered,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_required_python_version_inited,
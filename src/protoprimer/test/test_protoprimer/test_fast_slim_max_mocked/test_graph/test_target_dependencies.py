@@ -22,6 +22,7 @@ class TestTargetDependencies:
     state_func_boot_env_executed_dependencies = [
         EnvState.state_input_sub_command_arg_loaded.name,
         EnvState.state_input_final_state_eval_finalized.name,
+        EnvState.state_input_watch_conf_arg_loaded.name,
         EnvState.state_func_boot_env_executed.name,
     ]
 
@@ -1,7 +1,9 @@
+import json
 import os
 import subprocess
 from unittest.mock import (
     ANY,
+    call,
     patch,
 )
 
@@ -116,6 +118,294 @@ def test_install_dependencies(mock_subprocess_check_call):
     )
 
 
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_resolve_dependencies(mock_subprocess_check_call, tmp_path):
+
+    # given:
+
+    selected_python_file_abs_path = "/tmp/test_venv/bin/python"
+    install_driver = VenvDriverPip(
+        required_python_version=test_python_version,
+        selected_python_file_abs_path=selected_python_file_abs_path,
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+    )
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+    report_file_abs_path = f"{resolved_file_abs_path}.json"
+
+    def write_report(*args, **kwargs):
+        with open(report_file_abs_path, "w") as report_file:
+            json.dump(
+                {
+                    "install": [
+                        {
+                            "download_info": {
+                                "url": "file:///tmp/project1",
+                                "dir_info": {"editable": True},
+                            },
+                            "metadata": {"name": "project1", "version": "0.0.0"},
+                        },
+                        {
+                            "download_info": {"url": "https://example.com/requests-2.32.3-py3-none-any.whl"},
+                            "metadata": {"name": "requests", "version": "2.32.3"},
+                        },
+                        {
+                            "download_info": {"url": "https://example.com/tool-1.0.tar.gz"},
+                            "is_direct": True,
+                            "metadata": {"name": "tool", "version": "1.0"},
+                        },
+                    ],
+                },
+                report_file,
+            )
+
+    mock_subprocess_check_call.side_effect = write_report
+
+    # when:
+
+    install_driver.resolve_dependencies(
+        ref_root_dir_abs_path="/tmp",
+        venv_python_file_abs_path=selected_python_file_abs_path,
+        constraints_file_abs_path="/tmp/constraints.txt",
+        project_descriptors=[
+            {
+                ConfField.field_build_root_dir_rel_path.value: "project1",
+                ConfField.field_install_extras.value: ["extra1"],
+            },
+        ],
+        extra_command_args=["--test-option"],
+        resolved_file_abs_path=resolved_file_abs_path,
+    )
+
+    # then:
+
+    mock_subprocess_check_call.assert_called_once_with(
+        [
+            selected_python_file_abs_path,
+            "-m",
+            "pip",
+            "install",
+            "--dry-run",
+            "--ignore-installed",
+            "--quiet",
+            "--report",
+            report_file_abs_path,
+            "--constraint",
+            "/tmp/constraints.txt",
+            "--test-option",
+            "--editable",
+            "/tmp/project1[extra1]",
+        ],
+        env=ANY,
+    )
+    with open(resolved_file_abs_path) as resolved_file:
+        assert resolved_file.read() == "--editable /tmp/project1\nrequests==2.32.3\ntool @ https://example.com/tool-1.0.tar.gz\n"
+
+
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_install_resolved_dependencies(mock_subprocess_check_call):
+
+    # given:
+
+    selected_python_file_abs_path = "/tmp/test_venv/bin/python"
+    install_driver = VenvDriverPip(
+        required_python_version=test_python_version,
+        selected_python_file_abs_path=selected_python_file_abs_path,
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+    )
+
+    # when:
+
+    install_driver.install_resolved_dependencies(
+        venv_python_file_abs_path=selected_python_file_abs_path,
+        resolved_file_abs_path="/tmp/resolved_requirements.txt",
+        extra_command_args=["--test-option"],
+    )
+
+    # then:
+
+    mock_subprocess_check_call.assert_called_once_with(
+        [
+            selected_python_file_abs_path,
+            "-m",
+            "pip",
+            "install",
+            "--no-deps",
+            "--requirement",
+            "/tmp/resolved_requirements.txt",
+            "--test-option",
+        ],
+        env=ANY,
+    )
+
+
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_resolve_dependencies_hashed(mock_subprocess_check_call, tmp_path):
+
+    # given:
+
+    install_driver = VenvDriverPip(
+        required_python_version=test_python_version,
+        selected_python_file_abs_path="/tmp/test_venv/bin/python",
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+    )
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+
+    def write_report(*args, **kwargs):
+        with open(f"{resolved_file_abs_path}.json", "w") as report_file:
+            json.dump(
+                {
+                    "install": [
+                        {
+                            "download_info": {
+                                "url": "https://example.com/requests-2.32.3-py3-none-any.whl",
+                                "archive_info": {"hashes": {"sha256": "0123456789abcdef"}},
+                            },
+                            "metadata": {"name": "requests", "version": "2.32.3"},
+                        },
+                        {
+                            "download_info": {
+                                "url": "https://example.com/idna-3.10-py3-none-any.whl",
+                                "archive_info": {"hash": "sha256=fedcba9876543210"},
+                            },
+                            "metadata": {"name": "idna", "version": "3.10"},
+                        },
+                    ],
+                },
+                report_file,
+            )
+
+    mock_subprocess_check_call.side_effect = write_report
+
+    # when:
+
+    install_driver.resolve_dependencies(
+        ref_root_dir_abs_path="/tmp",
+        venv_python_file_abs_path="/tmp/test_venv/bin/python",
+        constraints_file_abs_path="/tmp/constraints.txt",
+        project_descriptors=[],
+        extra_command_args=[],
+        resolved_file_abs_path=resolved_file_abs_path,
+        is_hashed=True,
+    )
+
+    # then:
+
+    with open(resolved_file_abs_path) as resolved_file:
+        assert resolved_file.read() == "requests==2.32.3 --hash=sha256:0123456789abcdef\nidna==3.10 --hash=sha256:fedcba9876543210\n"
+
+
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_install_locked_dependencies(mock_subprocess_check_call):
+
+    # given:
+
+    selected_python_file_abs_path = "/tmp/test_venv/bin/python"
+    install_driver = VenvDriverPip(
+        required_python_version=test_python_version,
+        selected_python_file_abs_path=selected_python_file_abs_path,
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+    )
+
+    # when:
+
+    install_driver.install_locked_dependencies(
+        ref_root_dir_abs_path="/tmp",
+        venv_python_file_abs_path=selected_python_file_abs_path,
+        lock_file_abs_path="/tmp/constraints.lock.txt",
+        project_descriptors=[
+            {
+                ConfField.field_build_root_dir_rel_path.value: "project1",
+                ConfField.field_install_extras.value: ["extra1"],
+            },
+        ],
+        extra_command_args=["--test-option"],
+    )
+
+    # then:
+
+    assert mock_subprocess_check_call.call_args_list == [
+        call(
+            [
+                selected_python_file_abs_path,
+                "-m",
+                "pip",
+                "install",
+                "--no-deps",
+                "--require-hashes",
+                "--requirement",
+                "/tmp/constraints.lock.txt",
+                "--test-option",
+            ],
+            env=ANY,
+        ),
+        call(
+            [
+                selected_python_file_abs_path,
+                "-m",
+                "pip",
+                "install",
+                "--no-deps",
+                "--test-option",
+                "--editable",
+                "/tmp/project1[extra1]",
+            ],
+            env=ANY,
+        ),
+    ]
+
+
+@patch(f"{subprocess.__name__}.{subprocess.check_output.__name__}")
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_sync_resolved_dependencies(mock_subprocess_check_call, mock_subprocess_check_output, tmp_path):
+
+    # given:
+
+    selected_python_file_abs_path = "/tmp/test_venv/bin/python"
+    install_driver = VenvDriverPip(
+        required_python_version=test_python_version,
+        selected_python_file_abs_path=selected_python_file_abs_path,
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+    )
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+    with open(resolved_file_abs_path, "w") as resolved_file:
+        resolved_file.write("--editable /tmp/project1\nrequests==2.32.3\n")
+    mock_subprocess_check_output.return_value = json.dumps(
+        [
+            # The `venv` bootstrap packages (not in the resolved set):
+            {"name": "pip", "version": "25.0"},
+            {"name": "setuptools", "version": "80.0"},
+            {"name": "wheel", "version": "0.45.0"},
+            {"name": "Requests", "version": "2.32.3"},
+            {"name": "project1", "version": "0.0.0", "editable_project_location": "/tmp/project1"},
+            {"name": "project_removed", "version": "0.0.0", "editable_project_location": "/tmp/project_removed"},
+            {"name": "stray-package", "version": "1.0"},
+        ]
+    )
+
+    # when:
+
+    install_driver.sync_resolved_dependencies(
+        venv_python_file_abs_path=selected_python_file_abs_path,
+        resolved_file_abs_path=resolved_file_abs_path,
+        extra_command_args=[],
+    )
+
+    # then:
+
+    assert mock_subprocess_check_call.call_count == 2
+    mock_subprocess_check_call.assert_called_with(
+        [
+            selected_python_file_abs_path,
+            "-m",
+            "pip",
+            "uninstall",
+            "--yes",
+            "project_removed",
+            "stray-package",
+        ]
+    )
+
+
 @patch("protoprimer.primer_kernel.get_venv_type")
 def test_is_mine_venv_when_pip_venv(mock_get_venv_type):
 
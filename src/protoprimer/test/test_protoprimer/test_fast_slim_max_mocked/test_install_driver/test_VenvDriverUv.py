@@ -1,3 +1,5 @@
+import json
+import os
 import subprocess
 from unittest.mock import (
     ANY,
@@ -197,6 +199,195 @@ def test_pin_versions(mock_subprocess_check_call, mock_exists, mock_isfile):
     assert mock_subprocess_check_call.call_count == 2
 
 
+@patch(f"{primer_kernel.__name__}.os.path.isfile")
+@patch(f"{primer_kernel.__name__}.os.path.exists")
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_resolve_dependencies(mock_subprocess_check_call, mock_exists, mock_isfile, tmp_path):
+
+    # given:
+
+    mock_exists.return_value = True
+    mock_isfile.return_value = True
+    selected_python_file_abs_path = "/tmp/test_venv/bin/python"
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path=selected_python_file_abs_path,
+        state_local_venv_dir_abs_path_inited="/mock/venv",
+        state_local_cache_dir_abs_path_inited="/tmp/cache",
+    )
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+
+    # when:
+
+    install_driver.resolve_dependencies(
+        ref_root_dir_abs_path="/tmp",
+        venv_python_file_abs_path=selected_python_file_abs_path,
+        constraints_file_abs_path="/tmp/constraints.txt",
+        project_descriptors=[
+            {
+                ConfField.field_build_root_dir_rel_path.value: "project1",
+                ConfField.field_install_extras.value: ["extra1"],
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "project2",
+                ConfField.field_install_extras.value: [],
+            },
+        ],
+        extra_command_args=["--test-option"],
+        resolved_file_abs_path=resolved_file_abs_path,
+    )
+
+    # then:
+
+    mock_subprocess_check_call.assert_called_with(
+        [
+            "/tmp/cache/venv/uv.venv/bin/uv",
+            "pip",
+            "compile",
+            "--python",
+            "/mock/venv/bin/python",
+            "--quiet",
+            "--constraint",
+            "/tmp/constraints.txt",
+            "--test-option",
+            "--output-file",
+            resolved_file_abs_path,
+            f"{resolved_file_abs_path}.in",
+        ],
+        env=ANY,
+    )
+    with open(f"{resolved_file_abs_path}.in") as requirements_in_file:
+        assert requirements_in_file.read() == "--editable /tmp/project1[extra1]\n--editable /tmp/project2\n"
+
+
+@patch(f"{primer_kernel.__name__}.os.path.isfile")
+@patch(f"{primer_kernel.__name__}.os.path.exists")
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_resolve_dependencies_hashed(mock_subprocess_check_call, mock_exists, mock_isfile, tmp_path):
+
+    # given:
+
+    mock_exists.return_value = True
+    mock_isfile.return_value = True
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/tmp/test_venv/bin/python",
+        state_local_venv_dir_abs_path_inited="/mock/venv",
+        state_local_cache_dir_abs_path_inited="/tmp/cache",
+    )
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+
+    # when:
+
+    install_driver.resolve_dependencies(
+        ref_root_dir_abs_path="/tmp",
+        venv_python_file_abs_path="/tmp/test_venv/bin/python",
+        constraints_file_abs_path="/tmp/constraints.txt",
+        project_descriptors=[],
+        extra_command_args=[],
+        resolved_file_abs_path=resolved_file_abs_path,
+        is_hashed=True,
+    )
+
+    # then:
+
+    mock_subprocess_check_call.assert_called_with(
+        [
+            "/tmp/cache/venv/uv.venv/bin/uv",
+            "pip",
+            "compile",
+            "--python",
+            "/mock/venv/bin/python",
+            "--quiet",
+            "--constraint",
+            "/tmp/constraints.txt",
+            "--generate-hashes",
+            "--output-file",
+            resolved_file_abs_path,
+            f"{resolved_file_abs_path}.in",
+        ],
+        env=ANY,
+    )
+
+
+@patch(f"{primer_kernel.__name__}.os.path.isfile")
+@patch(f"{primer_kernel.__name__}.os.path.exists")
+@patch(f"{subprocess.__name__}.{subprocess.check_output.__name__}")
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+def test_sync_resolved_dependencies(mock_subprocess_check_call, mock_subprocess_check_output, mock_exists, mock_isfile, tmp_path):
+
+    # given:
+
+    mock_exists.return_value = True
+    mock_isfile.return_value = True
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/tmp/test_venv/bin/python",
+        state_local_venv_dir_abs_path_inited="/mock/venv",
+        state_local_cache_dir_abs_path_inited="/tmp/cache",
+    )
+    resolved_file_abs_path = str(tmp_path / "resolved_requirements.txt")
+    with open(resolved_file_abs_path, "w") as resolved_file:
+        resolved_file.write("requests==2.32.3\n")
+    mock_subprocess_check_output.return_value = json.dumps(
+        [
+            {"name": "pip", "version": "25.0"},
+            {"name": "requests", "version": "2.32.3"},
+            {"name": "stray-package", "version": "1.0"},
+        ]
+    )
+
+    # when:
+
+    install_driver.sync_resolved_dependencies(
+        venv_python_file_abs_path="/tmp/test_venv/bin/python",
+        resolved_file_abs_path=resolved_file_abs_path,
+        extra_command_args=["--test-option"],
+    )
+
+    # then:
+
+    # No `uv pip sync` - it would also uninstall `pip`:
+    assert (
+        call(
+            [
+                "/tmp/cache/venv/uv.venv/bin/uv",
+                "pip",
+                "install",
+                "--python",
+                "/mock/venv/bin/python",
+                "--no-deps",
+                "--requirement",
+                resolved_file_abs_path,
+                "--test-option",
+            ],
+            env=ANY,
+        )
+        in mock_subprocess_check_call.call_args_list
+    )
+    mock_subprocess_check_call.assert_called_with(
+        [
+            "/tmp/cache/venv/uv.venv/bin/uv",
+            "pip",
+            "uninstall",
+            "--python",
+            "/mock/venv/bin/python",
+            "stray-package",
+        ]
+    )
+    mock_subprocess_check_output.assert_called_once_with(
+        [
+            "/tmp/cache/venv/uv.venv/bin/uv",
+            "pip",
+            "list",
+            "--format=json",
+            "--python",
+            "/mock/venv/bin/python",
+        ],
+        universal_newlines=True,
+    )
+
+
 @patch("protoprimer.primer_kernel.get_venv_type")
 def test_is_mine_venv_when_uv_venv(mock_get_venv_type):
     # given
@@ -253,3 +444,196 @@ def test_is_mine_venv_when_cfg_not_exists(mock_get_venv_type):
     with pytest.raises(AssertionError):
         driver.is_mine_venv(venv_path)
     mock_get_venv_type.assert_called_once_with(venv_path)
+
+
+def _create_fake_uv_venv(uv_venv_abs_path: str) -> None:
+    os.makedirs(os.path.join(uv_venv_abs_path, "bin"))
+    with open(os.path.join(uv_venv_abs_path, "bin", "uv"), "w") as uv_file:
+        uv_file.write("")
+
+
+@patch(f"{primer_kernel.__name__}.get_uv_version")
+@patch(f"{primer_kernel.__name__}.VenvDriverUv._install_uv")
+def test_shared_uv_is_installed_once_keyed_by_version(mock_install_uv, mock_get_uv_version, tmp_path):
+
+    # given:
+
+    uv_tools_dir_abs_path = str(tmp_path / "uv_tools")
+    mock_install_uv.side_effect = _create_fake_uv_venv
+    mock_get_uv_version.return_value = "0.8.0"
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/mock/python",
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+        state_local_cache_dir_abs_path_inited="/tmp/cache",
+        uv_tools_dir_abs_path=uv_tools_dir_abs_path,
+    )
+
+    # when:
+
+    install_driver._ensure_uv_is_available()
+
+    # then:
+
+    mock_install_uv.assert_called_once()
+    assert install_driver.uv_exec_abs_path == os.path.join(uv_tools_dir_abs_path, "uv.venv", "bin", "uv")
+    assert os.path.isfile(install_driver.uv_exec_abs_path)
+    assert os.readlink(os.path.join(uv_tools_dir_abs_path, "uv.venv")) == "uv-0.8.0.venv"
+    assert sorted(os.listdir(uv_tools_dir_abs_path)) == [
+        "uv-0.8.0.venv",
+        "uv.venv",
+        "uv.venv.lock",
+    ]
+
+
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+@patch(f"{primer_kernel.__name__}.VenvDriverUv._install_uv")
+def test_shared_uv_is_reused_by_another_client(mock_install_uv, mock_subprocess_check_call, tmp_path):
+
+    # given:
+
+    uv_tools_dir_abs_path = str(tmp_path / "uv_tools")
+    _create_fake_uv_venv(os.path.join(uv_tools_dir_abs_path, "uv-0.8.0.venv"))
+    os.symlink("uv-0.8.0.venv", os.path.join(uv_tools_dir_abs_path, "uv.venv"))
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/mock/python",
+        state_local_venv_dir_abs_path_inited="/another/venv",
+        state_local_cache_dir_abs_path_inited="/another/cache",
+        uv_tools_dir_abs_path=uv_tools_dir_abs_path,
+    )
+
+    # when:
+
+    install_driver._ensure_uv_is_available()
+
+    # then:
+
+    mock_install_uv.assert_not_called()
+    mock_subprocess_check_call.assert_called_once_with(
+        [
+            install_driver.uv_exec_abs_path,
+            "python",
+            "dir",
+        ]
+    )
+
+
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+@patch(f"{primer_kernel.__name__}.get_uv_version")
+@patch(f"{primer_kernel.__name__}.VenvDriverUv._install_uv")
+def test_shared_uv_pinned_version_is_used_directly(mock_install_uv, mock_get_uv_version, mock_subprocess_check_call, tmp_path):
+
+    # given:
+
+    uv_tools_dir_abs_path = str(tmp_path / "uv_tools")
+    _create_fake_uv_venv(os.path.join(uv_tools_dir_abs_path, "uv-0.8.0.venv"))
+    os.symlink("uv-0.8.0.venv", os.path.join(uv_tools_dir_abs_path, "uv.venv"))
+    mock_install_uv.side_effect = _create_fake_uv_venv
+    mock_get_uv_version.return_value = "0.7.0"
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/mock/python",
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+        state_local_cache_dir_abs_path_inited="/tmp/cache",
+        uv_tools_dir_abs_path=uv_tools_dir_abs_path,
+        required_uv_version="0.7.0",
+    )
+
+    # when:
+
+    install_driver._ensure_uv_is_available()
+
+    # then:
+
+    mock_install_uv.assert_called_once()
+    assert install_driver.uv_exec_abs_path == os.path.join(uv_tools_dir_abs_path, "uv-0.7.0.venv", "bin", "uv")
+    assert os.path.isfile(install_driver.uv_exec_abs_path)
+    # The symlink to the unpinned version is left intact:
+    assert os.readlink(os.path.join(uv_tools_dir_abs_path, "uv.venv")) == "uv-0.8.0.venv"
+
+
+@patch(f"{primer_kernel.__name__}.get_uv_version")
+@patch(f"{primer_kernel.__name__}.VenvDriverUv._install_uv")
+def test_shared_uv_pinned_version_mismatch(mock_install_uv, mock_get_uv_version, tmp_path):
+
+    # given:
+
+    uv_tools_dir_abs_path = str(tmp_path / "uv_tools")
+    os.makedirs(uv_tools_dir_abs_path)
+    mock_install_uv.side_effect = _create_fake_uv_venv
+    mock_get_uv_version.return_value = "0.8.0"
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/mock/python",
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+        state_local_cache_dir_abs_path_inited="/tmp/cache",
+        uv_tools_dir_abs_path=uv_tools_dir_abs_path,
+        required_uv_version="0.7.0",
+    )
+
+    # when/then:
+
+    with pytest.raises(AssertionError, match=r"does not match the installed `uv` version \[0.8.0\]"):
+        install_driver._ensure_uv_is_available()
+    assert sorted(os.listdir(uv_tools_dir_abs_path)) == [
+        "uv-0.7.0.venv.lock",
+    ]
+
+
+@patch(f"{subprocess.__name__}.{subprocess.check_call.__name__}")
+@patch(f"{primer_kernel.__name__}.get_uv_version")
+@patch(f"{primer_kernel.__name__}.VenvDriverUv._install_uv")
+def test_local_uv_is_replaced_by_pinned_version(mock_install_uv, mock_get_uv_version, mock_subprocess_check_call, tmp_path):
+
+    # given:
+
+    local_cache_dir_abs_path = str(tmp_path / "cache")
+    uv_venv_abs_path = os.path.join(local_cache_dir_abs_path, "venv", "uv.venv")
+    _create_fake_uv_venv(uv_venv_abs_path)
+    mock_install_uv.side_effect = _create_fake_uv_venv
+    mock_get_uv_version.return_value = "0.8.0"
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/mock/python",
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+        state_local_cache_dir_abs_path_inited=local_cache_dir_abs_path,
+        required_uv_version="0.7.0",
+    )
+
+    # when:
+
+    install_driver._ensure_uv_is_available()
+
+    # then:
+
+    mock_install_uv.assert_called_once_with(uv_venv_abs_path)
+    assert os.path.isfile(install_driver.uv_exec_abs_path)
+
+
+@patch(f"{primer_kernel.__name__}.VenvDriverPip.install_packages")
+@patch(f"{primer_kernel.__name__}.VenvDriverPip.create_venv")
+def test_install_uv_with_pinned_version(mock_create_venv, mock_install_packages):
+
+    # given:
+
+    install_driver = VenvDriverUv(
+        required_python_version="3.10",
+        selected_python_file_abs_path="/mock/python",
+        state_local_venv_dir_abs_path_inited="/tmp/venv",
+        state_local_cache_dir_abs_path_inited="/tmp/cache",
+        required_uv_version="0.7.0",
+    )
+
+    # when:
+
+    install_driver._install_uv("/tmp/uv.venv")
+
+    # then:
+
+    mock_install_packages.assert_called_once_with(
+        "/tmp/uv.venv/bin/python",
+        [
+            "uv==0.7.0",
+        ],
+    )
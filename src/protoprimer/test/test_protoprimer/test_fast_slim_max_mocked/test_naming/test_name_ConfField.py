@@ -134,6 +134,14 @@ class FieldName(enum.Enum):
         ],
     )
 
+    field_install_mode = FieldMeta(
+        conf_field=ConfField.field_install_mode,
+        name_category=NameCategory.category_value_field,
+        name_components=[
+            ValueName.value_install_mode.value,
+        ],
+    )
+
     field_version_constraints_file_basename = FieldMeta(
         conf_field=ConfField.field_version_constraints_file_basename,
         name_category=NameCategory.category_value_field,
@@ -215,6 +223,25 @@ class FieldName(enum.Enum):
         ],
     )
 
+    field_uv_tools_dir_abs_path = FieldMeta(
+        conf_field=ConfField.field_uv_tools_dir_abs_path,
+        name_category=NameCategory.category_derived_path_field,
+        name_components=[
+            PathName.path_uv_tools.value,
+            FilesystemObject.fs_object_dir.value,
+            PathType.path_abs.value,
+        ],
+    )
+
+    field_required_uv_version = FieldMeta(
+        conf_field=ConfField.field_required_uv_version,
+        name_category=NameCategory.category_value_field,
+        name_components=[
+            PathName.path_required_uv.value,
+            ValueName.value_version.value,
+        ],
+    )
+
 
 class TestFieldName(NamingTestBase):
     prod_enum = ConfField
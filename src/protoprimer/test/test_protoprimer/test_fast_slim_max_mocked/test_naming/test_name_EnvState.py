@@ -184,6 +184,18 @@ class StateName(enum.Enum):
         ],
     )
 
+    state_input_conf_format_arg_loaded = StateMeta(
+        env_state=EnvState.state_input_conf_format_arg_loaded,
+        name_category=NameCategory.category_named_value,
+        name_components=[
+            KeyWord.key_state.value,
+            ConfLeap.leap_input.value,
+            ValueName.value_conf_format.value,
+            ValueSource.value_arg.value,
+            CompletedAction.action_loaded.value,
+        ],
+    )
+
     state_print_conf_finalized = StateMeta(
         env_state=EnvState.state_print_conf_finalized,
         name_category=NameCategory.category_name_only,
@@ -218,6 +230,18 @@ class StateName(enum.Enum):
         ],
     )
 
+    state_input_watch_conf_arg_loaded = StateMeta(
+        env_state=EnvState.state_input_watch_conf_arg_loaded,
+        name_category=NameCategory.category_named_value,
+        name_components=[
+            KeyWord.key_state.value,
+            ConfLeap.leap_input.value,
+            ValueName.value_watch_conf.value,
+            ValueSource.value_arg.value,
+            CompletedAction.action_loaded.value,
+        ],
+    )
+
     state_func_boot_env_executed = StateMeta(
         env_state=EnvState.state_func_boot_env_executed,
         name_category=NameCategory.category_state_mutation,
@@ -324,6 +348,18 @@ class StateName(enum.Enum):
         ],
     )
 
+    state_primer_conf_data_verified = StateMeta(
+        env_state=EnvState.state_primer_conf_data_verified,
+        name_category=NameCategory.category_state_mutation,
+        name_components=[
+            KeyWord.key_state.value,
+            ConfLeap.leap_primer.value,
+            KeyWord.key_conf.value,
+            KeyWord.key_data.value,
+            CompletedAction.action_verified.value,
+        ],
+    )
+
     state_ref_root_dir_abs_path_inited = StateMeta(
         env_state=EnvState.state_ref_root_dir_abs_path_inited,
         name_category=NameCategory.category_path_value,
@@ -373,6 +409,18 @@ class StateName(enum.Enum):
         ],
     )
 
+    state_client_conf_data_verified = StateMeta(
+        env_state=EnvState.state_client_conf_data_verified,
+        name_category=NameCategory.category_state_mutation,
+        name_components=[
+            KeyWord.key_state.value,
+            ConfLeap.leap_client.value,
+            KeyWord.key_conf.value,
+            KeyWord.key_data.value,
+            CompletedAction.action_verified.value,
+        ],
+    )
+
     state_local_conf_symlink_abs_path_inited = StateMeta(
         env_state=EnvState.state_local_conf_symlink_abs_path_inited,
         name_category=NameCategory.category_path_value,
@@ -422,6 +470,79 @@ class StateName(enum.Enum):
         ],
     )
 
+    state_host_conf_file_abs_path_inited = StateMeta(
+        env_state=EnvState.state_host_conf_file_abs_path_inited,
+        name_category=NameCategory.category_path_value,
+        name_components=[
+            KeyWord.key_state.value,
+            PathName.path_host_conf.value,
+            FilesystemObject.fs_object_file.value,
+            PathType.path_abs.value,
+            CompletedAction.action_inited.value,
+        ],
+    )
+
+    state_host_conf_file_data_loaded = StateMeta(
+        env_state=EnvState.state_host_conf_file_data_loaded,
+        name_category=NameCategory.category_loaded_data,
+        name_components=[
+            KeyWord.key_state.value,
+            ConfLeap.leap_host.value,
+            KeyWord.key_conf.value,
+            FilesystemObject.fs_object_file.value,
+            KeyWord.key_data.value,
+            CompletedAction.action_loaded.value,
+        ],
+    )
+
+    state_user_conf_file_abs_path_inited = StateMeta(
+        env_state=EnvState.state_user_conf_file_abs_path_inited,
+        name_category=NameCategory.category_path_value,
+        name_components=[
+            KeyWord.key_state.value,
+            PathName.path_user_conf.value,
+            FilesystemObject.fs_object_file.value,
+            PathType.path_abs.value,
+            CompletedAction.action_inited.value,
+        ],
+    )
+
+    state_user_conf_file_data_loaded = StateMeta(
+        env_state=EnvState.state_user_conf_file_data_loaded,
+        name_category=NameCategory.category_loaded_data,
+        name_components=[
+            KeyWord.key_state.value,
+            ConfLeap.leap_user.value,
+            KeyWord.key_conf.value,
+            FilesystemObject.fs_object_file.value,
+            KeyWord.key_data.value,
+            CompletedAction.action_loaded.value,
+        ],
+    )
+
+    state_conf_data_verified = StateMeta(
+        env_state=EnvState.state_conf_data_verified,
+        name_category=NameCategory.category_state_mutation,
+        name_components=[
+            KeyWord.key_state.value,
+            KeyWord.key_conf.value,
+            KeyWord.key_data.value,
+            CompletedAction.action_verified.value,
+        ],
+    )
+
+    state_merged_conf_data_loaded = StateMeta(
+        env_state=EnvState.state_merged_conf_data_loaded,
+        name_category=NameCategory.category_state_mutation,
+        name_components=[
+            KeyWord.key_state.value,
+            KeyWord.key_merged.value,
+            KeyWord.key_conf.value,
+            KeyWord.key_data.value,
+            CompletedAction.action_loaded.value,
+        ],
+    )
+
     state_required_python_version_inited = StateMeta(
         env_state=EnvState.state_required_python_version_inited,
         name_category=NameCategory.category_value_field_action,
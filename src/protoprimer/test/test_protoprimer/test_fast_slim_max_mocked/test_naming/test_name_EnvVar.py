@@ -6,6 +6,7 @@ from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer.primer_kernel import (
     ConfConstGeneral,
     EnvVar,
+    FilesystemObject,
     KeyWord,
     PathName,
     ValueName,
@@ -109,6 +110,72 @@ class EnvVarName(enum.Enum):
             ValueName.value_venv_driver.value.upper(),
         ],
     )
+    var_PROTOPRIMER_UV_TOOLS_DIR = EnvVarMeta(
+        env_var=EnvVar.var_PROTOPRIMER_UV_TOOLS_DIR,
+        name_category=NameCategory.category_name_only,
+        name_components=[
+            ConfConstGeneral.name_protoprimer_package.upper(),
+            PathName.path_uv_tools.value.upper(),
+            FilesystemObject.fs_object_dir.value.upper(),
+        ],
+    )
+    var_PROTOPRIMER_HOST_CONF = EnvVarMeta(
+        env_var=EnvVar.var_PROTOPRIMER_HOST_CONF,
+        name_category=NameCategory.category_name_only,
+        name_components=[
+            ConfConstGeneral.name_protoprimer_package.upper(),
+            PathName.path_host_conf.value.upper(),
+        ],
+    )
+    var_PROTOPRIMER_ASYNC_FILE_LOG = EnvVarMeta(
+        env_var=EnvVar.var_PROTOPRIMER_ASYNC_FILE_LOG,
+        name_category=NameCategory.category_name_only,
+        name_components=[
+            ConfConstGeneral.name_protoprimer_package.upper(),
+            KeyWord.key_async.value.upper(),
+            FilesystemObject.fs_object_file.value.upper(),
+            KeyWord.key_log.value.upper(),
+        ],
+    )
+    var_PROTOPRIMER_FILE_LOG_FORMAT = EnvVarMeta(
+        env_var=EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT,
+        name_category=NameCategory.category_name_only,
+        name_components=[
+            ConfConstGeneral.name_protoprimer_package.upper(),
+            FilesystemObject.fs_object_file.value.upper(),
+            KeyWord.key_log.value.upper(),
+            KeyWord.key_format.value.upper(),
+        ],
+    )
+    var_PROTOPRIMER_DIRECT_EXEC = EnvVarMeta(
+        env_var=EnvVar.var_PROTOPRIMER_DIRECT_EXEC,
+        name_category=NameCategory.category_name_only,
+        name_components=[
+            ConfConstGeneral.name_protoprimer_package.upper(),
+            KeyWord.key_direct.value.upper(),
+            KeyWord.key_exec.value.upper(),
+        ],
+    )
+    var_PROTOPRIMER_LAUNCH_RECORD = EnvVarMeta(
+        env_var=EnvVar.var_PROTOPRIMER_LAUNCH_RECORD,
+        name_category=NameCategory.category_name_only,
+        name_components=[
+            ConfConstGeneral.name_protoprimer_package.upper(),
+            KeyWord.key_launch.value.upper(),
+            KeyWord.key_record.value.upper(),
+        ],
+    )
+    var_PROTOPRIMER_VENV_LOCK_FD = EnvVarMeta(
+        env_var=EnvVar.var_PROTOPRIMER_VENV_LOCK_FD,
+        name_category=NameCategory.category_name_only,
+        name_components=[
+            ConfConstGeneral.name_protoprimer_package.upper(),
+            KeyWord.key_venv.value.upper(),
+            KeyWord.key_lock.value.upper(),
+            KeyWord.key_fd.value.upper(),
+        ],
+    )
+
     var_PROTOPRIMER_MOCKED_RESTART = EnvVarMeta(
         env_var=EnvVar.var_PROTOPRIMER_MOCKED_RESTART,
         name_category=NameCategory.category_name_only,
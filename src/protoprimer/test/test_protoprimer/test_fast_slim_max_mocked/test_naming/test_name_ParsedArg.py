@@ -84,6 +84,22 @@ class ArgName(enum.Enum):
         ],
     )
 
+    name_watch_conf = ArgMeta(
+        command_arg=ParsedArg.name_watch_conf,
+        name_category=NameCategory.category_named_arg_value,
+        name_components=[
+            ValueName.value_watch_conf.value,
+        ],
+    )
+
+    name_conf_format = ArgMeta(
+        command_arg=ParsedArg.name_conf_format,
+        name_category=NameCategory.category_named_arg_value,
+        name_components=[
+            ValueName.value_conf_format.value,
+        ],
+    )
+
 
 class TestParsedArgName(NamingTestBase):
     prod_enum = ParsedArg
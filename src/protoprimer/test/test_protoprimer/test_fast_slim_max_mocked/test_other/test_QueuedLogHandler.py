@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import threading
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    JsonFileLogFormatter,
+    QueuedLogHandler,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(QueuedLogHandler.__name__)
+
+
+class RecordingHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.thread_names: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.thread_names.append(threading.current_thread().name)
+
+
+class ThreadNameFilter(logging.Filter):
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.filter_thread_name = threading.current_thread().name
+        return True
+
+
+def _create_logger(log_handler: logging.Handler) -> logging.Logger:
+    test_logger = logging.getLogger(f"{__name__}.{id(log_handler)}")
+    test_logger.propagate = False
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.addHandler(log_handler)
+    return test_logger
+
+
+def test_flush_writes_all_queued_records():
+
+    # given:
+
+    target_handler = RecordingHandler()
+    queued_handler = QueuedLogHandler(target_handler)
+    test_logger = _create_logger(queued_handler)
+
+    # when:
+
+    for record_index in range(100):
+        test_logger.info("record %d", record_index)
+    queued_handler.flush()
+
+    # then:
+
+    assert [record.getMessage() for record in target_handler.records] == [f"record {record_index}" for record_index in range(100)]
+    # Records are written by the background thread:
+    assert threading.current_thread().name not in target_handler.thread_names
+
+    # when: logged after flush
+
+    test_logger.info("record after flush")
+    queued_handler.close()
+
+    # then: logged after flush
+
+    assert target_handler.records[-1].getMessage() == "record after flush"
+    test_logger.removeHandler(queued_handler)
+
+
+def test_filters_run_in_caller_thread():
+
+    # given:
+
+    target_handler = RecordingHandler()
+    queued_handler = QueuedLogHandler(target_handler)
+    queued_handler.addFilter(ThreadNameFilter())
+    test_logger = _create_logger(queued_handler)
+
+    # when:
+
+    test_logger.info("filtered record")
+    queued_handler.close()
+
+    # then:
+
+    assert target_handler.records[0].filter_thread_name == threading.current_thread().name
+    test_logger.removeHandler(queued_handler)
+
+
+def test_target_handler_level_is_respected():
+
+    # given:
+
+    target_handler = RecordingHandler()
+    target_handler.setLevel(logging.WARNING)
+    queued_handler = QueuedLogHandler(target_handler)
+    test_logger = _create_logger(queued_handler)
+
+    # when:
+
+    test_logger.info("info record")
+    test_logger.warning("warning record")
+    queued_handler.close()
+
+    # then:
+
+    assert [record.getMessage() for record in target_handler.records] == ["warning record"]
+    test_logger.removeHandler(queued_handler)
+
+
+def test_repeated_close_and_flush_are_ignored():
+
+    # given:
+
+    target_handler = RecordingHandler()
+    queued_handler = QueuedLogHandler(target_handler)
+    queued_handler.close()
+
+    # when/then (e.g. `logging.shutdown` on exit):
+
+    queued_handler.flush()
+    queued_handler.close()
+
+
+def test_json_format_keeps_exc_info_and_stack_info():
+
+    # given:
+
+    log_stream = io.StringIO()
+    target_handler = logging.StreamHandler(log_stream)
+    target_handler.setFormatter(JsonFileLogFormatter("mock_start_id"))
+    queued_handler = QueuedLogHandler(target_handler)
+    test_logger = _create_logger(queued_handler)
+
+    # when:
+
+    try:
+        raise ValueError("mock_error")
+    except ValueError:
+        test_logger.exception("failed %s", "mock_arg", stack_info=True)
+    queued_handler.close()
+
+    # then:
+
+    log_entry = json.loads(log_stream.getvalue())
+    # The traceback is not merged into the message (as it is by the default `QueueHandler.prepare`):
+    assert log_entry["message"] == "failed mock_arg"
+    assert log_entry["exc_info"].startswith("Traceback (most recent call last):")
+    assert log_entry["exc_info"].endswith("ValueError: mock_error")
+    assert log_entry["stack_info"].startswith("Stack (most recent call last):")
+    test_logger.removeHandler(queued_handler)
+
+
+def test_text_format_prints_traceback_once():
+
+    # given:
+
+    log_stream = io.StringIO()
+    target_handler = logging.StreamHandler(log_stream)
+    target_handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    queued_handler = QueuedLogHandler(target_handler)
+    test_logger = _create_logger(queued_handler)
+
+    # when:
+
+    try:
+        raise ValueError("mock_error")
+    except ValueError:
+        test_logger.exception("failed")
+    queued_handler.close()
+
+    # then:
+
+    log_text = log_stream.getvalue()
+    assert log_text.startswith("ERROR failed\nTraceback (most recent call last):")
+    assert log_text.count("ValueError: mock_error") == 1
+    test_logger.removeHandler(queued_handler)
@@ -0,0 +1,106 @@
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import ActivatedEnvDelta
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(
+        ActivatedEnvDelta.__name__,
+    )
+
+
+def test_from_env_vars_diff():
+    # given:
+    orig_env_vars = {
+        "PATH": "/usr/bin:/bin",
+        "PS1": "$ ",
+        "SHLVL": "1",
+        "VAR": "value",
+    }
+    activated_env_vars = {
+        "PATH": "/fake/venv/bin:/usr/bin:/bin",
+        "PS1": "(venv) $ ",
+        "SHLVL": "2",
+        "VIRTUAL_ENV": "/fake/venv",
+        "_": "/usr/bin/python",
+    }
+    # when:
+    activated_env_delta = ActivatedEnvDelta.from_env_vars_diff(orig_env_vars, activated_env_vars)
+    # then:
+    assert activated_env_delta.env_vars_set == {
+        "VIRTUAL_ENV": "/fake/venv",
+    }
+    assert activated_env_delta.env_vars_prepended == {
+        "PATH": "/fake/venv/bin",
+    }
+    assert activated_env_delta.env_vars_unset == [
+        "VAR",
+        "PYTHONHOME",
+    ]
+
+
+def test_apply_env_vars():
+    # given:
+    activated_env_delta = ActivatedEnvDelta.from_venv_abs_path("/fake/venv")
+    env_vars = {
+        "PATH": "/usr/bin:/bin",
+        "PYTHONHOME": "/usr",
+    }
+    # when:
+    activated_env_vars = activated_env_delta.apply_env_vars(env_vars)
+    # then:
+    assert activated_env_vars == {
+        "PATH": "/fake/venv/bin:/usr/bin:/bin",
+        "VIRTUAL_ENV": "/fake/venv",
+    }
+    # The original env vars are not modified:
+    assert env_vars == {
+        "PATH": "/usr/bin:/bin",
+        "PYTHONHOME": "/usr",
+    }
+
+
+def test_get_shell_lines():
+    # given:
+    activated_env_delta = ActivatedEnvDelta(
+        env_vars_set={"VIRTUAL_ENV": "/fake/my venv"},
+        env_vars_prepended={"PATH": "/fake/my venv/bin"},
+        env_vars_unset=["PYTHONHOME"],
+    )
+    # when:
+    shell_lines = activated_env_delta.get_shell_lines()
+    # then:
+    assert shell_lines == [
+        "unset PYTHONHOME",
+        "export PATH='/fake/my venv/bin'\"${PATH:+:$PATH}\"",
+        "export VIRTUAL_ENV='/fake/my venv'",
+    ]
+
+
+def test_get_fish_lines():
+    # given:
+    activated_env_delta = ActivatedEnvDelta(
+        env_vars_set={"VIRTUAL_ENV": "/fake/my venv"},
+        env_vars_prepended={
+            "PATH": "/fake/my venv/bin",
+            "VENV_LIST": "/fake/my venv/lib",
+        },
+        env_vars_unset=["PYTHONHOME"],
+    )
+    # when:
+    fish_lines = activated_env_delta.get_fish_lines()
+    # then:
+    assert fish_lines == [
+        "set --erase PYTHONHOME",
+        "set --global --export PATH '/fake/my venv/bin' $PATH",
+        "set --query VENV_LIST; and set --global --export VENV_LIST '/fake/my venv/lib:'$VENV_LIST; or set --global --export VENV_LIST '/fake/my venv/lib'",
+        "set --global --export VIRTUAL_ENV '/fake/my venv'",
+    ]
+
+
+def test_data_round_trip():
+    # given:
+    activated_env_delta = ActivatedEnvDelta.from_venv_abs_path("/fake/venv")
+    # when:
+    restored_env_delta = ActivatedEnvDelta.from_data(activated_env_delta.to_data())
+    # then:
+    assert restored_env_delta.to_data() == activated_env_delta.to_data()
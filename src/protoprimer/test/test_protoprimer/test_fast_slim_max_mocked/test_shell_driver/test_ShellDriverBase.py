@@ -1,9 +1,15 @@
+import os
+import subprocess
 from unittest.mock import patch
 
 import pytest
 
 from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    ActivatedEnvDelta,
+    read_json_file,
+    read_text_file,
     ShellDriverBase,
     ShellType,
 )
@@ -61,8 +67,18 @@ def test_get_venv_activate_script_abs_path():
     assert path == "/fake/venv/bin/activate"
 
 
-@patch("protoprimer.primer_kernel.write_text_file")
-def test_write_init_file(mock_write_text_file, fs):
+expected_init_file_data = """
+# Load user settings if available:
+test -f ~/.bashrc && . ~/.bashrc || true
+# Activate `venv` (see `ActivatedEnvDelta`):
+unset PYTHONHOME
+export PATH=/fake/venv/bin"${PATH:+:$PATH}"
+export VIRTUAL_ENV=/fake/venv
+[ -z "${VIRTUAL_ENV_DISABLE_PROMPT:-}" ] && PS1='(venv) '"${PS1:-}" || true
+"""
+
+
+def test_write_init_file(fs):
     # given:
     fs.create_dir("/fake/cache")
     driver = ShellDriverConcrete(
@@ -71,20 +87,43 @@ def test_write_init_file(mock_write_text_file, fs):
         cache_dir_abs_path="/fake/cache",
     )
     # when:
-    driver.write_init_file("/fake/venv")
+    is_written = driver.write_init_file("/fake/venv")
     # then:
-    mock_write_text_file.assert_called_once_with(
-        "/fake/cache/bash/.bashrc",
-        """
-# Load user settings if available:
-test -f ~/.bashrc && source ~/.bashrc || true
-# Activate `venv`:
-if [ "true" = "true" ]
-then
-    source /fake/venv/bin/activate
-fi
-""",
+    assert is_written
+    assert read_text_file("/fake/cache/bash/.bashrc") == expected_init_file_data
+    # No temporary file is left (and no `ActivatedEnvDelta` is captured without `pyvenv.cfg`):
+    assert os.listdir("/fake/cache/bash") == [".bashrc"]
+
+
+def test_write_init_file_reuses_unchanged_file(fs):
+    # given:
+    fs.create_file("/fake/cache/bash/.bashrc", contents=expected_init_file_data)
+    driver = ShellDriverConcrete(
+        shell_abs_path="/bin/bash",
+        shell_env_vars={},
+        cache_dir_abs_path="/fake/cache",
+    )
+    # when:
+    with patch(f"{primer_kernel.__name__}.write_text_file_atomically") as mock_write_text_file_atomically:
+        is_written = driver.write_init_file("/fake/venv")
+    # then:
+    assert not is_written
+    mock_write_text_file_atomically.assert_not_called()
+
+
+def test_write_init_file_replaces_changed_file(fs):
+    # given:
+    fs.create_file("/fake/cache/bash/.bashrc", contents=expected_init_file_data.replace("/fake/venv", "/fake/old_venv"))
+    driver = ShellDriverConcrete(
+        shell_abs_path="/bin/bash",
+        shell_env_vars={},
+        cache_dir_abs_path="/fake/cache",
     )
+    # when:
+    is_written = driver.write_init_file("/fake/venv")
+    # then:
+    assert is_written
+    assert read_text_file("/fake/cache/bash/.bashrc") == expected_init_file_data
 
 
 @patch("os.execve")
@@ -109,6 +148,155 @@ def test_run_shell(mock_configure, mock_write, mock_execve):
     )
 
 
+@pytest.mark.parametrize(
+    "shell_env_vars, activate_venv, expected_env_vars",
+    [
+        (
+            {"VAR": "value", "PATH": "/usr/bin:/bin", "PYTHONHOME": "/usr"},
+            True,
+            {"VAR": "value", "PATH": "/fake/venv/bin:/usr/bin:/bin", "VIRTUAL_ENV": "/fake/venv"},
+        ),
+        (
+            {"VAR": "value"},
+            True,
+            {"VAR": "value", "PATH": "/fake/venv/bin", "VIRTUAL_ENV": "/fake/venv"},
+        ),
+        (
+            {"VAR": "value", "PATH": "/usr/bin:/bin", "PYTHONHOME": "/usr"},
+            False,
+            {"VAR": "value", "PATH": "/usr/bin:/bin", "PYTHONHOME": "/usr"},
+        ),
+    ],
+)
+def test_get_activated_env_vars(shell_env_vars, activate_venv, expected_env_vars):
+    # given:
+    driver = ShellDriverConcrete(
+        shell_abs_path="/bin/bash",
+        shell_env_vars=shell_env_vars,
+        cache_dir_abs_path="/fake/cache",
+        activate_venv=activate_venv,
+    )
+    # when:
+    activated_env_vars = driver.get_activated_env_vars("/fake/venv")
+    # then:
+    assert activated_env_vars == expected_env_vars
+    # The shell env vars are not modified:
+    assert activated_env_vars is not shell_env_vars
+
+
+def _create_fake_venv(venv_abs_path) -> None:
+    """
+    Creates `venv` with a minimal `activate` script (enough to capture its env vars).
+    """
+    os.makedirs(os.path.join(venv_abs_path, "bin"))
+    with open(os.path.join(venv_abs_path, "pyvenv.cfg"), "w") as venv_config_file:
+        venv_config_file.write("home = /usr/bin\n")
+    with open(os.path.join(venv_abs_path, "bin", "activate"), "w") as activate_file:
+        activate_file.write(
+            f"""
+unset PYTHONHOME
+VIRTUAL_ENV={venv_abs_path}
+export VIRTUAL_ENV
+PATH="$VIRTUAL_ENV/bin:$PATH"
+export PATH
+VENV_EXTRA=extra_value
+export VENV_EXTRA
+"""
+        )
+
+
+def test_get_activated_env_delta_is_captured_once(tmp_path):
+    # given:
+    venv_abs_path = str(tmp_path / "venv")
+    _create_fake_venv(venv_abs_path)
+    driver = ShellDriverConcrete(
+        shell_abs_path="/bin/bash",
+        shell_env_vars={"PATH": os.environ["PATH"], "PYTHONHOME": "/usr"},
+        cache_dir_abs_path=str(tmp_path / "cache"),
+    )
+
+    # when:
+    with patch(f"{primer_kernel.__name__}.subprocess.run", wraps=subprocess.run) as mock_run:
+        activated_env_vars = driver.get_activated_env_vars(venv_abs_path)
+        driver.get_activated_env_vars(venv_abs_path)
+
+    # then:
+    assert mock_run.call_count == 1
+    assert activated_env_vars == {
+        "PATH": f"{venv_abs_path}/bin:{os.environ['PATH']}",
+        "VIRTUAL_ENV": venv_abs_path,
+        "VENV_EXTRA": "extra_value",
+    }
+    activated_env_data = read_json_file(driver.get_activated_env_file_abs_path())
+    assert activated_env_data["venv_abs_path"] == venv_abs_path
+    assert activated_env_data["env_vars_prepended"] == {"PATH": f"{venv_abs_path}/bin"}
+
+
+def test_get_activated_env_delta_is_recaptured_on_venv_change(tmp_path):
+    # given:
+    venv_abs_path = str(tmp_path / "venv")
+    _create_fake_venv(venv_abs_path)
+    driver = ShellDriverConcrete(
+        shell_abs_path="/bin/bash",
+        shell_env_vars={"PATH": os.environ["PATH"]},
+        cache_dir_abs_path=str(tmp_path / "cache"),
+    )
+    driver.get_activated_env_delta(venv_abs_path)
+    # Re-created `venv` (e.g. by `--reinstall`):
+    venv_config_stat = os.stat(os.path.join(venv_abs_path, "pyvenv.cfg"))
+    os.utime(
+        os.path.join(venv_abs_path, "pyvenv.cfg"),
+        ns=(venv_config_stat.st_atime_ns, venv_config_stat.st_mtime_ns + 1_000_000_000),
+    )
+
+    # when:
+    with patch(f"{primer_kernel.__name__}.subprocess.run", wraps=subprocess.run) as mock_run:
+        driver.get_activated_env_delta(venv_abs_path)
+
+    # then:
+    assert mock_run.call_count == 1
+
+
+def test_get_activated_env_delta_without_venv_config(tmp_path):
+    # given:
+    driver = ShellDriverConcrete(
+        shell_abs_path="/bin/bash",
+        shell_env_vars={},
+        cache_dir_abs_path=str(tmp_path / "cache"),
+    )
+
+    # when:
+    with patch(f"{primer_kernel.__name__}.subprocess.run") as mock_run:
+        activated_env_delta = driver.get_activated_env_delta(str(tmp_path / "venv"))
+
+    # then:
+    mock_run.assert_not_called()
+    assert activated_env_delta.to_data() == ActivatedEnvDelta.from_venv_abs_path(str(tmp_path / "venv")).to_data()
+    assert not os.path.exists(driver.get_activated_env_file_abs_path())
+
+
+@patch("os.execve")
+@patch.object(ShellDriverConcrete, "write_init_file")
+@patch.object(ShellDriverConcrete, "configure_interactive_shell")
+def test_exec_command(mock_configure, mock_write, mock_execve):
+    # given:
+    driver = ShellDriverConcrete(
+        shell_abs_path="/bin/bash",
+        shell_env_vars={"VAR": "value"},
+        cache_dir_abs_path="/fake/cache",
+    )
+    # when:
+    driver.exec_command("echo hello", "/fake/venv")
+    # then:
+    mock_write.assert_not_called()
+    mock_configure.assert_not_called()
+    mock_execve.assert_called_once_with(
+        "/bin/bash",
+        ["/bin/bash", "-c", "echo hello"],
+        {"VAR": "value", "PATH": "/fake/venv/bin", "VIRTUAL_ENV": "/fake/venv"},
+    )
+
+
 def test_get_type_raises_not_implemented_error():
     # given:
     driver = ShellDriverConcrete(
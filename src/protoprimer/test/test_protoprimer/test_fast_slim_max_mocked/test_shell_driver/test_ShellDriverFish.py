@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ActivatedEnvDelta,
+    ShellDriverFish,
+    ShellType,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(
+        ShellDriverFish.__name__,
+    )
+
+
+def _create_driver() -> ShellDriverFish:
+    return ShellDriverFish(
+        shell_abs_path="/usr/bin/fish",
+        shell_env_vars={},
+        cache_dir_abs_path="/fake/cache",
+    )
+
+
+def test_get_type():
+    # given:
+    driver = _create_driver()
+    # when:
+    shell_type = driver.get_type()
+    # then:
+    assert shell_type == ShellType.shell_fish
+
+
+def test_get_venv_activate_script_abs_path():
+    # given:
+    driver = _create_driver()
+    # when:
+    path = driver.get_venv_activate_script_abs_path("/fake/venv")
+    # then:
+    assert path == "/fake/venv/bin/activate.fish"
+
+
+def test_configure_interactive_shell():
+    # given:
+    driver = _create_driver()
+    # when:
+    driver.configure_interactive_shell(True)
+    # then:
+    assert driver.shell_env_vars == {}
+    assert driver.shell_args == ["/usr/bin/fish", "--init-command", "source '/fake/cache/fish/config.fish'"]
+
+
+def test_get_init_file_data():
+    # given:
+    driver = _create_driver()
+    # when:
+    with patch.object(ShellDriverFish, "get_activated_env_delta", return_value=ActivatedEnvDelta.from_venv_abs_path("/fake/venv")):
+        init_file_data = driver.get_init_file_data("/fake/venv")
+    # then:
+    assert init_file_data.splitlines()[2:6] == [
+        "# Activate `venv` (see `ActivatedEnvDelta`):",
+        "set --erase PYTHONHOME",
+        "set --global --export PATH '/fake/venv/bin' $PATH",
+        "set --global --export VIRTUAL_ENV '/fake/venv'",
+    ]
+    assert "    function fish_prompt; printf '%s' '(venv) '; _protoprimer_orig_fish_prompt; end" in init_file_data
+
+
+def test_get_capture_command_line():
+    # given:
+    driver = _create_driver()
+    # when:
+    command_line = driver.get_capture_command_line("dump_env", "/fake/venv/bin/activate.fish")
+    # then:
+    assert command_line == "dump_env; source '/fake/venv/bin/activate.fish'; dump_env"
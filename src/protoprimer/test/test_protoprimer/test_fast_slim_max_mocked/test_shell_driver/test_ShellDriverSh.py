@@ -0,0 +1,64 @@
+import os
+import subprocess
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    ShellDriverSh,
+    ShellType,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(
+        ShellDriverSh.__name__,
+    )
+
+
+def test_get_type():
+    # given:
+    driver = ShellDriverSh(
+        shell_abs_path="/bin/sh",
+        shell_env_vars={},
+        cache_dir_abs_path="/fake/cache",
+    )
+    # when:
+    shell_type = driver.get_type()
+    # then:
+    assert shell_type == ShellType.shell_sh
+
+
+def test_configure_interactive_shell():
+    # given:
+    driver = ShellDriverSh(
+        shell_abs_path="/bin/sh",
+        shell_env_vars={},
+        cache_dir_abs_path="/fake/cache",
+    )
+    # when:
+    driver.configure_interactive_shell(True)
+    # then:
+    assert driver.shell_env_vars == {"ENV": "/fake/cache/sh/.shrc"}
+    assert driver.shell_args == ["/bin/sh"]
+
+
+def test_init_file_activates_venv(tmp_path):
+    # given:
+    venv_abs_path = str(tmp_path / "venv")
+    driver = ShellDriverSh(
+        shell_abs_path="/bin/sh",
+        shell_env_vars={"PATH": os.environ["PATH"], "HOME": str(tmp_path)},
+        cache_dir_abs_path=str(tmp_path / "cache"),
+    )
+    driver.write_init_file(venv_abs_path)
+    driver.configure_interactive_shell(True)
+    # when:
+    sub_proc = subprocess.run(
+        driver.shell_args + ["-i", "-c", 'echo "$VIRTUAL_ENV:$PATH"'],
+        env=driver.shell_env_vars,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    # then:
+    assert sub_proc.stdout.decode("utf-8").strip() == f"{venv_abs_path}:{venv_abs_path}/bin:{os.environ['PATH']}"
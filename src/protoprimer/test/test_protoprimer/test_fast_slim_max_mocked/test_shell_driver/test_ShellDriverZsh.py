@@ -7,6 +7,7 @@ from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer.primer_kernel import (
     _get_shell_driver,
     ShellDriverBash,
+    ShellDriverSh,
     ShellDriverZsh,
     ShellType,
 )
@@ -117,19 +118,22 @@ def test_get_shell_driver_no_shell_env_no_bash(mock_warning, mock_which):
     # given:
     mock_which.return_value = None
 
-    # when/then:
-    with pytest.raises(AssertionError):
-        _get_shell_driver("/fake/cache")
+    # when:
+    driver = _get_shell_driver("/fake/cache")
+
+    # then:
     mock_warning.assert_called_once_with("env var `SHELL` is not set - assuming `bash` as default")
+    assert isinstance(driver, ShellDriverSh)
+    assert driver.shell_abs_path == "/bin/sh"
 
 
 def test_get_shell_driver_unknown_shell():
     # given:
-    with patch.dict(os.environ, {"SHELL": "/bin/fish"}, clear=True):
+    with patch.dict(os.environ, {"SHELL": "/bin/tcsh"}, clear=True):
         # when/then:
         with pytest.raises(ValueError) as excinfo:
             _get_shell_driver("/fake/cache")
-        assert "env var `SHELL` has unknown value [/bin/fish]" in str(excinfo.value)
+        assert "env var `SHELL` has unknown value [/bin/tcsh]" in str(excinfo.value)
 
 
 def test_get_shell_driver_zsh():
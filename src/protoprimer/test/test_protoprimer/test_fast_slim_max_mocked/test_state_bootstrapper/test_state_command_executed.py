@@ -15,6 +15,7 @@ from protoprimer.primer_kernel import (
     Bootstrapper_state_stride_src_updated_reached,
     EnvContext,
     EnvState,
+    EnvVar,
     StateStride,
 )
 
@@ -285,3 +286,61 @@ def test_command_executed_with_whitespace(
             "SHELL": "/bin/bash",
         },
     )
+
+
+@patch(f"{primer_kernel.__name__}.{EnvContext.__name__}.{EnvContext.get_stride.__name__}")
+@patch(f"{primer_kernel.__name__}.os.execve")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_stride_src_updated_reached.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_command_line.__name__}.create_state_node")
+@patch.dict(
+    os.environ,
+    {
+        "SHELL": "/bin/zsh",
+        "PATH": "/usr/bin",
+        "PYTHONHOME": "/usr",
+        EnvVar.var_PROTOPRIMER_DIRECT_EXEC.value: str(True),
+    },
+    clear=True,
+)
+def test_command_executed_directly(
+    mock_state_input_command_line,
+    mock_state_local_cache_dir_abs_path_inited,
+    mock_state_local_venv_dir_abs_path_inited,
+    mock_state_stride_src_updated_reached,
+    mock_os_execve,
+    mock_get_stride,
+    env_ctx,
+    fs,
+):
+    # given:
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_command_executed.name,
+    )
+    mock_state_input_command_line.return_value.eval_own_state.return_value = "echo hello"
+    mock_get_stride.return_value = StateStride.stride_src_updated
+    mock_state_stride_src_updated_reached.return_value.eval_own_state.return_value = StateStride.stride_src_updated
+    mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/fake/venv"
+    mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/fake/cache"
+
+    # when:
+    env_ctx.eval_state(EnvState.state_command_executed.name)
+
+    # then:
+    # No interactive shell (`-i`), no `ZDOTDIR`, and no init file:
+    mock_os_execve.assert_called_once_with(
+        "/bin/zsh",
+        [
+            "/bin/zsh",
+            "-c",
+            "echo hello",
+        ],
+        {
+            "SHELL": "/bin/zsh",
+            "PATH": "/fake/venv/bin:/usr/bin",
+            "VIRTUAL_ENV": "/fake/venv",
+        },
+    )
+    assert not fs.exists("/fake/cache/zsh/.zshrc")
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+import pytest
+
+from local_test.mock_verifier import (
+    assert_parent_factories_mocked,
+)
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    Bootstrapper_state_client_conf_data_verified,
+    Bootstrapper_state_env_conf_file_data_loaded,
+    Bootstrapper_state_host_conf_file_data_loaded,
+    Bootstrapper_state_primer_conf_data_verified,
+    Bootstrapper_state_user_conf_file_data_loaded,
+    ConfField,
+    EnvContext,
+    EnvState,
+)
+
+
+@pytest.fixture
+def env_ctx():
+    return EnvContext()
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(EnvState.state_conf_data_verified.name)
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_env_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_data_verified.__name__}.create_state_node")
+def test_all_conf_leaps_are_verified(
+    mock_state_primer_conf_data_verified,
+    mock_state_client_conf_data_verified,
+    mock_state_env_conf_file_data_loaded,
+    mock_state_host_conf_file_data_loaded,
+    mock_state_user_conf_file_data_loaded,
+    env_ctx,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_conf_data_verified.name,
+    )
+
+    mock_state_env_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_install_specs.value: {},
+    }
+    mock_state_host_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+    mock_state_user_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+
+    # when/then:
+
+    with pytest.raises(AssertionError, match=f"Field `leap_env.{ConfField.field_install_specs.value}` must be a `list`"):
+        env_ctx.eval_state(EnvState.state_conf_data_verified.name)
+
+    # The `ConfLeap.leap_primer` and `ConfLeap.leap_client` data are verified by the parents:
+    mock_state_primer_conf_data_verified.return_value.eval_own_state.assert_called_once()
+    mock_state_client_conf_data_verified.return_value.eval_own_state.assert_called_once()
@@ -14,6 +14,9 @@ from protoprimer.primer_kernel import (
     EnvContext,
     EnvState,
     _PrimerFileLogFormatter,
+    EnvVar,
+    JsonFileLogFormatter,
+    LogFormat,
     StateStrideFilter,
 )
 
@@ -73,6 +76,36 @@ class ThisTestClass(BasePyfakefsTestClass):
         self.assertTrue(any(isinstance(f, StateStrideFilter) for f in file_handler.filters))
         self.assertIn(file_handler, logging.getLogger().handlers)
 
+    @patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_FILE_LOG_FORMAT.value: LogFormat.log_format_json.value})
+    @patch("sys.argv", ["/path/to/script.py"])
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_start_id_var_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_log_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_stderr_log_level_handler_configured.__name__}.create_state_node")
+    def test_json_file_log_format(
+        self,
+        mock_state_input_stderr_log_level_handler_configured,
+        mock_state_local_log_dir_abs_path_inited,
+        mock_state_input_start_id_var_loaded,
+    ):
+        # given:
+        assert_parent_factories_mocked(
+            self.env_ctx,
+            EnvState.state_default_file_log_handler_configured.name,
+        )
+        mock_state_input_start_id_var_loaded.return_value.eval_own_state.return_value = self.mock_start_id
+        mock_state_local_log_dir_abs_path_inited.return_value.eval_own_state.return_value = self.mock_log_dir
+        mock_stderr_handler = logging.StreamHandler()
+        mock_stderr_handler.setLevel(logging.INFO)
+        mock_state_input_stderr_log_level_handler_configured.return_value.eval_own_state.return_value = mock_stderr_handler
+        self.fs.create_dir(self.mock_log_dir)
+
+        # when:
+        file_handler = self.env_ctx.eval_state(EnvState.state_default_file_log_handler_configured.name)
+
+        # then:
+        self.assertIsInstance(file_handler.formatter, JsonFileLogFormatter)
+        self.assertEqual(file_handler.formatter.start_id, self.mock_start_id)
+
     @patch("sys.argv", ["/path/to/script.py"])
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_start_id_var_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_log_dir_abs_path_inited.__name__}.create_state_node")
@@ -0,0 +1,151 @@
+import json
+from unittest.mock import (
+    patch,
+)
+
+import pytest
+
+from local_test.mock_verifier import (
+    assert_parent_factories_mocked,
+)
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    Bootstrapper_state_client_conf_file_data_loaded,
+    Bootstrapper_state_derived_conf_data_loaded,
+    Bootstrapper_state_env_conf_file_data_loaded,
+    Bootstrapper_state_global_conf_file_abs_path_inited,
+    Bootstrapper_state_host_conf_file_abs_path_inited,
+    Bootstrapper_state_host_conf_file_data_loaded,
+    Bootstrapper_state_local_conf_file_abs_path_inited,
+    Bootstrapper_state_merged_conf_data_loaded,
+    Bootstrapper_state_primer_conf_file_abs_path_inited,
+    Bootstrapper_state_primer_conf_file_data_loaded,
+    Bootstrapper_state_user_conf_file_abs_path_inited,
+    Bootstrapper_state_user_conf_file_data_loaded,
+    ConfConstGeneral,
+    ConfField,
+    ConfLeap,
+    ContextBuilder,
+    EffectiveConfigFormat,
+    EntryFunc,
+    EnvState,
+    Factory_state_input_conf_format_arg_loaded,
+    Factory_state_input_sub_command_arg_loaded,
+    Factory_state_proto_code_file_abs_path_inited,
+    FieldProvenance,
+    MergedConfData,
+    StateStride,
+    SubCommand,
+)
+
+
+@pytest.fixture
+def env_ctx():
+    return (
+        ContextBuilder()
+        #
+        .entry_func(EntryFunc.func_boot_env)
+        #
+        .is_app(True)
+        #
+        .build_context()
+    )
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(EnvState.state_effective_conf_data_printed.name)
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_derived_conf_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_env_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_global_conf_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_conf_format_arg_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+def test_json_format(
+    mock_state_input_sub_command_arg_loaded,
+    mock_state_input_conf_format_arg_loaded,
+    mock_state_proto_code_file_abs_path_inited,
+    mock_state_primer_conf_file_abs_path_inited,
+    mock_state_primer_conf_file_data_loaded,
+    mock_state_global_conf_file_abs_path_inited,
+    mock_state_client_conf_file_data_loaded,
+    mock_state_local_conf_file_abs_path_inited,
+    mock_state_env_conf_file_data_loaded,
+    mock_state_host_conf_file_abs_path_inited,
+    mock_state_host_conf_file_data_loaded,
+    mock_state_user_conf_file_abs_path_inited,
+    mock_state_user_conf_file_data_loaded,
+    mock_state_merged_conf_data_loaded,
+    mock_state_derived_conf_data_loaded,
+    env_ctx,
+    tmp_path,
+    capsys,
+):
+
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_effective_conf_data_printed.name,
+    )
+    env_ctx._state_stride = StateStride.stride_py_arbitrary
+    mock_state_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_eval
+    mock_state_input_conf_format_arg_loaded.return_value.eval_own_state.return_value = EffectiveConfigFormat.format_json
+    mock_state_proto_code_file_abs_path_inited.return_value.eval_own_state.return_value = str(tmp_path / "proto_kernel.py")
+    mock_state_primer_conf_file_abs_path_inited.return_value.eval_own_state.return_value = str(tmp_path / "primer.json")
+    mock_state_primer_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+    mock_state_global_conf_file_abs_path_inited.return_value.eval_own_state.return_value = str(tmp_path / "global.json")
+    mock_state_client_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_install_specs.value: [],
+    }
+    mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = str(tmp_path / "local.json")
+    mock_state_env_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+    # No host conf file is configured:
+    mock_state_host_conf_file_abs_path_inited.return_value.eval_own_state.return_value = None
+    mock_state_host_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+    mock_state_user_conf_file_abs_path_inited.return_value.eval_own_state.return_value = str(tmp_path / "user.json")
+    mock_state_user_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (
+                ConfLeap.leap_client,
+                {
+                    ConfField.field_install_specs.value: [],
+                },
+            ),
+        ]
+    )
+    mock_state_derived_conf_data_loaded.return_value.eval_own_state.return_value = {}
+
+    # when:
+
+    state_value = env_ctx.eval_state(EnvState.state_effective_conf_data_printed.name)
+
+    # then:
+
+    assert state_value == 0
+    effective_conf_document = json.loads(capsys.readouterr().out)
+    assert effective_conf_document["schema_version"] == ConfConstGeneral.effective_conf_schema_version
+    assert list(effective_conf_document["conf_leaps"].keys()) == [
+        ConfLeap.leap_input.name,
+        ConfLeap.leap_primer.name,
+        ConfLeap.leap_client.name,
+        ConfLeap.leap_env.name,
+        ConfLeap.leap_host.name,
+        ConfLeap.leap_user.name,
+        ConfLeap.leap_derived.name,
+    ]
+    assert effective_conf_document["conf_leaps"][ConfLeap.leap_client.name]["conf_file_abs_path"] == str(tmp_path / "global.json")
+    assert effective_conf_document["conf_leaps"][ConfLeap.leap_host.name]["conf_file_abs_path"] is None
+    assert [field_record["field_provenance"] for field_record in effective_conf_document["fields"] if field_record["conf_leap"] == ConfLeap.leap_client.name and field_record["field_name"] == ConfField.field_install_specs.value] == [FieldProvenance.provenance_set.name]
@@ -11,7 +11,9 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    ConfWatchReporter,
     Factory_state_input_final_state_eval_finalized,
+    Factory_state_input_watch_conf_arg_loaded,
     Factory_state_input_sub_command_arg_loaded,
     Bootstrapper_state_input_stderr_log_level_handler_configured,
     ContextBuilder,
@@ -38,6 +40,7 @@ def test_relationship():
     assert_test_module_name_embeds_str(EnvState.state_func_boot_env_executed.name)
 
 
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_watch_conf_arg_loaded.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_final_state_eval_finalized.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_stderr_log_level_handler_configured.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
@@ -45,6 +48,7 @@ def test_sub_command_boot(
     mock_state_input_sub_command_arg_loaded,
     mock_state_input_stderr_log_level_handler_configured,
     mock_state_input_final_state_eval_finalized,
+    mock_state_input_watch_conf_arg_loaded,
     env_ctx,
 ):
     # given:
@@ -70,6 +74,7 @@ def test_sub_command_boot(
     assert exc_info.value.code == 0
 
 
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_watch_conf_arg_loaded.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_final_state_eval_finalized.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_stderr_log_level_handler_configured.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
@@ -77,6 +82,7 @@ def test_sub_command_none(
     mock_state_input_sub_command_arg_loaded,
     mock_state_input_stderr_log_level_handler_configured,
     mock_state_input_final_state_eval_finalized,
+    mock_state_input_watch_conf_arg_loaded,
     env_ctx,
 ):
     # given:
@@ -97,6 +103,7 @@ def test_sub_command_none(
         env_ctx.eval_state(EnvState.state_func_boot_env_executed.name)
 
 
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_watch_conf_arg_loaded.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_final_state_eval_finalized.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_stderr_log_level_handler_configured.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
@@ -104,6 +111,7 @@ def test_sub_command_invalid(
     mock_state_input_sub_command_arg_loaded,
     mock_state_input_stderr_log_level_handler_configured,
     mock_state_input_final_state_eval_finalized,
+    mock_state_input_watch_conf_arg_loaded,
     env_ctx,
 ):
     # given:
@@ -122,3 +130,56 @@ def test_sub_command_invalid(
     # when/then:
     with pytest.raises(ValueError, match="cannot handle sub command"):
         env_ctx.eval_state(EnvState.state_func_boot_env_executed.name)
+
+
+@pytest.mark.parametrize(
+    "is_watch_conf, watch_execute_strategy_call_count",
+    [
+        (False, 0),
+        (True, 1),
+    ],
+)
+@patch(f"{primer_kernel.__name__}.{ConfWatchReporter.__name__}.execute_strategy")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_watch_conf_arg_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_final_state_eval_finalized.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_stderr_log_level_handler_configured.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+def test_sub_command_eval(
+    mock_state_input_sub_command_arg_loaded,
+    mock_state_input_stderr_log_level_handler_configured,
+    mock_state_input_final_state_eval_finalized,
+    mock_state_input_watch_conf_arg_loaded,
+    mock_watch_execute_strategy,
+    env_ctx,
+    is_watch_conf,
+    watch_execute_strategy_call_count,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_func_boot_env_executed.name,
+    )
+
+    mock_state_input_watch_conf_arg_loaded.return_value.eval_own_state.return_value = is_watch_conf
+    mock_state_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_eval
+    mock_state_input_final_state_eval_finalized.return_value.eval_own_state.return_value = "mock_final_state"
+
+    env_ctx._state_graph.state_nodes["mock_final_state"] = MagicMock()
+    mock_state_node = MagicMock()
+    mock_state_node.state_name = EnvState.state_effective_conf_data_printed.name
+    mock_state_node.eval_own_state.return_value = 0
+    env_ctx._state_graph.state_nodes[EnvState.state_effective_conf_data_printed.name] = mock_state_node
+
+    # when:
+
+    if is_watch_conf:
+        env_ctx.eval_state(EnvState.state_func_boot_env_executed.name)
+    else:
+        with pytest.raises(SystemExit) as exc_info:
+            env_ctx.eval_state(EnvState.state_func_boot_env_executed.name)
+        assert exc_info.value.code == 0
+
+    # then:
+
+    assert mock_watch_execute_strategy.call_count == watch_execute_strategy_call_count
@@ -10,6 +10,7 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_client_conf_data_verified,
     Bootstrapper_state_client_conf_file_data_loaded,
     Bootstrapper_state_ref_root_dir_abs_path_inited,
     Factory_state_selected_env_dir_rel_path_inited,
@@ -34,6 +35,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     def test_relationship(self):
         assert_test_module_name_embeds_str(EnvState.state_local_conf_symlink_abs_path_inited.name)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -42,6 +44,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
 
         # given:
@@ -95,6 +98,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         # no exception happens
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -103,6 +107,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
 
         # given:
@@ -149,6 +154,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         # no exception happens
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -157,6 +163,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
 
         # given:
@@ -205,6 +212,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         self.assertIn("not the same as the provided target", str(ctx.exception))
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -213,6 +221,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
 
         # given:
@@ -260,6 +269,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         self.assertIn("is not a directory", str(ctx.exception))
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -268,6 +278,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
 
         # given:
@@ -315,6 +326,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         self.assertIn("is not a symlink", str(ctx.exception))
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -323,6 +335,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
 
         # given:
@@ -370,6 +383,7 @@ class ThisTestClass(BasePyfakefsTestClass):
             target_dst_dir_path,
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -378,6 +392,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
 
         # given:
@@ -425,6 +440,7 @@ class ThisTestClass(BasePyfakefsTestClass):
             target_dst_dir_path_normalized,
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_selected_env_dir_rel_path_inited.__name__}.create_state_node")
@@ -433,6 +449,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_env_dir_rel_path_inited,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_client_conf_file_data_loaded,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -0,0 +1,171 @@
+from unittest.mock import patch
+
+import pytest
+
+from local_test.mock_verifier import (
+    assert_parent_factories_mocked,
+)
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    Bootstrapper_state_client_conf_file_data_loaded,
+    Bootstrapper_state_conf_data_verified,
+    Bootstrapper_state_env_conf_file_data_loaded,
+    Bootstrapper_state_host_conf_file_data_loaded,
+    Bootstrapper_state_user_conf_file_data_loaded,
+    ConfField,
+    ConfLeap,
+    EnvContext,
+    EnvState,
+    MergedConfData,
+)
+
+
+@pytest.fixture
+def env_ctx():
+    return EnvContext()
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(EnvState.state_merged_conf_data_loaded.name)
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_conf_data_verified.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_env_conf_file_data_loaded.__name__}.create_state_node")
+def test_env_overrides_client(
+    mock_state_env_conf_file_data_loaded,
+    mock_state_client_conf_file_data_loaded,
+    mock_state_host_conf_file_data_loaded,
+    mock_state_user_conf_file_data_loaded,
+    mock_state_conf_data_verified,
+    env_ctx,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_merged_conf_data_loaded.name,
+    )
+
+    mock_state_client_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_local_venv_dir_rel_path.value: "venv.client",
+        ConfField.field_local_log_dir_rel_path.value: "log.client",
+    }
+    mock_state_env_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_local_venv_dir_rel_path.value: "venv.env",
+    }
+    mock_state_host_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+    mock_state_user_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+
+    # when:
+
+    state_value: MergedConfData = env_ctx.eval_state(EnvState.state_merged_conf_data_loaded.name)
+
+    # then:
+
+    assert state_value.get_value_or_default(ConfField.field_local_venv_dir_rel_path.value, "venv") == "venv.env"
+    assert state_value.get_conf_leap(ConfField.field_local_venv_dir_rel_path.value) == ConfLeap.leap_env
+
+    assert state_value.get_value_or_default(ConfField.field_local_log_dir_rel_path.value, "log") == "log.client"
+    assert state_value.get_conf_leap(ConfField.field_local_log_dir_rel_path.value) == ConfLeap.leap_client
+
+    assert state_value.get_value_or_default(ConfField.field_local_tmp_dir_rel_path.value, "tmp") == "tmp"
+    assert state_value.get_conf_leap(ConfField.field_local_tmp_dir_rel_path.value) is None
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_conf_data_verified.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_env_conf_file_data_loaded.__name__}.create_state_node")
+def test_user_overrides_host_overrides_env(
+    mock_state_env_conf_file_data_loaded,
+    mock_state_client_conf_file_data_loaded,
+    mock_state_host_conf_file_data_loaded,
+    mock_state_user_conf_file_data_loaded,
+    mock_state_conf_data_verified,
+    env_ctx,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_merged_conf_data_loaded.name,
+    )
+
+    mock_state_client_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_local_cache_dir_rel_path.value: "cache.client",
+    }
+    mock_state_env_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_local_venv_dir_rel_path.value: "venv.env",
+        ConfField.field_local_cache_dir_rel_path.value: "cache.env",
+    }
+    mock_state_host_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_local_tmp_dir_rel_path.value: "tmp.host",
+        ConfField.field_local_cache_dir_rel_path.value: "cache.shared",
+    }
+    mock_state_user_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_local_tmp_dir_rel_path.value: "tmp.user",
+    }
+
+    # when:
+
+    state_value: MergedConfData = env_ctx.eval_state(EnvState.state_merged_conf_data_loaded.name)
+
+    # then:
+
+    assert state_value.get_value_or_default(ConfField.field_local_tmp_dir_rel_path.value, "tmp") == "tmp.user"
+    assert state_value.get_conf_leap(ConfField.field_local_tmp_dir_rel_path.value) == ConfLeap.leap_user
+
+    assert state_value.get_value_or_default(ConfField.field_local_venv_dir_rel_path.value, "venv") == "venv.env"
+    assert state_value.get_conf_leap(ConfField.field_local_venv_dir_rel_path.value) == ConfLeap.leap_env
+
+    assert state_value.get_value_or_default(ConfField.field_local_cache_dir_rel_path.value, "cache") == "cache.shared"
+    assert state_value.get_conf_leap(ConfField.field_local_cache_dir_rel_path.value) == ConfLeap.leap_host
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_conf_data_verified.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_user_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_host_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_env_conf_file_data_loaded.__name__}.create_state_node")
+def test_unused_field_does_not_override(
+    mock_state_env_conf_file_data_loaded,
+    mock_state_client_conf_file_data_loaded,
+    mock_state_host_conf_file_data_loaded,
+    mock_state_user_conf_file_data_loaded,
+    mock_state_conf_data_verified,
+    env_ctx,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_merged_conf_data_loaded.name,
+    )
+
+    mock_state_client_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_local_conf_symlink_rel_path.value: "conf.client",
+    }
+    mock_state_env_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        # Not read from `ConfLeap.leap_env`:
+        ConfField.field_local_conf_symlink_rel_path.value: "conf.env",
+        "whatever_test": 5,
+    }
+    mock_state_host_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+    mock_state_user_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
+
+    # when:
+
+    state_value: MergedConfData = env_ctx.eval_state(EnvState.state_merged_conf_data_loaded.name)
+
+    # then:
+
+    assert state_value.get_value_or_default(ConfField.field_local_conf_symlink_rel_path.value, None) == "conf.client"
+    assert state_value.get_conf_leap(ConfField.field_local_conf_symlink_rel_path.value) == ConfLeap.leap_client
+
+    assert state_value.get_value_or_default("whatever_test", None) is None
+    assert state_value.get_conf_leap("whatever_test") is None
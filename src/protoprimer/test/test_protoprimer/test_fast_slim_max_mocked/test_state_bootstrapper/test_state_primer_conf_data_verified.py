@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import pytest
+
+from local_test.mock_verifier import (
+    assert_parent_factories_mocked,
+)
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    Bootstrapper_state_primer_conf_file_data_loaded,
+    ConfField,
+    EnvContext,
+    EnvState,
+)
+
+
+@pytest.fixture
+def env_ctx():
+    return EnvContext()
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(EnvState.state_primer_conf_data_verified.name)
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_data_loaded.__name__}.create_state_node")
+def test_valid_conf_data(
+    mock_state_primer_conf_file_data_loaded,
+    env_ctx,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_primer_conf_data_verified.name,
+    )
+
+    mock_state_primer_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_ref_root_dir_rel_path.value: "..",
+    }
+
+    # when/then:
+
+    assert env_ctx.eval_state(EnvState.state_primer_conf_data_verified.name) is True
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_data_loaded.__name__}.create_state_node")
+def test_absolute_rel_path_fails(
+    mock_state_primer_conf_file_data_loaded,
+    env_ctx,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_primer_conf_data_verified.name,
+    )
+
+    mock_state_primer_conf_file_data_loaded.return_value.eval_own_state.return_value = {
+        ConfField.field_ref_root_dir_rel_path.value: "/abs/ref_root",
+    }
+
+    # when/then:
+
+    with pytest.raises(AssertionError, match=f"Field `leap_primer.{ConfField.field_ref_root_dir_rel_path.value}` must be a relative path"):
+        env_ctx.eval_state(EnvState.state_primer_conf_data_verified.name)
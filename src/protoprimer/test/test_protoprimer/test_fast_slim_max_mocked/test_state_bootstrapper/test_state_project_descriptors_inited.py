@@ -8,11 +8,12 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
-    Bootstrapper_state_client_conf_file_data_loaded,
-    Bootstrapper_state_env_conf_file_data_loaded,
+    Bootstrapper_state_merged_conf_data_loaded,
     ConfField,
+    ConfLeap,
     EnvContext,
     EnvState,
+    MergedConfData,
 )
 
 
@@ -25,11 +26,9 @@ def test_relationship():
     assert_test_module_name_embeds_str(EnvState.state_project_descriptors_inited.name)
 
 
-@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
-@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_env_conf_file_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
 def test_stride_py_venv(
-    mock_state_env_conf_file_data_loaded,
-    mock_state_client_conf_file_data_loaded,
+    mock_state_merged_conf_data_loaded,
     env_ctx,
 ):
     # given:
@@ -50,11 +49,17 @@ def test_stride_py_venv(
         },
     ]
 
-    mock_state_client_conf_file_data_loaded.return_value.eval_own_state.return_value = {}
-
-    mock_state_env_conf_file_data_loaded.return_value.eval_own_state.return_value = {
-        ConfField.field_project_descriptors.value: project_descriptors,
-    }
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (
+                ConfLeap.leap_env,
+                {
+                    ConfField.field_project_descriptors.value: project_descriptors,
+                },
+            ),
+            (ConfLeap.leap_client, {}),
+        ]
+    )
 
     # when:
 
@@ -9,6 +9,8 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_local_cache_dir_abs_path_inited,
+    Bootstrapper_state_local_venv_dir_abs_path_inited,
     Factory_state_proto_code_file_abs_path_inited,
     Factory_state_stride_deps_updated_reached,
     ConfConstGeneral,
@@ -41,6 +43,8 @@ class ThisTestClass(BasePyfakefsTestClass):
     def test_relationship(self):
         assert_test_module_name_embeds_str(EnvState.state_proto_code_updated.name)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_stride_deps_updated_reached.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
@@ -51,6 +55,8 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_input_sub_command_arg_loaded,
         mock_state_stride_deps_updated_reached,
         mock_state_proto_code_file_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
     ):
 
         # given:
@@ -59,6 +65,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             self.env_ctx,
             EnvState.state_proto_code_updated.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
 
         mock_client_dir = "/mock_client_dir"
         self.fs.create_dir(mock_client_dir)
@@ -100,6 +108,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             proto_kernel_obj.contents,
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(
         f"{primer_kernel.__name__}.is_venv",
         return_value=True,
@@ -115,12 +125,16 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_stride_deps_updated_reached,
         mock_state_proto_code_file_abs_path_inited,
         mock_is_venv,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
     ):
         # given:
         assert_parent_factories_mocked(
             self.env_ctx,
             EnvState.state_proto_code_updated.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_get_stride.return_value = StateStride.stride_deps_updated
 
         fake_path = "/fake/path"
@@ -8,6 +8,9 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_merged_conf_data_loaded,
+    Bootstrapper_state_local_cache_dir_abs_path_inited,
+    Bootstrapper_state_local_venv_dir_abs_path_inited,
     Bootstrapper_state_local_conf_symlink_abs_path_inited,
     Bootstrapper_state_project_descriptors_inited,
     Bootstrapper_state_install_specs_inited,
@@ -18,11 +21,14 @@ from protoprimer.primer_kernel import (
     CommandAction,
     ConfConstClient,
     ConfField,
+    ConfLeap,
     ContextBuilder,
     EntryFunc,
     EnvContext,
     EnvState,
+    MergedConfData,
     EnvVar,
+    InstallMode,
     SubCommand,
     StateStride,
     Factory_state_input_sub_command_arg_loaded,
@@ -48,6 +54,9 @@ class ThisTestClass(BasePyfakefsTestClass):
     def test_relationship(self):
         assert_test_module_name_embeds_str(EnvState.state_protoprimer_package_installed.name)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
@@ -72,12 +81,23 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_stride_py_venv_reached,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
     ):
         # given:
         assert_parent_factories_mocked(
             self.env_ctx,
             EnvState.state_protoprimer_package_installed.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (ConfLeap.leap_env, {}),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
         mock_get_stride.return_value = StateStride.stride_py_venv
         mock_client_ref_root_dir = "/mock_client_ref_root_dir"
         self.fs.create_dir(mock_client_ref_root_dir)
@@ -132,6 +152,9 @@ class ThisTestClass(BasePyfakefsTestClass):
             [],
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
@@ -156,12 +179,23 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_stride_py_venv_reached,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
     ):
         # given:
         assert_parent_factories_mocked(
             self.env_ctx,
             EnvState.state_protoprimer_package_installed.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (ConfLeap.leap_env, {}),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
         mock_get_stride.return_value = StateStride.stride_py_venv
         mock_client_ref_root_dir = "/mock_client_ref_root_dir"
         self.fs.create_dir(mock_client_ref_root_dir)
@@ -216,6 +250,9 @@ class ThisTestClass(BasePyfakefsTestClass):
             [],
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
@@ -240,12 +277,23 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_stride_py_venv_reached,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
     ):
         # given:
         assert_parent_factories_mocked(
             self.env_ctx,
             EnvState.state_protoprimer_package_installed.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (ConfLeap.leap_env, {}),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
         mock_get_stride.return_value = StateStride.stride_py_venv
         mock_client_ref_root_dir = "/mock_client_ref_root_dir"
         self.fs.create_dir(mock_client_ref_root_dir)
@@ -315,6 +363,608 @@ class ThisTestClass(BasePyfakefsTestClass):
             any_order=False,
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_project_descriptors_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_install_specs_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
+    @patch.dict(
+        os.environ,
+        {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name},
+    )
+    @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{EnvContext.__name__}.{EnvContext.get_stride.__name__}")
+    def test_combined_install(
+        self,
+        mock_get_stride,
+        mock_state_venv_driver_prepared,
+        mock_state_input_sub_command_arg_loaded,
+        mock_state_version_constraints_file_basename_inited,
+        mock_state_install_specs_inited,
+        mock_state_project_descriptors_inited,
+        mock_state_stride_py_venv_reached,
+        mock_state_ref_root_dir_abs_path_inited,
+        mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
+    ):
+
+        # given:
+
+        assert_parent_factories_mocked(
+            self.env_ctx,
+            EnvState.state_protoprimer_package_installed.name,
+        )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (
+                    ConfLeap.leap_env,
+                    {
+                        ConfField.field_install_mode.value: InstallMode.install_combined.name,
+                    },
+                ),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
+        mock_get_stride.return_value = StateStride.stride_py_venv
+        mock_client_ref_root_dir = "/mock_client_ref_root_dir"
+        self.fs.create_dir(mock_client_ref_root_dir)
+        os.chdir(mock_client_ref_root_dir)
+        mock_state_stride_py_venv_reached.return_value.eval_own_state.return_value = StateStride.stride_py_venv
+        mock_state_ref_root_dir_abs_path_inited.return_value.eval_own_state.return_value = mock_client_ref_root_dir
+        mock_client_conf_env_dir = "/mock_client_conf_env_dir"
+        self.fs.create_dir(mock_client_conf_env_dir)
+        mock_state_local_conf_symlink_abs_path_inited.return_value.eval_own_state.return_value = mock_client_conf_env_dir
+
+        project_descriptors = [
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj1",
+                ConfField.field_install_group.value: "group2",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj2",
+                ConfField.field_install_group.value: "group1",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj3",
+                # missing group -> None
+            },
+        ]
+        mock_state_project_descriptors_inited.return_value.eval_own_state.return_value = project_descriptors
+        mock_state_install_specs_inited.return_value.eval_own_state.return_value = [
+            {"group1": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+            {"group2": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+        ]
+        mock_state_version_constraints_file_basename_inited.return_value.eval_own_state.return_value = primer_kernel.ConfConstEnv.default_version_constraints_file_basename
+        mock_state_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_boot
+
+        # when:
+
+        self.env_ctx.eval_state(EnvState.state_protoprimer_package_installed.name)
+
+        # then:
+
+        mock_venv_driver = mock_state_venv_driver_prepared.return_value.eval_own_state.return_value
+        mock_venv_driver.install_dependencies.assert_not_called()
+
+        # All groups (in `install_specs` order) are resolved at once with the args combined per group:
+        mock_venv_driver.resolve_dependencies.assert_called_once()
+        resolve_args = mock_venv_driver.resolve_dependencies.call_args.args
+        self.assertEqual(
+            (
+                mock_client_ref_root_dir,
+                primer_kernel.get_path_to_curr_python(),
+                os.path.join(
+                    mock_client_conf_env_dir,
+                    primer_kernel.ConfConstEnv.default_version_constraints_file_basename,
+                ),
+                [
+                    project_descriptors[1],
+                    project_descriptors[0],
+                    project_descriptors[2],
+                ],
+                ["--index-url", "https://example.com/simple"],
+            ),
+            resolve_args[:5],
+        )
+        resolved_file_abs_path = resolve_args[5]
+        self.assertEqual(
+            primer_kernel.ConfConstGeneral.file_basename_resolved_requirements,
+            os.path.basename(resolved_file_abs_path),
+        )
+
+        mock_venv_driver.install_resolved_dependencies.assert_called_once_with(
+            primer_kernel.get_path_to_curr_python(),
+            resolved_file_abs_path,
+            ["--index-url", "https://example.com/simple"],
+        )
+
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_project_descriptors_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_install_specs_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
+    @patch.dict(
+        os.environ,
+        {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name},
+    )
+    @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{EnvContext.__name__}.{EnvContext.get_stride.__name__}")
+    def test_combined_install_with_conflicting_index_urls(
+        self,
+        mock_get_stride,
+        mock_state_venv_driver_prepared,
+        mock_state_input_sub_command_arg_loaded,
+        mock_state_version_constraints_file_basename_inited,
+        mock_state_install_specs_inited,
+        mock_state_project_descriptors_inited,
+        mock_state_stride_py_venv_reached,
+        mock_state_ref_root_dir_abs_path_inited,
+        mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
+    ):
+
+        # given:
+
+        assert_parent_factories_mocked(
+            self.env_ctx,
+            EnvState.state_protoprimer_package_installed.name,
+        )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (
+                    ConfLeap.leap_env,
+                    {
+                        ConfField.field_install_mode.value: InstallMode.install_combined.name,
+                    },
+                ),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
+        mock_get_stride.return_value = StateStride.stride_py_venv
+        mock_client_ref_root_dir = "/mock_client_ref_root_dir"
+        self.fs.create_dir(mock_client_ref_root_dir)
+        os.chdir(mock_client_ref_root_dir)
+        mock_state_stride_py_venv_reached.return_value.eval_own_state.return_value = StateStride.stride_py_venv
+        mock_state_ref_root_dir_abs_path_inited.return_value.eval_own_state.return_value = mock_client_ref_root_dir
+        mock_client_conf_env_dir = "/mock_client_conf_env_dir"
+        self.fs.create_dir(mock_client_conf_env_dir)
+        mock_state_local_conf_symlink_abs_path_inited.return_value.eval_own_state.return_value = mock_client_conf_env_dir
+
+        project_descriptors = [
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj1",
+                ConfField.field_install_group.value: "group2",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj2",
+                ConfField.field_install_group.value: "group1",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj3",
+                # missing group -> None
+            },
+        ]
+        mock_state_project_descriptors_inited.return_value.eval_own_state.return_value = project_descriptors
+        mock_state_install_specs_inited.return_value.eval_own_state.return_value = [
+            {"group1": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+            {"group2": {ConfField.field_extra_command_args.value: ["--index-url", "https://other.example.com/simple"]}},
+        ]
+        mock_state_version_constraints_file_basename_inited.return_value.eval_own_state.return_value = primer_kernel.ConfConstEnv.default_version_constraints_file_basename
+        mock_state_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_boot
+
+        # when/then:
+
+        with self.assertRaisesRegex(AssertionError, r"`install_group`-s \[group1\] and \[group2\] specify conflicting package indexes"):
+            self.env_ctx.eval_state(EnvState.state_protoprimer_package_installed.name)
+
+        mock_venv_driver = mock_state_venv_driver_prepared.return_value.eval_own_state.return_value
+        mock_venv_driver.resolve_dependencies.assert_not_called()
+        mock_venv_driver.install_dependencies.assert_not_called()
+
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_project_descriptors_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_install_specs_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
+    @patch.dict(
+        os.environ,
+        {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name},
+    )
+    @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{EnvContext.__name__}.{EnvContext.get_stride.__name__}")
+    def test_synced_install(
+        self,
+        mock_get_stride,
+        mock_state_venv_driver_prepared,
+        mock_state_input_sub_command_arg_loaded,
+        mock_state_version_constraints_file_basename_inited,
+        mock_state_install_specs_inited,
+        mock_state_project_descriptors_inited,
+        mock_state_stride_py_venv_reached,
+        mock_state_ref_root_dir_abs_path_inited,
+        mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
+    ):
+
+        # given:
+
+        assert_parent_factories_mocked(
+            self.env_ctx,
+            EnvState.state_protoprimer_package_installed.name,
+        )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (
+                    ConfLeap.leap_env,
+                    {
+                        ConfField.field_install_mode.value: InstallMode.install_synced.name,
+                    },
+                ),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
+        mock_get_stride.return_value = StateStride.stride_py_venv
+        mock_client_ref_root_dir = "/mock_client_ref_root_dir"
+        self.fs.create_dir(mock_client_ref_root_dir)
+        os.chdir(mock_client_ref_root_dir)
+        mock_state_stride_py_venv_reached.return_value.eval_own_state.return_value = StateStride.stride_py_venv
+        mock_state_ref_root_dir_abs_path_inited.return_value.eval_own_state.return_value = mock_client_ref_root_dir
+        mock_client_conf_env_dir = "/mock_client_conf_env_dir"
+        self.fs.create_dir(mock_client_conf_env_dir)
+        mock_state_local_conf_symlink_abs_path_inited.return_value.eval_own_state.return_value = mock_client_conf_env_dir
+
+        project_descriptors = [
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj1",
+                ConfField.field_install_group.value: "group2",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj2",
+                ConfField.field_install_group.value: "group1",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj3",
+                # missing group -> None
+            },
+        ]
+        mock_state_project_descriptors_inited.return_value.eval_own_state.return_value = project_descriptors
+        mock_state_install_specs_inited.return_value.eval_own_state.return_value = [
+            {"group1": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+            {"group2": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+        ]
+        mock_state_version_constraints_file_basename_inited.return_value.eval_own_state.return_value = primer_kernel.ConfConstEnv.default_version_constraints_file_basename
+        mock_state_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_boot
+
+        # when:
+
+        self.env_ctx.eval_state(EnvState.state_protoprimer_package_installed.name)
+
+        # then:
+
+        mock_venv_driver = mock_state_venv_driver_prepared.return_value.eval_own_state.return_value
+        mock_venv_driver.install_dependencies.assert_not_called()
+
+        mock_venv_driver.resolve_dependencies.assert_called_once()
+        resolve_args = mock_venv_driver.resolve_dependencies.call_args.args
+        self.assertEqual(
+            (
+                mock_client_ref_root_dir,
+                primer_kernel.get_path_to_curr_python(),
+                os.path.join(
+                    mock_client_conf_env_dir,
+                    primer_kernel.ConfConstEnv.default_version_constraints_file_basename,
+                ),
+                [
+                    project_descriptors[1],
+                    project_descriptors[0],
+                    project_descriptors[2],
+                ],
+                ["--index-url", "https://example.com/simple"],
+            ),
+            resolve_args[:5],
+        )
+        resolved_file_abs_path = resolve_args[5]
+        self.assertEqual(
+            primer_kernel.ConfConstGeneral.file_basename_resolved_requirements,
+            os.path.basename(resolved_file_abs_path),
+        )
+
+        mock_venv_driver.install_resolved_dependencies.assert_not_called()
+        mock_venv_driver.sync_resolved_dependencies.assert_called_once_with(
+            primer_kernel.get_path_to_curr_python(),
+            resolved_file_abs_path,
+            ["--index-url", "https://example.com/simple"],
+        )
+
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_project_descriptors_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_install_specs_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
+    @patch.dict(
+        os.environ,
+        {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name},
+    )
+    @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{EnvContext.__name__}.{EnvContext.get_stride.__name__}")
+    def test_locked_install_from_up_to_date_lock_file(
+        self,
+        mock_get_stride,
+        mock_state_venv_driver_prepared,
+        mock_state_input_sub_command_arg_loaded,
+        mock_state_version_constraints_file_basename_inited,
+        mock_state_install_specs_inited,
+        mock_state_project_descriptors_inited,
+        mock_state_stride_py_venv_reached,
+        mock_state_ref_root_dir_abs_path_inited,
+        mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
+    ):
+
+        # given:
+
+        assert_parent_factories_mocked(
+            self.env_ctx,
+            EnvState.state_protoprimer_package_installed.name,
+        )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (
+                    ConfLeap.leap_env,
+                    {
+                        ConfField.field_install_mode.value: InstallMode.install_locked.name,
+                    },
+                ),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
+        mock_get_stride.return_value = StateStride.stride_py_venv
+        mock_client_ref_root_dir = "/mock_client_ref_root_dir"
+        self.fs.create_dir(mock_client_ref_root_dir)
+        os.chdir(mock_client_ref_root_dir)
+        mock_state_stride_py_venv_reached.return_value.eval_own_state.return_value = StateStride.stride_py_venv
+        mock_state_ref_root_dir_abs_path_inited.return_value.eval_own_state.return_value = mock_client_ref_root_dir
+        mock_client_conf_env_dir = "/mock_client_conf_env_dir"
+        self.fs.create_dir(mock_client_conf_env_dir)
+        mock_state_local_conf_symlink_abs_path_inited.return_value.eval_own_state.return_value = mock_client_conf_env_dir
+
+        project_descriptors = [
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj1",
+                ConfField.field_install_group.value: "group2",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj2",
+                ConfField.field_install_group.value: "group1",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj3",
+                # missing group -> None
+            },
+        ]
+        mock_state_project_descriptors_inited.return_value.eval_own_state.return_value = project_descriptors
+        mock_state_install_specs_inited.return_value.eval_own_state.return_value = [
+            {"group1": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+            {"group2": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+        ]
+        mock_state_version_constraints_file_basename_inited.return_value.eval_own_state.return_value = primer_kernel.ConfConstEnv.default_version_constraints_file_basename
+        mock_state_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_boot
+
+        combined_descriptors = [
+            project_descriptors[1],
+            project_descriptors[0],
+            project_descriptors[2],
+        ]
+        lock_file_abs_path = os.path.join(
+            mock_client_conf_env_dir,
+            "constraints.lock.txt",
+        )
+        self.fs.create_file(
+            lock_file_abs_path,
+            contents=(
+                "# install_input_digest: "
+                + primer_kernel.get_install_input_digest(
+                    mock_client_ref_root_dir,
+                    combined_descriptors,
+                    ["--index-url", "https://example.com/simple"],
+                )
+                + "\nrequests==2.32.3 --hash=sha256:0123456789abcdef\n"
+            ),
+        )
+
+        # when:
+
+        self.env_ctx.eval_state(EnvState.state_protoprimer_package_installed.name)
+
+        # then:
+
+        mock_venv_driver = mock_state_venv_driver_prepared.return_value.eval_own_state.return_value
+        mock_venv_driver.install_dependencies.assert_not_called()
+        mock_venv_driver.resolve_dependencies.assert_not_called()
+        mock_venv_driver.install_locked_dependencies.assert_called_once_with(
+            mock_client_ref_root_dir,
+            primer_kernel.get_path_to_curr_python(),
+            lock_file_abs_path,
+            combined_descriptors,
+            ["--index-url", "https://example.com/simple"],
+        )
+
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_project_descriptors_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_install_specs_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
+    @patch.dict(
+        os.environ,
+        {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name},
+    )
+    @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{EnvContext.__name__}.{EnvContext.get_stride.__name__}")
+    def test_locked_install_regenerates_stale_lock_file(
+        self,
+        mock_get_stride,
+        mock_state_venv_driver_prepared,
+        mock_state_input_sub_command_arg_loaded,
+        mock_state_version_constraints_file_basename_inited,
+        mock_state_install_specs_inited,
+        mock_state_project_descriptors_inited,
+        mock_state_stride_py_venv_reached,
+        mock_state_ref_root_dir_abs_path_inited,
+        mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
+    ):
+
+        # given:
+
+        assert_parent_factories_mocked(
+            self.env_ctx,
+            EnvState.state_protoprimer_package_installed.name,
+        )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (
+                    ConfLeap.leap_env,
+                    {
+                        ConfField.field_install_mode.value: InstallMode.install_locked.name,
+                    },
+                ),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
+        mock_get_stride.return_value = StateStride.stride_py_venv
+        mock_client_ref_root_dir = "/mock_client_ref_root_dir"
+        self.fs.create_dir(mock_client_ref_root_dir)
+        os.chdir(mock_client_ref_root_dir)
+        mock_state_stride_py_venv_reached.return_value.eval_own_state.return_value = StateStride.stride_py_venv
+        mock_state_ref_root_dir_abs_path_inited.return_value.eval_own_state.return_value = mock_client_ref_root_dir
+        mock_client_conf_env_dir = "/mock_client_conf_env_dir"
+        self.fs.create_dir(mock_client_conf_env_dir)
+        mock_state_local_conf_symlink_abs_path_inited.return_value.eval_own_state.return_value = mock_client_conf_env_dir
+
+        project_descriptors = [
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj1",
+                ConfField.field_install_group.value: "group2",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj2",
+                ConfField.field_install_group.value: "group1",
+            },
+            {
+                ConfField.field_build_root_dir_rel_path.value: "proj3",
+                # missing group -> None
+            },
+        ]
+        mock_state_project_descriptors_inited.return_value.eval_own_state.return_value = project_descriptors
+        mock_state_install_specs_inited.return_value.eval_own_state.return_value = [
+            {"group1": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+            {"group2": {ConfField.field_extra_command_args.value: ["--index-url", "https://example.com/simple"]}},
+        ]
+        mock_state_version_constraints_file_basename_inited.return_value.eval_own_state.return_value = primer_kernel.ConfConstEnv.default_version_constraints_file_basename
+        mock_state_input_sub_command_arg_loaded.return_value.eval_own_state.return_value = SubCommand.command_boot
+
+        combined_descriptors = [
+            project_descriptors[1],
+            project_descriptors[0],
+            project_descriptors[2],
+        ]
+        lock_file_abs_path = os.path.join(
+            mock_client_conf_env_dir,
+            "constraints.lock.txt",
+        )
+        self.fs.create_file(
+            lock_file_abs_path,
+            contents="# install_input_digest: sha256:stale\n",
+        )
+
+        def write_resolved_file(*args, **kwargs):
+            with open(args[5], "w") as resolved_file:
+                resolved_file.write("-e file:///mock_client_ref_root_dir/proj1\nrequests==2.32.3 --hash=sha256:0123456789abcdef\n")
+
+        mock_state_venv_driver_prepared.return_value.eval_own_state.return_value.resolve_dependencies.side_effect = write_resolved_file
+
+        # when:
+
+        self.env_ctx.eval_state(EnvState.state_protoprimer_package_installed.name)
+
+        # then:
+
+        mock_venv_driver = mock_state_venv_driver_prepared.return_value.eval_own_state.return_value
+        mock_venv_driver.install_dependencies.assert_not_called()
+        mock_venv_driver.resolve_dependencies.assert_called_once()
+        self.assertEqual(
+            {"is_hashed": True},
+            mock_venv_driver.resolve_dependencies.call_args.kwargs,
+        )
+        with open(lock_file_abs_path) as lock_file:
+            self.assertEqual(
+                (
+                    "# install_input_digest: "
+                    + primer_kernel.get_install_input_digest(
+                        mock_client_ref_root_dir,
+                        combined_descriptors,
+                        ["--index-url", "https://example.com/simple"],
+                    )
+                    + "\nrequests==2.32.3 --hash=sha256:0123456789abcdef\n"
+                ),
+                lock_file.read(),
+            )
+        mock_venv_driver.install_locked_dependencies.assert_called_once_with(
+            mock_client_ref_root_dir,
+            primer_kernel.get_path_to_curr_python(),
+            lock_file_abs_path,
+            combined_descriptors,
+            ["--index-url", "https://example.com/simple"],
+        )
+
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_stride_py_venv_reached.__name__}.create_state_node")
@@ -339,6 +989,9 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_stride_py_venv_reached,
         mock_state_ref_root_dir_abs_path_inited,
         mock_state_local_conf_symlink_abs_path_inited,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
+        mock_state_merged_conf_data_loaded,
     ):
 
         # given:
@@ -347,6 +1000,14 @@ class ThisTestClass(BasePyfakefsTestClass):
             self.env_ctx,
             EnvState.state_protoprimer_package_installed.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
+        mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+            [
+                (ConfLeap.leap_env, {}),
+                (ConfLeap.leap_client, {}),
+            ]
+        )
         mock_get_stride.return_value = StateStride.stride_py_venv
         mock_client_dir = "/mock_client_dir"
         self.fs.create_dir(mock_client_dir)
@@ -13,6 +13,7 @@ from protoprimer.primer_kernel import (
     Bootstrapper_state_input_start_id_var_loaded,
     Bootstrapper_state_local_conf_symlink_abs_path_inited,
     Bootstrapper_state_local_tmp_dir_abs_path_inited,
+    Bootstrapper_state_local_cache_dir_abs_path_inited,
     Bootstrapper_state_local_venv_dir_abs_path_inited,
     Bootstrapper_state_version_constraints_file_basename_inited,
     ContextBuilder,
@@ -46,6 +47,7 @@ def test_relationship():
     assert_test_module_name_embeds_str(EnvState.state_reboot_triggered.name)
 
 
+@patch(f"{primer_kernel.__name__}.hold_venv_lock")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_input_start_id_var_loaded.__name__}.create_state_node")
 @patch("os.path.exists")
 @patch("os.remove")
@@ -54,6 +56,7 @@ def test_relationship():
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_tmp_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_prepare_venv_finalized.__name__}.create_state_node")
@@ -63,6 +66,7 @@ def test_reboot_true(
     mock_state_prepare_venv_finalized,
     mock_state_proto_code_file_abs_path_inited,
     mock_state_local_venv_dir_abs_path_inited,
+    mock_state_local_cache_dir_abs_path_inited,
     mock_state_local_conf_symlink_abs_path_inited,
     mock_state_version_constraints_file_basename_inited,
     mock_state_local_tmp_dir_abs_path_inited,
@@ -71,6 +75,7 @@ def test_reboot_true(
     mock_os_remove,
     mock_os_path_exists,
     mock_state_input_start_id_var_loaded,
+    mock_hold_venv_lock,
     env_ctx,
 ):
 
@@ -88,6 +93,7 @@ def test_reboot_true(
     env_ctx._state_stride = py_exec
 
     mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/path/to/venv"
+    mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/path/to/cache"
     mock_state_local_tmp_dir_abs_path_inited.return_value.eval_own_state.return_value = "/path/to/tmp"
     mock_state_local_conf_symlink_abs_path_inited.return_value.eval_own_state.return_value = "/path/to/conf"
     mock_state_version_constraints_file_basename_inited.return_value.eval_own_state.return_value = ConfConstEnv.default_version_constraints_file_basename
@@ -100,6 +106,7 @@ def test_reboot_true(
     assert state_value is True
     mock_shutil_move.assert_called_once_with("/path/to/venv", "/path/to/tmp/venv.before.mock_start_id")
     mock_os_remove.assert_called_once_with(f"/path/to/conf/{ConfConstEnv.default_version_constraints_file_basename}")
+    mock_hold_venv_lock.assert_called_once_with("/path/to/cache/venv.lock")
 
 
 @patch("os.path.exists")
@@ -110,6 +117,7 @@ def test_reboot_true(
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_tmp_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_prepare_venv_finalized.__name__}.create_state_node")
@@ -119,6 +127,7 @@ def test_reboot_false(
     mock_state_prepare_venv_finalized,
     mock_state_proto_code_file_abs_path_inited,
     mock_state_local_venv_dir_abs_path_inited,
+    mock_state_local_cache_dir_abs_path_inited,
     mock_state_local_conf_symlink_abs_path_inited,
     mock_state_version_constraints_file_basename_inited,
     mock_state_local_tmp_dir_abs_path_inited,
@@ -157,6 +166,7 @@ def test_reboot_false(
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_tmp_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_symlink_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_prepare_venv_finalized.__name__}.create_state_node")
@@ -166,6 +176,7 @@ def test_reboot_true_but_py_exec_not_required(
     mock_state_prepare_venv_finalized,
     mock_state_proto_code_file_abs_path_inited,
     mock_state_local_venv_dir_abs_path_inited,
+    mock_state_local_cache_dir_abs_path_inited,
     mock_state_local_conf_symlink_abs_path_inited,
     mock_state_version_constraints_file_basename_inited,
     mock_state_local_tmp_dir_abs_path_inited,
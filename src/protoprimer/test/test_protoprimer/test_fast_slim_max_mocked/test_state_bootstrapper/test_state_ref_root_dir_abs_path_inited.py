@@ -8,6 +8,7 @@ from local_test.mock_verifier import assert_parent_factories_mocked
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_primer_conf_data_verified,
     Bootstrapper_state_primer_conf_file_data_loaded,
     Factory_state_proto_code_file_abs_path_inited,
     ConfField,
@@ -34,11 +35,13 @@ def test_relationship():
     assert_test_module_name_embeds_str(EnvState.state_ref_root_dir_abs_path_inited.name)
 
 
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_data_verified.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_data_loaded.__name__}.create_state_node")
 def test_success_when_field_present(
     mock_state_primer_conf_file_data_loaded,
     state_proto_code_file_abs_path_inited,
+    mock_state_primer_conf_data_verified,
     env_ctx,
     mock_proto_code_dir,
 ):
@@ -62,6 +65,7 @@ def test_success_when_field_present(
     assert result == ref_root_abs_path
 
 
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_data_verified.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.EnvContext.get_stride")
 @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_data_loaded.__name__}.create_state_node")
@@ -69,6 +73,7 @@ def test_warning_when_field_missing(
     mock_state_primer_conf_file_data_loaded,
     state_proto_code_file_abs_path_inited,
     mock_get_stride,
+    mock_state_primer_conf_data_verified,
     env_ctx,
     mock_proto_code_dir,
     caplog,
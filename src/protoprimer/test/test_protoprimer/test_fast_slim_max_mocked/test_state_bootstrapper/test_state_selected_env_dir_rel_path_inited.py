@@ -10,6 +10,7 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_client_conf_data_verified,
     Factory_state_args_parsed,
     Bootstrapper_state_client_conf_file_data_loaded,
     Bootstrapper_state_ref_root_dir_abs_path_inited,
@@ -39,6 +40,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     def test_relationship(self):
         assert_test_module_name_embeds_str(EnvState.state_selected_env_dir_rel_path_inited.name)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -47,6 +49,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -75,6 +78,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertEqual(state_selected_env_dir_rel_path_inited, arg_value)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -83,6 +87,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -110,6 +115,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertEqual(state_selected_env_dir_rel_path_inited, arg_value)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -118,6 +124,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -141,6 +148,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertEqual(state_selected_env_dir_rel_path_inited, "my_env_dir")
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.EnvContext.get_stride")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
@@ -151,6 +159,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
         mock_get_stride,
+        mock_state_client_conf_data_verified,
     ):
         # given:
 
@@ -179,6 +188,7 @@ class ThisTestClass(BasePyfakefsTestClass):
             log_dst.output[0],
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -187,6 +197,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -211,6 +222,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertIn("is relative to neither", str(ctx.exception))
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -219,6 +231,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -242,6 +255,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertIn("must be a relative path", str(ctx.exception))
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -250,6 +264,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -272,6 +287,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertIn("is not under", str(ctx.exception))
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -280,6 +296,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -302,6 +319,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertEqual(result, arg_value_rel)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -310,6 +328,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -333,6 +352,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertIn("is relative to neither", str(ctx.exception))
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -341,6 +361,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -365,6 +386,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         # then:
         self.assertEqual(result, "symlink_to_dir")
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -373,6 +395,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -398,6 +421,7 @@ class ThisTestClass(BasePyfakefsTestClass):
             str(ctx.exception),
         )
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_data_verified.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_ref_root_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_args_parsed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_client_conf_file_data_loaded.__name__}.create_state_node")
@@ -406,6 +430,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_client_conf_file_data_loaded,
         mock_state_args_parsed,
         mock_state_ref_root_dir_abs_path_inited,
+        mock_state_client_conf_data_verified,
     ):
         # given:
         assert_parent_factories_mocked(
@@ -1,6 +1,11 @@
 import os
+import pathlib
 import sys
-from unittest.mock import patch
+from unittest.mock import (
+    ANY,
+    MagicMock,
+    patch,
+)
 
 from local_test.base_test_class import BasePyfakefsTestClass
 from local_test.integrated_helper import (
@@ -13,8 +18,10 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_stride_py_venv_reached_not_is_app,
     Bootstrapper_state_input_start_id_var_loaded,
     Bootstrapper_state_local_conf_file_abs_path_inited,
+    Bootstrapper_state_local_cache_dir_abs_path_inited,
     Bootstrapper_state_local_venv_dir_abs_path_inited,
     Factory_state_proto_code_file_abs_path_inited,
     Factory_state_reboot_triggered,
@@ -29,6 +36,7 @@ from protoprimer.primer_kernel import (
     EnvVar,
     StateStride,
     Factory_state_input_sub_command_arg_loaded,
+    read_json_file,
     VenvDriverPip,
 )
 
@@ -86,6 +94,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -105,6 +114,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -123,7 +133,10 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_proto_code_file_abs_path_inited.return_value.eval_own_state.return_value = state_proto_code_file_abs_path_inited
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = test_python_abs_path
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = os.path.join(mock_client_dir, ConfConstEnv.default_dir_rel_path_venv)
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
+        launch_record_abs_path = os.path.join(mock_client_dir, "__pycache__", "proto_kernel.my_module.my_func.launch.json")
+        self.fs.create_file(launch_record_abs_path)
 
         # when:
 
@@ -131,6 +144,8 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         # then:
 
+        # The fast launcher entry script falls back to `start_app` (waiting for the lock):
+        self.assertFalse(os.path.exists(launch_record_abs_path))
         mock_state_venv_driver_prepared.return_value.eval_own_state.return_value.create_venv.assert_called_once_with(
             os.path.join(
                 mock_client_dir,
@@ -152,6 +167,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             path=path_to_required_python,
             argv=expected_argv,
             env={
+                # The `venv` lock is held across the `python` switch:
+                EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value: ANY,
                 EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name,
                 EnvVar.var_PROTOPRIMER_START_ID.value: "mock_start_id",
                 EnvVar.var_PROTOPRIMER_PROTO_CODE.value: state_proto_code_file_abs_path_inited,
@@ -165,6 +182,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -182,6 +200,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -201,6 +220,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = test_python_abs_path
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = os.path.join(mock_client_dir, ConfConstEnv.default_dir_rel_path_venv)
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
 
         # when:
@@ -222,6 +242,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -240,6 +261,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -259,6 +281,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = test_python_abs_path
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = os.path.join(mock_client_dir, ConfConstEnv.default_dir_rel_path_venv)
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
 
         # when:
@@ -281,6 +304,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -300,6 +324,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -319,6 +344,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = non_default_file_abs_path_python
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = ConfConstEnv.default_dir_rel_path_venv
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
 
         # when:
@@ -341,6 +367,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -360,6 +387,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -379,6 +407,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = test_python_abs_path
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = os.path.join(mock_client_dir, ConfConstEnv.default_dir_rel_path_venv)
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
 
         # when:
@@ -408,6 +437,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             path=path_to_venv_python,
             argv=expected_argv,
             env={
+                # The `venv` lock is held across the `python` switch:
+                EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value: ANY,
                 EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name,
                 EnvVar.var_PROTOPRIMER_START_ID.value: "mock_start_id",
                 EnvVar.var_PROTOPRIMER_PROTO_CODE.value: state_proto_code_file_abs_path_inited,
@@ -422,6 +453,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -441,6 +473,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -460,6 +493,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = non_default_file_abs_path_python
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = non_default_dir_abs_path_venv
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
 
         # when:
@@ -486,6 +520,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             path=path_to_venv_python,
             argv=expected_argv,
             env={
+                # The `venv` lock is held across the `python` switch:
+                EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value: ANY,
                 EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name,
                 EnvVar.var_PROTOPRIMER_START_ID.value: "mock_start_id",
                 EnvVar.var_PROTOPRIMER_PROTO_CODE.value: state_proto_code_file_abs_path_inited,
@@ -501,6 +537,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -520,6 +557,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -545,6 +583,7 @@ class ThisTestClass(BasePyfakefsTestClass):
 
         # Make sure `is_sub_path` is false:
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/not/the/parent/of/current/python"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
 
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "any/path"
 
@@ -566,6 +605,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             path=path_to_venv_python,
             argv=expected_argv,
             env={
+                # The `venv` lock is held across the `python` switch:
+                EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value: ANY,
                 EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name,
                 EnvVar.var_PROTOPRIMER_START_ID.value: "mock_start_id",
                 EnvVar.var_PROTOPRIMER_PROTO_CODE.value: "any/path",
@@ -585,6 +626,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -601,6 +643,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -635,6 +678,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -654,6 +698,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -675,6 +720,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = test_python_abs_path
         path_to_venv = os.path.join(mock_client_dir, ConfConstEnv.default_dir_rel_path_venv)
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = path_to_venv
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
 
         self.fs.create_dir(path_to_venv)
@@ -702,6 +748,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             path=path_to_venv_python,
             argv=expected_argv,
             env={
+                # The `venv` lock is held across the `python` switch:
+                EnvVar.var_PROTOPRIMER_VENV_LOCK_FD.value: ANY,
                 EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name,
                 EnvVar.var_PROTOPRIMER_START_ID.value: "mock_start_id",
                 EnvVar.var_PROTOPRIMER_PROTO_CODE.value: state_proto_code_file_abs_path_inited,
@@ -715,6 +763,7 @@ class ThisTestClass(BasePyfakefsTestClass):
     @patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_proto_code_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_conf_file_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
@@ -736,6 +785,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_venv_driver_prepared,
         mock_state_selected_python_file_abs_path_inited,
         mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
         mock_state_local_conf_file_abs_path_inited,
         mock_state_proto_code_file_abs_path_inited,
         mock_state_reboot_triggered,
@@ -754,6 +804,7 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = test_python_abs_path
         path_to_venv = os.path.join(mock_client_dir, ConfConstEnv.default_dir_rel_path_venv)
         mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = path_to_venv
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         mock_state_local_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "fake: " + EnvState.state_local_conf_file_abs_path_inited.name
 
         # Create an uv-style `venv`:
@@ -777,3 +828,44 @@ class ThisTestClass(BasePyfakefsTestClass):
         self.assertIn("was not created by this driver", str(cm.exception))
         mock_venv_venv_pip_create_venv.assert_not_called()
         mock_execve.assert_not_called()
+
+
+@patch(f"{primer_kernel.__name__}.os.execve")
+def test_launch_record_is_written_when_requested_by_entry_script(mock_execve, tmp_path):
+
+    # given:
+
+    venv_dir_abs_path = str(tmp_path / "venv")
+    venv_python_abs_path = os.path.join(venv_dir_abs_path, ConfConstGeneral.file_rel_path_venv_python)
+    os.makedirs(os.path.dirname(venv_python_abs_path))
+    pathlib.Path(venv_python_abs_path).touch()
+    launch_record_abs_path = str(tmp_path / "__pycache__" / "proto_kernel.my_module.my_func.launch.json")
+    mock_env_ctx = MagicMock()
+    mock_env_ctx.has_stride_reached.return_value = False
+    mock_env_ctx.set_max_stride.return_value = StateStride.stride_py_venv
+    mock_env_ctx.eval_state.side_effect = {
+        EnvState.state_input_start_id_var_loaded.name: "mock_start_id",
+        EnvState.state_proto_code_file_abs_path_inited.name: state_proto_code_file_abs_path_inited,
+        EnvState.state_local_venv_dir_abs_path_inited.name: venv_dir_abs_path,
+        EnvState.state_local_cache_dir_abs_path_inited.name: str(tmp_path / "cache"),
+    }.get
+
+    # when:
+
+    with patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_LAUNCH_RECORD.value: launch_record_abs_path}, clear=True):
+        Bootstrapper_state_stride_py_venv_reached_not_is_app(mock_env_ctx).eval_own_state()
+        next_environ = dict(os.environ)
+
+    # then:
+
+    launch_record_data = read_json_file(launch_record_abs_path)
+    assert launch_record_data["venv_python"] == venv_python_abs_path
+    assert list(launch_record_data["file_stats"].keys()) == [
+        state_proto_code_file_abs_path_inited,
+        venv_python_abs_path,
+        os.path.join(venv_dir_abs_path, ConfConstGeneral.venv_config_file_basename),
+    ]
+    mock_execve.assert_called_once()
+    # FT_66_02_54_56.context_isolation.md: not passed to the next `python` (and the app):
+    assert EnvVar.var_PROTOPRIMER_LAUNCH_RECORD.value not in next_environ
+    assert EnvVar.var_PROTOPRIMER_LAUNCH_RECORD.value not in mock_execve.call_args[1]["env"]
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import pytest
+
+from local_test.mock_verifier import (
+    assert_parent_factories_mocked,
+)
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    Bootstrapper_state_primer_conf_file_abs_path_inited,
+    ConfConstInput,
+    EnvContext,
+    EnvState,
+)
+
+
+@pytest.fixture
+def env_ctx():
+    return EnvContext()
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(EnvState.state_user_conf_file_abs_path_inited.name)
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_abs_path_inited.__name__}.create_state_node")
+def test_xdg_config_home_is_used(
+    mock_state_primer_conf_file_abs_path_inited,
+    env_ctx,
+    monkeypatch,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_user_conf_file_abs_path_inited.name,
+    )
+
+    mock_state_primer_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "/repo/proto_kernel.json"
+    monkeypatch.setenv(ConfConstInput.ext_env_var_XDG_CONFIG_HOME, "/home/user/.xdg")
+
+    # when:
+
+    state_value: str = env_ctx.eval_state(EnvState.state_user_conf_file_abs_path_inited.name)
+
+    # then:
+
+    assert state_value == "/home/user/.xdg/protoprimer/proto_kernel.json"
+
+
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_primer_conf_file_abs_path_inited.__name__}.create_state_node")
+def test_home_config_is_default(
+    mock_state_primer_conf_file_abs_path_inited,
+    env_ctx,
+    monkeypatch,
+):
+    # given:
+
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_user_conf_file_abs_path_inited.name,
+    )
+
+    mock_state_primer_conf_file_abs_path_inited.return_value.eval_own_state.return_value = "/repo/proto_kernel.json"
+    monkeypatch.delenv(ConfConstInput.ext_env_var_XDG_CONFIG_HOME, raising=False)
+    monkeypatch.setenv("HOME", "/home/user")
+
+    # when:
+
+    state_value: str = env_ctx.eval_state(EnvState.state_user_conf_file_abs_path_inited.name)
+
+    # then:
+
+    assert state_value == "/home/user/.config/protoprimer/proto_kernel.json"
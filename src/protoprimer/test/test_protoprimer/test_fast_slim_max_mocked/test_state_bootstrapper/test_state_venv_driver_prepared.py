@@ -1,3 +1,4 @@
+import os
 from unittest.mock import (
     Mock,
     patch,
@@ -11,13 +12,18 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_merged_conf_data_loaded,
     Bootstrapper_state_local_cache_dir_abs_path_inited,
     Factory_state_reboot_triggered,
     Bootstrapper_state_selected_python_file_abs_path_inited,
     Bootstrapper_state_venv_driver_inited,
+    ConfField,
+    ConfLeap,
     ContextBuilder,
     EntryFunc,
     EnvState,
+    MergedConfData,
+    EnvVar,
     VenvDriverPip,
     VenvDriverType,
     VenvDriverUv,
@@ -49,9 +55,11 @@ def test_relationship():
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
 def test_pip_driver_inited(
     mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
     mock_state_selected_python_file_abs_path_inited,
     mock_state_required_python_version_inited,
     mock_state_local_cache_dir_abs_path_inited,
@@ -69,6 +77,12 @@ def test_pip_driver_inited(
     mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
     mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
     mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (ConfLeap.leap_env, {}),
+            (ConfLeap.leap_client, {}),
+        ]
+    )
     mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/venv"
 
     # when:
@@ -88,9 +102,11 @@ def test_pip_driver_inited(
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
 def test_uv_driver_inited_when_not_installed(
     mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
     mock_state_selected_python_file_abs_path_inited,
     mock_state_required_python_version_inited,
     mock_state_local_cache_dir_abs_path_inited,
@@ -112,6 +128,12 @@ def test_uv_driver_inited_when_not_installed(
     mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
     mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
     mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (ConfLeap.leap_env, {}),
+            (ConfLeap.leap_client, {}),
+        ]
+    )
     mock_os_path_exists.return_value = False
     mock_os_path_isfile.return_value = True
     mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/venv"
@@ -133,9 +155,11 @@ def test_uv_driver_inited_when_not_installed(
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
 def test_uv_driver_inited_when_already_installed(
     mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
     mock_state_selected_python_file_abs_path_inited,
     mock_state_required_python_version_inited,
     mock_state_local_cache_dir_abs_path_inited,
@@ -157,6 +181,12 @@ def test_uv_driver_inited_when_already_installed(
     mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
     mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
     mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (ConfLeap.leap_env, {}),
+            (ConfLeap.leap_client, {}),
+        ]
+    )
     mock_os_path_exists.return_value = True
     mock_os_path_isfile.return_value = True
     mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/venv"
@@ -175,9 +205,11 @@ def test_uv_driver_inited_when_already_installed(
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
 @patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
 @patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
 def test_unsupported_driver(
     mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
     mock_state_selected_python_file_abs_path_inited,
     mock_state_required_python_version_inited,
     mock_state_local_cache_dir_abs_path_inited,
@@ -197,7 +229,218 @@ def test_unsupported_driver(
     mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
     mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
     mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (ConfLeap.leap_env, {}),
+            (ConfLeap.leap_client, {}),
+        ]
+    )
 
     # when/then:
     with pytest.raises(AssertionError, match="unsupported `VenvDriverType`"):
         env_ctx.eval_state(EnvState.state_venv_driver_prepared.name)
+
+
+@patch.dict(os.environ, {}, clear=True)
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_venv_driver_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+@patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+def test_uv_driver_uses_local_cache_by_default(
+    mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
+    mock_state_selected_python_file_abs_path_inited,
+    mock_state_required_python_version_inited,
+    mock_state_local_cache_dir_abs_path_inited,
+    mock_state_reboot_triggered,
+    mock_state_venv_driver_inited,
+    mock_state_local_venv_dir_abs_path_inited,
+    env_ctx,
+):
+    # given:
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_venv_driver_prepared.name,
+    )
+    mock_state_venv_driver_inited.return_value.eval_own_state.return_value = VenvDriverType.venv_uv
+    mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
+    mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
+    mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (ConfLeap.leap_env, {}),
+            (ConfLeap.leap_client, {}),
+        ]
+    )
+    mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/venv"
+
+    # when:
+    state_value = env_ctx.eval_state(EnvState.state_venv_driver_prepared.name)
+
+    # then:
+    assert isinstance(state_value, VenvDriverUv)
+    assert state_value.uv_tools_dir_abs_path is None
+    assert state_value.uv_exec_abs_path == "/cache/venv/uv.venv/bin/uv"
+
+
+@patch.dict(os.environ, {}, clear=True)
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_venv_driver_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+@patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+def test_uv_driver_uses_shared_uv_tools_dir_from_conf(
+    mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
+    mock_state_selected_python_file_abs_path_inited,
+    mock_state_required_python_version_inited,
+    mock_state_local_cache_dir_abs_path_inited,
+    mock_state_reboot_triggered,
+    mock_state_venv_driver_inited,
+    mock_state_local_venv_dir_abs_path_inited,
+    env_ctx,
+):
+    # given:
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_venv_driver_prepared.name,
+    )
+    mock_state_venv_driver_inited.return_value.eval_own_state.return_value = VenvDriverType.venv_uv
+    mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
+    mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
+    mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (
+                ConfLeap.leap_env,
+                {
+                    ConfField.field_uv_tools_dir_abs_path.value: "/env/uv_tools",
+                },
+            ),
+            (
+                ConfLeap.leap_client,
+                {
+                    ConfField.field_uv_tools_dir_abs_path.value: "/client/uv_tools",
+                },
+            ),
+        ]
+    )
+    mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/venv"
+
+    # when:
+    state_value = env_ctx.eval_state(EnvState.state_venv_driver_prepared.name)
+
+    # then:
+    assert isinstance(state_value, VenvDriverUv)
+    assert state_value.uv_tools_dir_abs_path == "/env/uv_tools"
+    assert state_value.uv_exec_abs_path == "/env/uv_tools/uv.venv/bin/uv"
+
+
+@patch.dict(
+    os.environ,
+    {
+        EnvVar.var_PROTOPRIMER_UV_TOOLS_DIR.value: "/var/uv_tools",
+    },
+    clear=True,
+)
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_venv_driver_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+@patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+def test_uv_driver_uses_shared_uv_tools_dir_from_env_var(
+    mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
+    mock_state_selected_python_file_abs_path_inited,
+    mock_state_required_python_version_inited,
+    mock_state_local_cache_dir_abs_path_inited,
+    mock_state_reboot_triggered,
+    mock_state_venv_driver_inited,
+    mock_state_local_venv_dir_abs_path_inited,
+    env_ctx,
+):
+    # given:
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_venv_driver_prepared.name,
+    )
+    mock_state_venv_driver_inited.return_value.eval_own_state.return_value = VenvDriverType.venv_uv
+    mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
+    mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
+    mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (ConfLeap.leap_env, {}),
+            (
+                ConfLeap.leap_client,
+                {
+                    ConfField.field_uv_tools_dir_abs_path.value: "/client/uv_tools",
+                },
+            ),
+        ]
+    )
+    mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/venv"
+
+    # when:
+    state_value = env_ctx.eval_state(EnvState.state_venv_driver_prepared.name)
+
+    # then:
+    assert isinstance(state_value, VenvDriverUv)
+    assert state_value.uv_tools_dir_abs_path == "/var/uv_tools"
+    assert state_value.uv_exec_abs_path == "/var/uv_tools/uv.venv/bin/uv"
+
+
+@patch.dict(os.environ, {}, clear=True)
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_venv_driver_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_reboot_triggered.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+@patch("protoprimer.primer_kernel.Bootstrapper_required_python_version_inited.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_selected_python_file_abs_path_inited.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Bootstrapper_state_merged_conf_data_loaded.__name__}.create_state_node")
+@patch(f"{primer_kernel.__name__}.{Factory_state_input_sub_command_arg_loaded.__name__}.create_state_node")
+def test_uv_driver_fails_on_relative_uv_tools_dir(
+    mock_input_sub_command_arg_loaded,
+    mock_state_merged_conf_data_loaded,
+    mock_state_selected_python_file_abs_path_inited,
+    mock_state_required_python_version_inited,
+    mock_state_local_cache_dir_abs_path_inited,
+    mock_state_reboot_triggered,
+    mock_state_venv_driver_inited,
+    mock_state_local_venv_dir_abs_path_inited,
+    env_ctx,
+):
+    # given:
+    assert_parent_factories_mocked(
+        env_ctx,
+        EnvState.state_venv_driver_prepared.name,
+    )
+    mock_state_venv_driver_inited.return_value.eval_own_state.return_value = VenvDriverType.venv_uv
+    mock_state_selected_python_file_abs_path_inited.return_value.eval_own_state.return_value = "/usr/bin/python"
+    mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/cache"
+    mock_state_reboot_triggered.return_value.eval_own_state.return_value = False
+    mock_state_merged_conf_data_loaded.return_value.eval_own_state.return_value = MergedConfData(
+        [
+            (ConfLeap.leap_env, {}),
+            (
+                ConfLeap.leap_client,
+                {
+                    ConfField.field_uv_tools_dir_abs_path.value: "uv_tools",
+                },
+            ),
+        ]
+    )
+
+    # when/then:
+    with pytest.raises(AssertionError, match="must specify absolute path"):
+        env_ctx.eval_state(EnvState.state_venv_driver_prepared.name)
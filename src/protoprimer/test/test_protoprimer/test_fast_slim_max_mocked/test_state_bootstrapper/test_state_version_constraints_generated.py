@@ -10,6 +10,8 @@ from local_test.mock_verifier import (
 from local_test.name_assertion import assert_test_module_name_embeds_str
 from protoprimer import primer_kernel
 from protoprimer.primer_kernel import (
+    Bootstrapper_state_local_cache_dir_abs_path_inited,
+    Bootstrapper_state_local_venv_dir_abs_path_inited,
     Bootstrapper_state_local_conf_symlink_abs_path_inited,
     Factory_state_protoprimer_package_installed,
     Factory_state_venv_driver_prepared,
@@ -42,6 +44,8 @@ class ThisTestClass(BasePyfakefsTestClass):
     def test_relationship(self):
         assert_test_module_name_embeds_str(EnvState.state_version_constraints_generated.name)
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_protoprimer_package_installed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
@@ -54,6 +58,8 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_version_constraints_file_basename_inited,
         mock_state_venv_driver_prepared,
         mock_state_protoprimer_package_installed,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
     ):
 
         # given:
@@ -62,6 +68,8 @@ class ThisTestClass(BasePyfakefsTestClass):
             self.env_ctx,
             EnvState.state_version_constraints_generated.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         self.fs.reset()
         self.env_ctx = (
             ContextBuilder()
@@ -97,6 +105,8 @@ class ThisTestClass(BasePyfakefsTestClass):
         self.assertTrue(os.path.exists(constraints_txt_path))
         mock_state_venv_driver_prepared.return_value.eval_own_state.return_value.pin_versions.assert_called_once()
 
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_cache_dir_abs_path_inited.__name__}.create_state_node")
+    @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_local_venv_dir_abs_path_inited.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_protoprimer_package_installed.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Factory_state_venv_driver_prepared.__name__}.create_state_node")
     @patch(f"{primer_kernel.__name__}.{Bootstrapper_state_version_constraints_file_basename_inited.__name__}.create_state_node")
@@ -109,12 +119,16 @@ class ThisTestClass(BasePyfakefsTestClass):
         mock_state_version_constraints_file_basename_inited,
         mock_state_venv_driver_prepared,
         mock_state_protoprimer_package_installed,
+        mock_state_local_venv_dir_abs_path_inited,
+        mock_state_local_cache_dir_abs_path_inited,
     ):
         # given:
         assert_parent_factories_mocked(
             self.env_ctx,
             EnvState.state_version_constraints_generated.name,
         )
+        mock_state_local_venv_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_venv_dir"
+        mock_state_local_cache_dir_abs_path_inited.return_value.eval_own_state.return_value = "/mock_cache_dir"
         self.fs.reset()
         self.env_ctx = (
             ContextBuilder()
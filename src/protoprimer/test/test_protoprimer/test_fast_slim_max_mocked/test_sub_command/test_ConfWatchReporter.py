@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import typing
+from unittest.mock import patch
+
+import pytest
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer import primer_kernel
+from protoprimer.primer_kernel import (
+    AbstractCachingStateNode,
+    ConfWatchReporter,
+    ContextBuilder,
+    EntryFunc,
+    EnvContext,
+    EnvState,
+    read_json_file,
+    ValueType,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(ConfWatchReporter.__name__)
+
+
+class CountingStateNode(AbstractCachingStateNode[typing.Any]):
+
+    def __init__(
+        self,
+        env_ctx: EnvContext,
+        state_name: str,
+        parent_states: list[str],
+        eval_func: typing.Callable[[], typing.Any],
+    ):
+        self._state_name = lambda: state_name
+        self._parent_states = lambda: parent_states
+        super().__init__(env_ctx=env_ctx)
+        self.eval_func = eval_func
+        self.eval_count: int = 0
+
+    def _eval_state_once(self) -> ValueType:
+        self.eval_count += 1
+        return self.eval_func()
+
+
+def _add_state_node(
+    env_ctx: EnvContext,
+    env_state: EnvState,
+    parent_states: list[EnvState],
+    eval_func: typing.Callable[[], typing.Any],
+) -> CountingStateNode:
+    state_node = CountingStateNode(
+        env_ctx,
+        env_state.name,
+        [parent_state.name for parent_state in parent_states],
+        eval_func,
+    )
+    env_ctx._state_graph.state_nodes[env_state.name] = state_node
+    return state_node
+
+
+@pytest.fixture
+def watched_graph(tmp_path):
+    env_ctx = ContextBuilder().entry_func(EntryFunc.func_boot_env).is_app(True).build_context()
+
+    primer_conf_file_abs_path = str(tmp_path / "proto_kernel.json")
+    with open(primer_conf_file_abs_path, "w") as conf_file:
+        conf_file.write("{}")
+
+    state_nodes: dict[str, CountingStateNode] = {}
+    state_nodes["stride"] = _add_state_node(
+        env_ctx,
+        EnvState.state_stride_py_arbitrary_reached,
+        [],
+        lambda: 1,
+    )
+    state_nodes["path"] = _add_state_node(
+        env_ctx,
+        EnvState.state_primer_conf_file_abs_path_inited,
+        [EnvState.state_stride_py_arbitrary_reached],
+        lambda: primer_conf_file_abs_path,
+    )
+    state_nodes["data"] = _add_state_node(
+        env_ctx,
+        EnvState.state_primer_conf_file_data_loaded,
+        [EnvState.state_primer_conf_file_abs_path_inited],
+        lambda: read_json_file(primer_conf_file_abs_path),
+    )
+    state_nodes["printed"] = _add_state_node(
+        env_ctx,
+        EnvState.state_effective_conf_data_printed,
+        [EnvState.state_primer_conf_file_data_loaded],
+        lambda: 0,
+    )
+    return env_ctx, state_nodes, primer_conf_file_abs_path
+
+
+def test_only_changed_conf_leap_is_re_evaluated(watched_graph):
+
+    # given:
+
+    env_ctx, state_nodes, primer_conf_file_abs_path = watched_graph
+
+    def change_conf_file_on_first_poll(poll_interval_sec):
+        if state_nodes["printed"].eval_count == 1:
+            with open(primer_conf_file_abs_path, "w") as conf_file:
+                conf_file.write('{"field_test": 1}')
+        else:
+            raise KeyboardInterrupt()
+
+    # when:
+
+    with patch(f"{primer_kernel.__name__}.time.sleep", side_effect=change_conf_file_on_first_poll):
+        with pytest.raises(SystemExit) as exc_info:
+            ConfWatchReporter(env_ctx).execute_strategy(state_nodes["printed"])
+
+    # then:
+
+    assert exc_info.value.code == 0
+    assert state_nodes["stride"].eval_count == 1
+    assert state_nodes["path"].eval_count == 1
+    assert state_nodes["data"].eval_count == 2
+    assert state_nodes["printed"].eval_count == 2
+    assert state_nodes["data"].cached_value == {"field_test": 1}
+
+
+def test_failed_evaluation_keeps_watching(watched_graph):
+
+    # given:
+
+    env_ctx, state_nodes, primer_conf_file_abs_path = watched_graph
+
+    poll_conf_file_contents = [
+        "{ broken json",
+        '{"field_test": 2}',
+    ]
+
+    def change_conf_file_on_poll(poll_interval_sec):
+        if len(poll_conf_file_contents) == 0:
+            raise KeyboardInterrupt()
+        with open(primer_conf_file_abs_path, "w") as conf_file:
+            conf_file.write(poll_conf_file_contents.pop(0))
+
+    # when:
+
+    with patch(f"{primer_kernel.__name__}.time.sleep", side_effect=change_conf_file_on_poll):
+        with pytest.raises(SystemExit):
+            ConfWatchReporter(env_ctx).execute_strategy(state_nodes["printed"])
+
+    # then:
+
+    assert state_nodes["data"].eval_count == 3
+    assert state_nodes["data"].cached_value == {"field_test": 2}
+    assert state_nodes["printed"].is_cached
@@ -0,0 +1,86 @@
+import datetime
+import json
+import logging
+import sys
+
+from freezegun import freeze_time
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    JsonFileLogFormatter,
+    StateStride,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(
+        JsonFileLogFormatter.__name__,
+    )
+
+
+def _create_record(
+    log_msg: str,
+    exc_info=None,
+) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "test_name",
+        logging.INFO,
+        "/path/to/test.py",
+        123,
+        log_msg,
+        None,
+        exc_info,
+    )
+    record.created = datetime.datetime.now(datetime.timezone.utc).timestamp()
+    record.process = 12345
+    return record
+
+
+@freeze_time("2025-01-18 12:00:00")
+def test_format_file_log():
+    # given:
+    formatter = JsonFileLogFormatter("test_start_id")
+    record = _create_record("Test message\nwith second line")
+    # These attributes are added by the StateStrideFilter:
+    record.py_exec_name = StateStride.stride_py_venv
+    record.state_stride = StateStride.stride_deps_updated
+    record.state_name = "state_test"
+
+    # when:
+    formatted_log = formatter.format(record)
+
+    # then:
+    assert "\n" not in formatted_log
+    assert json.loads(formatted_log) == {
+        "time": "2025-01-18T12:00:00.000Z",
+        "start_id": "test_start_id",
+        "pid": 12345,
+        "level": "INFO",
+        "py_exec_name": StateStride.stride_py_venv.name,
+        "state_stride": StateStride.stride_deps_updated.name,
+        "state_name": "state_test",
+        "file": "test.py",
+        "line": 123,
+        "message": "Test message\nwith second line",
+    }
+
+
+@freeze_time("2025-01-18 12:00:00")
+def test_format_file_log_without_filter():
+    # given:
+    formatter = JsonFileLogFormatter("test_start_id")
+    try:
+        raise ValueError("test error")
+    except ValueError:
+        record = _create_record("Test message", sys.exc_info())
+
+    # when:
+    formatted_log = formatter.format(record)
+
+    # then:
+    log_entry = json.loads(formatted_log)
+    assert log_entry["py_exec_name"] is None
+    assert log_entry["state_stride"] is None
+    assert log_entry["state_name"] is None
+    assert log_entry["message"] == "Test message"
+    assert log_entry["exc_info"].endswith("ValueError: test error")
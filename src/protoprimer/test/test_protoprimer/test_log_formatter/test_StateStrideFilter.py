@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+from unittest.mock import patch
+
+from local_test.name_assertion import assert_test_module_name_embeds_str
+from protoprimer.primer_kernel import (
+    _PrimerFileLogFormatter,
+    EnvVar,
+    log_stride,
+    StateStride,
+    StateStrideFilter,
+)
+
+
+def test_relationship():
+    assert_test_module_name_embeds_str(
+        StateStrideFilter.__name__,
+    )
+
+
+def _create_logger(log_handler: logging.Handler) -> logging.Logger:
+    test_logger = logging.getLogger(f"{__name__}.{id(log_handler)}")
+    test_logger.propagate = False
+    # Same as the primer `logger` (see `_configure_primer_stderr_log_handler`):
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.addHandler(log_handler)
+    return test_logger
+
+
+@patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_venv.name})
+def test_py_exec_name_is_loaded_once():
+
+    # given:
+
+    state_stride_filter = StateStrideFilter()
+    record = logging.LogRecord("test_name", logging.INFO, "/path/to/test.py", 123, "Test message", None, None)
+
+    # when:
+
+    with patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_required.name}):
+        assert state_stride_filter.filter(record)
+
+    # then:
+
+    assert record.py_exec_name == StateStride.stride_py_venv
+    assert record.state_stride == log_stride.get(StateStride.stride_py_unknown)
+
+    # when: reloaded (e.g. mocked restart)
+
+    with patch.dict(f"{os.__name__}.environ", {EnvVar.var_PROTOPRIMER_PY_EXEC.value: StateStride.stride_py_required.name}):
+        state_stride_filter.load_py_exec_name()
+        assert state_stride_filter.filter(record)
+
+    # then: reloaded (e.g. mocked restart)
+
+    assert record.py_exec_name == StateStride.stride_py_required
+
+
+def test_filter_is_skipped_below_handler_level():
+
+    # given:
+
+    log_handler = logging.StreamHandler(io.StringIO())
+    log_handler.setLevel(logging.INFO)
+    state_stride_filter = StateStrideFilter()
+    log_handler.addFilter(state_stride_filter)
+    test_logger = _create_logger(log_handler)
+
+    # when:
+
+    with patch.object(state_stride_filter, "filter", wraps=state_stride_filter.filter) as mock_filter:
+        test_logger.debug("debug record")
+        test_logger.info("info record")
+
+    # then:
+
+    mock_filter.assert_called_once()
+    test_logger.removeHandler(log_handler)
+
+
+def test_env_is_not_read_per_log_record():
+    """
+    Unlike the uncached path, formatting log records does not read `EnvVar.var_PROTOPRIMER_PY_EXEC` per record.
+
+    See `cmd/bench_log_records` to measure the time (outside the unit tests).
+    """
+
+    # given:
+
+    record_count = 100
+    log_stream = io.StringIO()
+    log_handler = logging.StreamHandler(log_stream)
+    log_handler.setLevel(logging.DEBUG)
+    log_handler.setFormatter(_PrimerFileLogFormatter())
+    log_handler.addFilter(StateStrideFilter())
+    test_logger = _create_logger(log_handler)
+
+    # when:
+
+    with patch(f"{os.__name__}.getenv", wraps=os.getenv) as mock_getenv:
+        for record_index in range(record_count):
+            test_logger.debug("record %d", record_index)
+
+    # then:
+
+    mock_getenv.assert_not_called()
+    log_lines = log_stream.getvalue().splitlines()
+    assert len(log_lines) == record_count
+    assert log_lines[-1].endswith(f"record {record_count - 1}")
+    test_logger.removeHandler(log_handler)
@@ -68,3 +68,25 @@ def test_format_time_with_neither_date_nor_time():
 
     # then
     assert formatted_time == ""
+
+
+def test_format_time_reuses_second_prefix():
+    # given
+    formatter = UtcTimeFormatter(print_date=True, print_time=True)
+    record = Mock(spec=logging.LogRecord)
+    created_second = datetime.datetime(2025, 1, 18, 12, 0, 0, tzinfo=datetime.timezone.utc).timestamp()
+
+    # when
+    formatted_times = []
+    for created_offset in [0.0, 0.25, 0.9995, 1.0]:
+        record.created = created_second + created_offset
+        formatted_times.append(formatter.formatTime(record))
+
+    # then
+    assert formatted_times == [
+        "2025-01-18T12:00:00.000Z",
+        "2025-01-18T12:00:00.250Z",
+        "2025-01-18T12:00:00.999Z",
+        "2025-01-18T12:00:01.000Z",
+    ]
+    assert formatter.cached_second_prefix == (int(created_second) + 1, "2025-01-18T12:00:01")